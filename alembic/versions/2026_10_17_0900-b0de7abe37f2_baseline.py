@@ -0,0 +1,936 @@
+"""baseline
+
+Revision ID: b0de7abe37f2
+Revises:
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from collections.abc import Callable, Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import mysql
+
+# revision identifiers, used by Alembic.
+revision: str = 'b0de7abe37f2'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_dd_real_business_overview() -> None:
+    op.create_table(
+        'dd_real_business_overview',
+        sa.Column('id', sa.CHAR(length=32), nullable=False, comment='主键ID'),
+        sa.Column('bind_user_id', sa.BigInteger(), nullable=False, comment='绑定的数据用户ID'),
+        sa.Column('collect_date', sa.Date(), nullable=False, comment='采集时间'),
+        sa.Column('store_name', sa.String(length=255), nullable=True, comment='店铺名称'),
+        sa.Column('store_id', sa.String(length=255), nullable=True, comment='店铺id'),
+        sa.Column('crawl_account', sa.String(length=255), nullable=True, comment='采集账号'),
+        sa.Column('real_time', sa.DateTime(), nullable=True, comment='实时时间'),
+        sa.Column('pay_amt', sa.DECIMAL(precision=20, scale=2), nullable=True, comment='用户支付金额'),
+        sa.Column('pay_cnt', sa.Integer(), nullable=True, comment='成交订单数'),
+        sa.Column('per_usr_pay_amt', sa.DECIMAL(precision=20, scale=2), nullable=True, comment='客单价'),
+        sa.Column('product_show_ucnt', sa.Integer(), nullable=True, comment='商品曝光人数'),
+        sa.Column('product_click_ucnt', sa.Integer(), nullable=True, comment='商品点击人数'),
+        sa.Column('pay_ucnt', sa.Integer(), nullable=True, comment='成交人数'),
+        sa.Column('pay_plat_cost_amt', sa.DECIMAL(precision=20, scale=2), nullable=True, comment='达人佣金金额'),
+        sa.Column('income_amt', sa.DECIMAL(precision=20, scale=2), nullable=True, comment='成交金额'),
+        sa.Column('refund_amt_rate', sa.DECIMAL(precision=10, scale=4), nullable=True, comment='退款率(支付时间)'),
+        sa.Column('rfndsuc_amt', sa.DECIMAL(precision=20, scale=2), nullable=True, comment='退款金额(退款时间)'),
+        sa.Column(
+            'rfndsuc_amt_pay_time', sa.DECIMAL(precision=20, scale=2), nullable=True, comment='退款金额(支付时间)'
+        ),
+        sa.Column('refund_order_cnt', sa.Integer(), nullable=True, comment='退款订单数(退款时间)'),
+        sa.Column(
+            'refund_amt_pay_time', sa.DECIMAL(precision=20, scale=2), nullable=True, comment='退款金额(支付时间)'
+        ),
+        sa.Column('refund_order_cnt_pay_time', sa.Integer(), nullable=True, comment='退款订单数(支付时间)'),
+        sa.Column(
+            'product_show_click_cnt_ratio',
+            sa.DECIMAL(precision=10, scale=4),
+            nullable=True,
+            comment='商品曝光-点击转化率(次数)',
+        ),
+        sa.Column('product_show_cnt', sa.Integer(), nullable=True, comment='商品曝光次数'),
+        sa.Column(
+            'product_click_pay_cnt_ratio',
+            sa.DECIMAL(precision=10, scale=4),
+            nullable=True,
+            comment='商品点击-成交转化率(次数)',
+        ),
+        sa.Column('gpm', sa.DECIMAL(precision=20, scale=2), nullable=True, comment='千次曝光成交金额'),
+        sa.Column('product_click_cnt', sa.Integer(), nullable=True, comment='商品点击次数'),
+        sa.Column('refund_amt', sa.DECIMAL(precision=20, scale=2), nullable=True, comment='退款金额'),
+        sa.Column(
+            'refunded_pay_amt_pay_time',
+            sa.DECIMAL(precision=20, scale=2),
+            nullable=True,
+            comment='退款后用户支付金额(支付时间)',
+        ),
+        sa.Column(
+            'refund_pay_qc_plat_coupon_amt_pay_time',
+            sa.DECIMAL(precision=20, scale=2),
+            nullable=True,
+            comment='退款后智能优惠券(支付时间)',
+        ),
+        sa.Column('deposit_pay_amt', sa.DECIMAL(precision=20, scale=2), nullable=True, comment='预售定金'),
+        sa.Column('author_subsidy_amt', sa.DECIMAL(precision=20, scale=2), nullable=True, comment='达人补贴金额'),
+        sa.Column(
+            'refund_pay_plat_cost_amt_pay_time',
+            sa.DECIMAL(precision=20, scale=2),
+            nullable=True,
+            comment='退款后达人佣金优惠券金额(支付时间)',
+        ),
+        sa.Column('pay_qc_plat_coupon_amt', sa.DECIMAL(precision=20, scale=2), nullable=True, comment='智能优惠券'),
+        sa.Column(
+            'update_time',
+            sa.DateTime(),
+            server_default=sa.text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'),
+            nullable=False,
+            comment='更新时间',
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        comment='抖店实时业务概览表',
+    )
+
+
+def _create_dd_real_hourly_trend() -> None:
+    op.create_table(
+        'dd_real_hourly_trend',
+        sa.Column('id', sa.CHAR(length=32), nullable=False, comment='主键ID'),
+        sa.Column('bind_user_id', sa.BigInteger(), nullable=False, comment='绑定的数据用户ID'),
+        sa.Column('collect_date', sa.Date(), nullable=False, comment='采集时间'),
+        sa.Column('store_name', sa.String(length=255), nullable=True, comment='店铺名称'),
+        sa.Column('store_id', sa.String(length=255), nullable=True, comment='店铺id'),
+        sa.Column('crawl_account', sa.String(length=255), nullable=True, comment='采集账号'),
+        sa.Column('real_time', sa.DateTime(), nullable=True, comment='采集实时时间'),
+        sa.Column('index_name', sa.String(length=100), nullable=False, comment='指标名称'),
+        sa.Column('index_display', sa.String(length=255), nullable=True, comment='指标显示名称'),
+        sa.Column('index_unit', sa.Integer(), nullable=True, comment='指标单位类型'),
+        sa.Column('hour', sa.Integer(), nullable=False, comment='小时(0-23)'),
+        sa.Column('hour_str', sa.String(length=10), nullable=True, comment='小时字符串(如00:00)'),
+        sa.Column('today_value', sa.DECIMAL(precision=20, scale=2), nullable=True, comment='今日值'),
+        sa.Column('yesterday_value', sa.DECIMAL(precision=20, scale=2), nullable=True, comment='昨日值'),
+        sa.Column('value_diff', sa.DECIMAL(precision=20, scale=2), nullable=True, comment='今日-昨日差值'),
+        sa.Column(
+            'update_time',
+            sa.DateTime(),
+            server_default=sa.text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'),
+            nullable=False,
+            comment='更新时间',
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        comment='抖店实时小时趋势表',
+    )
+
+
+def _create_dd_real_income_expenditure_overview() -> None:
+    op.create_table(
+        'dd_real_income_expenditure_overview',
+        sa.Column('id', sa.CHAR(length=32), nullable=False, comment='主键ID'),
+        sa.Column('bind_user_id', sa.BigInteger(), nullable=False, comment='绑定的数据用户ID'),
+        sa.Column('collect_date', sa.Date(), nullable=False, comment='采集时间'),
+        sa.Column('store_name', sa.String(length=255), nullable=True, comment='店铺名称'),
+        sa.Column('store_id', sa.String(length=255), nullable=True, comment='店铺id'),
+        sa.Column('crawl_account', sa.String(length=255), nullable=True, comment='采集账号'),
+        sa.Column('real_time', sa.DateTime(), nullable=True, comment='实时时间'),
+        sa.Column('income_amt', sa.DECIMAL(precision=20, scale=2), nullable=True, comment='成交金额'),
+        sa.Column('pay_amt', sa.DECIMAL(precision=20, scale=2), nullable=True, comment='用户支付金额'),
+        sa.Column('pay_qc_plat_coupon_amt', sa.DECIMAL(precision=20, scale=2), nullable=True, comment='智能优惠券'),
+        sa.Column('pay_plat_cost_amt', sa.DECIMAL(precision=20, scale=2), nullable=True, comment='达人佣金金额'),
+        sa.Column('homepage_other_pay_amt', sa.DECIMAL(precision=20, scale=2), nullable=True, comment='其它'),
+        sa.Column('cost_amt', sa.DECIMAL(precision=20, scale=2), nullable=True, comment='支出金额'),
+        sa.Column('ad_cost', sa.DECIMAL(precision=20, scale=2), nullable=True, comment='投放消耗'),
+        sa.Column('shop_serv_amt', sa.DECIMAL(precision=20, scale=2), nullable=True, comment='技术服务费'),
+        sa.Column('real_commission', sa.DECIMAL(precision=20, scale=2), nullable=True, comment='实际佣金'),
+        sa.Column('ad_expense_ratio_with_refund', sa.DECIMAL(precision=10, scale=4), nullable=True, comment='投放费比'),
+        sa.Column('refund_amt_rate', sa.DECIMAL(precision=10, scale=4), nullable=True, comment='退款率'),
+        sa.Column(
+            'refund_amt_pay_time', sa.DECIMAL(precision=20, scale=2), nullable=True, comment='退款金额(支付时间)'
+        ),
+        sa.Column(
+            'update_time',
+            sa.DateTime(),
+            server_default=sa.text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'),
+            nullable=False,
+            comment='更新时间',
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        comment='抖店实时收支概览表',
+    )
+
+
+def _create_dvd_access_key() -> None:
+    op.create_table(
+        'dvd_access_key',
+        sa.Column('access_key', sa.VARCHAR(length=255), nullable=False, comment='卡密'),
+        sa.Column('bind_store_num', sa.Integer(), server_default='5', nullable=True, comment='可绑定店铺数量'),
+        sa.Column('flag', sa.VARCHAR(length=5), server_default='0', nullable=True, comment='是否有效 1过期 0有效'),
+        sa.Column(
+            'is_used', sa.VARCHAR(length=5), server_default='0', nullable=True, comment='是否被使用 1已使用 0未使用'
+        ),
+        sa.Column('used_time', sa.DateTime(), nullable=True, comment='被使用时间'),
+        sa.Column('use_deadline', sa.DateTime(), nullable=True, comment='使用截止日期'),
+        sa.Column('duration_hours', sa.Integer(), server_default='0', nullable=True, comment='可激活时长(小时)'),
+        sa.Column('remark', sa.String(length=500), nullable=True, comment='备注'),
+        sa.Column('create_time', sa.DateTime(), nullable=True, comment='创建时间'),
+        sa.Column('update_date', sa.DateTime(), nullable=True, comment='更新时间'),
+        sa.PrimaryKeyConstraint('access_key'),
+        comment='卡密表',
+    )
+
+
+def _create_dvd_account_store_relation() -> None:
+    op.create_table(
+        'dvd_account_store_relation',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False, comment='主键ID'),
+        sa.Column('dvd_account_id', sa.BigInteger(), nullable=False, comment='账号ID（关联dvd_crawl_account_info.id）'),
+        sa.Column('store_name', sa.VARCHAR(length=255), nullable=False, comment='店铺名称'),
+        sa.Column('platform_id', sa.VARCHAR(length=50), nullable=False, comment='平台ID'),
+        sa.Column('product_id', sa.VARCHAR(length=100), nullable=False, comment='产品ID'),
+        sa.Column(
+            'is_active', sa.SmallInteger(), server_default='1', nullable=False, comment='是否激活（1-激活，0-未激活）'
+        ),
+        sa.Column('create_time', sa.DateTime(), nullable=False, comment='创建时间'),
+        sa.Column('update_time', sa.DateTime(), nullable=False, comment='更新时间'),
+        sa.PrimaryKeyConstraint('id'),
+        comment='账号-店铺关联表',
+    )
+
+
+def _create_dvd_config_menu() -> None:
+    op.create_table(
+        'dvd_config_menu',
+        sa.Column('dvd_config_menu_id', sa.BigInteger(), autoincrement=True, nullable=False, comment='菜单ID'),
+        sa.Column('dvd_config_menu_name', sa.String(length=50), nullable=False, comment='菜单名称'),
+        sa.Column('dvd_config_parent_id', sa.BigInteger(), server_default='0', nullable=True, comment='父菜单ID'),
+        sa.Column('order_num', sa.Integer(), server_default='0', nullable=True, comment='显示顺序'),
+        sa.Column(
+            'dvd_config_menu_type',
+            sa.CHAR(length=1),
+            server_default='',
+            nullable=True,
+            comment='菜单类型（P平台 D产品(数据端) F方法）',
+        ),
+        sa.Column('status', sa.CHAR(length=1), server_default='0', nullable=True, comment='菜单状态（0正常 1停用）'),
+        sa.Column('logo', sa.VARCHAR(length=100), nullable=True, comment='产品LOGO'),
+        sa.Column('screenshot_url', sa.VARCHAR(length=200), nullable=True, comment='功能截图地址'),
+        sa.Column('create_time', sa.DateTime(), nullable=True, comment='创建时间'),
+        sa.Column('update_time', sa.DateTime(), nullable=True, comment='更新时间'),
+        sa.Column('remark', sa.String(length=500), nullable=True, comment='备注'),
+        sa.PrimaryKeyConstraint('dvd_config_menu_id'),
+        comment='DVD配置菜单表',
+    )
+
+
+def _create_dvd_crawl_account_info() -> None:
+    op.create_table(
+        'dvd_crawl_account_info',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False, comment='自增主键'),
+        sa.Column('platform_id', sa.VARCHAR(length=50), nullable=False, comment='平台名称'),
+        sa.Column('product_id', sa.VARCHAR(length=100), nullable=False, comment='产品名称'),
+        sa.Column('account', sa.VARCHAR(length=100), nullable=False, comment='账号（手机号/邮箱/用户名）'),
+        sa.Column('password', sa.VARCHAR(length=255), nullable=True, comment='密码（建议加密存储）'),
+        sa.Column('cookies', sa.Text(), nullable=True, comment='Cookies信息（JSON/字符串格式）'),
+        sa.Column('status', sa.Integer(), server_default='1', nullable=False, comment='状态：1-正常，2-过期，3-异常'),
+        sa.Column('bind_user_id', sa.BigInteger(), nullable=False, comment='绑定的用户ID'),
+        sa.Column('create_time', sa.DateTime(), nullable=False, comment='创建时间'),
+        sa.Column('update_time', sa.DateTime(), nullable=False, comment='更新时间'),
+        sa.Column(
+            'unique_md5',
+            sa.CHAR(length=32),
+            nullable=False,
+            comment='唯一标识MD5(platform,product,account,bind_user_id)',
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('unique_md5'),
+        comment='大屏采集账号账号信息表',
+    )
+
+
+def _create_qf_order_list() -> None:
+    op.create_table(
+        'qf_order_list',
+        sa.Column('id', sa.CHAR(length=32), nullable=False, comment='主键ID'),
+        sa.Column('collect_date', sa.Date(), nullable=False, comment='采集时间'),
+        sa.Column('store_name', sa.String(length=255), nullable=True, comment='店铺名称'),
+        sa.Column('store_id', sa.String(length=255), nullable=True, comment='店铺id'),
+        sa.Column('crawl_account', sa.String(length=255), nullable=True, comment='采集账号'),
+        sa.Column('package_id', sa.String(length=255), nullable=True, comment='订单包裹ID'),
+        sa.Column('sku_id', sa.String(length=255), nullable=True, comment='SKU ID'),
+        sa.Column('nick_name', sa.String(length=255), nullable=True, comment='买家昵称'),
+        sa.Column('ordered_at', sa.String(length=255), nullable=True, comment='下单时间'),
+        sa.Column('name', sa.String(length=255), nullable=True, comment='买家姓名'),
+        sa.Column('sold_price', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='售价'),
+        sa.Column('specification', sa.Text(), nullable=True, comment='规格'),
+        sa.Column('sku_name', sa.Text(), nullable=True, comment='SKU名称'),
+        sa.Column('sku_raw_price', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='SKU原价'),
+        sa.Column('after_sale_status_desc', sa.String(length=255), nullable=True, comment='售后状态描述'),
+        sa.Column('express_company_name', sa.String(length=255), nullable=True, comment='快递公司名称'),
+        sa.Column('sku_total_paid_amount', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='SKU总实付金额'),
+        sa.Column(
+            'update_time',
+            sa.DateTime(),
+            server_default=sa.text('CURRENT_TIMESTAMP'),
+            nullable=False,
+            comment='更新时间',
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        comment='千帆订单列表表',
+    )
+
+
+def _create_qf_overview() -> None:
+    op.create_table(
+        'qf_overview',
+        sa.Column('id', sa.CHAR(length=32), nullable=False, comment='主键ID'),
+        sa.Column('collect_date', sa.Date(), nullable=False, comment='采集时间'),
+        sa.Column('store_name', sa.String(length=255), nullable=True, comment='店铺名称'),
+        sa.Column('store_id', sa.String(length=255), nullable=True, comment='店铺id'),
+        sa.Column('crawl_account', sa.String(length=255), nullable=True, comment='采集账号'),
+        sa.Column('dtm', sa.String(length=255), nullable=True, comment='时间'),
+        sa.Column('pay_gmv', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='支付金额'),
+        sa.Column('note_pay_gmv', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='笔记支付金额'),
+        sa.Column('live_pay_gmv', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='直播支付金额'),
+        sa.Column('card_pay_gmv', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='商卡支付金额'),
+        sa.Column('pay_pkg_cnt', sa.BigInteger(), nullable=True, comment='支付订单数'),
+        sa.Column('note_pay_pkg_cnt', sa.BigInteger(), nullable=True, comment='笔记支付订单数'),
+        sa.Column('live_pay_pkg_cnt', sa.BigInteger(), nullable=True, comment='直播支付订单数'),
+        sa.Column('card_pay_pkg_cnt', sa.BigInteger(), nullable=True, comment='商卡支付订单数'),
+        sa.Column('pay_user_num', sa.BigInteger(), nullable=True, comment='支付买家数'),
+        sa.Column('note_pay_user_num', sa.BigInteger(), nullable=True, comment='笔记支付买家数'),
+        sa.Column('live_pay_user_num', sa.BigInteger(), nullable=True, comment='直播支付买家数'),
+        sa.Column('card_pay_user_num', sa.BigInteger(), nullable=True, comment='商卡支付买家数'),
+        sa.Column('goods_uv', sa.BigInteger(), nullable=True, comment='商品访客数'),
+        sa.Column('note_goods_uv', sa.BigInteger(), nullable=True, comment='笔记商品访客数'),
+        sa.Column('live_goods_uv', sa.BigInteger(), nullable=True, comment='直播商品访客数'),
+        sa.Column('card_goods_uv', sa.BigInteger(), nullable=True, comment='商卡商品访客数'),
+        sa.Column('refund_pay_gmv', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='退款金额（退款时间）'),
+        sa.Column(
+            'note_refund_pay_gmv', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='笔记退款金额（退款时间）'
+        ),
+        sa.Column(
+            'live_refund_pay_gmv', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='直播退款金额（退款时间）'
+        ),
+        sa.Column(
+            'card_refund_pay_gmv', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='商卡退款金额（退款时间）'
+        ),
+        sa.Column('pay_refund_amt', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='退款金额（支付时间）'),
+        sa.Column(
+            'note_pay_refund_amt', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='笔记退款金额（支付时间）'
+        ),
+        sa.Column(
+            'live_pay_refund_amt', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='直播退款金额（支付时间）'
+        ),
+        sa.Column(
+            'card_pay_refund_amt', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='商卡退款金额（支付时间）'
+        ),
+        sa.Column('pay_refund_rate', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='退款率（支付时间）'),
+        sa.Column(
+            'note_pay_refund_rate', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='笔记退款率（支付时间）'
+        ),
+        sa.Column(
+            'live_pay_refund_rate', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='直播退款率（支付时间）'
+        ),
+        sa.Column(
+            'card_pay_refund_rate', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='商卡退款率（支付时间）'
+        ),
+        sa.Column(
+            'pay_refund_pkg_cnt', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='退款订单数（支付时间）'
+        ),
+        sa.Column(
+            'note_pay_refund_pkg_cnt',
+            sa.DECIMAL(precision=20, scale=4),
+            nullable=True,
+            comment='笔记退款订单数（支付时间）',
+        ),
+        sa.Column(
+            'live_pay_refund_pkg_cnt',
+            sa.DECIMAL(precision=20, scale=4),
+            nullable=True,
+            comment='直播退款订单数（支付时间）',
+        ),
+        sa.Column(
+            'card_pay_refund_pkg_cnt',
+            sa.DECIMAL(precision=20, scale=4),
+            nullable=True,
+            comment='商卡退款订单数（支付时间）',
+        ),
+        sa.Column(
+            'pay_refund_rate_before_ship',
+            sa.DECIMAL(precision=20, scale=4),
+            nullable=True,
+            comment='发货前退款率（支付时间）',
+        ),
+        sa.Column(
+            'note_pay_refund_rate_before_ship',
+            sa.DECIMAL(precision=20, scale=4),
+            nullable=True,
+            comment='笔记发货前退款率（支付时间）',
+        ),
+        sa.Column(
+            'live_pay_refund_rate_before_ship',
+            sa.DECIMAL(precision=20, scale=4),
+            nullable=True,
+            comment='直播发货前退款率（支付时间）',
+        ),
+        sa.Column(
+            'card_pay_refund_rate_before_ship',
+            sa.DECIMAL(precision=20, scale=4),
+            nullable=True,
+            comment='商卡发货前退款率（支付时间）',
+        ),
+        sa.Column(
+            'pay_refund_rate_after_ship',
+            sa.DECIMAL(precision=20, scale=4),
+            nullable=True,
+            comment='发货后退款率（支付时间）',
+        ),
+        sa.Column(
+            'note_pay_refund_rate_after_ship',
+            sa.DECIMAL(precision=20, scale=4),
+            nullable=True,
+            comment='笔记发货后退款率（支付时间）',
+        ),
+        sa.Column(
+            'live_pay_refund_rate_after_ship',
+            sa.DECIMAL(precision=20, scale=4),
+            nullable=True,
+            comment='直播发货后退款率（支付时间）',
+        ),
+        sa.Column(
+            'card_pay_refund_rate_after_ship',
+            sa.DECIMAL(precision=20, scale=4),
+            nullable=True,
+            comment='商卡发货后退款率（支付时间）',
+        ),
+        sa.Column(
+            'pay_net_amt', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='退款后支付金额（支付时间）'
+        ),
+        sa.Column(
+            'note_pay_net_amt',
+            sa.DECIMAL(precision=20, scale=4),
+            nullable=True,
+            comment='笔记退款后支付金额（支付时间）',
+        ),
+        sa.Column(
+            'live_pay_net_amt',
+            sa.DECIMAL(precision=20, scale=4),
+            nullable=True,
+            comment='直播退款后支付金额（支付时间）',
+        ),
+        sa.Column(
+            'card_pay_net_amt',
+            sa.DECIMAL(precision=20, scale=4),
+            nullable=True,
+            comment='商卡退款后支付金额（支付时间）',
+        ),
+        sa.Column('upr', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='支付转化率'),
+        sa.Column('note_upr', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='笔记支付转化率'),
+        sa.Column('live_upr', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='直播支付转化率'),
+        sa.Column('card_upr', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='商卡支付转化率'),
+        sa.Column('pay_goods_cnt', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='支付件数'),
+        sa.Column('cart_user_num', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='加购人数'),
+        sa.Column('cart_goods_cnt', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='加购件数'),
+        sa.Column(
+            'update_time',
+            sa.DateTime(),
+            server_default=sa.text('CURRENT_TIMESTAMP'),
+            nullable=False,
+            comment='更新时间',
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        comment='千帆数据概览表',
+    )
+
+
+def _create_qf_realtime_metrics() -> None:
+    op.create_table(
+        'qf_realtime_metrics',
+        sa.Column('id', sa.CHAR(length=32), nullable=False),
+        sa.Column('collect_date', sa.Date(), nullable=False, comment='采集日期'),
+        sa.Column('store_name', sa.String(length=255), nullable=True, comment='店铺名称'),
+        sa.Column('store_id', sa.String(length=255), nullable=True, comment='店铺id'),
+        sa.Column('crawl_account', sa.String(length=255), nullable=True, comment='采集账号'),
+        sa.Column('pay_amount', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='支付金额'),
+        sa.Column('pay_order_count', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='支付订单数'),
+        sa.Column('goods_visit_count', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='商品访问量'),
+        sa.Column('refund_amount', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='退款金额'),
+        sa.Column('pay_buyer_count', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='支付买家数'),
+        sa.Column('account_balance', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='可提现余额'),
+        sa.Column('shop_page_visit', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='店铺访问页面'),
+        sa.Column('cps_pay_amount', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='买手支付额'),
+        sa.Column('ad_pay_amount', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='广告支付额'),
+        sa.Column(
+            'update_time',
+            sa.DateTime(),
+            server_default=sa.text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'),
+            nullable=False,
+            comment='更新时间',
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        comment='千帆实时指标表',
+    )
+
+
+def _create_qf_realtime_trend() -> None:
+    op.create_table(
+        'qf_realtime_trend',
+        sa.Column('id', sa.CHAR(length=32), nullable=False, comment='主键ID'),
+        sa.Column('collect_date', sa.Date(), nullable=False, comment='采集时间'),
+        sa.Column('store_name', sa.String(length=255), nullable=True, comment='店铺名称'),
+        sa.Column('store_id', sa.String(length=255), nullable=True, comment='店铺id'),
+        sa.Column('crawl_account', sa.String(length=255), nullable=True, comment='采集账号'),
+        sa.Column('dtm', sa.String(length=255), nullable=True, comment='时间点(00-23)'),
+        sa.Column('pay_net_amt', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='净支付金额'),
+        sa.Column('card_click_cnt', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='商品卡片点击次数'),
+        sa.Column(
+            'pay_refund_rate_after_ship', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='发货后退款率'
+        ),
+        sa.Column(
+            'note_seller_real_income_amt', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='笔记实际收入金额'
+        ),
+        sa.Column(
+            'pay_refund_pkg_cnt_before_ship_only',
+            sa.DECIMAL(precision=20, scale=4),
+            nullable=True,
+            comment='仅发货前退款包裹数',
+        ),
+        sa.Column(
+            'pay_refund_pkg_cnt_after_ship_only',
+            sa.DECIMAL(precision=20, scale=4),
+            nullable=True,
+            comment='仅发货后退款包裹数',
+        ),
+        sa.Column(
+            'card_click_user_num', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='商品卡片点击用户数'
+        ),
+        sa.Column(
+            'live_seller_real_income_amt', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='直播实际收入金额'
+        ),
+        sa.Column('add_cart_goods_num', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='加购商品数'),
+        sa.Column(
+            'pay_refund_amt_after_ship_only',
+            sa.DECIMAL(precision=20, scale=4),
+            nullable=True,
+            comment='仅发货后退款金额',
+        ),
+        sa.Column(
+            'pay_refund_amt_before_ship_only',
+            sa.DECIMAL(precision=20, scale=4),
+            nullable=True,
+            comment='仅发货前退款金额',
+        ),
+        sa.Column('add_cart_user_num', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='加购用户数'),
+        sa.Column('pay_refund_pkg_cnt', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='退款包裹数'),
+        sa.Column('upr', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='支付转化率'),
+        sa.Column('pay_refund_rate', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='退款率'),
+        sa.Column('pay_refund_amt', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='退款金额'),
+        sa.Column('upr_pv', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='PV支付转化率'),
+        sa.Column('seller_real_income_amt', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='实际收入金额'),
+        sa.Column('deal_goods_cnt', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='成交商品数'),
+        sa.Column(
+            'pay_refund_amt_with_return', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='含退货退款金额'
+        ),
+        sa.Column('refund_amt', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='退款金额'),
+        sa.Column(
+            'pay_refund_pkg_cnt_with_return',
+            sa.DECIMAL(precision=20, scale=4),
+            nullable=True,
+            comment='含退货退款包裹数',
+        ),
+        sa.Column('deal_order_cnt', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='成交订单数'),
+        sa.Column('pct', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='PCT'),
+        sa.Column(
+            'card_seller_real_income_amt', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='商卡实际收入金额'
+        ),
+        sa.Column('deal_user_num', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='成交用户数'),
+        sa.Column(
+            'pay_refund_rate_before_ship', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='发货前退款率'
+        ),
+        sa.Column(
+            'update_time',
+            sa.DateTime(),
+            server_default=sa.text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'),
+            nullable=False,
+            comment='更新时间',
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        comment='千帆实时趋势表',
+    )
+
+
+def _create_sys_config() -> None:
+    op.create_table(
+        'sys_config',
+        sa.Column('config_id', sa.Integer(), autoincrement=True, nullable=False, comment='参数主键'),
+        sa.Column('config_name', sa.String(length=100), server_default='', nullable=True, comment='参数名称'),
+        sa.Column('config_key', sa.String(length=100), server_default='', nullable=True, comment='参数键名'),
+        sa.Column('config_value', sa.String(length=500), server_default='', nullable=True, comment='参数键值'),
+        sa.Column('config_type', sa.CHAR(length=1), server_default='N', nullable=True, comment='系统内置（Y是 N否）'),
+        sa.Column('create_by', sa.String(length=64), server_default='', nullable=True, comment='创建者'),
+        sa.Column('create_time', sa.DateTime(), nullable=True, comment='创建时间'),
+        sa.Column('update_by', sa.String(length=64), server_default='', nullable=True, comment='更新者'),
+        sa.Column('update_time', sa.DateTime(), nullable=True, comment='更新时间'),
+        sa.Column('remark', sa.String(length=500), nullable=True, comment='备注'),
+        sa.PrimaryKeyConstraint('config_id'),
+        comment='参数配置表',
+    )
+
+
+def _create_sys_dept() -> None:
+    op.create_table(
+        'sys_dept',
+        sa.Column('dept_id', sa.BigInteger(), autoincrement=True, nullable=False, comment='部门id'),
+        sa.Column('parent_id', sa.BigInteger(), server_default='0', nullable=True, comment='父部门id'),
+        sa.Column('ancestors', sa.String(length=50), server_default='', nullable=True, comment='祖级列表'),
+        sa.Column('dept_name', sa.String(length=30), server_default='', nullable=True, comment='部门名称'),
+        sa.Column('order_num', sa.Integer(), server_default='0', nullable=True, comment='显示顺序'),
+        sa.Column('leader', sa.String(length=20), nullable=True, comment='负责人'),
+        sa.Column('phone', sa.String(length=11), nullable=True, comment='联系电话'),
+        sa.Column('email', sa.String(length=50), nullable=True, comment='邮箱'),
+        sa.Column('status', sa.CHAR(length=1), server_default='0', nullable=True, comment='部门状态（0正常 1停用）'),
+        sa.Column(
+            'del_flag', sa.CHAR(length=1), server_default='0', nullable=True, comment='删除标志（0代表存在 2代表删除）'
+        ),
+        sa.Column('create_by', sa.String(length=64), server_default='', nullable=True, comment='创建者'),
+        sa.Column('create_time', sa.DateTime(), nullable=True, comment='创建时间'),
+        sa.Column('update_by', sa.String(length=64), server_default='', nullable=True, comment='更新者'),
+        sa.Column('update_time', sa.DateTime(), nullable=True, comment='更新时间'),
+        sa.PrimaryKeyConstraint('dept_id'),
+        comment='部门表',
+    )
+
+
+def _create_sys_dict_data() -> None:
+    op.create_table(
+        'sys_dict_data',
+        sa.Column('dict_code', sa.BigInteger(), autoincrement=True, nullable=False, comment='字典编码'),
+        sa.Column('dict_sort', sa.Integer(), server_default='0', nullable=True, comment='字典排序'),
+        sa.Column('dict_label', sa.String(length=100), server_default='', nullable=True, comment='字典标签'),
+        sa.Column('dict_value', sa.String(length=100), server_default='', nullable=True, comment='字典键值'),
+        sa.Column('dict_type', sa.String(length=100), server_default='', nullable=True, comment='字典类型'),
+        sa.Column('css_class', sa.String(length=100), nullable=True, comment='样式属性（其他样式扩展）'),
+        sa.Column('list_class', sa.String(length=100), nullable=True, comment='表格回显样式'),
+        sa.Column('is_default', sa.CHAR(length=1), server_default='N', nullable=True, comment='是否默认（Y是 N否）'),
+        sa.Column('status', sa.CHAR(length=1), server_default='0', nullable=True, comment='状态（0正常 1停用）'),
+        sa.Column('create_by', sa.String(length=64), server_default='', nullable=True, comment='创建者'),
+        sa.Column('create_time', sa.DateTime(), nullable=True, comment='创建时间'),
+        sa.Column('update_by', sa.String(length=64), server_default='', nullable=True, comment='更新者'),
+        sa.Column('update_time', sa.DateTime(), nullable=True, comment='更新时间'),
+        sa.Column('remark', sa.String(length=500), nullable=True, comment='备注'),
+        sa.PrimaryKeyConstraint('dict_code'),
+        comment='字典数据表',
+    )
+
+
+def _create_sys_dict_type() -> None:
+    op.create_table(
+        'sys_dict_type',
+        sa.Column('dict_id', sa.BigInteger(), autoincrement=True, nullable=False, comment='字典主键'),
+        sa.Column('dict_name', sa.String(length=100), server_default='', nullable=True, comment='字典名称'),
+        sa.Column('dict_type', sa.String(length=100), server_default='', nullable=True, comment='字典类型'),
+        sa.Column('status', sa.CHAR(length=1), server_default='0', nullable=True, comment='状态（0正常 1停用）'),
+        sa.Column('create_by', sa.String(length=64), server_default='', nullable=True, comment='创建者'),
+        sa.Column('create_time', sa.DateTime(), nullable=True, comment='创建时间'),
+        sa.Column('update_by', sa.String(length=64), server_default='', nullable=True, comment='更新者'),
+        sa.Column('update_time', sa.DateTime(), nullable=True, comment='更新时间'),
+        sa.Column('remark', sa.String(length=500), nullable=True, comment='备注'),
+        sa.PrimaryKeyConstraint('dict_id'),
+        sa.UniqueConstraint('dict_type'),
+        comment='字典类型表',
+    )
+
+
+def _create_sys_logininfor() -> None:
+    op.create_table(
+        'sys_logininfor',
+        sa.Column('info_id', sa.BigInteger(), autoincrement=True, nullable=False, comment='访问ID'),
+        sa.Column('user_name', sa.String(length=50), server_default='', nullable=True, comment='用户账号'),
+        sa.Column('ipaddr', sa.String(length=128), server_default='', nullable=True, comment='登录IP地址'),
+        sa.Column('login_location', sa.String(length=255), server_default='', nullable=True, comment='登录地点'),
+        sa.Column('browser', sa.String(length=50), server_default='', nullable=True, comment='浏览器类型'),
+        sa.Column('os', sa.String(length=50), server_default='', nullable=True, comment='操作系统'),
+        sa.Column('status', sa.CHAR(length=1), server_default='0', nullable=True, comment='登录状态（0成功 1失败）'),
+        sa.Column('msg', sa.String(length=255), server_default='', nullable=True, comment='提示消息'),
+        sa.Column('login_time', sa.DateTime(), nullable=True, comment='访问时间'),
+        sa.PrimaryKeyConstraint('info_id'),
+        comment='系统访问记录',
+    )
+    op.create_index('idx_sys_logininfor_lt', 'sys_logininfor', ['login_time'], unique=False)
+    op.create_index('idx_sys_logininfor_s', 'sys_logininfor', ['status'], unique=False)
+
+
+def _create_sys_menu() -> None:
+    op.create_table(
+        'sys_menu',
+        sa.Column('menu_id', sa.BigInteger(), autoincrement=True, nullable=False, comment='菜单ID'),
+        sa.Column('menu_name', sa.String(length=50), nullable=False, comment='菜单名称'),
+        sa.Column('parent_id', sa.BigInteger(), server_default='0', nullable=True, comment='父菜单ID'),
+        sa.Column('order_num', sa.Integer(), server_default='0', nullable=True, comment='显示顺序'),
+        sa.Column('path', sa.String(length=200), server_default='', nullable=True, comment='路由地址'),
+        sa.Column('component', sa.String(length=255), nullable=True, comment='组件路径'),
+        sa.Column('query', sa.String(length=255), nullable=True, comment='路由参数'),
+        sa.Column('route_name', sa.String(length=50), server_default='', nullable=True, comment='路由名称'),
+        sa.Column('is_frame', sa.Integer(), server_default='1', nullable=True, comment='是否为外链（0是 1否）'),
+        sa.Column('is_cache', sa.Integer(), server_default='0', nullable=True, comment='是否缓存（0缓存 1不缓存）'),
+        sa.Column(
+            'menu_type', sa.CHAR(length=1), server_default='', nullable=True, comment='菜单类型（M目录 C菜单 F按钮）'
+        ),
+        sa.Column('visible', sa.CHAR(length=1), server_default='0', nullable=True, comment='菜单状态（0显示 1隐藏）'),
+        sa.Column('status', sa.CHAR(length=1), server_default='0', nullable=True, comment='菜单状态（0正常 1停用）'),
+        sa.Column('perms', sa.String(length=100), nullable=True, comment='权限标识'),
+        sa.Column('icon', sa.String(length=100), server_default='#', nullable=True, comment='菜单图标'),
+        sa.Column('create_by', sa.String(length=64), server_default='', nullable=True, comment='创建者'),
+        sa.Column('create_time', sa.DateTime(), nullable=True, comment='创建时间'),
+        sa.Column('update_by', sa.String(length=64), server_default='', nullable=True, comment='更新者'),
+        sa.Column('update_time', sa.DateTime(), nullable=True, comment='更新时间'),
+        sa.Column('remark', sa.String(length=500), server_default='', nullable=True, comment='备注'),
+        sa.PrimaryKeyConstraint('menu_id'),
+        comment='菜单权限表',
+    )
+
+
+def _create_sys_notice() -> None:
+    op.create_table(
+        'sys_notice',
+        sa.Column('notice_id', sa.Integer(), autoincrement=True, nullable=False, comment='公告ID'),
+        sa.Column('notice_title', sa.String(length=50), nullable=False, comment='公告标题'),
+        sa.Column('notice_type', sa.CHAR(length=1), nullable=False, comment='公告类型（1通知 2公告）'),
+        sa.Column('notice_content', mysql.LONGBLOB(), nullable=True, comment='公告内容'),
+        sa.Column('status', sa.CHAR(length=1), server_default='0', nullable=True, comment='公告状态（0正常 1关闭）'),
+        sa.Column('create_by', sa.String(length=64), server_default='', nullable=True, comment='创建者'),
+        sa.Column('create_time', sa.DateTime(), nullable=True, comment='创建时间'),
+        sa.Column('update_by', sa.String(length=64), server_default='', nullable=True, comment='更新者'),
+        sa.Column('update_time', sa.DateTime(), nullable=True, comment='更新时间'),
+        sa.Column('remark', sa.String(length=255), nullable=True, comment='备注'),
+        sa.PrimaryKeyConstraint('notice_id'),
+        comment='通知公告表',
+    )
+
+
+def _create_sys_oper_log() -> None:
+    op.create_table(
+        'sys_oper_log',
+        sa.Column('oper_id', sa.BigInteger(), autoincrement=True, nullable=False, comment='日志主键'),
+        sa.Column('title', sa.String(length=50), server_default='', nullable=True, comment='模块标题'),
+        sa.Column(
+            'business_type',
+            sa.Integer(),
+            server_default='0',
+            nullable=True,
+            comment='业务类型（0其它 1新增 2修改 3删除）',
+        ),
+        sa.Column('method', sa.String(length=100), server_default='', nullable=True, comment='方法名称'),
+        sa.Column('request_method', sa.String(length=10), server_default='', nullable=True, comment='请求方式'),
+        sa.Column(
+            'operator_type',
+            sa.Integer(),
+            server_default='0',
+            nullable=True,
+            comment='操作类别（0其它 1后台用户 2手机端用户）',
+        ),
+        sa.Column('oper_name', sa.String(length=50), server_default='', nullable=True, comment='操作人员'),
+        sa.Column('dept_name', sa.String(length=50), server_default='', nullable=True, comment='部门名称'),
+        sa.Column('oper_url', sa.String(length=255), server_default='', nullable=True, comment='请求URL'),
+        sa.Column('oper_ip', sa.String(length=128), server_default='', nullable=True, comment='主机地址'),
+        sa.Column('oper_location', sa.String(length=255), server_default='', nullable=True, comment='操作地点'),
+        sa.Column('oper_param', sa.String(length=2000), server_default='', nullable=True, comment='请求参数'),
+        sa.Column('json_result', sa.String(length=2000), server_default='', nullable=True, comment='返回参数'),
+        sa.Column('status', sa.Integer(), server_default='0', nullable=True, comment='操作状态（0正常 1异常）'),
+        sa.Column('error_msg', sa.String(length=2000), server_default='', nullable=True, comment='错误消息'),
+        sa.Column('oper_time', sa.DateTime(), nullable=True, comment='操作时间'),
+        sa.Column('cost_time', sa.BigInteger(), server_default='0', nullable=True, comment='消耗时间'),
+        sa.PrimaryKeyConstraint('oper_id'),
+        comment='操作日志记录',
+    )
+    op.create_index('idx_sys_oper_log_bt', 'sys_oper_log', ['business_type'], unique=False)
+    op.create_index('idx_sys_oper_log_ot', 'sys_oper_log', ['oper_time'], unique=False)
+    op.create_index('idx_sys_oper_log_s', 'sys_oper_log', ['status'], unique=False)
+
+
+def _create_sys_post() -> None:
+    op.create_table(
+        'sys_post',
+        sa.Column('post_id', sa.BigInteger(), autoincrement=True, nullable=False, comment='岗位ID'),
+        sa.Column('post_code', sa.String(length=64), nullable=False, comment='岗位编码'),
+        sa.Column('post_name', sa.String(length=50), nullable=False, comment='岗位名称'),
+        sa.Column('post_sort', sa.Integer(), nullable=False, comment='显示顺序'),
+        sa.Column('status', sa.CHAR(length=1), nullable=False, comment='状态（0正常 1停用）'),
+        sa.Column('create_by', sa.String(length=64), server_default='', nullable=True, comment='创建者'),
+        sa.Column('create_time', sa.DateTime(), nullable=True, comment='创建时间'),
+        sa.Column('update_by', sa.String(length=64), server_default='', nullable=True, comment='更新者'),
+        sa.Column('update_time', sa.DateTime(), nullable=True, comment='更新时间'),
+        sa.Column('remark', sa.String(length=500), nullable=True, comment='备注'),
+        sa.PrimaryKeyConstraint('post_id'),
+        comment='岗位信息表',
+    )
+
+
+def _create_sys_role() -> None:
+    op.create_table(
+        'sys_role',
+        sa.Column('role_id', sa.BigInteger(), autoincrement=True, nullable=False, comment='角色ID'),
+        sa.Column('role_name', sa.String(length=30), nullable=False, comment='角色名称'),
+        sa.Column('role_key', sa.String(length=100), nullable=False, comment='角色权限字符串'),
+        sa.Column('role_sort', sa.Integer(), nullable=False, comment='显示顺序'),
+        sa.Column(
+            'data_scope',
+            sa.CHAR(length=1),
+            server_default='1',
+            nullable=True,
+            comment='数据范围（1：全部数据权限 2：自定数据权限 3：本部门数据权限 4：本部门及以下数据权限）',
+        ),
+        sa.Column(
+            'menu_check_strictly',
+            mysql.TINYINT(display_width=1),
+            server_default='1',
+            nullable=True,
+            comment='菜单树选择项是否关联显示',
+        ),
+        sa.Column(
+            'dept_check_strictly',
+            mysql.TINYINT(display_width=1),
+            server_default='1',
+            nullable=True,
+            comment='部门树选择项是否关联显示',
+        ),
+        sa.Column('status', sa.CHAR(length=1), nullable=False, comment='角色状态（0正常 1停用）'),
+        sa.Column(
+            'del_flag', sa.CHAR(length=1), server_default='0', nullable=True, comment='删除标志（0代表存在 2代表删除）'
+        ),
+        sa.Column('create_by', sa.String(length=64), server_default='', nullable=True, comment='创建者'),
+        sa.Column('create_time', sa.DateTime(), nullable=True, comment='创建时间'),
+        sa.Column('update_by', sa.String(length=64), server_default='', nullable=True, comment='更新者'),
+        sa.Column('update_time', sa.DateTime(), nullable=True, comment='更新时间'),
+        sa.Column('remark', sa.String(length=500), nullable=True, comment='备注'),
+        sa.PrimaryKeyConstraint('role_id'),
+        comment='角色信息表',
+    )
+
+
+def _create_sys_role_dept() -> None:
+    op.create_table(
+        'sys_role_dept',
+        sa.Column('role_id', sa.BigInteger(), nullable=False, comment='角色ID'),
+        sa.Column('dept_id', sa.BigInteger(), nullable=False, comment='部门ID'),
+        sa.PrimaryKeyConstraint('role_id', 'dept_id'),
+        comment='角色和部门关联表',
+    )
+
+
+def _create_sys_role_menu() -> None:
+    op.create_table(
+        'sys_role_menu',
+        sa.Column('role_id', sa.BigInteger(), nullable=False, comment='角色ID'),
+        sa.Column('menu_id', sa.BigInteger(), nullable=False, comment='菜单ID'),
+        sa.PrimaryKeyConstraint('role_id', 'menu_id'),
+        comment='角色和菜单关联表',
+    )
+
+
+def _create_sys_user() -> None:
+    op.create_table(
+        'sys_user',
+        sa.Column('user_id', sa.BigInteger(), autoincrement=True, nullable=False, comment='用户ID'),
+        sa.Column('dept_id', sa.BigInteger(), nullable=True, comment='部门ID'),
+        sa.Column('user_name', sa.String(length=30), nullable=False, comment='用户账号'),
+        sa.Column('nick_name', sa.String(length=30), nullable=False, comment='用户昵称'),
+        sa.Column(
+            'user_type', sa.String(length=2), server_default='00', nullable=True, comment='用户类型（00系统用户）'
+        ),
+        sa.Column('email', sa.String(length=50), server_default='', nullable=True, comment='用户邮箱'),
+        sa.Column('phonenumber', sa.String(length=11), server_default='', nullable=True, comment='手机号码'),
+        sa.Column('sex', sa.CHAR(length=1), server_default='0', nullable=True, comment='用户性别（0男 1女 2未知）'),
+        sa.Column('avatar', sa.String(length=100), server_default='', nullable=True, comment='头像地址'),
+        sa.Column('password', sa.String(length=100), server_default='', nullable=True, comment='密码'),
+        sa.Column('status', sa.CHAR(length=1), server_default='0', nullable=True, comment='帐号状态（0正常 1停用）'),
+        sa.Column(
+            'del_flag', sa.CHAR(length=1), server_default='0', nullable=True, comment='删除标志（0代表存在 2代表删除）'
+        ),
+        sa.Column('login_ip', sa.String(length=128), server_default='', nullable=True, comment='最后登录IP'),
+        sa.Column('login_date', sa.DateTime(), nullable=True, comment='最后登录时间'),
+        sa.Column('pwd_update_date', sa.DateTime(), nullable=True, comment='密码最后更新时间'),
+        sa.Column('create_by', sa.String(length=64), server_default='', nullable=True, comment='创建者'),
+        sa.Column('create_time', sa.DateTime(), nullable=True, comment='创建时间'),
+        sa.Column('update_by', sa.String(length=64), server_default='', nullable=True, comment='更新者'),
+        sa.Column('update_time', sa.DateTime(), nullable=True, comment='更新时间'),
+        sa.Column('remark', sa.String(length=500), nullable=True, comment='备注'),
+        sa.Column('access_key', sa.String(length=255), nullable=True, comment='卡密'),
+        sa.PrimaryKeyConstraint('user_id'),
+        comment='用户信息表',
+    )
+
+
+def _create_sys_user_post() -> None:
+    op.create_table(
+        'sys_user_post',
+        sa.Column('user_id', sa.BigInteger(), nullable=False, comment='用户ID'),
+        sa.Column('post_id', sa.BigInteger(), nullable=False, comment='岗位ID'),
+        sa.PrimaryKeyConstraint('user_id', 'post_id'),
+        comment='用户与岗位关联表',
+    )
+
+
+def _create_sys_user_role() -> None:
+    op.create_table(
+        'sys_user_role',
+        sa.Column('user_id', sa.BigInteger(), nullable=False, comment='用户ID'),
+        sa.Column('role_id', sa.BigInteger(), nullable=False, comment='角色ID'),
+        sa.PrimaryKeyConstraint('user_id', 'role_id'),
+        comment='用户和角色关联表',
+    )
+
+
+# 引入迁移前已存在的全部基础表及其建表方法，按创建顺序排列，删除时逆序执行
+BASELINE_TABLES: list[tuple[str, Callable[[], None]]] = [
+    ('dd_real_business_overview', _create_dd_real_business_overview),
+    ('dd_real_hourly_trend', _create_dd_real_hourly_trend),
+    ('dd_real_income_expenditure_overview', _create_dd_real_income_expenditure_overview),
+    ('dvd_access_key', _create_dvd_access_key),
+    ('dvd_account_store_relation', _create_dvd_account_store_relation),
+    ('dvd_config_menu', _create_dvd_config_menu),
+    ('dvd_crawl_account_info', _create_dvd_crawl_account_info),
+    ('qf_order_list', _create_qf_order_list),
+    ('qf_overview', _create_qf_overview),
+    ('qf_realtime_metrics', _create_qf_realtime_metrics),
+    ('qf_realtime_trend', _create_qf_realtime_trend),
+    ('sys_config', _create_sys_config),
+    ('sys_dept', _create_sys_dept),
+    ('sys_dict_data', _create_sys_dict_data),
+    ('sys_dict_type', _create_sys_dict_type),
+    ('sys_logininfor', _create_sys_logininfor),
+    ('sys_menu', _create_sys_menu),
+    ('sys_notice', _create_sys_notice),
+    ('sys_oper_log', _create_sys_oper_log),
+    ('sys_post', _create_sys_post),
+    ('sys_role', _create_sys_role),
+    ('sys_role_dept', _create_sys_role_dept),
+    ('sys_role_menu', _create_sys_role_menu),
+    ('sys_user', _create_sys_user),
+    ('sys_user_post', _create_sys_user_post),
+    ('sys_user_role', _create_sys_user_role),
+]
+
+
+def _existing_tables() -> set[str]:
+    """获取已存在的表，引入迁移前部署的数据库已由建表脚本或create_all创建基础表"""
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    existing_tables = _existing_tables()
+    for table_name, create_table in BASELINE_TABLES:
+        if table_name not in existing_tables:
+            create_table()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    existing_tables = _existing_tables()
+    for table_name, _ in reversed(BASELINE_TABLES):
+        if table_name in existing_tables:
+            op.drop_table(table_name)
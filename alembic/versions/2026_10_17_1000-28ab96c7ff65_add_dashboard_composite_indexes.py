@@ -0,0 +1,80 @@
+"""add dashboard composite indexes
+
+Revision ID: 28ab96c7ff65
+Revises: b0de7abe37f2
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '28ab96c7ff65'
+down_revision: Union[str, Sequence[str], None] = 'b0de7abe37f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 表名 -> [(索引名, 索引列)]，与各DO模型中的Index声明保持一致
+DASHBOARD_INDEXES: dict[str, list[tuple[str, list[str]]]] = {
+    'qf_overview': [
+        ('idx_qf_overview_cd_sn', ['collect_date', 'store_name']),
+        ('idx_qf_overview_ut', ['update_time']),
+    ],
+    'qf_realtime_trend': [
+        ('idx_qf_realtime_trend_cd_sn_dtm', ['collect_date', 'store_name', 'dtm']),
+        ('idx_qf_realtime_trend_ut', ['update_time']),
+    ],
+    'qf_realtime_metrics': [
+        ('idx_qf_realtime_metrics_cd_sn', ['collect_date', 'store_name']),
+        ('idx_qf_realtime_metrics_sn', ['store_name']),
+    ],
+    'qf_order_list': [
+        ('idx_qf_order_list_cd_sn_pid', ['collect_date', 'store_name', 'package_id']),
+        ('idx_qf_order_list_cd_sku', ['collect_date', 'sku_id']),
+    ],
+    'dd_real_business_overview': [
+        ('idx_dd_real_business_overview_cd_sid', ['collect_date', 'store_id']),
+        ('idx_dd_real_business_overview_sn_sid', ['store_name', 'store_id']),
+    ],
+    'dd_real_hourly_trend': [
+        ('idx_dd_real_hourly_trend_cd_sid_id_h', ['collect_date', 'store_id', 'index_display', 'hour']),
+        ('idx_dd_real_hourly_trend_cd_in_id', ['collect_date', 'index_name', 'index_display']),
+    ],
+    'dd_real_income_expenditure_overview': [
+        ('idx_dd_real_income_expenditure_overview_cd_sid', ['collect_date', 'store_id']),
+    ],
+}
+
+
+def _existing_indexes() -> dict[str, set[str]]:
+    """获取已存在的表及其索引，表可能由应用启动时的create_all创建并已带有索引"""
+    inspector = sa.inspect(op.get_bind())
+    return {
+        table_name: {index['name'] for index in inspector.get_indexes(table_name)}
+        for table_name in inspector.get_table_names()
+        if table_name in DASHBOARD_INDEXES
+    }
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    existing_indexes = _existing_indexes()
+    for table_name, indexes in DASHBOARD_INDEXES.items():
+        if table_name not in existing_indexes:
+            continue
+        for index_name, columns in indexes:
+            if index_name not in existing_indexes[table_name]:
+                op.create_index(index_name, table_name, columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    existing_indexes = _existing_indexes()
+    for table_name, indexes in DASHBOARD_INDEXES.items():
+        for index_name, _ in indexes:
+            if index_name in existing_indexes.get(table_name, set()):
+                op.drop_index(index_name, table_name=table_name)
@@ -0,0 +1,53 @@
+"""add crawl account list indexes
+
+Revision ID: 5d3f8a1c9b20
+Revises: 28ab96c7ff65
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5d3f8a1c9b20'
+down_revision: Union[str, Sequence[str], None] = '28ab96c7ff65'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLE_NAME = 'dvd_crawl_account_info'
+# [(索引名, 索引列)]，与DvdCrawlAccountInfo中的Index声明保持一致
+CRAWL_ACCOUNT_INDEXES: list[tuple[str, list[str]]] = [
+    ('idx_dvd_crawl_account_info_ct_id', ['create_time', 'id']),
+    ('idx_dvd_crawl_account_info_pid_prid_ct_id', ['platform_id', 'product_id', 'create_time', 'id']),
+    ('idx_dvd_crawl_account_info_acc', ['account']),
+]
+
+
+def _existing_indexes() -> Union[set[str], None]:
+    """获取账号表已存在的索引，表不存在时返回None"""
+    inspector = sa.inspect(op.get_bind())
+    if TABLE_NAME not in inspector.get_table_names():
+        return None
+    return {index['name'] for index in inspector.get_indexes(TABLE_NAME)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    existing_indexes = _existing_indexes()
+    if existing_indexes is None:
+        return
+    for index_name, columns in CRAWL_ACCOUNT_INDEXES:
+        if index_name not in existing_indexes:
+            op.create_index(index_name, TABLE_NAME, columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    existing_indexes = _existing_indexes() or set()
+    for index_name, _ in CRAWL_ACCOUNT_INDEXES:
+        if index_name in existing_indexes:
+            op.drop_index(index_name, table_name=TABLE_NAME)
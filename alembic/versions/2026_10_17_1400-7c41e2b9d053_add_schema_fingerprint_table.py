@@ -0,0 +1,46 @@
+"""add schema fingerprint table
+
+Revision ID: 7c41e2b9d053
+Revises: 5d3f8a1c9b20
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '7c41e2b9d053'
+down_revision: Union[str, Sequence[str], None] = '5d3f8a1c9b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLE_NAME = 'sys_schema_fingerprint'
+
+
+def _table_exists() -> bool:
+    """表结构指纹表是否已存在（fingerprint模式启动时可能已由create_all创建）"""
+    return TABLE_NAME in sa.inspect(op.get_bind()).get_table_names()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if _table_exists():
+        return
+    op.create_table(
+        TABLE_NAME,
+        sa.Column('schema_name', sa.String(length=64), nullable=False, comment='表结构名称'),
+        sa.Column('fingerprint', sa.String(length=64), nullable=False, comment='表结构指纹'),
+        sa.Column('update_time', sa.DateTime(), nullable=True, comment='更新时间'),
+        sa.PrimaryKeyConstraint('schema_name'),
+        comment='表结构指纹表',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _table_exists():
+        op.drop_table(TABLE_NAME)
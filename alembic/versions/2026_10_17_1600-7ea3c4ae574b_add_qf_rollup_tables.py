@@ -0,0 +1,91 @@
+"""add qf rollup tables
+
+Revision ID: 7ea3c4ae574b
+Revises: 7c41e2b9d053
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '7ea3c4ae574b'
+down_revision: Union[str, Sequence[str], None] = '7c41e2b9d053'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TREND_TABLE_NAME = 'qf_realtime_trend_hourly_rollup'
+OVERVIEW_TABLE_NAME = 'qf_overview_daily_rollup'
+
+
+def _table_exists(table_name: str) -> bool:
+    """汇总表是否已存在（fingerprint模式启动时可能已由create_all创建）"""
+    return table_name in sa.inspect(op.get_bind()).get_table_names()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not _table_exists(TREND_TABLE_NAME):
+        op.create_table(
+            TREND_TABLE_NAME,
+            sa.Column('collect_date', sa.Date(), nullable=False, comment='采集时间'),
+            sa.Column(
+                'store_name',
+                sa.String(length=255),
+                server_default='',
+                nullable=False,
+                comment='店铺名称，空字符串表示未知店铺',
+            ),
+            sa.Column('hour', sa.Integer(), nullable=False, comment='时间点(0-23)'),
+            sa.Column('pay_net_amt', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='净支付金额'),
+            sa.Column('deal_order_cnt', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='成交订单数'),
+            sa.Column('card_click_cnt', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='商品卡片点击次数'),
+            sa.Column('source_update_time', sa.DateTime(), nullable=True, comment='源数据最后更新时间'),
+            sa.Column(
+                'update_time',
+                sa.DateTime(),
+                server_default=sa.text('CURRENT_TIMESTAMP'),
+                nullable=False,
+                comment='汇总时间',
+            ),
+            sa.PrimaryKeyConstraint('collect_date', 'store_name', 'hour'),
+            comment='千帆实时趋势小时汇总表',
+        )
+    if not _table_exists(OVERVIEW_TABLE_NAME):
+        op.create_table(
+            OVERVIEW_TABLE_NAME,
+            sa.Column('collect_date', sa.Date(), nullable=False, comment='采集时间'),
+            sa.Column(
+                'store_name',
+                sa.String(length=255),
+                server_default='',
+                nullable=False,
+                comment='店铺名称，空字符串表示未知店铺',
+            ),
+            sa.Column('pay_gmv', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='支付金额'),
+            sa.Column('note_pay_gmv', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='笔记支付金额'),
+            sa.Column('live_pay_gmv', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='直播支付金额'),
+            sa.Column('card_pay_gmv', sa.DECIMAL(precision=20, scale=4), nullable=True, comment='商卡支付金额'),
+            sa.Column('pay_pkg_cnt', sa.BigInteger(), nullable=True, comment='支付订单数'),
+            sa.Column('source_update_time', sa.DateTime(), nullable=True, comment='源数据最后更新时间'),
+            sa.Column(
+                'update_time',
+                sa.DateTime(),
+                server_default=sa.text('CURRENT_TIMESTAMP'),
+                nullable=False,
+                comment='汇总时间',
+            ),
+            sa.PrimaryKeyConstraint('collect_date', 'store_name'),
+            comment='千帆数据概览日汇总表',
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table_name in (OVERVIEW_TABLE_NAME, TREND_TABLE_NAME):
+        if _table_exists(table_name):
+            op.drop_table(table_name)
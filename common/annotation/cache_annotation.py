@@ -0,0 +1,130 @@
+from collections.abc import Awaitable
+from datetime import date
+from functools import wraps
+from typing import Callable, Literal, Optional, TypeVar
+
+from fastapi import Request, Response
+from typing_extensions import ParamSpec
+
+from common.annotation.log_annotation import get_function_parameters_name_by_type, get_function_parameters_value_by_name
+from utils.compress_util import CompressUtil
+from utils.dashboard_cache_util import DashboardCacheUtil
+from utils.etag_util import ETagUtil
+
+P = ParamSpec('P')
+R = TypeVar('R')
+
+
+class DashboardCache:
+    """
+    数据大屏结果缓存装饰器
+    """
+
+    def __init__(
+        self,
+        platform: Literal['qf', 'dd'],
+        today_expire: int = 10,
+        history_expire: int = 86400,
+        date_param: Optional[str] = 'target_date',
+        store_param: Optional[str] = 'store_name',
+    ) -> None:
+        """
+        数据大屏结果缓存装饰器
+
+        :param platform: 平台标识（qf千帆 dd抖店），用于按平台清除缓存
+        :param today_expire: 当天及未指定日期数据的缓存过期时间（秒）
+        :param history_expire: 历史日期数据的缓存过期时间（秒）
+        :param date_param: 日期查询参数名称，为None时表示接口固定查询最新日期的数据
+        :param store_param: 店铺筛选查询参数名称
+        :return:
+        """
+        self.platform = platform
+        self.today_expire = today_expire
+        self.history_expire = history_expire
+        self.date_param = date_param
+        self.store_param = store_param
+
+    def __call__(self, func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            request_name_list = get_function_parameters_name_by_type(func, Request)
+            request: Request = get_function_parameters_value_by_name(func, request_name_list[0], *args, **kwargs)
+            collect_date, expire = self._get_collect_date_and_expire(request)
+            # 日期参数格式错误时不走缓存，交由原始函数处理
+            if collect_date is None:
+                return await func(*args, **kwargs)
+
+            redis = request.app.state.redis
+            cache_key = DashboardCacheUtil.build_cache_key(
+                self.platform,
+                collect_date,
+                request.query_params.get(self.store_param) if self.store_param else None,
+                request.url.path,
+                dict(request.query_params),
+            )
+            # 缓存内容的ETag与请求匹配时直接返回304，无需读取缓存内容
+            etag = await DashboardCacheUtil.get_etag(redis, cache_key)
+            if etag is not None and ETagUtil.is_not_modified(request, etag):
+                return ETagUtil.not_modified_response(etag)
+
+            headers = {'X-Dashboard-Cache': 'HIT', 'Cache-Control': ETagUtil.cache_control}
+            if etag is not None:
+                headers['ETag'] = etag
+            if CompressUtil.accepts_encoding(
+                request.headers.get('accept-encoding', ''), DashboardCacheUtil.compressed_encoding
+            ):
+                compressed = await DashboardCacheUtil.get_compressed_cache(redis, cache_key)
+                if compressed is not None:
+                    # 预压缩内容直接返回，压缩中间件遇到已设置Content-Encoding的响应不会重复压缩；
+                    # 压缩内容与原始内容字节不同，使用弱ETag
+                    if etag is not None:
+                        headers['ETag'] = ETagUtil.weaken(etag)
+                    return Response(
+                        content=compressed,
+                        media_type='application/json',
+                        headers={
+                            **headers,
+                            'Content-Encoding': DashboardCacheUtil.compressed_encoding,
+                            'Vary': 'Accept-Encoding',
+                        },
+                    )
+            cached = await DashboardCacheUtil.get_cache(redis, cache_key)
+            if cached is None:
+                async with DashboardCacheUtil.single_flight(redis, cache_key) as is_rebuilder:
+                    # 同进程内排队等待期间，缓存可能已被前一个请求重建
+                    cached = await DashboardCacheUtil.get_cache(redis, cache_key)
+                    if cached is None and not is_rebuilder:
+                        cached = await DashboardCacheUtil.wait_for_cache(redis, cache_key)
+                    if cached is None:
+                        result = await func(*args, **kwargs)
+                        etag = await DashboardCacheUtil.set_cache(redis, cache_key, expire, result)
+                        if etag is not None:
+                            # 缓存过期后重建的数据未变化时ETag不变，仍可返回304
+                            if ETagUtil.is_not_modified(request, etag):
+                                return ETagUtil.not_modified_response(etag)
+                            ETagUtil.set_etag(result, etag)
+                        return result
+
+            return Response(content=cached, media_type='application/json', headers=headers)
+
+        return wrapper
+
+    def _get_collect_date_and_expire(self, request: Request) -> tuple[Optional[str], int]:
+        """
+        获取请求对应的数据日期及缓存过期时间
+
+        :param request: Request对象
+        :return: 数据日期及缓存过期时间
+        """
+        if self.date_param is None:
+            return 'latest', self.today_expire
+        target_date = request.query_params.get(self.date_param)
+        today = date.today()
+        if not target_date:
+            return today.isoformat(), self.today_expire
+        try:
+            date_obj = date.fromisoformat(target_date)
+        except ValueError:
+            return None, self.today_expire
+
+        return date_obj.isoformat(), self.history_expire if date_obj < today else self.today_expire
@@ -0,0 +1,55 @@
+from collections.abc import Awaitable, Sequence
+from functools import wraps
+from typing import Callable, TypeVar
+
+from fastapi import Request, Response
+from typing_extensions import ParamSpec
+
+from common.annotation.log_annotation import get_function_parameters_name_by_type, get_function_parameters_value_by_name
+from common.context import RequestContext
+from utils.etag_util import ETagUtil
+
+P = ParamSpec('P')
+R = TypeVar('R')
+
+
+class ConditionalGet:
+    """
+    条件请求装饰器
+    """
+
+    principal_version_name = 'principal'
+
+    def __init__(self, version_names: Sequence[str] = (), per_user: bool = False) -> None:
+        """
+        条件请求装饰器
+
+        :param version_names: 接口数据依赖的数据版本名称列表
+        :param per_user: 接口数据是否与当前用户相关，为True时ETag包含当前用户id及其登录用户信息缓存版本
+        :return:
+        """
+        self.version_names = version_names
+        self.per_user = per_user
+
+    def __call__(self, func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            request_name_list = get_function_parameters_name_by_type(func, Request)
+            request: Request = get_function_parameters_value_by_name(func, request_name_list[0], *args, **kwargs)
+            version_names = [*self.version_names, self.principal_version_name] if self.per_user else self.version_names
+            versions = await ETagUtil.get_versions(request.app.state.redis, version_names)
+            if self.per_user:
+                # 登录用户信息缓存版本在令牌校验时已读取，角色、菜单等变更均会递增该版本；
+                # 该版本为普通计数，redis清空后会从0重新开始，需同时使用principal数据版本的纪元区分
+                current_user = RequestContext.get_current_user()
+                versions.extend([str(current_user.user.user_id), RequestContext.get_current_principal_version()])
+            etag = ETagUtil.build_request_etag(request, *versions)
+            if ETagUtil.is_not_modified(request, etag):
+                return ETagUtil.not_modified_response(etag)
+
+            result = await func(*args, **kwargs)
+            if isinstance(result, Response):
+                ETagUtil.set_etag(result, etag)
+            return result
+
+        return wrapper
@@ -6,11 +6,8 @@ from datetime import datetime
 from functools import wraps
 from typing import Any, Callable, Literal, Optional, TypeVar
 
-import httpx
-from async_lru import alru_cache
 from fastapi import Request
 from fastapi.responses import JSONResponse, ORJSONResponse, UJSONResponse
-from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.status import HTTP_200_OK
 from typing_extensions import ParamSpec
 from user_agents import parse
@@ -20,8 +17,9 @@ from common.enums import BusinessType
 from config.env import AppConfig
 from exceptions.exception import LoginException, ServiceException, ServiceWarning
 from module_admin.entity.vo.log_vo import LogininforModel, OperLogModel
-from module_admin.service.log_service import LoginLogService, OperationLogService
+from module_admin.service.log_writer_service import LogWriterService
 from utils.dependency_util import DependencyUtil
+from utils.ip_location_util import IpLocationUtil
 from utils.log_util import logger
 from utils.response_util import ResponseUtil
 
@@ -63,8 +61,6 @@ class Log:
             request_name_list = get_function_parameters_name_by_type(func, Request)
             request = get_function_parameters_value_by_name(func, request_name_list[0], *args, **kwargs)
             DependencyUtil.check_exclude_routes(request, err_msg='当前路由不在认证规则内，不可使用Log装饰器')
-            session_name_list = get_function_parameters_name_by_type(func, AsyncSession)
-            query_db = get_function_parameters_value_by_name(func, session_name_list[0], *args, **kwargs)
             request_method = request.method
             user_agent = request.headers.get('User-Agent')
             # 获取操作类型
@@ -74,7 +70,7 @@ class Log:
             # 获取请求ip
             oper_ip = request.headers.get('X-Forwarded-For')
             # 获取请求ip归属区域
-            oper_location = await self._get_oper_location(oper_ip)
+            oper_location = await self._get_oper_location(request, oper_ip)
             # 获取请求参数
             oper_param = await self._get_request_params(request)
             # 日志表请求参数字段长度最大为2000，因此在此处判断长度
@@ -103,10 +99,9 @@ class Log:
             request_from_swagger, request_from_redoc = self._is_request_from_swagger_or_redoc(request)
             # 根据响应结果的类型使用不同的方法获取响应结果参数
             result_dict = self._get_result_dict(result, request_from_swagger, request_from_redoc)
-            json_result = json.dumps(result_dict, ensure_ascii=False)
             # 根据响应结果获取响应状态及异常信息
             status, error_msg = self._get_status_and_error_msg(result_dict)
-            # 根据日志类型向对应的日志表插入数据
+            # 根据日志类型将日志放入对应日志表的写入队列，由后台任务批量写入
             if self.log_type == 'login':
                 # 登录请求来自于api文档时不记录登录日志，其余情况则记录
                 if request_from_swagger or request_from_redoc:
@@ -122,7 +117,7 @@ class Log:
                         }
                     )
 
-                    await LoginLogService.add_login_log_services(query_db, LogininforModel(**login_log))
+                    LogWriterService.add_login_log(LogininforModel(**login_log))
             else:
                 current_user = RequestContext.get_current_user()
                 oper_name = current_user.user.user_name
@@ -139,13 +134,12 @@ class Log:
                     operIp=oper_ip,
                     operLocation=oper_location,
                     operParam=oper_param,
-                    jsonResult=json_result,
                     status=status,
                     errorMsg=error_msg,
                     operTime=oper_time,
                     costTime=int(cost_time),
                 )
-                await OperationLogService.add_operation_log_services(query_db, operation_log)
+                LogWriterService.add_operation_log(operation_log, result_dict)
 
             return result
 
@@ -182,16 +176,17 @@ class Log:
 
         return operator_type
 
-    async def _get_oper_location(self, oper_ip: str) -> str:
+    async def _get_oper_location(self, request: Request, oper_ip: str) -> str:
         """
         获取请求IP归属区域
 
+        :param request: Request对象
         :param oper_ip: 请求IP
         :return: 请求IP归属区域
         """
         oper_location = '内网IP'
         if AppConfig.app_ip_location_query:
-            oper_location = await get_ip_location(oper_ip)
+            oper_location = await IpLocationUtil.get_ip_location(request.app.state.redis, oper_ip)
 
         return oper_location
 
@@ -346,31 +341,6 @@ class Log:
         return result_dict
 
 
-@alru_cache()
-async def get_ip_location(oper_ip: str) -> str:
-    """
-    查询ip归属区域
-
-    :param oper_ip: 需要查询的ip
-    :return: ip归属区域
-    """
-    oper_location = '内网IP'
-    try:
-        if oper_ip not in ['127.0.0.1', 'localhost']:
-            oper_location = '未知'
-            async with httpx.AsyncClient() as client:
-                ip_result = await client.get(f'https://qifu-api.baidubce.com/ip/geo/v1/district?ip={oper_ip}')
-                if ip_result.status_code == HTTP_200_OK:
-                    prov = ip_result.json().get('data', {}).get('prov')
-                    city = ip_result.json().get('data', {}).get('city')
-                    if prov or city:
-                        oper_location = f'{prov}-{city}'
-    except Exception as e:
-        oper_location = '未知'
-        print(e)
-    return oper_location
-
-
 def get_function_parameters_name_by_type(func: Callable, param_type: Any) -> list:
     """
     获取函数指定类型的参数名称
@@ -16,6 +16,8 @@ current_exclude_patterns: ContextVar[
 ] = ContextVar('current_exclude_patterns', default=None)
 # 存储当前用户信息
 current_user: ContextVar[Optional[CurrentUserModel]] = ContextVar('current_user', default=None)
+# 存储当前用户信息的缓存版本
+current_principal_version: ContextVar[Optional[str]] = ContextVar('current_principal_version', default=None)
 
 
 class RequestContext:
@@ -73,6 +75,25 @@ class RequestContext:
             raise LoginException(data='', message='当前用户信息为空，请检查是否已登录')
         return _current_user
 
+    @staticmethod
+    def set_current_principal_version(version: str) -> Token:
+        """
+        设置当前用户信息的缓存版本
+
+        :param version: 缓存版本
+        :return: 上下文变量令牌，用于重置
+        """
+        return current_principal_version.set(version)
+
+    @staticmethod
+    def get_current_principal_version() -> Optional[str]:
+        """
+        获取当前用户信息的缓存版本
+
+        :return: 缓存版本，未登录时为None
+        """
+        return current_principal_version.get()
+
     @staticmethod
     def reset_current_exclude_patterns(token: Token) -> None:
         """
@@ -98,3 +119,4 @@ class RequestContext:
         """
         current_exclude_patterns.set(None)
         current_user.set(None)
+        current_principal_version.set(None)
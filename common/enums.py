@@ -50,3 +50,13 @@ class RedisInitKeyConfig(Enum):
     ACCOUNT_LOCK = {'key': 'account_lock', 'remark': '用户锁定'}
     PASSWORD_ERROR_COUNT = {'key': 'password_error_count', 'remark': '密码错误次数'}
     SMS_CODE = {'key': 'sms_code', 'remark': '短信验证码'}
+    DASHBOARD_CACHE = {'key': 'dashboard_cache', 'remark': '数据大屏缓存'}
+    DD_LATEST_COLLECT_DATE = {'key': 'dd_latest_collect_date', 'remark': '抖店最新采集日期'}
+    PRINCIPAL_CACHE = {'key': 'principal_cache', 'remark': '登录用户信息'}
+    PRINCIPAL_VERSION = {'key': 'principal_version', 'remark': '登录用户信息版本'}
+    IP_LOCATION = {'key': 'ip_location', 'remark': 'IP归属区域'}
+    QRCODE_WATCH = {'key': 'qrcode_watch', 'remark': '二维码扫码状态'}
+    COOKIE_HEALTH = {'key': 'cookie_health', 'remark': '采集账号cookies检测'}
+    CRAWL_ACCOUNT_COUNT = {'key': 'crawl_account_count', 'remark': '采集账号总数'}
+    DATA_VERSION = {'key': 'data_version', 'remark': '响应数据版本'}
+    QF_ROLLUP = {'key': 'qf_rollup', 'remark': '千帆汇总表刷新'}
@@ -1,4 +1,6 @@
+import ast
 import importlib
+import inspect
 import os
 import sys
 from collections.abc import Sequence
@@ -15,6 +17,9 @@ from starlette.routing import BaseRoute
 from starlette.types import ASGIApp, Lifespan
 from typing_extensions import deprecated
 
+from config.env import AppConfig
+from utils.import_profile_util import ImportProfiler
+
 
 class APIRouterPro(APIRouter):
     """
@@ -287,15 +292,38 @@ class APIRouterPro(APIRouter):
 class RouterRegister:
     """
     路由注册器，用于自动注册所有controller目录下的路由
+
+    启用路由清单时按构建期生成的路由清单（common/router_manifest.py）导入controller模块，无需在每个worker启动时遍历项目目录；
+    未启用路由清单（开发环境）或路由清单不存在、与controller目录下的文件不一致时，遍历项目目录查找controller模块
     """
 
-    def __init__(self, app: FastAPI) -> None:
+    # 遍历项目目录时跳过的目录，隐藏目录及包含pyvenv.cfg的虚拟环境目录同样跳过
+    exclude_dirs = {
+        '__pycache__',
+        'venv',
+        'env',
+        'node_modules',
+        'logs',
+        'vf_admin',
+        'assets',
+        'sql',
+        'test',
+        'alembic',
+    }
+    manifest_module = 'common.router_manifest'
+    manifest_file = os.path.join(os.path.dirname(__file__), 'router_manifest.py')
+
+    def __init__(self, app: FastAPI, use_manifest: bool = False, profile_imports: bool = False) -> None:
         """
         初始化路由注册器
 
         :param app: FastAPI对象
+        :param use_manifest: 是否按路由清单注册路由
+        :param profile_imports: 是否统计并输出controller模块的导入耗时
         """
         self.app = app
+        self.use_manifest = use_manifest
+        self.profiler = ImportProfiler(enabled=profile_imports)
         # 获取项目根目录
         self.project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
         sys.path.insert(0, self.project_root)
@@ -308,16 +336,34 @@ class RouterRegister:
         """
         controller_files = []
         # 遍历所有目录，查找controller目录
-        for root, _dirs, files in os.walk(self.project_root):
+        for root, dirs, files in os.walk(self.project_root):
+            # 跳过虚拟环境、日志、上传文件等不包含controller的目录
+            dirs[:] = sorted(
+                d
+                for d in dirs
+                if d not in self.exclude_dirs
+                and not d.startswith('.')
+                and not os.path.exists(os.path.join(root, d, 'pyvenv.cfg'))
+            )
             # 检查当前目录是否为controller目录
             if os.path.basename(root) == 'controller':
                 # 遍历controller目录下的所有py文件
-                for file in files:
+                for file in sorted(files):
                     if file.endswith('.py') and not file.startswith('__'):
                         file_path = os.path.join(root, file)
                         controller_files.append(file_path)
         return controller_files
 
+    def _get_module_name(self, file_path: str) -> str:
+        """
+        根据py文件路径计算模块路径
+
+        :param file_path: py文件路径
+        :return: 模块路径
+        """
+        relative_path = os.path.relpath(file_path, self.project_root)
+        return relative_path.replace(os.sep, '.')[:-3]
+
     def _import_module_and_get_routers(self, controller_files: list[str]) -> list[tuple[str, APIRouter]]:
         """
         导入模块并获取路由实例
@@ -328,12 +374,12 @@ class RouterRegister:
         routers = []
         for file_path in controller_files:
             # 计算模块路径
-            relative_path = os.path.relpath(file_path, self.project_root)
-            module_name = relative_path.replace(os.sep, '.')[:-3]
+            module_name = self._get_module_name(file_path)
 
             try:
                 # 动态导入模块
-                module = importlib.import_module(module_name)
+                with self.profiler.measure(module_name):
+                    module = importlib.import_module(module_name)
                 # 遍历模块属性，寻找APIRouter和APIRouterPro实例
                 for attr_name in dir(module):
                     attr = getattr(module, attr_name)
@@ -348,6 +394,82 @@ class RouterRegister:
                 print(f'Error importing module {module_name}: {e}')
         return routers
 
+    def _load_manifest(self) -> Optional[list[tuple[str, str, Optional[int]]]]:
+        """
+        加载路由清单，路由清单不存在或其中的controller目录下有新增、删除的文件时返回None
+
+        :return: 路由清单
+        """
+        try:
+            manifest: list[tuple[str, str, Optional[int]]] = importlib.import_module(
+                self.manifest_module
+            ).ROUTER_MANIFEST
+        except ImportError:
+            print('Router manifest not found, falling back to directory scan')
+            return None
+
+        manifest_modules = {module_name for module_name, _attr_name, _order_num in manifest}
+        controller_dirs = {
+            os.path.join(self.project_root, *module_name.split('.')[:-1]) for module_name in manifest_modules
+        }
+        controller_modules = {
+            self._get_module_name(entry.path)
+            for controller_dir in controller_dirs
+            if os.path.isdir(controller_dir)
+            for entry in os.scandir(controller_dir)
+            if entry.is_file() and entry.name.endswith('.py') and not entry.name.startswith('__')
+        }
+        if controller_modules != manifest_modules:
+            print('Router manifest is out of date, falling back to directory scan')
+            return None
+        return manifest
+
+    def _import_manifest_routers(self, manifest: list[tuple[str, str, Optional[int]]]) -> list[tuple[str, APIRouter]]:
+        """
+        按路由清单导入模块并获取路由实例
+
+        :param manifest: 路由清单
+        :return: 路由实例列表
+        """
+        routers = [
+            (attr_name, self._import_manifest_router(module_name, attr_name))
+            for module_name, attr_name, _order_num in manifest
+        ]
+        return [(attr_name, router) for attr_name, router in routers if router is not None]
+
+    def _import_manifest_router(self, module_name: str, attr_name: str) -> Optional[APIRouter]:
+        """
+        导入路由清单中的模块并获取路由实例
+
+        :param module_name: 模块路径
+        :param attr_name: 路由变量名
+        :return: 路由实例，导入失败时返回None
+        """
+        try:
+            with self.profiler.measure(module_name):
+                module = importlib.import_module(module_name)
+            return getattr(module, attr_name)
+        except Exception as e:
+            print(f'Error importing module {module_name}: {e}')
+            return None
+
+    @staticmethod
+    def _sort_key(
+        attr_name: str, order_num: Optional[int]
+    ) -> Union[tuple[Literal[0], int, str], tuple[Literal[1], str]]:
+        """
+        路由排序规则
+
+        :param attr_name: 路由变量名
+        :param order_num: APIRouterPro实例的序号，APIRouter实例为None
+        :return: 排序键
+        """
+        # APIRouterPro实例按order_num排序，序号越小越靠前
+        if order_num is not None:
+            return (0, order_num, attr_name)
+        # APIRouter实例按变量名首字母排序
+        return (1, attr_name)
+
     def _sort_routers(self, routers: list[tuple[str, APIRouter]]) -> list[tuple[str, APIRouter]]:
         """
         按规则排序路由
@@ -355,17 +477,10 @@ class RouterRegister:
         :param routers: 路由实例列表
         :return: 排序后的路由实例列表
         """
-
-        # 按规则排序路由
-        def sort_key(item: tuple[str, APIRouter]) -> Union[tuple[Literal[0], int, str], tuple[Literal[1], str]]:
-            attr_name, router = item
-            # APIRouterPro实例按order_num排序，序号越小越靠前
-            if isinstance(router, APIRouterPro):
-                return (0, router.order_num, attr_name)
-            # APIRouter实例按变量名首字母排序
-            return (1, attr_name)
-
-        return sorted(routers, key=sort_key)
+        return sorted(
+            routers,
+            key=lambda item: self._sort_key(item[0], item[1].order_num if isinstance(item[1], APIRouterPro) else None),
+        )
 
     def _register_routers_to_app(self, routers: list[tuple[str, APIRouter]]) -> None:
         """
@@ -383,14 +498,90 @@ class RouterRegister:
 
         :return: None
         """
-        # 查找所有controller目录下的py文件
-        controller_files = self._find_controller_files()
-        # 导入模块并获取路由实例
-        routers = self._import_module_and_get_routers(controller_files)
-        # 按规则排序路由
-        sorted_routers = self._sort_routers(routers)
+        manifest = self._load_manifest() if self.use_manifest else None
+        if manifest is not None:
+            # 路由清单已按注册顺序排列
+            sorted_routers = self._import_manifest_routers(manifest)
+        else:
+            # 查找所有controller目录下的py文件
+            controller_files = self._find_controller_files()
+            # 导入模块并获取路由实例
+            routers = self._import_module_and_get_routers(controller_files)
+            # 按规则排序路由
+            sorted_routers = self._sort_routers(routers)
         # 注册路由到FastAPI应用
-        self._register_routers_to_app(sorted_routers)
+        with self.profiler.measure('include_router'):
+            self._register_routers_to_app(sorted_routers)
+        self.profiler.report(f'路由注册（{"路由清单" if manifest is not None else "目录遍历"}）')
+
+    def _parse_controller_routers(self, file_path: str) -> list[tuple[str, Optional[int]]]:
+        """
+        解析controller文件中模块级定义的路由实例，无需导入模块
+
+        :param file_path: controller文件路径
+        :return: 路由变量名及序号列表，APIRouter实例的序号为None
+        """
+        router_params = inspect.signature(APIRouterPro.__init__).parameters
+        with open(file_path, encoding='utf-8') as f:
+            tree = ast.parse(f.read(), filename=file_path)
+        routers = []
+        for node in tree.body:
+            if not isinstance(node, (ast.Assign, ast.AnnAssign)) or not isinstance(node.value, ast.Call):
+                continue
+            func = node.value.func
+            class_name = func.id if isinstance(func, ast.Name) else getattr(func, 'attr', None)
+            if class_name not in ('APIRouterPro', 'APIRouter'):
+                continue
+            keywords = {keyword.arg: keyword.value for keyword in node.value.keywords if keyword.arg}
+            order_num = None
+            if class_name == 'APIRouterPro':
+                # order_num和auto_register需为字面量，否则无法在构建期确定注册顺序
+                if 'auto_register' in keywords:
+                    auto_register = ast.literal_eval(keywords['auto_register'])
+                else:
+                    auto_register = router_params['auto_register'].default
+                if not auto_register:
+                    continue
+                if 'order_num' in keywords:
+                    order_num = ast.literal_eval(keywords['order_num'])
+                else:
+                    order_num = router_params['order_num'].default
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            routers.extend((target.id, order_num) for target in targets if isinstance(target, ast.Name))
+        return routers
+
+    def build_manifest(self) -> list[tuple[str, str, Optional[int]]]:
+        """
+        遍历项目目录并解析controller文件，生成按注册顺序排列的路由清单
+
+        :return: 路由清单
+        """
+        manifest = [
+            (self._get_module_name(file_path), attr_name, order_num)
+            for file_path in self._find_controller_files()
+            for attr_name, order_num in self._parse_controller_routers(file_path)
+        ]
+        return sorted(manifest, key=lambda item: self._sort_key(item[1], item[2]))
+
+    def write_manifest(self) -> list[tuple[str, str, Optional[int]]]:
+        """
+        生成路由清单并写入common/router_manifest.py
+
+        :return: 路由清单
+        """
+        manifest = self.build_manifest()
+        lines = [
+            '# 本文件由 python -m common.router_manifest_builder 生成，请勿手动修改',
+            '# 新增、删除controller文件或修改路由的order_num、auto_register后需重新生成',
+            '# (模块路径, 路由变量名, 路由序号)，已按注册顺序排列，APIRouter实例的路由序号为None',
+            'ROUTER_MANIFEST = [',
+            *[f'    {entry!r},' for entry in manifest],
+            ']',
+            '',
+        ]
+        with open(self.manifest_file, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines))
+        return manifest
 
 
 def auto_register_routers(app: FastAPI) -> None:
@@ -401,5 +592,7 @@ def auto_register_routers(app: FastAPI) -> None:
     :return: None
     """
     # 使用路由注册器进行注册
-    router_register = RouterRegister(app)
+    router_register = RouterRegister(
+        app, use_manifest=AppConfig.app_router_manifest, profile_imports=AppConfig.app_import_profile
+    )
     router_register.register_routers()
@@ -0,0 +1,27 @@
+# 本文件由 python -m common.router_manifest_builder 生成，请勿手动修改
+# 新增、删除controller文件或修改路由的order_num、auto_register后需重新生成
+# (模块路径, 路由变量名, 路由序号)，已按注册顺序排列，APIRouter实例的路由序号为None
+ROUTER_MANIFEST = [
+    ('module_admin.controller.login_controller', 'login_controller', 1),
+    ('module_admin.controller.captcha_controller', 'captcha_controller', 2),
+    ('module_admin.controller.user_controller', 'user_controller', 3),
+    ('module_admin.controller.role_controller', 'role_controller', 4),
+    ('module_admin.controller.menu_controller', 'menu_controller', 5),
+    ('module_admin.controller.dept_controller', 'dept_controller', 6),
+    ('module_admin.controller.post_controller', 'post_controller', 7),
+    ('module_admin.controller.dict_controller', 'dict_controller', 8),
+    ('module_admin.controller.config_controller', 'config_controller', 9),
+    ('module_dvd.controller.access_key_controller', 'access_key_controller', 10),
+    ('module_admin.controller.notice_controller', 'notice_controller', 10),
+    ('module_admin.controller.log_controller', 'log_controller', 11),
+    ('module_admin.controller.online_controller', 'online_controller', 12),
+    ('module_admin.controller.server_controller', 'server_controller', 14),
+    ('module_admin.controller.cache_controller', 'cache_controller', 15),
+    ('module_admin.controller.common_controller', 'common_controller', 16),
+    ('module_dvd.controller.config_menu_controller', 'config_menu_controller', 20),
+    ('module_dvd.controller.dvd_account_controller', 'dvd_account_controller', 21),
+    ('module_dvd.controller.ingest_controller', 'ingest_controller', 22),
+    ('module_dvd.controller.dd_controller', 'dd_controller', 99),
+    ('module_dvd.controller.dvd_controller', 'dvd_controller', 99),
+    ('module_dvd.controller.qf_controller', 'qf_controller', 99),
+]
@@ -0,0 +1,19 @@
+"""
+路由清单生成脚本
+
+解析所有controller目录下的py文件，生成按注册顺序排列的路由清单common/router_manifest.py，
+生产环境启用APP_ROUTER_MANIFEST后按路由清单注册路由，无需在每个worker启动时遍历项目目录
+
+用法：python -m common.router_manifest_builder
+"""
+
+from fastapi import FastAPI
+
+from common.router import RouterRegister
+
+if __name__ == '__main__':
+    router_register = RouterRegister(FastAPI())
+    manifest = router_register.write_manifest()
+    for module_name, attr_name, order_num in manifest:
+        print(f'{order_num!s:>5}  {module_name}.{attr_name}')
+    print(f'已生成路由清单 {router_register.manifest_file}，共{len(manifest)}个路由')
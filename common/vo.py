@@ -91,12 +91,27 @@ class PageModel(BaseModel, Generic[T]):
     has_next: bool = Field(description='是否有下一页')
 
 
+class CursorPageModel(PageModel, Generic[T]):
+    """
+    游标分页模型
+    """
+
+    next_cursor: Optional[str] = Field(default=None, description='下一页游标，没有下一页时为空')
+    total_is_exact: bool = Field(default=True, description='总记录数是否为精确值')
+
+
 class PageResponseModel(PageModel, ResponseBaseModel, Generic[T]):
     """
     分页响应模型
     """
 
 
+class CursorPageResponseModel(CursorPageModel, ResponseBaseModel, Generic[T]):
+    """
+    游标分页响应模型
+    """
+
+
 class DataResponseModel(ResponseBaseModel, Generic[T]):
     """
     数据响应模型
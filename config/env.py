@@ -22,7 +22,15 @@ class AppSettings(BaseSettings):
     app_version: str = '1.0.0'
     app_reload: bool = True
     app_ip_location_query: bool = True
+    app_ip_location_db: str = ''
     app_same_time_login: bool = True
+    app_cookie_check_enabled: bool = True
+    app_cookie_check_interval_minutes: int = 60
+    app_cookie_check_dry_run: bool = False
+    app_qf_rollup_refresh_enabled: bool = True
+    app_qf_rollup_refresh_interval_minutes: int = 10
+    app_router_manifest: bool = False
+    app_import_profile: bool = False
 
 
 class JwtSettings(BaseSettings):
@@ -52,6 +60,7 @@ class DataBaseSettings(BaseSettings):
     db_pool_size: int = 50
     db_pool_recycle: int = 3600
     db_pool_timeout: int = 30
+    db_schema_mode: Literal['create_all', 'fingerprint', 'alembic'] = 'fingerprint'
 
     @computed_field
     @property
@@ -3,7 +3,9 @@ from collections.abc import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config.database import AsyncSessionLocal, Base, async_engine
+from config.env import DataBaseConfig
 from utils.log_util import logger
+from utils.schema_util import SchemaUtil
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -18,11 +20,10 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
 async def init_create_table() -> None:
     """
-    应用启动时初始化数据库连接
+    应用启动时初始化数据库连接，表结构指纹变化时按配置的方式初始化表结构
 
     :return:
     """
     logger.info('🔎 初始化数据库连接...')
-    async with async_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    await SchemaUtil.ensure_schema(async_engine, Base.metadata, DataBaseConfig.db_schema_mode)
     logger.info('✅️ 数据库连接成功')
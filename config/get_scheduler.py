@@ -0,0 +1,66 @@
+from datetime import datetime
+from typing import Optional
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+from redis import asyncio as aioredis
+
+from config.env import AppConfig
+from module_dvd.service.cookie_health_service import CookieHealthService
+from module_dvd.service.qf_rollup_service import QfRollupService
+from utils.log_util import logger
+
+
+class SchedulerUtil:
+    """
+    定时任务相关方法
+    """
+
+    _scheduler: Optional[AsyncIOScheduler] = None
+
+    @classmethod
+    async def init_system_scheduler(cls, redis: aioredis.Redis) -> None:
+        """
+        应用启动时启动定时任务调度器并注册系统定时任务
+
+        :param redis: redis对象
+        :return:
+        """
+        cls._scheduler = AsyncIOScheduler()
+        if AppConfig.app_cookie_check_enabled:
+            cls._scheduler.add_job(
+                CookieHealthService.scheduled_check_services,
+                IntervalTrigger(minutes=AppConfig.app_cookie_check_interval_minutes),
+                args=[redis, AppConfig.app_cookie_check_dry_run],
+                id='cookie_health_check',
+                name='采集账号cookies检测',
+                max_instances=1,
+                coalesce=True,
+                replace_existing=True,
+            )
+        if AppConfig.app_qf_rollup_refresh_enabled:
+            # 启动后立即执行一次，汇总表为空时完成回填
+            cls._scheduler.add_job(
+                QfRollupService.scheduled_refresh_services,
+                IntervalTrigger(minutes=AppConfig.app_qf_rollup_refresh_interval_minutes),
+                args=[redis],
+                id='qf_rollup_refresh',
+                name='千帆汇总表刷新',
+                next_run_time=datetime.now(),
+                max_instances=1,
+                coalesce=True,
+                replace_existing=True,
+            )
+        cls._scheduler.start()
+        logger.info('✅️ 系统定时任务启动成功')
+
+    @classmethod
+    async def close_system_scheduler(cls) -> None:
+        """
+        应用关闭时关闭定时任务调度器
+
+        :return:
+        """
+        if cls._scheduler and cls._scheduler.running:
+            cls._scheduler.shutdown(wait=False)
+        cls._scheduler = None
@@ -11,7 +11,7 @@ from exceptions.exception import (
     ServiceWarning,
 )
 from utils.log_util import logger
-from utils.response_util import JSONResponse, ResponseUtil, jsonable_encoder
+from utils.response_util import FastJSONResponse, ResponseUtil
 
 
 def handle_exception(app: FastAPI) -> None:
@@ -61,9 +61,7 @@ def handle_exception(app: FastAPI) -> None:
     # 处理其他http请求异常
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException) -> Response:
-        return JSONResponse(
-            content=jsonable_encoder({'code': exc.status_code, 'msg': exc.detail}), status_code=exc.status_code
-        )
+        return FastJSONResponse(content={'code': exc.status_code, 'msg': exc.detail}, status_code=exc.status_code)
 
     # 处理其他异常
     @app.exception_handler(Exception)
@@ -1,12 +1,141 @@
+from collections.abc import Sequence
+from typing import Optional
+
 from fastapi import FastAPI
-from starlette.middleware.gzip import GZipMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from utils.compress_util import CompressUtil, StreamCompressor
+
+
+class CompressionMiddleware:
+    """
+    自适应压缩中间件
+
+    根据响应大小和内容类型选择压缩编码及级别，已设置Content-Encoding的响应（如预压缩的数据大屏缓存）及文件下载接口直接透传
+    """
+
+    def __init__(self, app: ASGIApp, excluded_paths: Sequence[str] = ()) -> None:
+        self.app = app
+        self.excluded_paths = tuple(excluded_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or self._is_excluded(scope):
+            await self.app(scope, receive, send)
+            return
+
+        encoding = CompressUtil.select_encoding(Headers(scope=scope).get('accept-encoding', ''))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        await CompressionResponder(self.app, encoding)(scope, receive, send)
+
+    def _is_excluded(self, scope: Scope) -> bool:
+        """
+        判断请求路径是否为不压缩的路径
+
+        :param scope: ASGI scope
+        :return: 是否不压缩
+        """
+        if not self.excluded_paths:
+            return False
+        path = scope['path']
+        root_path = scope.get('root_path', '')
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path) :]
+
+        return path.startswith(self.excluded_paths)
+
+
+class CompressionResponder:
+    """
+    单个请求的响应压缩处理
+    """
+
+    def __init__(self, app: ASGIApp, encoding: str) -> None:
+        self.app = app
+        self.encoding = encoding
+        self.send: Send
+        self.initial_message: Message = {}
+        self.passthrough = False
+        self.started = False
+        self.content_length: Optional[int] = None
+        self.compressor: Optional[StreamCompressor] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_with_compression)
+
+    async def send_with_compression(self, message: Message) -> None:
+        message_type = message['type']
+        if message_type == 'http.response.start':
+            self.initial_message = message
+            headers = Headers(raw=message['headers'])
+            self.passthrough = 'content-encoding' in headers or not CompressUtil.is_compressible(
+                headers.get('content-type', '')
+            )
+            if self.passthrough:
+                await self.send(message)
+            elif headers.get('content-length', '').isdigit():
+                self.content_length = int(headers['content-length'])
+            return
+
+        if message_type != 'http.response.body' or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get('body', b'')
+        more_body = message.get('more_body', False)
+        if not self.started:
+            self.started = True
+            if not more_body:
+                # 完整响应一次性压缩，过小的响应压缩收益低于开销，直接返回
+                if len(body) < CompressUtil.minimum_size:
+                    await self.send(self.initial_message)
+                    await self.send(message)
+                    return
+                body = CompressUtil.compress(body, self.encoding)
+                headers = self._set_encoding_headers()
+                headers['Content-Length'] = str(len(body))
+                message['body'] = body
+                await self.send(self.initial_message)
+                await self.send(message)
+                return
+
+            # 流式响应逐块压缩，响应头中有Content-Length时据此选择压缩级别
+            self.compressor = CompressUtil.create_compressor(self.encoding, self.content_length)
+            headers = self._set_encoding_headers()
+            del headers['Content-Length']
+            await self.send(self.initial_message)
+
+        if self.compressor is None:
+            await self.send(message)
+            return
+        data = self.compressor.compress(body)
+        if not more_body:
+            data += self.compressor.finish()
+        message['body'] = data
+        await self.send(message)
+
+    def _set_encoding_headers(self) -> MutableHeaders:
+        """
+        设置压缩相关的响应头
+
+        :return: 响应头对象
+        """
+        headers = MutableHeaders(raw=self.initial_message['headers'])
+        headers['Content-Encoding'] = self.encoding
+        headers.add_vary_header('Accept-Encoding')
+
+        return headers
 
 
 def add_gzip_middleware(app: FastAPI) -> None:
     """
-    添加gzip压缩中间件
+    添加自适应压缩中间件
 
     :param app: FastAPI对象
     :return:
     """
-    app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=9)
+    app.add_middleware(CompressionMiddleware, excluded_paths=['/common/download'])
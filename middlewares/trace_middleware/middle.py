@@ -2,11 +2,15 @@ from functools import wraps
 
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from common.context import RequestContext
+
 from .span import Span, get_current_span
 
 
 class TraceASGIMiddleware:
     """
+    纯ASGI实现的trace中间件，为每个请求生成request-id，并在请求处理完成后清理上下文变量
+
     fastapi-example:
         app = FastAPI()
         app.add_middleware(TraceASGIMiddleware)
@@ -39,4 +43,8 @@ class TraceASGIMiddleware:
                 await span.response(message)
                 await send(message)
 
-            await self.app(scope, handle_outgoing_receive, handle_outgoing_request)
+            try:
+                await self.app(scope, handle_outgoing_receive, handle_outgoing_request)
+            finally:
+                # 请求处理完成后清理所有上下文变量
+                RequestContext.clear_all()
@@ -10,6 +10,7 @@ from module_admin.entity.vo.login_vo import CaptchaCode
 from module_admin.service.captcha_service import CaptchaService
 from utils.log_util import logger
 from utils.response_util import ResponseUtil
+from utils.sys_cache_util import SysCacheUtil
 
 captcha_controller = APIRouterPro(order_num=2, tags=['验证码模块'])
 
@@ -22,10 +23,10 @@ captcha_controller = APIRouterPro(order_num=2, tags=['验证码模块'])
 )
 async def get_captcha_image(request: Request) -> Response:
     captcha_enabled = (
-        await request.app.state.redis.get(f'{RedisInitKeyConfig.SYS_CONFIG.key}:sys.account.captchaEnabled') == 'true'
+        await SysCacheUtil.get_config(request.app.state.redis, 'sys.account.captchaEnabled') == 'true'
     )
     register_enabled = (
-        await request.app.state.redis.get(f'{RedisInitKeyConfig.SYS_CONFIG.key}:sys.account.registerUser') == 'true'
+        await SysCacheUtil.get_config(request.app.state.redis, 'sys.account.registerUser') == 'true'
     )
     session_id = str(uuid.uuid4())
     captcha_result = await CaptchaService.create_captcha_image_service()
@@ -19,6 +19,7 @@ from module_admin.entity.vo.dept_vo import DeleteDeptModel, DeptModel, DeptQuery
 from module_admin.entity.vo.user_vo import CurrentUserModel
 from module_admin.service.dept_service import DeptService
 from utils.log_util import logger
+from utils.principal_cache_util import PrincipalCacheUtil
 from utils.response_util import ResponseUtil
 
 dept_controller = APIRouterPro(
@@ -111,6 +112,7 @@ async def edit_system_dept(
     edit_dept.update_by = current_user.user.user_name
     edit_dept.update_time = datetime.now()
     edit_dept_result = await DeptService.edit_dept_services(query_db, edit_dept)
+    await PrincipalCacheUtil.bump_global_version(request.app.state.redis)
     logger.info(edit_dept_result.message)
 
     return ResponseUtil.success(msg=edit_dept_result.message)
@@ -140,6 +142,7 @@ async def delete_system_dept(
     delete_dept.update_by = current_user.user.user_name
     delete_dept.update_time = datetime.now()
     delete_dept_result = await DeptService.delete_dept_services(query_db, delete_dept)
+    await PrincipalCacheUtil.bump_global_version(request.app.state.redis)
     logger.info(delete_dept_result.message)
 
     return ResponseUtil.success(msg=delete_dept_result.message)
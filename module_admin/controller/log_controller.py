@@ -1,4 +1,4 @@
-from typing import Annotated
+from typing import Annotated, Literal
 
 from fastapi import Form, Path, Query, Request, Response
 from fastapi.responses import StreamingResponse
@@ -10,7 +10,7 @@ from common.aspect.interface_auth import UserInterfaceAuthDependency
 from common.aspect.pre_auth import PreAuthDependency
 from common.enums import BusinessType
 from common.router import APIRouterPro
-from common.vo import PageResponseModel, ResponseBaseModel
+from common.vo import DataResponseModel, PageResponseModel, ResponseBaseModel
 from module_admin.entity.vo.log_vo import (
     DeleteLoginLogModel,
     DeleteOperLogModel,
@@ -21,7 +21,8 @@ from module_admin.entity.vo.log_vo import (
     UnlockUser,
 )
 from module_admin.service.log_service import LoginLogService, OperationLogService
-from utils.common_util import bytes2file_response
+from module_admin.service.log_writer_service import LogWriterService
+from utils.export_util import ExportUtil
 from utils.log_util import logger
 from utils.response_util import ResponseUtil
 
@@ -51,6 +52,19 @@ async def get_system_operation_log_list(
     return ResponseUtil.success(model_content=operation_log_page_query_result)
 
 
+@log_controller.get(
+    '/operlog/writerMetrics',
+    summary='获取日志写入指标接口',
+    description='用于获取当前进程日志异步写入队列的入队、写入、丢弃数量及队列长度等指标',
+    response_model=DataResponseModel[dict],
+    dependencies=[UserInterfaceAuthDependency('monitor:operlog:list')],
+)
+async def get_system_log_writer_metrics(request: Request) -> Response:
+    logger.info('获取成功')
+
+    return ResponseUtil.success(data=LogWriterService.get_metrics())
+
+
 @log_controller.delete(
     '/operlog/clean',
     summary='清空操作日志接口',
@@ -97,9 +111,10 @@ async def delete_system_operation_log(
     response_class=StreamingResponse,
     responses={
         200: {
-            'description': '流式返回操作日志列表excel文件',
+            'description': '流式返回操作日志列表xlsx或csv文件',
             'content': {
-                'application/octet-stream': {},
+                'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': {},
+                'text/csv': {},
             },
         }
     },
@@ -109,18 +124,17 @@ async def delete_system_operation_log(
 async def export_system_operation_log_list(
     request: Request,
     operation_log_page_query: Annotated[OperLogPageQueryModel, Form()],
-    query_db: Annotated[AsyncSession, DBSessionDependency()],
+    file_type: Annotated[
+        Literal['xlsx', 'csv'], Query(alias='fileType', description='导出文件类型，大数据量导出建议使用csv')
+    ] = 'xlsx',
 ) -> Response:
-    # 获取全量数据
-    operation_log_query_result = await OperationLogService.get_operation_log_list_services(
-        query_db, operation_log_page_query, is_page=False
-    )
+    # 使用服务端游标分批读取全量数据并流式写入导出文件
     operation_log_export_result = await OperationLogService.export_operation_log_list_services(
-        request, operation_log_query_result
+        request, operation_log_page_query, file_type
     )
     logger.info('导出成功')
 
-    return ResponseUtil.streaming(data=bytes2file_response(operation_log_export_result))
+    return ExportUtil.streaming_response(operation_log_export_result, '操作日志', file_type)
 
 
 @log_controller.get(
@@ -208,9 +222,10 @@ async def unlock_system_user(
     response_class=StreamingResponse,
     responses={
         200: {
-            'description': '流式返回登录日志列表excel文件',
+            'description': '流式返回登录日志列表xlsx或csv文件',
             'content': {
-                'application/octet-stream': {},
+                'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': {},
+                'text/csv': {},
             },
         }
     },
@@ -220,13 +235,12 @@ async def unlock_system_user(
 async def export_system_login_log_list(
     request: Request,
     login_log_page_query: Annotated[LoginLogPageQueryModel, Form()],
-    query_db: Annotated[AsyncSession, DBSessionDependency()],
+    file_type: Annotated[
+        Literal['xlsx', 'csv'], Query(alias='fileType', description='导出文件类型，大数据量导出建议使用csv')
+    ] = 'xlsx',
 ) -> Response:
-    # 获取全量数据
-    login_log_query_result = await LoginLogService.get_login_log_list_services(
-        query_db, login_log_page_query, is_page=False
-    )
-    login_log_export_result = await LoginLogService.export_login_log_list_services(login_log_query_result)
+    # 使用服务端游标分批读取全量数据并流式写入导出文件
+    login_log_export_result = await LoginLogService.export_login_log_list_services(login_log_page_query, file_type)
     logger.info('导出成功')
 
-    return ResponseUtil.streaming(data=bytes2file_response(login_log_export_result))
+    return ExportUtil.streaming_response(login_log_export_result, '登录日志', file_type)
@@ -7,6 +7,7 @@ from fastapi import Depends, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.responses import JSONResponse  # ← 添加这个
 
+from common.annotation.etag_annotation import ConditionalGet
 from common.annotation.log_annotation import Log
 from common.aspect.db_seesion import DBSessionDependency
 from common.aspect.pre_auth import CurrentUserDependency
@@ -19,7 +20,9 @@ from module_admin.entity.vo.user_vo import CurrentUserModel, EditUserModel
 from module_admin.service.login_service import CustomOAuth2PasswordRequestForm, LoginService, oauth2_scheme
 from module_admin.service.user_service import UserService
 from utils.log_util import logger
+from utils.principal_cache_util import PrincipalCacheUtil
 from utils.response_util import ResponseUtil
+from utils.sys_cache_util import SysCacheUtil
 
 login_controller = APIRouterPro(order_num=1, tags=['登录模块'])
 
@@ -37,7 +40,7 @@ async def login(
     query_db: Annotated[AsyncSession, DBSessionDependency()],
 ) -> Response:
     captcha_enabled = (
-        await request.app.state.redis.get(f'{RedisInitKeyConfig.SYS_CONFIG.key}:sys.account.captchaEnabled') == 'true'
+        await SysCacheUtil.get_config(request.app.state.redis, 'sys.account.captchaEnabled') == 'true'
     )
     user = UserLogin(
         userName=form_data.username,
@@ -76,6 +79,7 @@ async def login(
     await UserService.edit_user_services(
         query_db, EditUserModel(userId=result[0].user_id, loginDate=datetime.now(), type='status')
     )
+    await PrincipalCacheUtil.bump_user_versions(request.app.state.redis, [result[0].user_id])
     logger.info('登录成功')
     # 判断请求是否来自于api文档，如果是返回指定格式的结果，用于修复api文档认证成功后token显示undefined的bug
     request_from_swagger = request.headers.get('referer').endswith('docs') if request.headers.get('referer') else False
@@ -109,6 +113,7 @@ async def get_login_user_info(
     description='用于获取当前登录用户的路由信息',
     response_model=DataResponseModel[list[RouterModel]],
 )
+@ConditionalGet(per_user=True)
 async def get_login_user_routers(
     request: Request,
     current_user: Annotated[CurrentUserModel, CurrentUserDependency()],
@@ -17,6 +17,7 @@ from module_admin.entity.vo.role_vo import RoleMenuQueryModel
 from module_admin.entity.vo.user_vo import CurrentUserModel
 from module_admin.service.menu_service import MenuService
 from utils.log_util import logger
+from utils.principal_cache_util import PrincipalCacheUtil
 from utils.response_util import ResponseUtil
 
 menu_controller = APIRouterPro(
@@ -98,6 +99,8 @@ async def add_system_menu(
     add_menu.update_by = current_user.user.user_name
     add_menu.update_time = datetime.now()
     add_menu_result = await MenuService.add_menu_services(query_db, add_menu)
+    # 超级管理员的路由包含所有菜单，新增菜单同样需要使获取路由接口的ETag失效
+    await PrincipalCacheUtil.bump_global_version(request.app.state.redis)
     logger.info(add_menu_result.message)
 
     return ResponseUtil.success(msg=add_menu_result.message)
@@ -121,6 +124,7 @@ async def edit_system_menu(
     edit_menu.update_by = current_user.user.user_name
     edit_menu.update_time = datetime.now()
     edit_menu_result = await MenuService.edit_menu_services(query_db, edit_menu)
+    await PrincipalCacheUtil.bump_global_version(request.app.state.redis)
     logger.info(edit_menu_result.message)
 
     return ResponseUtil.success(msg=edit_menu_result.message)
@@ -141,6 +145,7 @@ async def delete_system_menu(
 ) -> Response:
     delete_menu = DeleteMenuModel(menuIds=menu_ids)
     delete_menu_result = await MenuService.delete_menu_services(query_db, delete_menu)
+    await PrincipalCacheUtil.bump_global_version(request.app.state.redis)
     logger.info(delete_menu_result.message)
 
     return ResponseUtil.success(msg=delete_menu_result.message)
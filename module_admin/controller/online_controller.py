@@ -10,7 +10,7 @@ from common.aspect.pre_auth import PreAuthDependency
 from common.enums import BusinessType
 from common.router import APIRouterPro
 from common.vo import ResponseBaseModel
-from module_admin.entity.vo.online_vo import DeleteOnlineModel, OnlinePageResponseModel, OnlineQueryModel
+from module_admin.entity.vo.online_vo import DeleteOnlineModel, OnlinePageQueryModel, OnlinePageResponseModel
 from module_admin.service.online_service import OnlineService
 from utils.log_util import logger
 from utils.response_util import ResponseUtil
@@ -29,15 +29,13 @@ online_controller = APIRouterPro(
 )
 async def get_monitor_online_list(
     request: Request,
-    online_page_query: Annotated[OnlineQueryModel, Query()],
+    online_page_query: Annotated[OnlinePageQueryModel, Query()],
 ) -> Response:
-    # 获取全量数据
+    # 传入分页参数时分页返回，否则返回全量数据
     online_query_result = await OnlineService.get_online_list_services(request, online_page_query)
     logger.info('获取成功')
 
-    return ResponseUtil.success(
-        model_content=OnlinePageResponseModel(rows=online_query_result, total=len(online_query_result))
-    )
+    return ResponseUtil.success(model_content=online_query_result)
 
 
 @online_controller.delete(
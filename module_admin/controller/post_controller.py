@@ -18,6 +18,7 @@ from module_admin.entity.vo.user_vo import CurrentUserModel
 from module_admin.service.post_service import PostService
 from utils.common_util import bytes2file_response
 from utils.log_util import logger
+from utils.principal_cache_util import PrincipalCacheUtil
 from utils.response_util import ResponseUtil
 
 post_controller = APIRouterPro(
@@ -87,6 +88,7 @@ async def edit_system_post(
     edit_post.update_by = current_user.user.user_name
     edit_post.update_time = datetime.now()
     edit_post_result = await PostService.edit_post_services(query_db, edit_post)
+    await PrincipalCacheUtil.bump_global_version(request.app.state.redis)
     logger.info(edit_post_result.message)
 
     return ResponseUtil.success(msg=edit_post_result.message)
@@ -107,6 +109,7 @@ async def delete_system_post(
 ) -> Response:
     delete_post = DeletePostModel(postIds=post_ids)
     delete_post_result = await PostService.delete_post_services(query_db, delete_post)
+    await PrincipalCacheUtil.bump_global_version(request.app.state.redis)
     logger.info(delete_post_result.message)
 
     return ResponseUtil.success(msg=delete_post_result.message)
@@ -31,6 +31,7 @@ from module_admin.service.role_service import RoleService
 from module_admin.service.user_service import UserService
 from utils.common_util import bytes2file_response
 from utils.log_util import logger
+from utils.principal_cache_util import PrincipalCacheUtil
 from utils.response_util import ResponseUtil
 
 role_controller = APIRouterPro(
@@ -127,6 +128,7 @@ async def edit_system_role(
     edit_role.update_by = current_user.user.user_name
     edit_role.update_time = datetime.now()
     edit_role_result = await RoleService.edit_role_services(query_db, edit_role)
+    await PrincipalCacheUtil.bump_global_version(request.app.state.redis)
     logger.info(edit_role_result.message)
 
     return ResponseUtil.success(msg=edit_role_result.message)
@@ -159,6 +161,7 @@ async def edit_system_role_datascope(
         updateTime=datetime.now(),
     )
     role_data_scope_result = await RoleService.role_datascope_services(query_db, edit_role)
+    await PrincipalCacheUtil.bump_global_version(request.app.state.redis)
     logger.info(role_data_scope_result.message)
 
     return ResponseUtil.success(msg=role_data_scope_result.message)
@@ -187,6 +190,7 @@ async def delete_system_role(
                 await RoleService.check_role_data_scope_services(query_db, role_id, data_scope_sql)
     delete_role = DeleteRoleModel(roleIds=role_ids, updateBy=current_user.user.user_name, updateTime=datetime.now())
     delete_role_result = await RoleService.delete_role_services(query_db, delete_role)
+    await PrincipalCacheUtil.bump_global_version(request.app.state.redis)
     logger.info(delete_role_result.message)
 
     return ResponseUtil.success(msg=delete_role_result.message)
@@ -272,6 +276,7 @@ async def reset_system_role_status(
         type='status',
     )
     edit_role_result = await RoleService.edit_role_services(query_db, edit_role)
+    await PrincipalCacheUtil.bump_global_version(request.app.state.redis)
     logger.info(edit_role_result.message)
 
     return ResponseUtil.success(msg=edit_role_result.message)
@@ -337,6 +342,7 @@ async def add_system_role_user(
     if not current_user.user.admin:
         await RoleService.check_role_data_scope_services(query_db, str(add_role_user.role_id), data_scope_sql)
     add_role_user_result = await UserService.add_user_role_services(query_db, add_role_user)
+    await PrincipalCacheUtil.bump_user_versions(request.app.state.redis, add_role_user.user_ids.split(','))
     logger.info(add_role_user_result.message)
 
     return ResponseUtil.success(msg=add_role_user_result.message)
@@ -356,6 +362,7 @@ async def cancel_system_role_user(
     query_db: Annotated[AsyncSession, DBSessionDependency()],
 ) -> Response:
     cancel_user_role_result = await UserService.delete_user_role_services(query_db, cancel_user_role)
+    await PrincipalCacheUtil.bump_user_versions(request.app.state.redis, [cancel_user_role.user_id])
     logger.info(cancel_user_role_result.message)
 
     return ResponseUtil.success(msg=cancel_user_role_result.message)
@@ -375,6 +382,7 @@ async def batch_cancel_system_role_user(
     query_db: Annotated[AsyncSession, DBSessionDependency()],
 ) -> Response:
     batch_cancel_user_role_result = await UserService.delete_user_role_services(query_db, batch_cancel_user_role)
+    await PrincipalCacheUtil.bump_user_versions(request.app.state.redis, batch_cancel_user_role.user_ids.split(','))
     logger.info(batch_cancel_user_role_result.message)
 
     return ResponseUtil.success(msg=batch_cancel_user_role_result.message)
@@ -31,6 +31,7 @@ from module_admin.entity.vo.user_vo import (
     ResetPasswordModel,
     ResetUserModel,
     UserDetailModel,
+    UserImportResultModel,
     UserInfoModel,
     UserModel,
     UserPageQueryModel,
@@ -43,7 +44,9 @@ from module_admin.service.dept_service import DeptService
 from module_admin.service.role_service import RoleService
 from module_admin.service.user_service import UserService
 from utils.common_util import bytes2file_response
+from utils.export_util import ExportUtil
 from utils.log_util import logger
+from utils.principal_cache_util import PrincipalCacheUtil
 from utils.pwd_util import PwdUtil
 from utils.response_util import ResponseUtil
 from utils.upload_util import UploadUtil
@@ -154,6 +157,7 @@ async def edit_system_user(
     edit_user.update_by = current_user.user.user_name
     edit_user.update_time = datetime.now()
     edit_user_result = await UserService.edit_user_services(query_db, edit_user)
+    await PrincipalCacheUtil.bump_user_versions(request.app.state.redis, [edit_user.user_id])
     logger.info(edit_user_result.message)
 
     return ResponseUtil.success(msg=edit_user_result.message)
@@ -186,6 +190,7 @@ async def delete_system_user(
                 await UserService.check_user_data_scope_services(query_db, int(user_id), data_scope_sql)
     delete_user = DeleteUserModel(userIds=user_ids, updateBy=current_user.user.user_name, updateTime=datetime.now())
     delete_user_result = await UserService.delete_user_services(query_db, delete_user)
+    await PrincipalCacheUtil.bump_user_versions(request.app.state.redis, user_id_list)
     logger.info(delete_user_result.message)
 
     return ResponseUtil.success(msg=delete_user_result.message)
@@ -218,6 +223,7 @@ async def reset_system_user_pwd(
         type='pwd',
     )
     edit_user_result = await UserService.edit_user_services(query_db, edit_user)
+    await PrincipalCacheUtil.bump_user_versions(request.app.state.redis, [edit_user.user_id])
     logger.info(edit_user_result.message)
 
     return ResponseUtil.success(msg=edit_user_result.message)
@@ -249,6 +255,7 @@ async def change_system_user_status(
         type='status',
     )
     edit_user_result = await UserService.edit_user_services(query_db, edit_user)
+    await PrincipalCacheUtil.bump_user_versions(request.app.state.redis, [edit_user.user_id])
     logger.info(edit_user_result.message)
 
     return ResponseUtil.success(msg=edit_user_result.message)
@@ -334,6 +341,7 @@ async def change_system_user_profile_avatar(
             type='avatar',
         )
         edit_user_result = await UserService.edit_user_services(query_db, edit_user)
+        await PrincipalCacheUtil.bump_user_versions(request.app.state.redis, [edit_user.user_id])
         logger.info(edit_user_result.message)
 
         return ResponseUtil.success(model_content=AvatarModel(imgUrl=edit_user.avatar), msg=edit_user_result.message)
@@ -364,6 +372,7 @@ async def change_system_user_profile_info(
         role=current_user.user.role,
     )
     edit_user_result = await UserService.edit_user_services(query_db, edit_user)
+    await PrincipalCacheUtil.bump_user_versions(request.app.state.redis, [edit_user.user_id])
     logger.info(edit_user_result.message)
 
     return ResponseUtil.success(msg=edit_user_result.message)
@@ -391,6 +400,7 @@ async def reset_system_user_password(
         updateTime=datetime.now(),
     )
     reset_user_result = await UserService.reset_user_services(query_db, reset_user)
+    await PrincipalCacheUtil.bump_user_versions(request.app.state.redis, [reset_user.user_id])
     logger.info(reset_user_result.message)
 
     return ResponseUtil.success(msg=reset_user_result.message)
@@ -399,8 +409,8 @@ async def reset_system_user_password(
 @user_controller.post(
     '/importData',
     summary='批量导入用户接口',
-    description='用于批量导入用户数据',
-    response_model=ResponseBaseModel,
+    description='用于批量导入用户数据，返回新增、更新、失败数量及每个失败行的原因',
+    response_model=DataResponseModel[UserImportResultModel],
     dependencies=[UserInterfaceAuthDependency('system:user:import')],
 )
 @Log(title='用户管理', business_type=BusinessType.IMPORT)
@@ -416,9 +426,11 @@ async def batch_import_system_user(
     batch_import_result = await UserService.batch_import_user_services(
         request, query_db, file, update_support, current_user, user_data_scope_sql, dept_data_scope_sql
     )
+    if update_support:
+        await PrincipalCacheUtil.bump_global_version(request.app.state.redis)
     logger.info(batch_import_result.message)
 
-    return ResponseUtil.success(msg=batch_import_result.message)
+    return ResponseUtil.success(msg=batch_import_result.message, data=batch_import_result.result)
 
 
 @user_controller.post(
@@ -452,9 +464,10 @@ async def export_system_user_template(
     response_class=StreamingResponse,
     responses={
         200: {
-            'description': '流式返回用户列表excel文件',
+            'description': '流式返回用户列表xlsx或csv文件',
             'content': {
-                'application/octet-stream': {},
+                'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': {},
+                'text/csv': {},
             },
         }
     },
@@ -464,17 +477,16 @@ async def export_system_user_template(
 async def export_system_user_list(
     request: Request,
     user_page_query: Annotated[UserPageQueryModel, Form()],
-    query_db: Annotated[AsyncSession, DBSessionDependency()],
     data_scope_sql: Annotated[ColumnElement, DataScopeDependency(SysUser)],
+    file_type: Annotated[
+        Literal['xlsx', 'csv'], Query(alias='fileType', description='导出文件类型，大数据量导出建议使用csv')
+    ] = 'xlsx',
 ) -> Response:
-    # 获取全量数据
-    user_query_result = await UserService.get_user_list_services(
-        query_db, user_page_query, data_scope_sql, is_page=False
-    )
-    user_export_result = await UserService.export_user_list_services(user_query_result)
+    # 使用服务端游标分批读取全量数据并流式写入导出文件
+    user_export_result = await UserService.export_user_list_services(user_page_query, data_scope_sql, file_type)
     logger.info('导出成功')
 
-    return ResponseUtil.streaming(data=bytes2file_response(user_export_result))
+    return ExportUtil.streaming_response(user_export_result, '用户信息', file_type)
 
 
 @user_controller.get(
@@ -521,6 +533,7 @@ async def update_system_role_user(
     add_user_role_result = await UserService.add_user_role_services(
         query_db, CrudUserRoleModel(userId=user_id, roleIds=role_ids)
     )
+    await PrincipalCacheUtil.bump_user_versions(request.app.state.redis, [user_id])
     logger.info(add_user_role_result.message)
 
     return ResponseUtil.success(msg=add_user_role_result.message)
@@ -185,6 +185,32 @@ class DeptDao:
 
         return dept_result
 
+    @classmethod
+    async def get_dept_ids_by_data_scope(
+        cls, db: AsyncSession, dept_ids: list[int], data_scope_sql: ColumnElement
+    ) -> Sequence[int]:
+        """
+        获取部门id列表中当前用户有数据权限的部门id
+
+        :param db: orm对象
+        :param dept_ids: 部门id列表
+        :param data_scope_sql: 数据权限对应的查询sql语句
+        :return: 有数据权限的部门id列表
+        """
+        dept_id_list = (
+            (
+                await db.execute(
+                    select(SysDept.dept_id).where(
+                        SysDept.del_flag == '0', SysDept.dept_id.in_(dept_ids), data_scope_sql
+                    )
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+        return dept_id_list
+
     @classmethod
     async def add_dept_dao(cls, db: AsyncSession, dept: DeptModel) -> SysDept:
         """
@@ -1,7 +1,7 @@
 from datetime import datetime, time
 from typing import Any, Union
 
-from sqlalchemy import asc, delete, desc, select
+from sqlalchemy import Select, asc, delete, desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from common.vo import PageModel
@@ -18,16 +18,12 @@ class OperationLogDao:
     """
 
     @classmethod
-    async def get_operation_log_list(
-        cls, db: AsyncSession, query_object: OperLogPageQueryModel, is_page: bool = False
-    ) -> Union[PageModel, list[dict[str, Any]]]:
+    def get_operation_log_list_query(cls, query_object: OperLogPageQueryModel) -> Select:
         """
-        根据查询参数获取操作日志列表信息
+        根据查询参数构建操作日志列表查询语句
 
-        :param db: orm对象
         :param query_object: 查询参数对象
-        :param is_page: 是否开启分页
-        :return: 操作日志列表信息对象
+        :return: 操作日志列表查询语句
         """
         if query_object.is_asc == 'ascending':
             order_by_column = asc(getattr(SysOperLog, SnakeCaseUtil.camel_to_snake(query_object.order_by_column), None))
@@ -54,8 +50,23 @@ class OperationLogDao:
             .distinct()
             .order_by(order_by_column)
         )
+
+        return query
+
+    @classmethod
+    async def get_operation_log_list(
+        cls, db: AsyncSession, query_object: OperLogPageQueryModel, is_page: bool = False
+    ) -> Union[PageModel, list[dict[str, Any]]]:
+        """
+        根据查询参数获取操作日志列表信息
+
+        :param db: orm对象
+        :param query_object: 查询参数对象
+        :param is_page: 是否开启分页
+        :return: 操作日志列表信息对象
+        """
         operation_log_list: Union[PageModel, list[dict[str, Any]]] = await PageUtil.paginate(
-            db, query, query_object.page_num, query_object.page_size, is_page
+            db, cls.get_operation_log_list_query(query_object), query_object.page_num, query_object.page_size, is_page
         )
 
         return operation_log_list
@@ -103,16 +114,12 @@ class LoginLogDao:
     """
 
     @classmethod
-    async def get_login_log_list(
-        cls, db: AsyncSession, query_object: LoginLogPageQueryModel, is_page: bool = False
-    ) -> Union[PageModel, list[dict[str, Any]]]:
+    def get_login_log_list_query(cls, query_object: LoginLogPageQueryModel) -> Select:
         """
-        根据查询参数获取登录日志列表信息
+        根据查询参数构建登录日志列表查询语句
 
-        :param db: orm对象
         :param query_object: 查询参数对象
-        :param is_page: 是否开启分页
-        :return: 登录日志列表信息对象
+        :return: 登录日志列表查询语句
         """
         if query_object.is_asc == 'ascending':
             order_by_column = asc(
@@ -140,8 +147,23 @@ class LoginLogDao:
             .distinct()
             .order_by(order_by_column)
         )
+
+        return query
+
+    @classmethod
+    async def get_login_log_list(
+        cls, db: AsyncSession, query_object: LoginLogPageQueryModel, is_page: bool = False
+    ) -> Union[PageModel, list[dict[str, Any]]]:
+        """
+        根据查询参数获取登录日志列表信息
+
+        :param db: orm对象
+        :param query_object: 查询参数对象
+        :param is_page: 是否开启分页
+        :return: 登录日志列表信息对象
+        """
         login_log_list: Union[PageModel, list[dict[str, Any]]] = await PageUtil.paginate(
-            db, query, query_object.page_num, query_object.page_size, is_page
+            db, cls.get_login_log_list_query(query_object), query_object.page_num, query_object.page_size, is_page
         )
 
         return login_log_list
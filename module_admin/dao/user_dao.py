@@ -2,7 +2,7 @@ from collections.abc import Sequence
 from datetime import datetime, time
 from typing import Any, Union
 
-from sqlalchemy import ColumnElement, and_, delete, desc, func, or_, select, update
+from sqlalchemy import ColumnElement, Select, and_, delete, desc, func, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from common.vo import PageModel
@@ -80,6 +80,55 @@ class UserDao:
 
         return query_user_info
 
+    @classmethod
+    async def get_user_list_by_user_names(cls, db: AsyncSession, user_names: list[str]) -> Sequence[SysUser]:
+        """
+        根据用户账号列表批量获取用户信息
+
+        :param db: orm对象
+        :param user_names: 用户账号列表
+        :return: 用户信息列表
+        """
+        user_list = (
+            (
+                await db.execute(
+                    select(SysUser)
+                    .where(SysUser.del_flag == '0', SysUser.user_name.in_(user_names))
+                    .order_by(desc(SysUser.create_time))
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+        return user_list
+
+    @classmethod
+    async def get_user_ids_by_data_scope(
+        cls, db: AsyncSession, user_ids: list[int], data_scope_sql: ColumnElement
+    ) -> Sequence[int]:
+        """
+        获取用户id列表中当前用户有数据权限的用户id
+
+        :param db: orm对象
+        :param user_ids: 用户id列表
+        :param data_scope_sql: 数据权限对应的查询sql语句
+        :return: 有数据权限的用户id列表
+        """
+        user_id_list = (
+            (
+                await db.execute(
+                    select(SysUser.user_id).where(
+                        SysUser.del_flag == '0', SysUser.user_id.in_(user_ids), data_scope_sql
+                    )
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+        return user_id_list
+
     @classmethod
     async def get_user_by_id(cls, db: AsyncSession, user_id: int) -> dict[str, Any]:
         """
@@ -291,6 +340,25 @@ class UserDao:
         :param is_page: 是否开启分页
         :return: 用户列表信息对象
         """
+        user_list: Union[PageModel, list[list[dict[str, Any]]]] = await PageUtil.paginate(
+            db,
+            cls.get_user_list_query(query_object, data_scope_sql),
+            query_object.page_num,
+            query_object.page_size,
+            is_page,
+        )
+
+        return user_list
+
+    @classmethod
+    def get_user_list_query(cls, query_object: UserPageQueryModel, data_scope_sql: ColumnElement) -> Select:
+        """
+        根据查询参数生成用户列表查询语句
+
+        :param query_object: 查询参数对象
+        :param data_scope_sql: 数据权限对应的查询sql语句
+        :return: 用户列表查询语句
+        """
         query = (
             select(SysUser, SysDept)
             .where(
@@ -326,11 +394,8 @@ class UserDao:
             .order_by(SysUser.user_id)
             .distinct()
         )
-        user_list: Union[PageModel, list[list[dict[str, Any]]]] = await PageUtil.paginate(
-            db, query, query_object.page_num, query_object.page_size, is_page
-        )
 
-        return user_list
+        return query
 
     @classmethod
     async def add_user_dao(cls, db: AsyncSession, user: UserModel) -> SysUser:
@@ -358,6 +423,28 @@ class UserDao:
         """
         await db.execute(update(SysUser), [user])
 
+    @classmethod
+    async def batch_add_user_dao(cls, db: AsyncSession, user_list: list[dict]) -> None:
+        """
+        批量新增用户数据库操作
+
+        :param db: orm对象
+        :param user_list: 需要新增的用户字典列表
+        :return:
+        """
+        await db.execute(insert(SysUser), user_list)
+
+    @classmethod
+    async def batch_edit_user_dao(cls, db: AsyncSession, user_list: list[dict]) -> None:
+        """
+        按主键批量编辑用户数据库操作
+
+        :param db: orm对象
+        :param user_list: 需要更新的用户字典列表，每项需包含user_id
+        :return:
+        """
+        await db.execute(update(SysUser), user_list)
+
     @classmethod
     async def delete_user_dao(cls, db: AsyncSession, user: UserModel) -> None:
         """
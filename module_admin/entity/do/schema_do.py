@@ -0,0 +1,16 @@
+from sqlalchemy import Column, DateTime, String
+
+from config.database import Base
+
+
+class SysSchemaFingerprint(Base):
+    """
+    表结构指纹表
+    """
+
+    __tablename__ = 'sys_schema_fingerprint'
+    __table_args__ = {'comment': '表结构指纹表'}
+
+    schema_name = Column(String(64), primary_key=True, nullable=False, comment='表结构名称')
+    fingerprint = Column(String(64), nullable=False, comment='表结构指纹')
+    update_time = Column(DateTime, nullable=True, comment='更新时间')
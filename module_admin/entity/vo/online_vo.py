@@ -31,6 +31,15 @@ class OnlineQueryModel(OnlineModel):
     end_time: Optional[str] = Field(default=None, description='结束时间')
 
 
+class OnlinePageQueryModel(OnlineQueryModel):
+    """
+    在线用户分页查询模型
+    """
+
+    page_num: Optional[int] = Field(default=None, description='当前页码，与每页记录数同时传入时分页返回')
+    page_size: Optional[int] = Field(default=None, description='每页记录数，与当前页码同时传入时分页返回')
+
+
 class OnlinePageResponseModel(BaseModel):
     """
     在线用户分页响应模型
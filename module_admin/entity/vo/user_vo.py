@@ -253,6 +253,32 @@ class DeleteUserModel(BaseModel):
     update_time: Optional[datetime] = Field(default=None, description='更新时间')
 
 
+class UserImportErrorModel(BaseModel):
+    """
+    用户导入失败行模型
+    """
+
+    model_config = ConfigDict(alias_generator=to_camel)
+
+    row_num: int = Field(description='导入文件中的行号')
+    user_name: Optional[str] = Field(default=None, description='用户账号')
+    message: str = Field(description='失败原因')
+
+
+class UserImportResultModel(BaseModel):
+    """
+    用户导入结果模型
+    """
+
+    model_config = ConfigDict(alias_generator=to_camel)
+
+    total: int = Field(default=0, description='导入总行数')
+    added: int = Field(default=0, description='新增用户数')
+    updated: int = Field(default=0, description='更新用户数')
+    failed: int = Field(default=0, description='失败行数')
+    errors: list[UserImportErrorModel] = Field(default=[], description='失败行信息')
+
+
 class UserRoleQueryModel(UserModel):
     """
     用户角色关联管理不分页查询模型
@@ -12,6 +12,8 @@ from module_admin.dao.config_dao import ConfigDao
 from module_admin.entity.vo.config_vo import ConfigModel, ConfigPageQueryModel, DeleteConfigModel
 from utils.common_util import CamelCaseUtil
 from utils.excel_util import ExcelUtil
+from utils.redis_key_util import RedisKeyUtil
+from utils.sys_cache_util import SysCacheUtil
 
 
 class ConfigService:
@@ -44,17 +46,15 @@ class ConfigService:
         :param redis: redis对象
         :return:
         """
-        # 获取以sys_config:开头的键列表
-        keys = await redis.keys(f'{RedisInitKeyConfig.SYS_CONFIG.key}:*')
-        # 删除匹配的键
-        if keys:
-            await redis.delete(*keys)
+        # 分批删除以sys_config:开头的键
+        await RedisKeyUtil.unlink_keys(redis, f'{RedisInitKeyConfig.SYS_CONFIG.key}:*')
         config_all = await ConfigDao.get_config_list(query_db, ConfigPageQueryModel(), is_page=False)
         for config_obj in config_all:
             await redis.set(
                 f'{RedisInitKeyConfig.SYS_CONFIG.key}:{config_obj.get("configKey")}',
                 config_obj.get('configValue'),
             )
+        await SysCacheUtil.publish_invalidate(redis, 'config')
 
     @classmethod
     async def query_config_list_from_cache_services(cls, redis: aioredis.Redis, config_key: str) -> Any:
@@ -65,7 +65,7 @@ class ConfigService:
         :param config_key: 参数键名
         :return: 参数键名对应值
         """
-        result = await redis.get(f'{RedisInitKeyConfig.SYS_CONFIG.key}:{config_key}')
+        result = await SysCacheUtil.get_config(redis, config_key)
 
         return result
 
@@ -104,6 +104,7 @@ class ConfigService:
             await request.app.state.redis.set(
                 f'{RedisInitKeyConfig.SYS_CONFIG.key}:{page_object.config_key}', page_object.config_value
             )
+            await SysCacheUtil.publish_invalidate(request.app.state.redis, 'config', [page_object.config_key])
             return CrudResponseModel(is_success=True, message='新增成功')
         except Exception as e:
             await query_db.rollback()
@@ -136,6 +137,9 @@ class ConfigService:
                 await request.app.state.redis.set(
                     f'{RedisInitKeyConfig.SYS_CONFIG.key}:{page_object.config_key}', page_object.config_value
                 )
+                await SysCacheUtil.publish_invalidate(
+                    request.app.state.redis, 'config', {config_info.config_key, page_object.config_key}
+                )
                 return CrudResponseModel(is_success=True, message='更新成功')
             except Exception as e:
                 await query_db.rollback()
@@ -164,10 +168,13 @@ class ConfigService:
                     if config_info.config_type == CommonConstant.YES:
                         raise ServiceException(message=f'内置参数{config_info.config_key}不能删除')
                     await ConfigDao.delete_config_dao(query_db, ConfigModel(configId=int(config_id)))
-                    delete_config_key_list.append(f'{RedisInitKeyConfig.SYS_CONFIG.key}:{config_info.config_key}')
+                    delete_config_key_list.append(config_info.config_key)
                 await query_db.commit()
                 if delete_config_key_list:
-                    await request.app.state.redis.delete(*delete_config_key_list)
+                    await request.app.state.redis.delete(
+                        *[f'{RedisInitKeyConfig.SYS_CONFIG.key}:{config_key}' for config_key in delete_config_key_list]
+                    )
+                    await SysCacheUtil.publish_invalidate(request.app.state.redis, 'config', delete_config_key_list)
                 return CrudResponseModel(is_success=True, message='删除成功')
             except Exception as e:
                 await query_db.rollback()
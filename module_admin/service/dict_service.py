@@ -22,6 +22,8 @@ from module_admin.entity.vo.dict_vo import (
 )
 from utils.common_util import CamelCaseUtil
 from utils.excel_util import ExcelUtil
+from utils.redis_key_util import RedisKeyUtil
+from utils.sys_cache_util import SysCacheUtil
 
 
 class DictTypeService:
@@ -80,6 +82,7 @@ class DictTypeService:
             await DictTypeDao.add_dict_type_dao(query_db, page_object)
             await query_db.commit()
             await request.app.state.redis.set(f'{RedisInitKeyConfig.SYS_DICT.key}:{page_object.dict_type}', '')
+            await SysCacheUtil.publish_invalidate(request.app.state.redis, 'dict', [page_object.dict_type])
             result = {'is_success': True, 'message': '新增成功'}
         except Exception as e:
             await query_db.rollback()
@@ -124,6 +127,9 @@ class DictTypeService:
                         f'{RedisInitKeyConfig.SYS_DICT.key}:{page_object.dict_type}',
                         json.dumps(dict_data, ensure_ascii=False, default=str),
                     )
+                    await SysCacheUtil.publish_invalidate(
+                        request.app.state.redis, 'dict', [dict_type_info.dict_type, page_object.dict_type]
+                    )
                 return CrudResponseModel(is_success=True, message='更新成功')
             except Exception as e:
                 await query_db.rollback()
@@ -152,10 +158,13 @@ class DictTypeService:
                     if (await DictDataDao.count_dict_data_dao(query_db, dict_type_into.dict_type)) > 0:
                         raise ServiceException(message=f'{dict_type_into.dict_name}已分配，不能删除')
                     await DictTypeDao.delete_dict_type_dao(query_db, DictTypeModel(dictId=int(dict_id)))
-                    delete_dict_type_list.append(f'{RedisInitKeyConfig.SYS_DICT.key}:{dict_type_into.dict_type}')
+                    delete_dict_type_list.append(dict_type_into.dict_type)
                 await query_db.commit()
                 if delete_dict_type_list:
-                    await request.app.state.redis.delete(*delete_dict_type_list)
+                    await request.app.state.redis.delete(
+                        *[f'{RedisInitKeyConfig.SYS_DICT.key}:{dict_type}' for dict_type in delete_dict_type_list]
+                    )
+                    await SysCacheUtil.publish_invalidate(request.app.state.redis, 'dict', delete_dict_type_list)
                 return CrudResponseModel(is_success=True, message='删除成功')
             except Exception as e:
                 await query_db.rollback()
@@ -265,11 +274,8 @@ class DictDataService:
         :param redis: redis对象
         :return:
         """
-        # 获取以sys_dict:开头的键列表
-        keys = await redis.keys(f'{RedisInitKeyConfig.SYS_DICT.key}:*')
-        # 删除匹配的键
-        if keys:
-            await redis.delete(*keys)
+        # 分批删除以sys_dict:开头的键
+        await RedisKeyUtil.unlink_keys(redis, f'{RedisInitKeyConfig.SYS_DICT.key}:*')
         dict_type_all = await DictTypeDao.get_all_dict_type(query_db)
         for dict_type_obj in [item for item in dict_type_all if item.status == '0']:
             dict_type = dict_type_obj.dict_type
@@ -279,6 +285,7 @@ class DictDataService:
                 f'{RedisInitKeyConfig.SYS_DICT.key}:{dict_type}',
                 json.dumps(dict_data, ensure_ascii=False, default=str),
             )
+        await SysCacheUtil.publish_invalidate(redis, 'dict')
 
     @classmethod
     async def query_dict_data_list_from_cache_services(
@@ -291,12 +298,9 @@ class DictDataService:
         :param dict_type: 字典类型
         :return: 字典数据列表信息对象
         """
-        result = []
-        dict_data_list_result = await redis.get(f'{RedisInitKeyConfig.SYS_DICT.key}:{dict_type}')
-        if dict_data_list_result:
-            result = json.loads(dict_data_list_result)
+        result = await SysCacheUtil.get_dict(redis, dict_type)
 
-        return CamelCaseUtil.transform_result(result)
+        return result
 
     @classmethod
     async def check_dict_data_unique_services(cls, query_db: AsyncSession, page_object: DictDataModel) -> bool:
@@ -337,6 +341,7 @@ class DictDataService:
                 f'{RedisInitKeyConfig.SYS_DICT.key}:{page_object.dict_type}',
                 json.dumps(CamelCaseUtil.transform_result(dict_data_list), ensure_ascii=False, default=str),
             )
+            await SysCacheUtil.publish_invalidate(request.app.state.redis, 'dict', [page_object.dict_type])
             return CrudResponseModel(is_success=True, message='新增成功')
         except Exception as e:
             await query_db.rollback()
@@ -369,6 +374,7 @@ class DictDataService:
                     f'{RedisInitKeyConfig.SYS_DICT.key}:{page_object.dict_type}',
                     json.dumps(CamelCaseUtil.transform_result(dict_data_list), ensure_ascii=False, default=str),
                 )
+                await SysCacheUtil.publish_invalidate(request.app.state.redis, 'dict', [page_object.dict_type])
                 return CrudResponseModel(is_success=True, message='更新成功')
             except Exception as e:
                 await query_db.rollback()
@@ -403,6 +409,7 @@ class DictDataService:
                         f'{RedisInitKeyConfig.SYS_DICT.key}:{dict_type}',
                         json.dumps(CamelCaseUtil.transform_result(dict_data_list), ensure_ascii=False, default=str),
                     )
+                await SysCacheUtil.publish_invalidate(request.app.state.redis, 'dict', set(delete_dict_type_list))
                 return CrudResponseModel(is_success=True, message='删除成功')
             except Exception as e:
                 await query_db.rollback()
@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from typing import Any, Union
 
 from fastapi import Request
@@ -16,7 +17,7 @@ from module_admin.entity.vo.log_vo import (
     UnlockUser,
 )
 from module_admin.service.dict_service import DictDataService
-from utils.excel_util import ExcelUtil
+from utils.export_util import ExportFileType, ExportUtil
 
 
 class OperationLogService:
@@ -98,13 +99,16 @@ class OperationLogService:
             raise e
 
     @classmethod
-    async def export_operation_log_list_services(cls, request: Request, operation_log_list: list) -> bytes:
+    async def export_operation_log_list_services(
+        cls, request: Request, query_object: OperLogPageQueryModel, file_type: ExportFileType = 'xlsx'
+    ) -> AsyncIterator[bytes]:
         """
         导出操作日志信息service
 
         :param request: Request对象
-        :param operation_log_list: 操作日志信息列表
-        :return: 操作日志信息对应excel的二进制数据
+        :param query_object: 查询参数对象
+        :param file_type: 导出文件类型
+        :return: 操作日志信息对应导出文件的内容分块
         """
         # 创建一个映射字典，将英文键映射到中文键
         mapping_dict = {
@@ -134,16 +138,18 @@ class OperationLogService:
         ]
         operation_type_option_dict = {item.get('value'): item for item in operation_type_option}
 
-        for item in operation_log_list:
+        def format_row(item: dict[str, Any]) -> dict[str, Any]:
             if item.get('status') == 0:
                 item['status'] = '成功'
             else:
                 item['status'] = '失败'
             if str(item.get('businessType')) in operation_type_option_dict:
                 item['businessType'] = operation_type_option_dict.get(str(item.get('businessType'))).get('label')
-        binary_data = ExcelUtil.export_list2excel(operation_log_list, mapping_dict)
+            return item
 
-        return binary_data
+        return ExportUtil.iter_export(
+            OperationLogDao.get_operation_log_list_query(query_object), mapping_dict, file_type, format_row
+        )
 
 
 class LoginLogService:
@@ -233,12 +239,15 @@ class LoginLogService:
         raise ServiceException(message='该用户未锁定')
 
     @staticmethod
-    async def export_login_log_list_services(login_log_list: list) -> bytes:
+    async def export_login_log_list_services(
+        query_object: LoginLogPageQueryModel, file_type: ExportFileType = 'xlsx'
+    ) -> AsyncIterator[bytes]:
         """
         导出登录日志信息service
 
-        :param login_log_list: 登录日志信息列表
-        :return: 登录日志信息对应excel的二进制数据
+        :param query_object: 查询参数对象
+        :param file_type: 导出文件类型
+        :return: 登录日志信息对应导出文件的内容分块
         """
         # 创建一个映射字典，将英文键映射到中文键
         mapping_dict = {
@@ -253,11 +262,13 @@ class LoginLogService:
             'loginTime': '登录日期',
         }
 
-        for item in login_log_list:
+        def format_row(item: dict[str, Any]) -> dict[str, Any]:
             if item.get('status') == '0':
                 item['status'] = '成功'
             else:
                 item['status'] = '失败'
-        binary_data = ExcelUtil.export_list2excel(login_log_list, mapping_dict)
+            return item
 
-        return binary_data
+        return ExportUtil.iter_export(
+            LoginLogDao.get_login_log_list_query(query_object), mapping_dict, file_type, format_row
+        )
@@ -0,0 +1,176 @@
+import asyncio
+import json
+import time
+from typing import Any, Optional, Union
+
+from sqlalchemy import insert
+
+from config.database import AsyncSessionLocal
+from module_admin.entity.do.log_do import SysLogininfor, SysOperLog
+from module_admin.entity.vo.log_vo import LogininforModel, OperLogModel
+from utils.log_util import logger
+
+# 日志队列元素：(日志表模型, 日志对象, 待序列化的响应结果)
+LogRecord = tuple[Union[type[SysOperLog], type[SysLogininfor]], Union[OperLogModel, LogininforModel], Optional[dict]]
+
+
+class LogWriterService:
+    """
+    日志异步批量写入服务层
+
+    Log装饰器只将日志放入进程内有界队列，由后台任务在攒够batch_size条或距首条日志超过flush_interval_seconds时
+    按表多行写入；队列已满时丢弃新日志并计数，避免日志写入拖慢接口响应
+    """
+
+    queue_max_size = 10000
+    batch_size = 200
+    flush_interval_seconds = 0.5
+    drain_timeout_seconds = 10
+    _queue: Optional[asyncio.Queue] = None
+    _worker_task: Optional[asyncio.Task] = None
+    _metrics: dict[str, Union[int, float]] = {
+        'enqueued': 0,
+        'written': 0,
+        'dropped': 0,
+        'failed': 0,
+        'flushes': 0,
+        'queueHighWater': 0,
+        'lastFlushMs': 0,
+    }
+
+    @classmethod
+    async def start_writer(cls) -> None:
+        """
+        应用启动时创建日志队列并启动写入任务
+
+        :return:
+        """
+        cls._queue = asyncio.Queue(maxsize=cls.queue_max_size)
+        cls._worker_task = asyncio.create_task(cls._run())
+        logger.info('✅️ 日志异步写入任务启动成功')
+
+    @classmethod
+    async def stop_writer(cls) -> None:
+        """
+        应用关闭时写入队列中剩余的日志并停止写入任务
+
+        :return:
+        """
+        if not cls._worker_task:
+            return
+        # 以None作为结束标记，写入任务处理完标记前的所有日志后退出
+        await cls._queue.put(None)
+        try:
+            await asyncio.wait_for(cls._worker_task, timeout=cls.drain_timeout_seconds)
+        except asyncio.TimeoutError:
+            cls._worker_task.cancel()
+            logger.warning(f'日志队列未能在{cls.drain_timeout_seconds}秒内写完，剩余{cls._queue.qsize()}条日志已丢弃')
+        cls._worker_task = None
+
+    @classmethod
+    def add_operation_log(cls, operation_log: OperLogModel, result_dict: dict) -> None:
+        """
+        将操作日志放入写入队列
+
+        :param operation_log: 操作日志对象，返回参数由写入任务根据result_dict序列化
+        :param result_dict: 响应结果字典
+        :return:
+        """
+        cls._put((SysOperLog, operation_log, result_dict))
+
+    @classmethod
+    def add_login_log(cls, login_log: LogininforModel) -> None:
+        """
+        将登录日志放入写入队列
+
+        :param login_log: 登录日志对象
+        :return:
+        """
+        cls._put((SysLogininfor, login_log, None))
+
+    @classmethod
+    def get_metrics(cls) -> dict[str, Union[int, float]]:
+        """
+        获取日志写入指标
+
+        :return: 入队、写入、丢弃、写入失败数量及队列长度等指标
+        """
+        return {**cls._metrics, 'queueSize': cls._queue.qsize() if cls._queue else 0}
+
+    @classmethod
+    def _put(cls, record: LogRecord) -> None:
+        """
+        日志入队，队列已满或写入任务未启动时丢弃
+
+        :param record: 日志队列元素
+        :return:
+        """
+        if cls._queue is None or cls._worker_task is None:
+            cls._metrics['dropped'] += 1
+            logger.warning('日志写入任务未启动，已丢弃日志')
+            return
+        try:
+            cls._queue.put_nowait(record)
+        except asyncio.QueueFull:
+            cls._metrics['dropped'] += 1
+            logger.warning(f'日志队列已满（{cls.queue_max_size}条），已丢弃日志')
+            return
+        cls._metrics['enqueued'] += 1
+        cls._metrics['queueHighWater'] = max(cls._metrics['queueHighWater'], cls._queue.qsize())
+
+    @classmethod
+    async def _run(cls) -> None:
+        """
+        按数量或时间间隔批量取出日志并写入
+
+        :return:
+        """
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            record = await cls._queue.get()
+            if record is None:
+                break
+            batch = [record]
+            deadline = loop.time() + cls.flush_interval_seconds
+            while len(batch) < cls.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    record = await asyncio.wait_for(cls._queue.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    break
+                if record is None:
+                    stopping = True
+                    break
+                batch.append(record)
+            await cls._flush(batch)
+
+    @classmethod
+    async def _flush(cls, batch: list[LogRecord]) -> None:
+        """
+        按日志表分组多行写入日志，写入失败时记录错误并丢弃本批日志
+
+        :param batch: 日志队列元素列表
+        :return:
+        """
+        start_time = time.perf_counter()
+        rows_by_table: dict[type, list[dict[str, Any]]] = {}
+        for table, log_model, result_dict in batch:
+            # 主键为自增列，写入时不指定
+            row = log_model.model_dump(exclude={'oper_id', 'info_id'})
+            if result_dict is not None:
+                row['json_result'] = json.dumps(result_dict, ensure_ascii=False)
+            rows_by_table.setdefault(table, []).append(row)
+        try:
+            async with AsyncSessionLocal() as session:
+                for table, rows in rows_by_table.items():
+                    await session.execute(insert(table).values(rows))
+                await session.commit()
+            cls._metrics['written'] += len(batch)
+        except Exception as e:
+            cls._metrics['failed'] += len(batch)
+            logger.error(f'批量写入{len(batch)}条日志失败，详细错误信息：{e}')
+        cls._metrics['flushes'] += 1
+        cls._metrics['lastFlushMs'] = round((time.perf_counter() - start_time) * 1000, 2)
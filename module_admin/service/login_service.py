@@ -29,7 +29,9 @@ from module_dvd.dao.access_key_dao import AccessKeyDao
 from utils.common_util import CamelCaseUtil
 from utils.log_util import logger
 from utils.message_util import message_service
+from utils.principal_cache_util import PrincipalCacheUtil
 from utils.pwd_util import PwdUtil
+from utils.sys_cache_util import SysCacheUtil
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl='login')
 
@@ -146,7 +148,7 @@ class LoginService:
         :param request: Request对象
         :return: 校验结果
         """
-        black_ip_value = await request.app.state.redis.get(f'{RedisInitKeyConfig.SYS_CONFIG.key}:sys.login.blackIPList')
+        black_ip_value = await SysCacheUtil.get_config(request.app.state.redis, 'sys.login.blackIPList')
         black_ip_list = black_ip_value.split(',') if black_ip_value else []
         if request.headers.get('X-Forwarded-For') in black_ip_list:
             logger.warning('当前IP禁止登录')
@@ -218,102 +220,109 @@ class LoginService:
         except InvalidTokenError as e:
             logger.warning('用户token已失效，请重新登录')
             raise AuthException(data='', message='用户token已失效，请重新登录') from e
-        query_user = await UserDao.get_user_by_id(query_db, user_id=token_data.user_id)
-        if query_user.get('user_basic_info') is None:
-            logger.warning('用户token不合法')
-            raise AuthException(data='', message='用户token不合法')
+        redis = request.app.state.redis
         if AppConfig.app_same_time_login:
-            redis_token = await request.app.state.redis.get(f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:{session_id}')
+            token_key = f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:{session_id}'
         else:
             # 此方法可实现同一账号同一时间只能登录一次
-            redis_token = await request.app.state.redis.get(
-                f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:{query_user.get("user_basic_info").user_id}'
-            )
-        if token == redis_token:
-            if AppConfig.app_same_time_login:
-                await request.app.state.redis.set(
-                    f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:{session_id}',
-                    redis_token,
-                    ex=timedelta(minutes=JwtConfig.jwt_redis_expire_minutes),
-                )
-            else:
-                await request.app.state.redis.set(
-                    f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:{query_user.get("user_basic_info").user_id}',
-                    redis_token,
-                    ex=timedelta(minutes=JwtConfig.jwt_redis_expire_minutes),
-                )
+            token_key = f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:{token_data.user_id}'
+        # 令牌与登录用户信息缓存版本在同一次MGET中读取
+        cached_user, cache_version, (redis_token,) = await PrincipalCacheUtil.get_principal(
+            redis, token_data.user_id, CurrentUserModel, [token_key]
+        )
+        if token != redis_token:
+            logger.warning('用户token已失效，请重新登录')
+            raise AuthException(data='', message='用户token已失效，请重新登录')
+        await redis.set(token_key, redis_token, ex=timedelta(minutes=JwtConfig.jwt_redis_expire_minutes))
+
+        if cached_user is None:
+            cached_user = await cls.__build_current_user(query_db, token_data.user_id)
+            await PrincipalCacheUtil.set_principal(redis, token_data.user_id, cache_version, cached_user)
+        pwd_update_date = cached_user.user.pwd_update_date
+        # 缓存对象在请求间共享，按需复制后再设置与当前时间、配置相关的字段
+        # 密码相关配置从进程内缓存读取
+        init_password_modify = await SysCacheUtil.get_config(redis, 'sys.account.initPasswordModify')
+        password_validate_days = await SysCacheUtil.get_config(redis, 'sys.account.passwordValidateDays')
+        current_user = cached_user.model_copy(
+            update={
+                'is_default_modify_pwd': cls.__init_password_is_modify(init_password_modify, pwd_update_date),
+                'is_password_expired': cls.__password_is_expired(password_validate_days, pwd_update_date),
+            }
+        )
+        # 设置当前用户信息到上下文
+        RequestContext.set_current_user(current_user)
+        RequestContext.set_current_principal_version(cache_version)
+        return current_user
 
-            role_id_list = [item.role_id for item in query_user.get('user_role_info')]
-            if 1 in role_id_list:  # noqa: SIM108
-                permissions = ['*:*:*']
-            else:
-                permissions = [row.perms for row in query_user.get('user_menu_info')]
-            post_ids = ','.join([str(row.post_id) for row in query_user.get('user_post_info')])
-            role_ids = ','.join([str(row.role_id) for row in query_user.get('user_role_info')])
-            roles = [row.role_key for row in query_user.get('user_role_info')]
-            is_default_modify_pwd = await cls.__init_password_is_modify(
-                request, query_user.get('user_basic_info').pwd_update_date
-            )
-            is_password_expired = await cls.__password_is_expired(
-                request, query_user.get('user_basic_info').pwd_update_date
-            )
+    @classmethod
+    async def __build_current_user(cls, query_db: AsyncSession, user_id: int) -> CurrentUserModel:
+        """
+        从数据库构建登录用户信息，不包含与当前时间、配置相关的密码提醒字段
 
-            # 计算卡密到期时间
-            expire_time = None
-            user_access_key = query_user.get('user_basic_info').access_key
-            if user_access_key:
-                access_key_info = await AccessKeyDao.get_access_key_detail_by_key(query_db, user_access_key)
-                if access_key_info and access_key_info.used_time and access_key_info.duration_hours:
-                    expire_time = access_key_info.used_time + timedelta(hours=access_key_info.duration_hours)
-
-            user_info_data = CamelCaseUtil.transform_result(query_user.get('user_basic_info'))
-            user_info_data['expire_time'] = expire_time
-
-            current_user = CurrentUserModel(
-                permissions=permissions,
-                roles=roles,
-                user=UserInfoModel(
-                    **user_info_data,
-                    postIds=post_ids,
-                    roleIds=role_ids,
-                    dept=CamelCaseUtil.transform_result(query_user.get('user_dept_info')),
-                    role=CamelCaseUtil.transform_result(query_user.get('user_role_info')),
-                ),
-                isDefaultModifyPwd=is_default_modify_pwd,
-                isPasswordExpired=is_password_expired,
-            )
-            # 设置当前用户信息到上下文
-            RequestContext.set_current_user(current_user)
-            return current_user
-        logger.warning('用户token已失效，请重新登录')
-        raise AuthException(data='', message='用户token已失效，请重新登录')
+        :param query_db: orm对象
+        :param user_id: 用户id
+        :return: 当前用户信息对象
+        :raise: 令牌异常AuthException
+        """
+        query_user = await UserDao.get_user_by_id(query_db, user_id=user_id)
+        if query_user.get('user_basic_info') is None:
+            logger.warning('用户token不合法')
+            raise AuthException(data='', message='用户token不合法')
+
+        role_id_list = [item.role_id for item in query_user.get('user_role_info')]
+        if 1 in role_id_list:  # noqa: SIM108
+            permissions = ['*:*:*']
+        else:
+            permissions = [row.perms for row in query_user.get('user_menu_info')]
+        post_ids = ','.join([str(row.post_id) for row in query_user.get('user_post_info')])
+        role_ids = ','.join([str(row.role_id) for row in query_user.get('user_role_info')])
+        roles = [row.role_key for row in query_user.get('user_role_info')]
+
+        # 计算卡密到期时间
+        expire_time = None
+        user_access_key = query_user.get('user_basic_info').access_key
+        if user_access_key:
+            access_key_info = await AccessKeyDao.get_access_key_detail_by_key(query_db, user_access_key)
+            if access_key_info and access_key_info.used_time and access_key_info.duration_hours:
+                expire_time = access_key_info.used_time + timedelta(hours=access_key_info.duration_hours)
+
+        user_info_data = CamelCaseUtil.transform_result(query_user.get('user_basic_info'))
+        user_info_data['expire_time'] = expire_time
+        # 登录用户信息会写入缓存，不保留密码
+        user_info_data.pop('password', None)
+
+        return CurrentUserModel(
+            permissions=permissions,
+            roles=roles,
+            user=UserInfoModel(
+                **user_info_data,
+                postIds=post_ids,
+                roleIds=role_ids,
+                dept=CamelCaseUtil.transform_result(query_user.get('user_dept_info')),
+                role=CamelCaseUtil.transform_result(query_user.get('user_role_info')),
+            ),
+        )
 
     @classmethod
-    async def __init_password_is_modify(cls, request: Request, pwd_update_date: datetime) -> bool:
+    def __init_password_is_modify(cls, init_password_modify: Optional[str], pwd_update_date: datetime) -> bool:
         """
         判断当前用户是否初始密码登录
 
-        :param request: Request对象
+        :param init_password_modify: 初始密码修改策略配置值
         :param pwd_update_date: 密码最后更新时间
         :return: 是否初始密码登录
         """
-        init_password_is_modify = await request.app.state.redis.get(
-            f'{RedisInitKeyConfig.SYS_CONFIG.key}:sys.account.initPasswordModify'
-        )
-        return init_password_is_modify == '1' and pwd_update_date is None
+        return init_password_modify == '1' and pwd_update_date is None
 
     @classmethod
-    async def __password_is_expired(cls, request: Request, pwd_update_date: datetime) -> bool:
+    def __password_is_expired(cls, password_validate_days: Optional[str], pwd_update_date: datetime) -> bool:
         """
         判断当前用户密码是否过期
 
-        :param request: Request对象
+        :param password_validate_days: 密码有效天数配置值
         :param pwd_update_date: 密码最后更新时间
         :return: 密码是否过期
         """
-        password_validate_days = await request.app.state.redis.get(
-            f'{RedisInitKeyConfig.SYS_CONFIG.key}:sys.account.passwordValidateDays'
-        )
         if password_validate_days and int(password_validate_days) > 0:
             if pwd_update_date is None:
                 return True
@@ -444,11 +453,10 @@ class LoginService:
         :return: 注册结果
         """
         register_enabled = (
-            await request.app.state.redis.get(f'{RedisInitKeyConfig.SYS_CONFIG.key}:sys.account.registerUser') == 'true'
+            await SysCacheUtil.get_config(request.app.state.redis, 'sys.account.registerUser') == 'true'
         )
         captcha_enabled = (
-            await request.app.state.redis.get(f'{RedisInitKeyConfig.SYS_CONFIG.key}:sys.account.captchaEnabled')
-            == 'true'
+            await SysCacheUtil.get_config(request.app.state.redis, 'sys.account.captchaEnabled') == 'true'
         )
         if user_register.password == user_register.confirm_password:
             if register_enabled:
@@ -517,6 +525,7 @@ class LoginService:
             forget_user.password = PwdUtil.get_password_hash(forget_user.password)
             forget_user.user_id = (await UserDao.get_user_by_name(query_db, forget_user.user_name)).user_id
             edit_result = await UserService.reset_user_services(query_db, forget_user)
+            await PrincipalCacheUtil.bump_user_versions(request.app.state.redis, [forget_user.user_id])
             result = edit_result.dict()
         elif not redis_sms_result:
             result = {'is_success': False, 'message': '短信验证码已过期'}
@@ -7,8 +7,9 @@ from common.enums import RedisInitKeyConfig
 from common.vo import CrudResponseModel
 from config.env import AppConfig, JwtConfig
 from exceptions.exception import ServiceException
-from module_admin.entity.vo.online_vo import DeleteOnlineModel, OnlineQueryModel
+from module_admin.entity.vo.online_vo import DeleteOnlineModel, OnlinePageQueryModel, OnlinePageResponseModel
 from utils.common_util import CamelCaseUtil
+from utils.redis_key_util import RedisKeyUtil
 
 
 class OnlineService:
@@ -17,49 +18,62 @@ class OnlineService:
     """
 
     @classmethod
-    async def get_online_list_services(cls, request: Request, query_object: OnlineQueryModel) -> list[dict[str, Any]]:
+    async def get_online_list_services(
+        cls, request: Request, query_object: OnlinePageQueryModel
+    ) -> OnlinePageResponseModel:
         """
         获取在线用户表信息service
 
+        未传入查询条件时只遍历令牌键名，按键名排序后仅读取当前页的令牌；
+        传入查询条件时分批读取并解析令牌，找到第一个匹配的在线用户即返回
+
         :param request: Request对象
         :param query_object: 查询参数对象
         :return: 在线用户列表信息
         """
-        access_token_keys = await request.app.state.redis.keys(f'{RedisInitKeyConfig.ACCESS_TOKEN.key}*')
-        if not access_token_keys:
-            access_token_keys = []
-        access_token_values_list = [await request.app.state.redis.get(key) for key in access_token_keys]
-        online_info_list = []
-        for item in access_token_values_list:
-            payload = jwt.decode(item, JwtConfig.jwt_secret_key, algorithms=[JwtConfig.jwt_algorithm])
-            online_dict = {
-                'token_id': payload.get('session_id') if AppConfig.app_same_time_login else payload.get('user_id'),
-                'user_name': payload.get('user_name'),
-                'dept_name': payload.get('dept_name'),
-                'ipaddr': payload.get('login_info').get('ipaddr'),
-                'login_location': payload.get('login_info').get('loginLocation'),
-                'browser': payload.get('login_info').get('browser'),
-                'os': payload.get('login_info').get('os'),
-                'login_time': payload.get('login_info').get('loginTime'),
-            }
-            if query_object.user_name and not query_object.ipaddr:
-                if query_object.user_name == payload.get('user_name'):
-                    online_info_list = [online_dict]
-                    break
-            elif not query_object.user_name and query_object.ipaddr:
-                if query_object.ipaddr == payload.get('login_info').get('ipaddr'):
-                    online_info_list = [online_dict]
-                    break
-            elif query_object.user_name and query_object.ipaddr:
-                if query_object.user_name == payload.get('user_name') and query_object.ipaddr == payload.get(
-                    'login_info'
-                ).get('ipaddr'):
-                    online_info_list = [online_dict]
-                    break
-            else:
-                online_info_list.append(online_dict)
+        redis = request.app.state.redis
+        match = f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:*'
+        if query_object.user_name or query_object.ipaddr:
+            async for items in RedisKeyUtil.iter_items(redis, match):
+                for _, access_token in items:
+                    online_dict = cls._get_online_dict(access_token)
+                    if (not query_object.user_name or query_object.user_name == online_dict['user_name']) and (
+                        not query_object.ipaddr or query_object.ipaddr == online_dict['ipaddr']
+                    ):
+                        return OnlinePageResponseModel(rows=CamelCaseUtil.transform_result([online_dict]), total=1)
+
+            return OnlinePageResponseModel(rows=[], total=0)
+
+        access_token_keys = sorted(await RedisKeyUtil.get_keys(redis, match))
+        total = len(access_token_keys)
+        if query_object.page_num and query_object.page_size:
+            start = (query_object.page_num - 1) * query_object.page_size
+            access_token_keys = access_token_keys[start : start + query_object.page_size]
+        access_token_values_list = await RedisKeyUtil.get_values(redis, access_token_keys)
+        online_info_list = [cls._get_online_dict(item) for item in access_token_values_list if item]
+
+        return OnlinePageResponseModel(rows=CamelCaseUtil.transform_result(online_info_list), total=total)
+
+    @classmethod
+    def _get_online_dict(cls, access_token: str) -> dict[str, Any]:
+        """
+        解析令牌获取在线用户信息
+
+        :param access_token: 令牌
+        :return: 在线用户信息
+        """
+        payload = jwt.decode(access_token, JwtConfig.jwt_secret_key, algorithms=[JwtConfig.jwt_algorithm])
 
-        return CamelCaseUtil.transform_result(online_info_list)
+        return {
+            'token_id': payload.get('session_id') if AppConfig.app_same_time_login else payload.get('user_id'),
+            'user_name': payload.get('user_name'),
+            'dept_name': payload.get('dept_name'),
+            'ipaddr': payload.get('login_info').get('ipaddr'),
+            'login_location': payload.get('login_info').get('loginLocation'),
+            'browser': payload.get('login_info').get('browser'),
+            'os': payload.get('login_info').get('os'),
+            'login_time': payload.get('login_info').get('loginTime'),
+        }
 
     @classmethod
     async def delete_online_services(cls, request: Request, page_object: DeleteOnlineModel) -> CrudResponseModel:
@@ -72,7 +86,8 @@ class OnlineService:
         """
         if page_object.token_ids:
             token_id_list = page_object.token_ids.split(',')
-            for token_id in token_id_list:
-                await request.app.state.redis.delete(f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:{token_id}')
+            await request.app.state.redis.delete(
+                *[f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:{token_id}' for token_id in token_id_list]
+            )
             return CrudResponseModel(is_success=True, message='强退成功')
         raise ServiceException(message='传入session_id为空')
@@ -1,17 +1,22 @@
-import io
+import asyncio
+from collections.abc import AsyncIterator
 from datetime import datetime
-from typing import Any, Union
+from itertools import islice
+from typing import Any, Optional, Union
 
-import pandas as pd
 from fastapi import Request, UploadFile
+from openpyxl import load_workbook
+from pydantic import ValidationError
+from pydantic_validation_decorator import FieldValidationError
 from sqlalchemy import ColumnElement
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from common.constant import CommonConstant
 from common.vo import CrudResponseModel, PageModel
-from exceptions.exception import ServiceException
+from exceptions.exception import ModelValidatorException, ServiceException
+from module_admin.dao.dept_dao import DeptDao
 from module_admin.dao.user_dao import UserDao
-from module_admin.entity.do.user_do import SysUserRole
+from module_admin.entity.do.user_do import SysUser, SysUserRole
 from module_admin.entity.vo.post_vo import PostPageQueryModel
 from module_admin.entity.vo.user_vo import (
     AddUserModel,
@@ -22,6 +27,8 @@ from module_admin.entity.vo.user_vo import (
     ResetUserModel,
     SelectedRoleModel,
     UserDetailModel,
+    UserImportErrorModel,
+    UserImportResultModel,
     UserInfoModel,
     UserModel,
     UserPageQueryModel,
@@ -33,11 +40,11 @@ from module_admin.entity.vo.user_vo import (
     UserRowModel,
 )
 from module_admin.service.config_service import ConfigService
-from module_admin.service.dept_service import DeptService
 from module_admin.service.post_service import PostService
 from module_admin.service.role_service import RoleService
 from utils.common_util import CamelCaseUtil
 from utils.excel_util import ExcelUtil
+from utils.export_util import ExportFileType, ExportUtil
 from utils.pwd_util import PwdUtil
 
 
@@ -46,6 +53,8 @@ class UserService:
     用户管理模块服务层
     """
 
+    import_chunk_size = 1000
+
     @classmethod
     async def get_user_list_services(
         cls,
@@ -364,31 +373,31 @@ class UserService:
             raise e
 
     @classmethod
-    def _set_row_sex_value(cls, row: pd.Series) -> None:
+    def _set_row_sex_value(cls, row: dict[str, Any]) -> None:
         """
         设置行性别值
 
         :param row: 行数据
         :return: None
         """
-        if row['sex'] == '男':
+        if row.get('sex') == '男':
             row['sex'] = '0'
-        if row['sex'] == '女':
+        if row.get('sex') == '女':
             row['sex'] = '1'
-        if row['sex'] == '未知':
+        if row.get('sex') == '未知':
             row['sex'] = '2'
 
     @classmethod
-    def _set_row_status_value(cls, row: pd.Series) -> None:
+    def _set_row_status_value(cls, row: dict[str, Any]) -> None:
         """
         设置行状态值
 
         :param row: 行数据
         :return: None
         """
-        if row['status'] == '正常':
+        if row.get('status') == '正常':
             row['status'] = '0'
-        if row['status'] == '停用':
+        if row.get('status') == '停用':
             row['status'] = '1'
 
     @classmethod
@@ -405,6 +414,9 @@ class UserService:
         """
         批量导入用户service
 
+        按import_chunk_size分块读取导入文件，每块使用一次IN查询获取已存在的用户，
+        部门数据权限按部门去重后批量校验，校验通过的行批量新增或更新，校验失败的行记录到导入结果中
+
         :param request: Request对象
         :param query_db: orm对象
         :param file: 用户导入文件对象
@@ -423,75 +435,307 @@ class UserService:
             '用户性别': 'sex',
             '帐号状态': 'status',
         }
-        contents = await file.read()
-        df = pd.read_excel(io.BytesIO(contents))
-        await file.close()
-        df.rename(columns=header_dict, inplace=True)
-        add_error_result = []
-        count = 0
+        # 所有新增用户的初始密码相同，只计算一次哈希
+        password = await asyncio.to_thread(
+            PwdUtil.get_password_hash,
+            await ConfigService.query_config_list_from_cache_services(request.app.state.redis, 'sys.user.initPassword'),
+        )
+        import_result = UserImportResultModel()
+        dept_scope_dict: dict[int, bool] = {}
+        imported_user_names: set[str] = set()
         try:
-            for _index, row in df.iterrows():
-                count = count + 1
-                cls._set_row_sex_value(row)
-                cls._set_row_status_value(row)
-                add_user = UserModel(
-                    deptId=row['dept_id'],
-                    userName=row['user_name'],
-                    password=PwdUtil.get_password_hash(
-                        await ConfigService.query_config_list_from_cache_services(
-                            request.app.state.redis, 'sys.user.initPassword'
-                        )
-                    ),
-                    nickName=row['nick_name'],
-                    email=row['email'],
-                    phonenumber=str(row['phonenumber']),
-                    sex=row['sex'],
-                    status=row['status'],
-                    createBy=current_user.user.user_name,
-                    createTime=datetime.now(),
-                    updateBy=current_user.user.user_name,
-                    updateTime=datetime.now(),
+            async for chunk in cls._iter_import_chunks(file, header_dict):
+                await cls._import_user_chunk(
+                    query_db,
+                    chunk,
+                    password,
+                    update_support,
+                    current_user,
+                    user_data_scope_sql,
+                    dept_data_scope_sql,
+                    dept_scope_dict,
+                    imported_user_names,
+                    import_result,
                 )
-                user_info = await UserDao.get_user_by_info(query_db, UserModel(userName=row['user_name']))
-                if user_info:
-                    if update_support:
-                        edit_user_model = UserModel(
-                            userId=user_info.user_id,
-                            deptId=row['dept_id'],
-                            userName=row['user_name'],
-                            nickName=row['nick_name'],
-                            email=row['email'],
-                            phonenumber=str(row['phonenumber']),
-                            sex=row['sex'],
-                            status=row['status'],
-                            updateBy=current_user.user.user_name,
-                            updateTime=datetime.now(),
-                        )
-                        edit_user_model.validate_fields()
-                        await cls.check_user_allowed_services(edit_user_model)
-                        if not current_user.user.admin:
-                            await cls.check_user_data_scope_services(
-                                query_db, edit_user_model.user_id, user_data_scope_sql
-                            )
-                            await DeptService.check_dept_data_scope_services(
-                                query_db, edit_user_model.dept_id, dept_data_scope_sql
-                            )
-                        edit_user = edit_user_model.model_dump(exclude_unset=True)
-                        await UserDao.edit_user_dao(query_db, edit_user)
-                    else:
-                        add_error_result.append(f'{count}.用户账号{row["user_name"]}已存在')
-                else:
-                    add_user.validate_fields()
-                    if not current_user.user.admin:
-                        await DeptService.check_dept_data_scope_services(
-                            query_db, add_user.dept_id, dept_data_scope_sql
-                        )
-                    await UserDao.add_user_dao(query_db, add_user)
             await query_db.commit()
-            return CrudResponseModel(is_success=True, message='\n'.join(add_error_result))
         except Exception as e:
             await query_db.rollback()
             raise e
+        finally:
+            await file.close()
+        message = (
+            f'导入完成，共{import_result.total}条，新增{import_result.added}条，'
+            f'更新{import_result.updated}条，失败{import_result.failed}条'
+        )
+        if import_result.errors:
+            message = '\n'.join([message] + [f'{error.row_num}.{error.message}' for error in import_result.errors])
+
+        return CrudResponseModel(is_success=True, message=message, result=import_result)
+
+    @classmethod
+    async def _iter_import_chunks(
+        cls, file: UploadFile, header_dict: dict[str, str]
+    ) -> AsyncIterator[list[tuple[int, dict[str, Any]]]]:
+        """
+        以只读模式分块读取导入文件
+
+        :param file: 用户导入文件对象
+        :param header_dict: 表头与字段名的映射字典
+        :return: 每块为行号与行数据组成的列表，行号为工作表中的实际行号，跳过的空行同样计入行号
+        """
+        await file.seek(0)
+        workbook = await asyncio.to_thread(load_workbook, file.file, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = await asyncio.to_thread(next, rows, ())
+            columns = [header_dict.get(str(cell).strip()) if cell is not None else None for cell in header]
+            # 表头为第1行，数据从第2行开始
+            numbered_rows = enumerate(rows, start=2)
+            while values_list := await asyncio.to_thread(lambda: list(islice(numbered_rows, cls.import_chunk_size))):
+                chunk = []
+                for row_num, values in values_list:
+                    if all(value is None or str(value).strip() == '' for value in values):
+                        continue
+                    chunk.append(
+                        (
+                            row_num,
+                            {
+                                column: cls._clean_import_value(value)
+                                for column, value in zip(columns, values)
+                                if column
+                            },
+                        )
+                    )
+                if chunk:
+                    yield chunk
+        finally:
+            workbook.close()
+
+    @classmethod
+    def _clean_import_value(cls, value: Any) -> Any:
+        """
+        清理导入单元格的值，去除字符串首尾空白，整数形式的浮点数转换为整数
+
+        :param value: 单元格的值
+        :return: 清理后的值
+        """
+        if isinstance(value, str):
+            value = value.strip()
+            return value or None
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+
+        return value
+
+    @classmethod
+    async def _import_user_chunk(
+        cls,
+        query_db: AsyncSession,
+        chunk: list[tuple[int, dict[str, Any]]],
+        password: str,
+        update_support: bool,
+        current_user: CurrentUserModel,
+        user_data_scope_sql: ColumnElement,
+        dept_data_scope_sql: ColumnElement,
+        dept_scope_dict: dict[int, bool],
+        imported_user_names: set[str],
+        import_result: UserImportResultModel,
+    ) -> None:
+        """
+        导入一块用户数据
+
+        :param query_db: orm对象
+        :param chunk: 行号与行数据组成的列表
+        :param password: 初始密码的哈希值
+        :param update_support: 用户存在时是否更新
+        :param current_user: 当前用户对象
+        :param user_data_scope_sql: 用户数据权限sql
+        :param dept_data_scope_sql: 部门数据权限sql
+        :param dept_scope_dict: 已校验部门的数据权限校验结果，跨块复用
+        :param imported_user_names: 已导入的用户账号，用于校验导入文件中的重复账号
+        :param import_result: 导入结果
+        :return:
+        """
+        import_result.total += len(chunk)
+        user_names = list({str(row['user_name']) for _, row in chunk if row.get('user_name') is not None})
+        user_info_dict = {
+            user.user_name: user for user in reversed(await UserDao.get_user_list_by_user_names(query_db, user_names))
+        }
+        now = datetime.now()
+        checked_users: list[tuple[int, UserModel, bool]] = []
+        for row_num, row in chunk:
+            user_name = str(row['user_name']) if row.get('user_name') is not None else None
+            user_info = user_info_dict.get(user_name)
+            try:
+                user = await cls._build_import_user(
+                    row, user_name, user_info, password, update_support, current_user, now, imported_user_names
+                )
+            except (ServiceException, ModelValidatorException, FieldValidationError) as e:
+                cls._add_import_error(import_result, row_num, user_name, e.message)
+                continue
+            except ValidationError as e:
+                cls._add_import_error(
+                    import_result, row_num, user_name, '；'.join(error['msg'] for error in e.errors())
+                )
+                continue
+            imported_user_names.add(user_name)
+            checked_users.append((row_num, user, user_info is not None))
+
+        if not current_user.user.admin:
+            checked_users = await cls._filter_import_users_by_data_scope(
+                query_db,
+                checked_users,
+                user_data_scope_sql,
+                dept_data_scope_sql,
+                dept_scope_dict,
+                imported_user_names,
+                import_result,
+            )
+        add_user_list = [
+            user.model_dump(exclude_unset=True, exclude={'admin'}) for _, user, is_edit in checked_users if not is_edit
+        ]
+        edit_user_list = [
+            user.model_dump(exclude_unset=True, exclude={'admin'}) for _, user, is_edit in checked_users if is_edit
+        ]
+        if add_user_list:
+            await UserDao.batch_add_user_dao(query_db, add_user_list)
+            import_result.added += len(add_user_list)
+        if edit_user_list:
+            await UserDao.batch_edit_user_dao(query_db, edit_user_list)
+            import_result.updated += len(edit_user_list)
+
+    @classmethod
+    async def _build_import_user(
+        cls,
+        row: dict[str, Any],
+        user_name: Optional[str],
+        user_info: Optional[SysUser],
+        password: str,
+        update_support: bool,
+        current_user: CurrentUserModel,
+        now: datetime,
+        imported_user_names: set[str],
+    ) -> UserModel:
+        """
+        校验导入行并构建新增或编辑的用户模型，校验失败时抛出异常
+
+        :param row: 行数据
+        :param user_name: 用户账号
+        :param user_info: 已存在的用户信息，为None表示新增用户
+        :param password: 初始密码的哈希值
+        :param update_support: 用户存在时是否更新
+        :param current_user: 当前用户对象
+        :param now: 当前时间
+        :param imported_user_names: 已导入的用户账号，用于校验导入文件中的重复账号
+        :return: 用户模型
+        """
+        cls._set_row_sex_value(row)
+        cls._set_row_status_value(row)
+        if user_name in imported_user_names:
+            raise ServiceException(message=f'用户账号{user_name}在导入文件中重复')
+        if user_info and not update_support:
+            raise ServiceException(message=f'用户账号{user_name}已存在')
+        phonenumber = str(row['phonenumber']) if row.get('phonenumber') is not None else None
+        if user_info:
+            user = UserModel(
+                userId=user_info.user_id,
+                deptId=row.get('dept_id'),
+                userName=user_name,
+                nickName=row.get('nick_name'),
+                email=row.get('email'),
+                phonenumber=phonenumber,
+                sex=row.get('sex'),
+                status=row.get('status'),
+                updateBy=current_user.user.user_name,
+                updateTime=now,
+            )
+            user.validate_fields()
+            await cls.check_user_allowed_services(user)
+        else:
+            user = UserModel(
+                deptId=row.get('dept_id'),
+                userName=user_name,
+                password=password,
+                nickName=row.get('nick_name'),
+                email=row.get('email'),
+                phonenumber=phonenumber,
+                sex=row.get('sex'),
+                status=row.get('status'),
+                createBy=current_user.user.user_name,
+                createTime=now,
+                updateBy=current_user.user.user_name,
+                updateTime=now,
+            )
+            user.validate_fields()
+
+        return user
+
+    @classmethod
+    async def _filter_import_users_by_data_scope(
+        cls,
+        query_db: AsyncSession,
+        checked_users: list[tuple[int, UserModel, bool]],
+        user_data_scope_sql: ColumnElement,
+        dept_data_scope_sql: ColumnElement,
+        dept_scope_dict: dict[int, bool],
+        imported_user_names: set[str],
+        import_result: UserImportResultModel,
+    ) -> list[tuple[int, UserModel, bool]]:
+        """
+        批量校验导入用户的数据权限，无权限的行记录到导入结果中
+
+        :param query_db: orm对象
+        :param checked_users: 行号、用户模型及是否为编辑组成的列表
+        :param user_data_scope_sql: 用户数据权限sql
+        :param dept_data_scope_sql: 部门数据权限sql
+        :param dept_scope_dict: 已校验部门的数据权限校验结果，跨块复用
+        :param imported_user_names: 已导入的用户账号，无权限的行从中移除
+        :param import_result: 导入结果
+        :return: 有权限的行号、用户模型及是否为编辑组成的列表
+        """
+        dept_ids = list(
+            {user.dept_id for _, user, _ in checked_users if user.dept_id is not None} - dept_scope_dict.keys()
+        )
+        if dept_ids:
+            allowed_dept_ids = set(await DeptDao.get_dept_ids_by_data_scope(query_db, dept_ids, dept_data_scope_sql))
+            dept_scope_dict.update({dept_id: dept_id in allowed_dept_ids for dept_id in dept_ids})
+        allowed_user_ids: set[int] = set()
+        edit_user_ids = [user.user_id for _, user, is_edit in checked_users if is_edit]
+        if edit_user_ids:
+            allowed_user_ids = set(
+                await UserDao.get_user_ids_by_data_scope(query_db, edit_user_ids, user_data_scope_sql)
+            )
+
+        allowed_users = []
+        for row_num, user, is_edit in checked_users:
+            error_message = None
+            if is_edit and user.user_id not in allowed_user_ids:
+                error_message = '没有权限访问用户数据'
+            elif user.dept_id is not None and not dept_scope_dict.get(user.dept_id):
+                error_message = '没有权限访问部门数据'
+            if error_message:
+                imported_user_names.discard(user.user_name)
+                cls._add_import_error(import_result, row_num, user.user_name, error_message)
+                continue
+            allowed_users.append((row_num, user, is_edit))
+
+        return allowed_users
+
+    @classmethod
+    def _add_import_error(
+        cls, import_result: UserImportResultModel, row_num: int, user_name: Optional[str], message: str
+    ) -> None:
+        """
+        记录导入失败的行
+
+        :param import_result: 导入结果
+        :param row_num: 行号
+        :param user_name: 用户账号
+        :param message: 失败原因
+        :return: None
+        """
+        import_result.failed += 1
+        import_result.errors.append(UserImportErrorModel(rowNum=row_num, userName=user_name, message=message))
 
     @staticmethod
     async def get_user_import_template_services() -> bytes:
@@ -510,12 +754,16 @@ class UserService:
         return binary_data
 
     @staticmethod
-    async def export_user_list_services(user_list: list) -> bytes:
+    async def export_user_list_services(
+        query_object: UserPageQueryModel, data_scope_sql: ColumnElement, file_type: ExportFileType = 'xlsx'
+    ) -> AsyncIterator[bytes]:
         """
         导出用户信息service
 
-        :param user_list: 用户信息列表
-        :return: 用户信息对应excel的二进制数据
+        :param query_object: 查询参数对象
+        :param data_scope_sql: 数据权限对应的查询sql语句
+        :param file_type: 导出文件类型
+        :return: 用户信息对应导出文件的内容分块
         """
         # 创建一个映射字典，将英文键映射到中文键
         mapping_dict = {
@@ -534,8 +782,8 @@ class UserService:
             'remark': '备注',
         }
 
-        for item in user_list:
-            item['deptName'] = item.get('dept').get('deptName')
+        def format_row(row: list[dict[str, Any]]) -> dict[str, Any]:
+            item = {**row[0], 'deptName': row[1].get('deptName') if row[1] else None}
             if item.get('status') == '0':
                 item['status'] = '正常'
             else:
@@ -546,9 +794,11 @@ class UserService:
                 item['sex'] = '女'
             else:
                 item['sex'] = '未知'
-        binary_data = ExcelUtil.export_list2excel(user_list, mapping_dict)
+            return item
 
-        return binary_data
+        return ExportUtil.iter_export(
+            UserDao.get_user_list_query(query_object, data_scope_sql), mapping_dict, file_type, format_row
+        )
 
     @classmethod
     async def get_user_role_allocated_list_services(
@@ -21,6 +21,7 @@ from module_dvd.entity.vo.access_key_vo import (
 )
 from module_dvd.service.access_key_service import AccessKeyService
 from utils.log_util import logger
+from utils.principal_cache_util import PrincipalCacheUtil
 from utils.response_util import ResponseUtil
 
 access_key_controller = APIRouterPro(
@@ -82,6 +83,7 @@ async def edit_access_key(
     query_db: Annotated[AsyncSession, DBSessionDependency()],
 ) -> Response:
     edit_access_key_result = await AccessKeyService.edit_access_key_services(query_db, edit_access_key_obj)
+    await PrincipalCacheUtil.bump_global_version(request.app.state.redis)
     logger.info(edit_access_key_result.message)
 
     return ResponseUtil.success(msg=edit_access_key_result.message)
@@ -102,6 +104,7 @@ async def delete_access_key(
 ) -> Response:
     delete_access_key_obj = DeleteAccessKeyModel(accessKeys=access_keys)
     delete_access_key_result = await AccessKeyService.delete_access_key_services(query_db, delete_access_key_obj)
+    await PrincipalCacheUtil.bump_global_version(request.app.state.redis)
     logger.info(delete_access_key_result.message)
 
     return ResponseUtil.success(msg=delete_access_key_result.message)
@@ -141,6 +144,7 @@ async def activate_access_key(
     activate_result = await AccessKeyService.activate_access_key_services(
         query_db, activate_model.access_key, current_user.user.user_id
     )
+    await PrincipalCacheUtil.bump_user_versions(request.app.state.redis, [current_user.user.user_id])
     logger.info(f'用户 {current_user.user.user_name} 激活卡密成功')
 
     return ResponseUtil.success(data=activate_result)
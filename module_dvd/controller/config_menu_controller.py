@@ -5,6 +5,7 @@ from fastapi import Path, Query, Request, Response
 from pydantic_validation_decorator import ValidateFields
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from common.annotation.etag_annotation import ConditionalGet
 from common.annotation.log_annotation import Log
 from common.aspect.db_seesion import DBSessionDependency
 from common.aspect.pre_auth import PreAuthDependency
@@ -18,6 +19,8 @@ from module_dvd.entity.vo.config_menu_vo import (
     DeleteConfigMenuModel,
 )
 from module_dvd.service.config_menu_service import ConfigMenuService
+from tools.qrcode.qrcode_login_factory import QRCodeLoginFactory
+from utils.etag_util import ETagUtil
 from utils.log_util import logger
 from utils.response_util import ResponseUtil
 
@@ -32,6 +35,7 @@ config_menu_controller = APIRouterPro(
     description='用于获取配置菜单树形下拉数据',
     response_model=DataResponseModel[list[ConfigMenuTreeModel]],
 )
+@ConditionalGet(version_names=[ConfigMenuService.data_version_name])
 async def get_config_menu_tree(
     request: Request,
     query_db: Annotated[AsyncSession, DBSessionDependency()],
@@ -48,6 +52,7 @@ async def get_config_menu_tree(
     description='用于获取配置菜单列表',
     response_model=DataResponseModel[list[ConfigMenuModel]],
 )
+@ConditionalGet(version_names=[ConfigMenuService.data_version_name])
 async def get_config_menu_list(
     request: Request,
     menu_query: Annotated[ConfigMenuQueryModel, Query()],
@@ -75,6 +80,8 @@ async def add_config_menu(
     add_config_menu.create_time = datetime.now()
     add_config_menu.update_time = datetime.now()
     add_menu_result = await ConfigMenuService.add_config_menu_services(query_db, add_config_menu)
+    await ETagUtil.bump_versions(request.app.state.redis, [ConfigMenuService.data_version_name])
+    await QRCodeLoginFactory.publish_invalidate(request.app.state.redis)
     logger.info(add_menu_result.message)
 
     return ResponseUtil.success(msg=add_menu_result.message)
@@ -95,6 +102,8 @@ async def edit_config_menu(
 ) -> Response:
     edit_config_menu.update_time = datetime.now()
     edit_menu_result = await ConfigMenuService.edit_config_menu_services(query_db, edit_config_menu)
+    await ETagUtil.bump_versions(request.app.state.redis, [ConfigMenuService.data_version_name])
+    await QRCodeLoginFactory.publish_invalidate(request.app.state.redis)
     logger.info(edit_menu_result.message)
 
     return ResponseUtil.success(msg=edit_menu_result.message)
@@ -114,6 +123,8 @@ async def delete_config_menu(
 ) -> Response:
     delete_menu = DeleteConfigMenuModel(dvdConfigMenuIds=menu_ids)
     delete_menu_result = await ConfigMenuService.delete_config_menu_services(query_db, delete_menu)
+    await ETagUtil.bump_versions(request.app.state.redis, [ConfigMenuService.data_version_name])
+    await QRCodeLoginFactory.publish_invalidate(request.app.state.redis)
     logger.info(delete_menu_result.message)
 
     return ResponseUtil.success(msg=delete_menu_result.message)
@@ -2,11 +2,14 @@ from datetime import date
 from typing import Annotated, Optional
 
 from fastapi import Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from common.annotation.cache_annotation import DashboardCache
 from common.aspect.db_seesion import DBSessionDependency
 from common.router import APIRouterPro
 from common.vo import DataResponseModel
+from module_dvd.service.dashboard_push_service import DashboardPushService
 from module_dvd.service.dd_service import DdOverviewService
 from utils.log_util import logger
 from utils.response_util import ResponseUtil
@@ -20,6 +23,7 @@ dd_controller = APIRouterPro(prefix='/dvd/dd', order_num=99, tags=['数据大屏
     description='获取所有抖店店铺列表用于筛选',
     response_model=DataResponseModel,
 )
+@DashboardCache(platform='dd', date_param=None, store_param='store_id')
 async def get_store_list(
     request: Request,
     query_db: Annotated[AsyncSession, DBSessionDependency()],
@@ -39,6 +43,7 @@ async def get_store_list(
     description='获取成交金额/订单数前五的店铺',
     response_model=DataResponseModel,
 )
+@DashboardCache(platform='dd', date_param=None, store_param='store_id')
 async def get_store_top5(
     request: Request,
     query_db: Annotated[AsyncSession, DBSessionDependency()],
@@ -49,7 +54,9 @@ async def get_store_top5(
     """
     获取抖店店铺销售TOP5
     """
-    top_stores = await DdOverviewService.get_store_top5_service(query_db, store_id, sort_by, limit)
+    top_stores = await DdOverviewService.get_store_top5_service(
+        query_db, request.app.state.redis, store_id, sort_by, limit
+    )
     logger.info(f'获取抖店店铺TOP{limit}成功，排序方式：{sort_by}')
 
     return ResponseUtil.success(data=top_stores)
@@ -61,6 +68,7 @@ async def get_store_top5(
     description='获取用户支付金额、成交订单数、商品曝光人数等概览指标',
     response_model=DataResponseModel,
 )
+@DashboardCache(platform='dd', date_param=None, store_param='store_id')
 async def get_overview_metrics(
     request: Request,
     query_db: Annotated[AsyncSession, DBSessionDependency()],
@@ -69,7 +77,7 @@ async def get_overview_metrics(
     """
     获取抖店概览指标
     """
-    metrics = await DdOverviewService.get_overview_metrics_service(query_db, store_id)
+    metrics = await DdOverviewService.get_overview_metrics_service(query_db, request.app.state.redis, store_id)
     logger.info('获取抖店概览指标成功')
 
     return ResponseUtil.success(data=metrics)
@@ -81,6 +89,7 @@ async def get_overview_metrics(
     description='获取24小时的趋势数据，支持按指标筛选',
     response_model=DataResponseModel,
 )
+@DashboardCache(platform='dd', date_param=None, store_param='store_id')
 async def get_hourly_trend(
     request: Request,
     query_db: Annotated[AsyncSession, DBSessionDependency()],
@@ -90,7 +99,9 @@ async def get_hourly_trend(
     """
     获取小时趋势数据
     """
-    trend_data = await DdOverviewService.get_hourly_trend_service(query_db, store_id, index_display)
+    trend_data = await DdOverviewService.get_hourly_trend_service(
+        query_db, request.app.state.redis, store_id, index_display
+    )
     logger.info(f'获取小时趋势数据成功，指标：{index_display}')
 
     return ResponseUtil.success(data=trend_data)
@@ -102,6 +113,7 @@ async def get_hourly_trend(
     description='查看数据库中有哪些可用的指标名称',
     response_model=DataResponseModel,
 )
+@DashboardCache(platform='dd', date_param=None, store_param='store_id')
 async def get_available_indices(
     request: Request,
     query_db: Annotated[AsyncSession, DBSessionDependency()],
@@ -109,7 +121,28 @@ async def get_available_indices(
     """
     获取可用的指标列表
     """
-    indices = await DdOverviewService.get_available_indices_service(query_db)
+    indices = await DdOverviewService.get_available_indices_service(query_db, request.app.state.redis)
     logger.info('获取可用指标列表成功')
 
     return ResponseUtil.success(data=indices)
+
+
+@dd_controller.get(
+    '/dashboard/stream',
+    summary='订阅抖店实时数据推送',
+    description='SSE长连接，连接后推送一次概览指标、小时趋势、店铺TOP5全量数据，之后在采集数据入库时仅推送发生变化的组件',
+)
+async def stream_dashboard_data(
+    request: Request,
+    store_id: Annotated[Optional[str], Query(description='店铺ID，用于筛选')] = None,
+) -> StreamingResponse:
+    """
+    订阅抖店实时数据推送
+    """
+    logger.info(f'订阅抖店实时数据推送，店铺：{store_id or "全部"}')
+
+    return StreamingResponse(
+        DashboardPushService.subscribe_services('dd', store=store_id),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
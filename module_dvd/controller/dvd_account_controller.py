@@ -1,16 +1,18 @@
 from datetime import datetime, timedelta
-from typing import Annotated
+from typing import Annotated, Optional
 
 from fastapi import Path, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic_validation_decorator import ValidateFields
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from common.annotation.log_annotation import Log
 from common.aspect.db_seesion import DBSessionDependency
+from common.aspect.interface_auth import UserInterfaceAuthDependency
 from common.aspect.pre_auth import CurrentUserDependency, PreAuthDependency
 from common.enums import BusinessType
 from common.router import APIRouterPro
-from common.vo import DataResponseModel, PageResponseModel, ResponseBaseModel
+from common.vo import CursorPageResponseModel, DataResponseModel, ResponseBaseModel
 from module_admin.entity.vo.user_vo import CurrentUserModel
 from module_dvd.entity.vo.dvd_crawl_account_vo import (
     CrawlAccountModel,
@@ -25,7 +27,9 @@ from module_dvd.entity.vo.dvd_user_info_vo import DvdUserInfoModel
 from exceptions.exception import ServiceException
 from module_dvd.dao.dvd_account_dao import CrawlAccountDao
 from module_dvd.dao.access_key_dao import AccessKeyDao
+from module_dvd.service.cookie_health_service import CookieHealthService
 from module_dvd.service.dvd_account_service import CrawlAccountService
+from module_dvd.service.qrcode_watch_service import QRCodeWatchService
 from utils.log_util import logger
 from utils.response_util import ResponseUtil
 
@@ -37,8 +41,8 @@ dvd_account_controller = APIRouterPro(
 @dvd_account_controller.get(
     '/list',
     summary='获取账号分页列表接口',
-    description='用于获取账号分页列表',
-    response_model=PageResponseModel[CrawlAccountModel],
+    description='用于获取账号分页列表，传入上一页返回的nextCursor按游标获取下一页，总数默认为缓存的近似值',
+    response_model=CursorPageResponseModel[CrawlAccountModel],
 )
 async def get_account_list(
     request: Request,
@@ -48,7 +52,9 @@ async def get_account_list(
     """
     获取账号分页列表
     """
-    account_page_result = await CrawlAccountService.get_account_list_services(query_db, account_query)
+    account_page_result = await CrawlAccountService.get_account_list_services(
+        query_db, request.app.state.redis, account_query
+    )
     logger.info('获取成功')
 
     return ResponseUtil.success(model_content=account_page_result)
@@ -89,6 +95,43 @@ async def get_dvd_user_info(
     return ResponseUtil.success(data=result)
 
 
+@dvd_account_controller.get(
+    '/cookieCheck/metrics',
+    summary='获取最近一次cookies检测结果接口',
+    description='用于获取最近一次采集账号cookies检测的数量、耗时及吞吐量指标',
+    response_model=DataResponseModel[dict],
+    dependencies=[UserInterfaceAuthDependency('dvd:account:cookieCheck')],
+)
+async def get_cookie_check_metrics(request: Request) -> Response:
+    """
+    获取最近一次cookies检测结果
+    """
+    metrics = await CookieHealthService.get_last_metrics_services(request.app.state.redis)
+
+    return ResponseUtil.success(data=metrics)
+
+
+@dvd_account_controller.post(
+    '/cookieCheck/run',
+    summary='执行cookies检测接口',
+    description='用于立即检测所有正常状态采集账号的cookies，dryRun为true时仅统计检测结果不更新账号状态',
+    response_model=DataResponseModel[dict],
+    dependencies=[UserInterfaceAuthDependency('dvd:account:cookieCheck')],
+)
+@Log(title='DVD账号管理', business_type=BusinessType.OTHER)
+async def run_cookie_check(
+    request: Request,
+    dry_run: Annotated[bool, Query(alias='dryRun', description='是否仅统计检测结果')] = True,
+) -> Response:
+    """
+    执行cookies检测
+    """
+    metrics = await CookieHealthService.check_cookies_services(request.app.state.redis, dry_run)
+    logger.info('cookies检测完成')
+
+    return ResponseUtil.success(data=metrics)
+
+
 @dvd_account_controller.get(
     '/{account_id}',
     summary='获取账号详情接口',
@@ -186,7 +229,7 @@ async def delete_account(
 @dvd_account_controller.post(
     '/qrcode/get',
     summary='获取登录二维码接口',
-    description='用于获取登录二维码（根据平台和产品自动选择登录方式）',
+    description='用于获取登录二维码（根据平台和产品自动选择登录方式），传入账号ID时在服务端启动扫码状态监听',
     response_model=DataResponseModel[dict],
 )
 async def get_qrcode(
@@ -200,6 +243,15 @@ async def get_qrcode(
     qrcode_result = await CrawlAccountService.get_qrcode_services(
         query_db, qrcode_request.platform_id, qrcode_request.product_id
     )
+    # 传入账号ID时由服务端监听扫码状态并保存登录结果，未传入时沿用客户端轮询状态接口的方式
+    if qrcode_request.account_id:
+        await QRCodeWatchService.start_watch_services(
+            request.app.state.redis,
+            qrcode_result['token'],
+            qrcode_request.platform_id,
+            qrcode_request.product_id,
+            qrcode_request.account_id,
+        )
     logger.info('获取二维码成功')
 
     return ResponseUtil.success(data=qrcode_result)
@@ -219,6 +271,10 @@ async def check_qrcode_status(
     """
     检查二维码扫码状态
     """
+    # 服务端已在监听该二维码时直接返回监听到的状态，不再请求平台
+    watch_state = await QRCodeWatchService.get_state_services(request.app.state.redis, status_model.token)
+    if watch_state:
+        return ResponseUtil.success(data=watch_state)
     # 根据账号ID获取平台和产品ID
     if status_model.account_id:
         account = await CrawlAccountDao.get_account_by_id(query_db, status_model.account_id)
@@ -235,6 +291,45 @@ async def check_qrcode_status(
     return ResponseUtil.success(data=status_result)
 
 
+@dvd_account_controller.get(
+    '/qrcode/wait/{token}',
+    summary='长轮询二维码扫码状态接口',
+    description='用于等待二维码扫码状态变化，状态与since不同时立即返回，否则最长等待timeout秒后返回当前状态',
+    response_model=DataResponseModel[dict],
+)
+async def wait_qrcode_status(
+    request: Request,
+    token: Annotated[str, Path(description='登录token')],
+    since: Annotated[Optional[str], Query(description='客户端已知的扫码状态')] = None,
+    timeout: Annotated[int, Query(ge=1, le=60, description='最长等待时间（秒）')] = 25,
+) -> Response:
+    """
+    长轮询二维码扫码状态
+    """
+    watch_state = await QRCodeWatchService.wait_state_services(request.app.state.redis, token, since, timeout)
+
+    return ResponseUtil.success(data=watch_state)
+
+
+@dvd_account_controller.get(
+    '/qrcode/stream/{token}',
+    summary='订阅二维码扫码状态接口',
+    description='SSE长连接，连接后推送一次当前扫码状态，之后推送状态变化（waiting/verify_code/success/expired/error），进入最终状态后结束',
+)
+async def stream_qrcode_status(
+    request: Request,
+    token: Annotated[str, Path(description='登录token')],
+) -> StreamingResponse:
+    """
+    订阅二维码扫码状态
+    """
+    return StreamingResponse(
+        QRCodeWatchService.subscribe_services(request.app.state.redis, token),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+
 @dvd_account_controller.post(
     '/qrcode/send_code',
     summary='发送身份验证码接口',
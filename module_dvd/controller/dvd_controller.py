@@ -4,6 +4,7 @@ from typing import Annotated, Optional
 from fastapi import Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from common.annotation.cache_annotation import DashboardCache
 from common.aspect.db_seesion import DBSessionDependency
 from common.router import APIRouterPro
 from common.vo import DataResponseModel
@@ -20,6 +21,7 @@ dvd_controller = APIRouterPro(prefix='/dvd', order_num=99, tags=['数据大屏']
     description='获取订单总数和GMV总额',
     response_model=DataResponseModel,
 )
+@DashboardCache(platform='qf')
 async def get_dashboard_metrics(
     request: Request,
     query_db: Annotated[AsyncSession, DBSessionDependency()],
@@ -41,6 +43,7 @@ async def get_dashboard_metrics(
     description='获取店铺销售排行TOP10',
     response_model=DataResponseModel,
 )
+@DashboardCache(platform='qf')
 async def get_store_sales_rank(
     request: Request,
     query_db: Annotated[AsyncSession, DBSessionDependency()],
@@ -63,6 +66,7 @@ async def get_store_sales_rank(
     description='获取笔记、直播、商卡的销售数据',
     response_model=DataResponseModel,
 )
+@DashboardCache(platform='qf')
 async def get_channel_sales_data(
     request: Request,
     query_db: Annotated[AsyncSession, DBSessionDependency()],
@@ -84,6 +88,7 @@ async def get_channel_sales_data(
     description='获取最近的订单列表',
     response_model=DataResponseModel,
 )
+@DashboardCache(platform='qf', date_param=None)
 async def get_recent_orders(
     request: Request,
     query_db: Annotated[AsyncSession, DBSessionDependency()],
@@ -104,6 +109,7 @@ async def get_recent_orders(
     description='获取GMV和订单量的趋势数据',
     response_model=DataResponseModel,
 )
+@DashboardCache(platform='qf', date_param=None)
 async def get_trend_data(
     request: Request,
     query_db: Annotated[AsyncSession, DBSessionDependency()],
@@ -124,6 +130,7 @@ async def get_trend_data(
     description='一次性获取大屏所有需要的数据',
     response_model=DataResponseModel,
 )
+@DashboardCache(platform='qf')
 async def get_all_dashboard_data(
     request: Request,
     query_db: Annotated[AsyncSession, DBSessionDependency()],
@@ -0,0 +1,38 @@
+from typing import Annotated
+
+from fastapi import Path, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.aspect.db_seesion import DBSessionDependency
+from common.aspect.interface_auth import UserInterfaceAuthDependency
+from common.aspect.pre_auth import PreAuthDependency
+from common.router import APIRouterPro
+from common.vo import ResponseBaseModel
+from module_dvd.service.ingest_service import IngestService
+from utils.log_util import logger
+from utils.response_util import ResponseUtil
+
+ingest_controller = APIRouterPro(
+    prefix='/dvd/ingest', order_num=22, tags=['数据采集-数据入库'], dependencies=[PreAuthDependency()]
+)
+
+
+@ingest_controller.post(
+    '/{table_name}',
+    summary='采集数据批量入库接口',
+    description='请求体为NDJSON格式（每行一个json对象），按主键批量写入或覆盖采集数据，入库后刷新汇总表、清除大屏缓存并推送数据变更',
+    response_model=ResponseBaseModel,
+    dependencies=[UserInterfaceAuthDependency('dvd:ingest:add')],
+)
+async def ingest_rows(
+    request: Request,
+    table_name: Annotated[str, Path(description='目标表名')],
+    query_db: Annotated[AsyncSession, DBSessionDependency()],
+) -> Response:
+    # 请求体可能包含数万行数据，不记录操作日志
+    ingest_result = await IngestService.ingest_ndjson_services(
+        query_db, request.app.state.redis, table_name, await request.body()
+    )
+    logger.info(f'{table_name}{ingest_result.message}')
+
+    return ResponseUtil.success(msg=ingest_result.message, data=ingest_result.result)
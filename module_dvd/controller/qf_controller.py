@@ -2,12 +2,22 @@ from datetime import date
 from typing import Annotated, Optional
 
 from fastapi import Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from common.annotation.cache_annotation import DashboardCache
+from common.annotation.log_annotation import Log
 from common.aspect.db_seesion import DBSessionDependency
+from common.aspect.interface_auth import UserInterfaceAuthDependency
+from common.aspect.pre_auth import PreAuthDependency
+from common.enums import BusinessType
 from common.router import APIRouterPro
-from common.vo import DataResponseModel
+from common.vo import DataResponseModel, ResponseBaseModel
+from module_dvd.entity.vo.qf_vo import QfRollupRebuildModel, QfRollupRefreshModel
+from module_dvd.service.dashboard_push_service import DashboardPushService
+from module_dvd.service.qf_rollup_service import QfRollupService
 from module_dvd.service.qf_service import QfOverviewService
+from utils.dashboard_cache_util import DashboardCacheUtil
 from utils.log_util import logger
 from utils.response_util import ResponseUtil
 
@@ -19,6 +29,7 @@ qf_controller = APIRouterPro(prefix='/dvd/qf', order_num=99, tags=['数据大屏
     description='获取所有店铺列表用于筛选',
     response_model=DataResponseModel,
 )
+@DashboardCache(platform='qf', date_param=None)
 async def get_store_list(
     request: Request,
     query_db: Annotated[AsyncSession, DBSessionDependency()],
@@ -38,6 +49,7 @@ async def get_store_list(
     description='从 qf_realtime_metrics 获取当天实时GMV、订单、访问量等走势数据',
     response_model=DataResponseModel,
 )
+@DashboardCache(platform='qf')
 async def get_realtime_metrics(
     request: Request,
     query_db: Annotated[AsyncSession, DBSessionDependency()],
@@ -60,6 +72,7 @@ async def get_realtime_metrics(
     description='获取当天24小时的实时GMV走势数据',
     response_model=DataResponseModel,
 )
+@DashboardCache(platform='qf')
 async def get_realtime_trend(
     request: Request,
     query_db: Annotated[AsyncSession, DBSessionDependency()],
@@ -82,6 +95,7 @@ async def get_realtime_trend(
     description='获取销售量/订单量前十的店铺',
     response_model=DataResponseModel,
 )
+@DashboardCache(platform='qf')
 async def get_top_stores(
     request: Request,
     query_db: Annotated[AsyncSession, DBSessionDependency()],
@@ -105,6 +119,7 @@ async def get_top_stores(
     description='获取实时订单列表，支持店铺筛选和日期筛选',
     response_model=DataResponseModel,
 )
+@DashboardCache(platform='qf')
 async def get_realtime_orders(
     request: Request,
     query_db: Annotated[AsyncSession, DBSessionDependency()],
@@ -128,6 +143,7 @@ async def get_realtime_orders(
     description='获取SKU销售数据，按销量或销售额排序',
     response_model=DataResponseModel,
 )
+@DashboardCache(platform='qf')
 async def get_sku_sales_data(
     request: Request,
     query_db: Annotated[AsyncSession, DBSessionDependency()],
@@ -150,6 +166,7 @@ async def get_sku_sales_data(
     description='获取订单总数和GMV总额',
     response_model=DataResponseModel,
 )
+@DashboardCache(platform='qf')
 async def get_dashboard_metrics(
     request: Request,
     query_db: Annotated[AsyncSession, DBSessionDependency()],
@@ -171,6 +188,7 @@ async def get_dashboard_metrics(
     description='获取店铺销售排行TOP10',
     response_model=DataResponseModel,
 )
+@DashboardCache(platform='qf')
 async def get_store_sales_rank(
     request: Request,
     query_db: Annotated[AsyncSession, DBSessionDependency()],
@@ -193,6 +211,7 @@ async def get_store_sales_rank(
     description='获取笔记、直播、商卡的销售数据',
     response_model=DataResponseModel,
 )
+@DashboardCache(platform='qf')
 async def get_channel_sales_data(
     request: Request,
     query_db: Annotated[AsyncSession, DBSessionDependency()],
@@ -214,6 +233,7 @@ async def get_channel_sales_data(
     description='获取最近的订单列表',
     response_model=DataResponseModel,
 )
+@DashboardCache(platform='qf', date_param=None)
 async def get_recent_orders(
     request: Request,
     query_db: Annotated[AsyncSession, DBSessionDependency()],
@@ -234,6 +254,7 @@ async def get_recent_orders(
     description='获取GMV和订单量的趋势数据',
     response_model=DataResponseModel,
 )
+@DashboardCache(platform='qf', date_param=None)
 async def get_trend_data(
     request: Request,
     query_db: Annotated[AsyncSession, DBSessionDependency()],
@@ -251,19 +272,91 @@ async def get_trend_data(
 @qf_controller.get(
     '/dashboard/all',
     summary='获取大屏所有数据',
-    description='一次性获取大屏所有需要的数据',
+    description='一次性获取大屏所有需要的数据，默认各组件并发查询并返回各组件耗时',
     response_model=DataResponseModel,
 )
+@DashboardCache(platform='qf')
 async def get_all_dashboard_data(
     request: Request,
     query_db: Annotated[AsyncSession, DBSessionDependency()],
     target_date: Annotated[Optional[str], Query(description='目标日期，格式：YYYY-MM-DD')] = None,
+    fan_out: Annotated[bool, Query(description='是否并发查询各组件数据')] = True,
 ) -> Response:
     """
     获取大屏所有数据
     """
     date_obj = date.fromisoformat(target_date) if target_date else None
-    all_data = await QfOverviewService.get_all_dashboard_data_service(query_db, date_obj)
-    logger.info('获取大屏所有数据成功')
+    all_data = await QfOverviewService.get_all_dashboard_data_service(query_db, date_obj, fan_out)
+    logger.info(f'获取大屏所有数据成功，各组件耗时(ms)：{all_data["widgetCost"]}')
 
     return ResponseUtil.success(data=all_data)
+
+
+@qf_controller.get(
+    '/dashboard/stream',
+    summary='订阅实时数据推送',
+    description='SSE长连接，连接后推送一次实时指标、实时走势、实时订单全量数据，之后在采集数据入库时仅推送发生变化的组件',
+)
+async def stream_dashboard_data(
+    request: Request,
+    target_date: Annotated[Optional[str], Query(description='目标日期，格式：YYYY-MM-DD')] = None,
+    store_name: Annotated[Optional[str], Query(description='店铺名称，用于筛选')] = None,
+) -> StreamingResponse:
+    """
+    订阅千帆实时数据推送
+    """
+    date_obj = date.fromisoformat(target_date) if target_date else None
+    logger.info(f'订阅千帆实时数据推送，日期：{target_date or "今天"}，店铺：{store_name or "全部"}')
+
+    return StreamingResponse(
+        DashboardPushService.subscribe_services('qf', date_obj, store_name),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+
+@qf_controller.post(
+    '/rollup/refresh',
+    summary='增量刷新汇总表接口',
+    description='采集数据入库后调用，重新聚合指定日期（默认为有变化的日期及当天）的大屏汇总表',
+    response_model=ResponseBaseModel,
+    dependencies=[PreAuthDependency(), UserInterfaceAuthDependency('dvd:qf:rollup')],
+)
+@Log(title='千帆汇总表', business_type=BusinessType.UPDATE)
+async def refresh_rollup(
+    request: Request,
+    refresh_rollup_obj: QfRollupRefreshModel,
+    query_db: Annotated[AsyncSession, DBSessionDependency()],
+) -> Response:
+    refresh_rollup_result = await QfRollupService.refresh_rollup_services(
+        query_db, refresh_rollup_obj.collect_date, refresh_rollup_obj.store_names
+    )
+    for collect_date in refresh_rollup_result.result['collectDates']:
+        await DashboardCacheUtil.invalidate(request.app.state.redis, 'qf', collect_date)
+        await DashboardPushService.publish_data_change_services(request.app.state.redis, 'qf', collect_date)
+    logger.info(refresh_rollup_result.message)
+
+    return ResponseUtil.success(msg=refresh_rollup_result.message, data=refresh_rollup_result.result)
+
+
+@qf_controller.post(
+    '/rollup/rebuild',
+    summary='重建汇总表接口',
+    description='按日期区间从源数据重建大屏汇总表，用于历史数据回填',
+    response_model=ResponseBaseModel,
+    dependencies=[PreAuthDependency(), UserInterfaceAuthDependency('dvd:qf:rollup')],
+)
+@Log(title='千帆汇总表', business_type=BusinessType.UPDATE)
+async def rebuild_rollup(
+    request: Request,
+    rebuild_rollup_obj: QfRollupRebuildModel,
+    query_db: Annotated[AsyncSession, DBSessionDependency()],
+) -> Response:
+    rebuild_rollup_result = await QfRollupService.rebuild_rollup_services(
+        query_db, rebuild_rollup_obj.begin_date, rebuild_rollup_obj.end_date
+    )
+    await DashboardCacheUtil.invalidate(request.app.state.redis, 'qf')
+    await DashboardPushService.publish_data_change_services(request.app.state.redis, 'qf')
+    logger.info(rebuild_rollup_result.message)
+
+    return ResponseUtil.success(msg=rebuild_rollup_result.message, data=rebuild_rollup_result.result)
@@ -1,5 +1,5 @@
 from datetime import date, datetime, timedelta
-from typing import Any
+from typing import Any, Optional
 
 from sqlalchemy import func, select, desc
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,6 +12,25 @@ class DdOverviewDao:
     抖店数据概览模块数据库操作层
     """
 
+    collect_date_models = {
+        DdRealBusinessOverview.__tablename__: DdRealBusinessOverview,
+        DdRealHourlyTrend.__tablename__: DdRealHourlyTrend,
+        DdRealIncomeExpenditureOverview.__tablename__: DdRealIncomeExpenditureOverview,
+    }
+
+    @classmethod
+    async def get_latest_collect_date(cls, db: AsyncSession, table_name: str) -> Optional[date]:
+        """
+        获取指定表的最新采集日期
+
+        :param db: orm对象
+        :param table_name: 表名
+        :return: 最新采集日期，表中没有数据时返回None
+        """
+        model = cls.collect_date_models[table_name]
+
+        return (await db.execute(select(func.max(model.collect_date)))).scalar()
+
     @classmethod
     async def get_store_list(cls, db: AsyncSession) -> list[dict[str, Any]]:
         """
@@ -37,6 +56,7 @@ class DdOverviewDao:
     async def get_store_top5(
         cls, 
         db: AsyncSession, 
+        query_date: Optional[date],
         store_id: str = None,
         sort_by: str = 'amount', 
         limit: int = 5
@@ -45,17 +65,12 @@ class DdOverviewDao:
         获取店铺销售TOP5
         
         :param db: orm对象
+        :param query_date: 最新采集日期
         :param store_id: 店铺ID筛选（可选）
         :param sort_by: 排序方式，'amount'-按成交金额，'orders'-按订单数
         :param limit: 返回数量
         :return: TOP5店铺列表
         """
-        # 查询数据库中最新的日期
-        latest_date_result = await db.execute(
-            select(func.max(DdRealBusinessOverview.collect_date))
-        )
-        query_date = latest_date_result.scalar()
-        
         # 如果数据库中没有数据，返回空列表
         if query_date is None:
             return []
@@ -113,21 +128,17 @@ class DdOverviewDao:
     async def get_overview_metrics(
         cls,
         db: AsyncSession,
+        query_date: Optional[date],
         store_id: str = None
     ) -> dict[str, Any]:
         """
         获取抖店概览指标数据
         
         :param db: orm对象
+        :param query_date: 业务概览表最新采集日期
         :param store_id: 店铺ID筛选（可选）
         :return: 概览指标数据
         """
-        # 查询数据库中最新的日期
-        latest_date_result = await db.execute(
-            select(func.max(DdRealBusinessOverview.collect_date))
-        )
-        query_date = latest_date_result.scalar()
-        
         # 如果数据库中没有数据，返回默认值
         if query_date is None:
             return {
@@ -237,6 +248,7 @@ class DdOverviewDao:
     async def get_hourly_trend(
         cls,
         db: AsyncSession,
+        query_date: Optional[date],
         store_id: str = None,
         index_display: str = None
     ) -> list[dict[str, Any]]:
@@ -244,16 +256,11 @@ class DdOverviewDao:
         获取小时趋势数据
         
         :param db: orm对象
+        :param query_date: 小时趋势表最新采集日期
         :param store_id: 店铺ID筛选（可选）
         :param index_display: 指标显示名称筛选（可选，如：用户支付金额）
         :return: 24小时趋势数据
         """
-        # 查询数据库中最新的日期
-        latest_date_result = await db.execute(
-            select(func.max(DdRealHourlyTrend.collect_date))
-        )
-        query_date = latest_date_result.scalar()
-        
         # 如果数据库中没有数据，返回空列表
         if query_date is None:
             return []
@@ -300,20 +307,16 @@ class DdOverviewDao:
     @classmethod
     async def get_available_indices(
         cls,
-        db: AsyncSession
+        db: AsyncSession,
+        query_date: Optional[date]
     ) -> list[dict[str, Any]]:
         """
         获取可用的指标列表（用于调试）
         
         :param db: orm对象
+        :param query_date: 小时趋势表最新采集日期
         :return: 指标列表
         """
-        # 查询数据库中最新的日期
-        latest_date_result = await db.execute(
-            select(func.max(DdRealHourlyTrend.collect_date))
-        )
-        query_date = latest_date_result.scalar()
-        
         if query_date is None:
             return []
         
@@ -1,8 +1,10 @@
 from collections.abc import Sequence
+from datetime import datetime
 from typing import Union
 
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import and_, delete, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
 
 from module_dvd.entity.do.dvd_crawl_account_do import DvdCrawlAccountInfo
 from module_dvd.entity.vo.dvd_crawl_account_vo import CrawlAccountModel, CrawlAccountQueryModel
@@ -43,6 +45,29 @@ class CrawlAccountDao:
 
         return account_info
 
+    @classmethod
+    def _build_filters(cls, query_object: CrawlAccountQueryModel) -> list[ColumnElement]:
+        """
+        根据查询参数构建账号查询条件
+
+        :param query_object: 查询参数对象
+        :return: 查询条件列表
+        """
+        if query_object.account and query_object.account_match == 'prefix':
+            # 前缀匹配可以使用账号索引
+            account_filter = DvdCrawlAccountInfo.account.startswith(query_object.account, autoescape=True)
+        elif query_object.account:
+            account_filter = DvdCrawlAccountInfo.account.contains(query_object.account, autoescape=True)
+        else:
+            account_filter = True
+
+        return [
+            DvdCrawlAccountInfo.platform_id == query_object.platform_id if query_object.platform_id else True,
+            DvdCrawlAccountInfo.product_id == query_object.product_id if query_object.product_id else True,
+            account_filter,
+            DvdCrawlAccountInfo.status == query_object.status if query_object.status else True,
+        ]
+
     @classmethod
     async def get_account_list(
         cls, db: AsyncSession, query_object: CrawlAccountQueryModel, is_page: bool = False
@@ -55,12 +80,11 @@ class CrawlAccountDao:
         :param is_page: 是否分页
         :return: 账号列表信息对象
         """
-        query = select(DvdCrawlAccountInfo).where(
-            DvdCrawlAccountInfo.platform_id == query_object.platform_id if query_object.platform_id else True,
-            DvdCrawlAccountInfo.product_id == query_object.product_id if query_object.product_id else True,
-            DvdCrawlAccountInfo.account.like(f'%{query_object.account}%') if query_object.account else True,
-            DvdCrawlAccountInfo.status == query_object.status if query_object.status else True,
-        ).order_by(DvdCrawlAccountInfo.create_time.desc())
+        query = (
+            select(DvdCrawlAccountInfo)
+            .where(*cls._build_filters(query_object))
+            .order_by(DvdCrawlAccountInfo.create_time.desc(), DvdCrawlAccountInfo.id.desc())
+        )
 
         if is_page:
             offset = (query_object.page_num - 1) * query_object.page_size
@@ -70,6 +94,38 @@ class CrawlAccountDao:
 
         return account_list
 
+    @classmethod
+    async def get_account_list_by_cursor(
+        cls,
+        db: AsyncSession,
+        query_object: CrawlAccountQueryModel,
+        cursor: Union[tuple[datetime, int], None],
+        limit: int,
+    ) -> Sequence[DvdCrawlAccountInfo]:
+        """
+        按(创建时间, id)游标获取账号列表信息，查询耗时与页码无关
+
+        :param db: orm对象
+        :param query_object: 查询参数对象
+        :param cursor: 上一页最后一条记录的(创建时间, id)，为空时从第一条开始
+        :param limit: 查询数量
+        :return: 账号列表信息对象
+        """
+        query = select(DvdCrawlAccountInfo).where(*cls._build_filters(query_object))
+        if cursor:
+            cursor_time, cursor_id = cursor
+            query = query.where(
+                or_(
+                    DvdCrawlAccountInfo.create_time < cursor_time,
+                    and_(DvdCrawlAccountInfo.create_time == cursor_time, DvdCrawlAccountInfo.id < cursor_id),
+                )
+            )
+        query = query.order_by(DvdCrawlAccountInfo.create_time.desc(), DvdCrawlAccountInfo.id.desc()).limit(limit)
+
+        account_list = (await db.execute(query)).scalars().all()
+
+        return account_list
+
     @classmethod
     async def get_account_count(cls, db: AsyncSession, query_object: CrawlAccountQueryModel) -> int:
         """
@@ -81,14 +137,7 @@ class CrawlAccountDao:
         """
         count = (
             await db.execute(
-                select(func.count('*'))
-                .select_from(DvdCrawlAccountInfo)
-                .where(
-                    DvdCrawlAccountInfo.platform_id == query_object.platform_id if query_object.platform_id else True,
-                    DvdCrawlAccountInfo.product_id == query_object.product_id if query_object.product_id else True,
-                    DvdCrawlAccountInfo.account.like(f'%{query_object.account}%') if query_object.account else True,
-                    DvdCrawlAccountInfo.status == query_object.status if query_object.status else True,
-                )
+                select(func.count('*')).select_from(DvdCrawlAccountInfo).where(*cls._build_filters(query_object))
             )
         ).scalar()
 
@@ -130,3 +179,48 @@ class CrawlAccountDao:
         :return:
         """
         await db.execute(delete(DvdCrawlAccountInfo).where(DvdCrawlAccountInfo.id.in_(account_ids)))
+
+    @classmethod
+    async def get_account_batch_after_id(
+        cls, db: AsyncSession, last_id: int, limit: int, status: int
+    ) -> Sequence[DvdCrawlAccountInfo]:
+        """
+        按主键顺序获取指定id之后的一批账号，用于全表遍历
+
+        :param db: orm对象
+        :param last_id: 上一批最后一个账号的id
+        :param limit: 每批数量
+        :param status: 账号状态
+        :return: 账号列表信息对象
+        """
+        account_list = (
+            await db.execute(
+                select(DvdCrawlAccountInfo)
+                .where(DvdCrawlAccountInfo.id > last_id, DvdCrawlAccountInfo.status == status)
+                .order_by(DvdCrawlAccountInfo.id)
+                .limit(limit)
+            )
+        ).scalars().all()
+
+        return account_list
+
+    @classmethod
+    async def update_account_status_batch_dao(
+        cls, db: AsyncSession, account_ids: list[int], from_status: int, to_status: int
+    ) -> int:
+        """
+        批量更新账号状态，仅更新当前仍为from_status的账号
+
+        :param db: orm对象
+        :param account_ids: 账号ID列表
+        :param from_status: 更新前状态
+        :param to_status: 更新后状态
+        :return: 更新的账号数量
+        """
+        result = await db.execute(
+            update(DvdCrawlAccountInfo)
+            .where(DvdCrawlAccountInfo.id.in_(account_ids), DvdCrawlAccountInfo.status == from_status)
+            .values(status=to_status, update_time=datetime.now())
+        )
+
+        return result.rowcount
@@ -0,0 +1,52 @@
+from typing import Any
+
+from sqlalchemy import func, inspect
+from sqlalchemy.dialects import mysql, postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.database import Base
+from config.env import DataBaseConfig
+
+
+class IngestDao:
+    """
+    采集数据入库模块数据库操作层
+    """
+
+    @classmethod
+    async def upsert_rows_dao(cls, db: AsyncSession, model: type[Base], rows: list[dict[str, Any]]) -> None:
+        """
+        多行写入采集数据，主键冲突时更新本次提供的非主键字段
+
+        :param db: orm对象
+        :param model: 目标表模型
+        :param rows: 字段集合相同的数据行列表
+        :return:
+        """
+        if not rows:
+            return
+        primary_keys = {column.name for column in inspect(model).primary_key}
+        update_columns = [key for key in rows[0] if key not in primary_keys]
+        # update_time未设置ON UPDATE的表在覆盖写入时手动刷新，供汇总表增量刷新识别变化
+        refresh_update_time = 'update_time' in model.__table__.columns and 'update_time' not in rows[0]
+
+        if DataBaseConfig.db_type == 'postgresql':
+            stmt = postgresql.insert(model).values(rows)
+            update_values = {key: stmt.excluded[key] for key in update_columns}
+            if refresh_update_time:
+                update_values['update_time'] = func.now()
+            stmt = (
+                stmt.on_conflict_do_update(index_elements=list(primary_keys), set_=update_values)
+                if update_values
+                else stmt.on_conflict_do_nothing(index_elements=list(primary_keys))
+            )
+        else:
+            stmt = mysql.insert(model).values(rows)
+            update_values = {key: stmt.inserted[key] for key in update_columns}
+            if refresh_update_time:
+                update_values['update_time'] = func.now()
+            # 没有可更新字段时用主键自赋值实现忽略冲突
+            stmt = stmt.on_duplicate_key_update(
+                update_values or {key: stmt.inserted[key] for key in primary_keys}
+            )
+        await db.execute(stmt)
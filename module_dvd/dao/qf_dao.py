@@ -1,13 +1,14 @@
 from datetime import date, datetime
 from typing import Any
 
-from sqlalchemy import func, select, desc
+from sqlalchemy import Row, Select, func, select, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from module_dvd.entity.do.qf_do import QfOverview
-from module_dvd.entity.do.qf_realtime_trend_do import QfRealtimeTrend
 from module_dvd.entity.do.qf_order_list_do import QfOrderList
 from module_dvd.entity.do.qf_realtime_metrics_do import QfRealtimeMetrics
+from module_dvd.entity.do.qf_realtime_trend_do import QfRealtimeTrend
+from module_dvd.entity.do.qf_rollup_do import QfOverviewDailyRollup, QfRealtimeTrendHourlyRollup
 
 
 class QfOverviewDao:
@@ -15,6 +16,24 @@ class QfOverviewDao:
     小红书数据概览模块数据库操作层
     """
 
+    @classmethod
+    async def _select_with_rollup_fallback(
+        cls, db: AsyncSession, rollup_query: Select, raw_query: Select
+    ) -> list[Row]:
+        """
+        优先查询汇总表，汇总表尚未生成对应数据（如部署后回填完成前）时回退查询源表
+
+        :param db: orm对象
+        :param rollup_query: 汇总表查询
+        :param raw_query: 源表查询，查询字段需与汇总表查询一致
+        :return: 查询结果
+        """
+        rows = (await db.execute(rollup_query)).all()
+        if not rows:
+            rows = (await db.execute(raw_query)).all()
+
+        return list(rows)
+
     @classmethod
     async def get_store_list(cls, db: AsyncSession) -> list[dict[str, Any]]:
         """
@@ -75,7 +94,7 @@ class QfOverviewDao:
     @classmethod
     async def get_realtime_trend(cls, db: AsyncSession, target_date: date = None, store_name: str = None) -> dict[str, Any]:
         """
-        获取实时GMV走势（24小时数据）
+        获取实时GMV走势（24小时数据，读取小时汇总表）
         
         :param db: orm对象
         :param target_date: 目标日期
@@ -85,9 +104,15 @@ class QfOverviewDao:
         if target_date is None:
             target_date = date.today()
 
-        # 构建查询
-        query = select(
-            QfRealtimeTrend.dtm,
+        # 从小时汇总表查询
+        rollup_query = select(
+            QfRealtimeTrendHourlyRollup.hour,
+            func.sum(QfRealtimeTrendHourlyRollup.pay_net_amt).label('total_gmv'),
+            func.sum(QfRealtimeTrendHourlyRollup.deal_order_cnt).label('total_orders'),
+            func.sum(QfRealtimeTrendHourlyRollup.card_click_cnt).label('total_card_clicks'),
+        ).where(QfRealtimeTrendHourlyRollup.collect_date == target_date)
+        raw_query = select(
+            QfRealtimeTrend.dtm.label('hour'),
             func.sum(QfRealtimeTrend.pay_net_amt).label('total_gmv'),
             func.sum(QfRealtimeTrend.deal_order_cnt).label('total_orders'),
             func.sum(QfRealtimeTrend.card_click_cnt).label('total_card_clicks'),
@@ -95,12 +120,14 @@ class QfOverviewDao:
 
         # 如果指定了店铺名称，添加筛选条件
         if store_name:
-            query = query.where(QfRealtimeTrend.store_name == store_name)
-
-        query = query.group_by(QfRealtimeTrend.dtm).order_by(QfRealtimeTrend.dtm)
+            rollup_query = rollup_query.where(QfRealtimeTrendHourlyRollup.store_name == store_name)
+            raw_query = raw_query.where(QfRealtimeTrend.store_name == store_name)
 
-        result = await db.execute(query)
-        rows = result.all()
+        rows = await cls._select_with_rollup_fallback(
+            db,
+            rollup_query.group_by(QfRealtimeTrendHourlyRollup.hour).order_by(QfRealtimeTrendHourlyRollup.hour),
+            raw_query.group_by(QfRealtimeTrend.dtm).order_by(QfRealtimeTrend.dtm),
+        )
 
         # 初始化24小时数据
         time_labels = [f'{i:02d}:00' for i in range(24)]
@@ -108,14 +135,13 @@ class QfOverviewDao:
         order_data = [0] * 24
         card_click_data = [0] * 24
 
-        # 填充实际数据
+        # 填充实际数据，源表的时间点为字符串
         for row in rows:
-            if row.dtm and row.dtm.isdigit():
-                hour = int(row.dtm)
-                if 0 <= hour < 24:
-                    gmv_data[hour] = float(row.total_gmv or 0)
-                    order_data[hour] = int(row.total_orders or 0)
-                    card_click_data[hour] = int(row.total_card_clicks or 0)
+            hour = int(row.hour) if str(row.hour).isdigit() else None
+            if hour is not None and 0 <= hour < len(time_labels):
+                gmv_data[hour] = float(row.total_gmv or 0)
+                order_data[hour] = int(row.total_orders or 0)
+                card_click_data[hour] = int(row.total_card_clicks or 0)
 
         return {
             'timeLabels': time_labels,
@@ -127,7 +153,7 @@ class QfOverviewDao:
     @classmethod
     async def get_top_stores(cls, db: AsyncSession, target_date: date = None, sort_by: str = 'orders', limit: int = 10) -> list[dict[str, Any]]:
         """
-        获取热销店铺TOP排行
+        获取热销店铺TOP排行（读取小时汇总表）
         
         :param db: orm对象
         :param target_date: 目标日期
@@ -138,8 +164,16 @@ class QfOverviewDao:
         if target_date is None:
             target_date = date.today()
 
-        # 构建查询
-        query = select(
+        # 从小时汇总表查询，空字符串店铺名对应源数据中的未知店铺
+        rollup_query = select(
+            QfRealtimeTrendHourlyRollup.store_name,
+            func.sum(QfRealtimeTrendHourlyRollup.deal_order_cnt).label('order_count'),
+            func.sum(QfRealtimeTrendHourlyRollup.pay_net_amt).label('sales_amount'),
+        ).where(
+            QfRealtimeTrendHourlyRollup.collect_date == target_date,
+            QfRealtimeTrendHourlyRollup.store_name != ''
+        ).group_by(QfRealtimeTrendHourlyRollup.store_name)
+        raw_query = select(
             QfRealtimeTrend.store_name,
             func.sum(QfRealtimeTrend.deal_order_cnt).label('order_count'),
             func.sum(QfRealtimeTrend.pay_net_amt).label('sales_amount'),
@@ -149,15 +183,10 @@ class QfOverviewDao:
         ).group_by(QfRealtimeTrend.store_name)
 
         # 根据排序方式选择排序字段
-        if sort_by == 'orders':
-            query = query.order_by(desc('order_count'))
-        else:  # sales
-            query = query.order_by(desc('sales_amount'))
-        
-        query = query.limit(limit)
-
-        result = await db.execute(query)
-        rows = result.all()
+        order_by = desc('order_count') if sort_by == 'orders' else desc('sales_amount')
+        rows = await cls._select_with_rollup_fallback(
+            db, rollup_query.order_by(order_by).limit(limit), raw_query.order_by(order_by).limit(limit)
+        )
 
         return [
             {
@@ -252,7 +281,7 @@ class QfOverviewDao:
     @classmethod
     async def get_store_sales_rank(cls, db: AsyncSession, target_date: date = None, limit: int = 10) -> list[dict[str, Any]]:
         """
-        获取店铺销售排行
+        获取店铺销售排行（读取日汇总表）
         
         :param db: orm对象
         :param target_date: 目标日期
@@ -262,7 +291,18 @@ class QfOverviewDao:
         if target_date is None:
             target_date = date.today()
 
-        result = await db.execute(
+        # 汇总表以空字符串表示未知店铺，查询时还原为None，与源表保持一致
+        rows = await cls._select_with_rollup_fallback(
+            db,
+            select(
+                func.nullif(QfOverviewDailyRollup.store_name, '').label('store_name'),
+                func.sum(QfOverviewDailyRollup.pay_pkg_cnt).label('order_count'),
+                func.sum(QfOverviewDailyRollup.pay_gmv).label('sales_amount'),
+            )
+            .where(QfOverviewDailyRollup.collect_date == target_date)
+            .group_by(QfOverviewDailyRollup.store_name)
+            .order_by(desc('sales_amount'))
+            .limit(limit),
             select(
                 QfOverview.store_name,
                 func.sum(QfOverview.pay_pkg_cnt).label('order_count'),
@@ -271,10 +311,8 @@ class QfOverviewDao:
             .where(QfOverview.collect_date == target_date)
             .group_by(QfOverview.store_name)
             .order_by(desc('sales_amount'))
-            .limit(limit)
+            .limit(limit),
         )
-
-        rows = result.all()
         return [
             {
                 'rank': idx + 1,
@@ -383,13 +421,25 @@ class QfOverviewDao:
     @classmethod
     async def get_trend_data(cls, db: AsyncSession, days: int = 7) -> dict[str, Any]:
         """
-        获取趋势数据（按天统计）
+        获取趋势数据（按天统计，读取日汇总表）
         
         :param db: orm对象
         :param days: 天数
         :return: 趋势数据
         """
-        result = await db.execute(
+        rows = await cls._select_with_rollup_fallback(
+            db,
+            select(
+                QfOverviewDailyRollup.collect_date,
+                func.sum(QfOverviewDailyRollup.pay_gmv).label('total_gmv'),
+                func.sum(QfOverviewDailyRollup.pay_pkg_cnt).label('total_orders'),
+                func.sum(QfOverviewDailyRollup.note_pay_gmv).label('note_gmv'),
+                func.sum(QfOverviewDailyRollup.live_pay_gmv).label('live_gmv'),
+                func.sum(QfOverviewDailyRollup.card_pay_gmv).label('card_gmv'),
+            )
+            .group_by(QfOverviewDailyRollup.collect_date)
+            .order_by(QfOverviewDailyRollup.collect_date)
+            .limit(days),
             select(
                 QfOverview.collect_date,
                 func.sum(QfOverview.pay_gmv).label('total_gmv'),
@@ -400,10 +450,8 @@ class QfOverviewDao:
             )
             .group_by(QfOverview.collect_date)
             .order_by(QfOverview.collect_date)
-            .limit(days)
+            .limit(days),
         )
-
-        rows = result.all()
         
         time_labels = []
         gmv_data = []
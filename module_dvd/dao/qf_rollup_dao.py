@@ -0,0 +1,231 @@
+from datetime import date, datetime
+from typing import Any, Optional
+
+from sqlalchemy import delete, func, insert, select, union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from module_dvd.entity.do.qf_do import QfOverview
+from module_dvd.entity.do.qf_realtime_trend_do import QfRealtimeTrend
+from module_dvd.entity.do.qf_rollup_do import QfOverviewDailyRollup, QfRealtimeTrendHourlyRollup
+
+
+class QfRollupDao:
+    """
+    千帆汇总表模块数据库操作层
+    """
+
+    hours_per_day = 24
+
+    @classmethod
+    async def get_changed_collect_dates(cls, db: AsyncSession) -> list[date]:
+        """
+        获取源数据在上次汇总之后发生变化的采集日期
+
+        :param db: orm对象
+        :return: 采集日期列表
+        """
+        trend_watermark = (
+            await db.execute(select(func.max(QfRealtimeTrendHourlyRollup.source_update_time)))
+        ).scalar() or datetime.min
+        overview_watermark = (
+            await db.execute(select(func.max(QfOverviewDailyRollup.source_update_time)))
+        ).scalar() or datetime.min
+
+        result = await db.execute(
+            union(
+                select(QfRealtimeTrend.collect_date).where(QfRealtimeTrend.update_time >= trend_watermark),
+                select(QfOverview.collect_date).where(QfOverview.update_time >= overview_watermark),
+            )
+        )
+
+        return sorted(result.scalars().all())
+
+    @classmethod
+    async def get_raw_collect_dates(cls, db: AsyncSession, begin_date: date, end_date: date) -> list[date]:
+        """
+        获取日期区间内源数据存在的采集日期
+
+        :param db: orm对象
+        :param begin_date: 开始日期
+        :param end_date: 结束日期
+        :return: 采集日期列表
+        """
+        result = await db.execute(
+            union(
+                select(QfRealtimeTrend.collect_date).where(QfRealtimeTrend.collect_date.between(begin_date, end_date)),
+                select(QfOverview.collect_date).where(QfOverview.collect_date.between(begin_date, end_date)),
+            )
+        )
+
+        return sorted(result.scalars().all())
+
+    @classmethod
+    async def get_raw_collect_date_range(cls, db: AsyncSession) -> Optional[tuple[date, date]]:
+        """
+        获取源数据的采集日期范围
+
+        :param db: orm对象
+        :return: 最早及最晚采集日期，源数据为空时返回None
+        """
+        date_ranges = [
+            (await db.execute(select(func.min(model.collect_date), func.max(model.collect_date)))).one()
+            for model in (QfRealtimeTrend, QfOverview)
+        ]
+        begin_dates = [begin_date for begin_date, _end_date in date_ranges if begin_date]
+        end_dates = [end_date for _begin_date, end_date in date_ranges if end_date]
+
+        return (min(begin_dates), max(end_dates)) if begin_dates else None
+
+    @classmethod
+    async def is_rollup_empty(cls, db: AsyncSession) -> bool:
+        """
+        汇总表是否尚未生成任何数据
+
+        :param db: orm对象
+        :return: 汇总表是否为空
+        """
+        trend_exists = (await db.execute(select(QfRealtimeTrendHourlyRollup.collect_date).limit(1))).first()
+        overview_exists = (await db.execute(select(QfOverviewDailyRollup.collect_date).limit(1))).first()
+
+        return trend_exists is None and overview_exists is None
+
+    @classmethod
+    async def aggregate_trend_rows(
+        cls, db: AsyncSession, collect_date: date, store_names: Optional[list[str]] = None
+    ) -> list[dict[str, Any]]:
+        """
+        按店铺和时间点聚合实时趋势源数据
+
+        :param db: orm对象
+        :param collect_date: 采集日期
+        :param store_names: 店铺名称列表，为空时聚合当天所有店铺
+        :return: 小时汇总数据列表
+        """
+        query = select(
+            QfRealtimeTrend.store_name,
+            QfRealtimeTrend.dtm,
+            func.sum(QfRealtimeTrend.pay_net_amt).label('pay_net_amt'),
+            func.sum(QfRealtimeTrend.deal_order_cnt).label('deal_order_cnt'),
+            func.sum(QfRealtimeTrend.card_click_cnt).label('card_click_cnt'),
+            func.max(QfRealtimeTrend.update_time).label('source_update_time'),
+        ).where(QfRealtimeTrend.collect_date == collect_date)
+        if store_names:
+            query = query.where(QfRealtimeTrend.store_name.in_(store_names))
+        query = query.group_by(QfRealtimeTrend.store_name, QfRealtimeTrend.dtm)
+
+        rows = (await db.execute(query)).all()
+        # 同一店铺的时间点可能存在'8'与'08'两种写法，按小时再合并一次
+        hourly_rows: dict[tuple[str, int], dict[str, Any]] = {}
+        for row in rows:
+            if not (row.dtm and row.dtm.isdigit() and 0 <= int(row.dtm) < cls.hours_per_day):
+                continue
+            key = (row.store_name or '', int(row.dtm))
+            hourly_row = hourly_rows.setdefault(
+                key,
+                {
+                    'collect_date': collect_date,
+                    'store_name': key[0],
+                    'hour': key[1],
+                    'pay_net_amt': 0,
+                    'deal_order_cnt': 0,
+                    'card_click_cnt': 0,
+                    'source_update_time': row.source_update_time,
+                },
+            )
+            hourly_row['pay_net_amt'] += row.pay_net_amt or 0
+            hourly_row['deal_order_cnt'] += row.deal_order_cnt or 0
+            hourly_row['card_click_cnt'] += row.card_click_cnt or 0
+            hourly_row['source_update_time'] = max(hourly_row['source_update_time'], row.source_update_time)
+
+        return list(hourly_rows.values())
+
+    @classmethod
+    async def aggregate_overview_rows(
+        cls, db: AsyncSession, collect_date: date, store_names: Optional[list[str]] = None
+    ) -> list[dict[str, Any]]:
+        """
+        按店铺聚合数据概览源数据
+
+        :param db: orm对象
+        :param collect_date: 采集日期
+        :param store_names: 店铺名称列表，为空时聚合当天所有店铺
+        :return: 日汇总数据列表
+        """
+        query = select(
+            func.coalesce(QfOverview.store_name, '').label('store_name'),
+            func.sum(QfOverview.pay_gmv).label('pay_gmv'),
+            func.sum(QfOverview.note_pay_gmv).label('note_pay_gmv'),
+            func.sum(QfOverview.live_pay_gmv).label('live_pay_gmv'),
+            func.sum(QfOverview.card_pay_gmv).label('card_pay_gmv'),
+            func.sum(QfOverview.pay_pkg_cnt).label('pay_pkg_cnt'),
+            func.max(QfOverview.update_time).label('source_update_time'),
+        ).where(QfOverview.collect_date == collect_date)
+        if store_names:
+            query = query.where(QfOverview.store_name.in_(store_names))
+        query = query.group_by(func.coalesce(QfOverview.store_name, ''))
+
+        rows = (await db.execute(query)).all()
+
+        return [{'collect_date': collect_date, **row._asdict()} for row in rows]
+
+    @classmethod
+    async def delete_trend_rollup_dao(
+        cls, db: AsyncSession, begin_date: date, end_date: date, store_names: Optional[list[str]] = None
+    ) -> None:
+        """
+        删除实时趋势小时汇总数据
+
+        :param db: orm对象
+        :param begin_date: 开始日期
+        :param end_date: 结束日期
+        :param store_names: 店铺名称列表，为空时删除区间内所有店铺
+        :return:
+        """
+        query = delete(QfRealtimeTrendHourlyRollup).where(
+            QfRealtimeTrendHourlyRollup.collect_date.between(begin_date, end_date)
+        )
+        if store_names:
+            query = query.where(QfRealtimeTrendHourlyRollup.store_name.in_(store_names))
+        await db.execute(query)
+
+    @classmethod
+    async def delete_overview_rollup_dao(
+        cls, db: AsyncSession, begin_date: date, end_date: date, store_names: Optional[list[str]] = None
+    ) -> None:
+        """
+        删除数据概览日汇总数据
+
+        :param db: orm对象
+        :param begin_date: 开始日期
+        :param end_date: 结束日期
+        :param store_names: 店铺名称列表，为空时删除区间内所有店铺
+        :return:
+        """
+        query = delete(QfOverviewDailyRollup).where(QfOverviewDailyRollup.collect_date.between(begin_date, end_date))
+        if store_names:
+            query = query.where(QfOverviewDailyRollup.store_name.in_(store_names))
+        await db.execute(query)
+
+    @classmethod
+    async def add_trend_rollup_dao(cls, db: AsyncSession, rollup_rows: list[dict[str, Any]]) -> None:
+        """
+        批量新增实时趋势小时汇总数据
+
+        :param db: orm对象
+        :param rollup_rows: 小时汇总数据列表
+        :return:
+        """
+        if rollup_rows:
+            await db.execute(insert(QfRealtimeTrendHourlyRollup), rollup_rows)
+
+    @classmethod
+    async def add_overview_rollup_dao(cls, db: AsyncSession, rollup_rows: list[dict[str, Any]]) -> None:
+        """
+        批量新增数据概览日汇总数据
+
+        :param db: orm对象
+        :param rollup_rows: 日汇总数据列表
+        :return:
+        """
+        if rollup_rows:
+            await db.execute(insert(QfOverviewDailyRollup), rollup_rows)
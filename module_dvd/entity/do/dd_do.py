@@ -1,7 +1,7 @@
 from datetime import date, datetime
 from decimal import Decimal
 
-from sqlalchemy import CHAR, Column, Date, DateTime, BigInteger, String, DECIMAL, Integer, text
+from sqlalchemy import CHAR, Column, Date, DateTime, Index, BigInteger, String, DECIMAL, Integer, text
 
 from config.database import Base
 
@@ -49,6 +49,9 @@ class DdRealBusinessOverview(Base):
     pay_qc_plat_coupon_amt = Column(DECIMAL(20, 2), nullable=True, comment='智能优惠券')
     update_time = Column(DateTime, nullable=False, server_default=text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'), comment='更新时间')
 
+    idx_dd_real_business_overview_cd_sid = Index('idx_dd_real_business_overview_cd_sid', collect_date, store_id)
+    idx_dd_real_business_overview_sn_sid = Index('idx_dd_real_business_overview_sn_sid', store_name, store_id)
+
 
 class DdRealHourlyTrend(Base):
     """
@@ -75,6 +78,9 @@ class DdRealHourlyTrend(Base):
     value_diff = Column(DECIMAL(20, 2), nullable=True, comment='今日-昨日差值')
     update_time = Column(DateTime, nullable=False, server_default=text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'), comment='更新时间')
 
+    idx_dd_real_hourly_trend_cd_sid_id_h = Index('idx_dd_real_hourly_trend_cd_sid_id_h', collect_date, store_id, index_display, hour)
+    idx_dd_real_hourly_trend_cd_in_id = Index('idx_dd_real_hourly_trend_cd_in_id', collect_date, index_name, index_display)
+
 
 class DdRealIncomeExpenditureOverview(Base):
     """
@@ -104,3 +110,5 @@ class DdRealIncomeExpenditureOverview(Base):
     refund_amt_rate = Column(DECIMAL(10, 4), nullable=True, comment='退款率')
     refund_amt_pay_time = Column(DECIMAL(20, 2), nullable=True, comment='退款金额(支付时间)')
     update_time = Column(DateTime, nullable=False, server_default=text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'), comment='更新时间')
+
+    idx_dd_real_income_expenditure_overview_cd_sid = Index('idx_dd_real_income_expenditure_overview_cd_sid', collect_date, store_id)
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import CHAR, BigInteger, Column, DateTime, Integer, String, Text, VARCHAR
+from sqlalchemy import CHAR, BigInteger, Column, DateTime, Index, Integer, String, Text, VARCHAR
 
 from config.database import Base
 
@@ -26,3 +26,9 @@ class DvdCrawlAccountInfo(Base):
         DateTime, nullable=False, default=datetime.now, onupdate=datetime.now, comment='更新时间'
     )
     unique_md5 = Column(CHAR(32), nullable=False, unique=True, comment='唯一标识MD5(platform,product,account,bind_user_id)')
+
+    idx_dvd_crawl_account_info_ct_id = Index('idx_dvd_crawl_account_info_ct_id', create_time, id)
+    idx_dvd_crawl_account_info_pid_prid_ct_id = Index(
+        'idx_dvd_crawl_account_info_pid_prid_ct_id', platform_id, product_id, create_time, id
+    )
+    idx_dvd_crawl_account_info_acc = Index('idx_dvd_crawl_account_info_acc', account)
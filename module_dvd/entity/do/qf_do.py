@@ -1,7 +1,7 @@
 from datetime import date, datetime
 from decimal import Decimal
 
-from sqlalchemy import CHAR, Column, Date, DateTime, BigInteger, String, DECIMAL, text
+from sqlalchemy import CHAR, Column, Date, DateTime, Index, BigInteger, String, DECIMAL, text
 
 from config.database import Base
 
@@ -73,3 +73,5 @@ class QfOverview(Base):
     cart_goods_cnt = Column(DECIMAL(20, 4), nullable=True, comment='加购件数')
     update_time = Column(DateTime, nullable=False, server_default=text('CURRENT_TIMESTAMP'), comment='更新时间')
 
+    idx_qf_overview_cd_sn = Index('idx_qf_overview_cd_sn', collect_date, store_name)
+    idx_qf_overview_ut = Index('idx_qf_overview_ut', update_time)
@@ -1,7 +1,7 @@
 from datetime import date, datetime
 from decimal import Decimal
 
-from sqlalchemy import CHAR, Column, Date, DateTime, String, DECIMAL, Text, text
+from sqlalchemy import CHAR, Column, Date, DateTime, Index, String, DECIMAL, Text, text
 
 from config.database import Base
 
@@ -33,3 +33,5 @@ class QfOrderList(Base):
     sku_total_paid_amount = Column(DECIMAL(20, 4), nullable=True, comment='SKU总实付金额')
     update_time = Column(DateTime, nullable=False, server_default=text('CURRENT_TIMESTAMP'), comment='更新时间')
 
+    idx_qf_order_list_cd_sn_pid = Index('idx_qf_order_list_cd_sn_pid', collect_date, store_name, package_id)
+    idx_qf_order_list_cd_sku = Index('idx_qf_order_list_cd_sku', collect_date, sku_id)
@@ -1,7 +1,7 @@
 from datetime import date, datetime
 from decimal import Decimal
 
-from sqlalchemy import CHAR, Column, Date, DateTime, String, DECIMAL, text
+from sqlalchemy import CHAR, Column, Date, DateTime, Index, String, DECIMAL, text
 
 from config.database import Base
 
@@ -31,3 +31,5 @@ class QfRealtimeMetrics(Base):
     ad_pay_amount = Column(DECIMAL(20, 4), nullable=True, comment='广告支付额')
     update_time = Column(DateTime, nullable=False, server_default=text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'), comment='更新时间')
 
+    idx_qf_realtime_metrics_cd_sn = Index('idx_qf_realtime_metrics_cd_sn', collect_date, store_name)
+    idx_qf_realtime_metrics_sn = Index('idx_qf_realtime_metrics_sn', store_name)
@@ -1,7 +1,7 @@
 from datetime import date, datetime
 from decimal import Decimal
 
-from sqlalchemy import CHAR, Column, Date, DateTime, String, DECIMAL, text
+from sqlalchemy import CHAR, Column, Date, DateTime, Index, String, DECIMAL, text
 
 from config.database import Base
 
@@ -49,4 +49,5 @@ class QfRealtimeTrend(Base):
     pay_refund_rate_before_ship = Column(DECIMAL(20, 4), nullable=True, comment='发货前退款率')
     update_time = Column(DateTime, nullable=False, server_default=text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'), comment='更新时间')
 
-
+    idx_qf_realtime_trend_cd_sn_dtm = Index('idx_qf_realtime_trend_cd_sn_dtm', collect_date, store_name, dtm)
+    idx_qf_realtime_trend_ut = Index('idx_qf_realtime_trend_ut', update_time)
@@ -0,0 +1,40 @@
+from sqlalchemy import DECIMAL, BigInteger, Column, Date, DateTime, Integer, String, text
+
+from config.database import Base
+
+
+class QfRealtimeTrendHourlyRollup(Base):
+    """
+    千帆实时趋势小时汇总表
+    """
+
+    __tablename__ = 'qf_realtime_trend_hourly_rollup'
+    __table_args__ = {'comment': '千帆实时趋势小时汇总表'}
+
+    collect_date = Column(Date, primary_key=True, nullable=False, comment='采集时间')
+    store_name = Column(String(255), primary_key=True, nullable=False, server_default='', comment='店铺名称，空字符串表示未知店铺')
+    hour = Column(Integer, primary_key=True, nullable=False, comment='时间点(0-23)')
+    pay_net_amt = Column(DECIMAL(20, 4), nullable=True, comment='净支付金额')
+    deal_order_cnt = Column(DECIMAL(20, 4), nullable=True, comment='成交订单数')
+    card_click_cnt = Column(DECIMAL(20, 4), nullable=True, comment='商品卡片点击次数')
+    source_update_time = Column(DateTime, nullable=True, comment='源数据最后更新时间')
+    update_time = Column(DateTime, nullable=False, server_default=text('CURRENT_TIMESTAMP'), comment='汇总时间')
+
+
+class QfOverviewDailyRollup(Base):
+    """
+    千帆数据概览日汇总表
+    """
+
+    __tablename__ = 'qf_overview_daily_rollup'
+    __table_args__ = {'comment': '千帆数据概览日汇总表'}
+
+    collect_date = Column(Date, primary_key=True, nullable=False, comment='采集时间')
+    store_name = Column(String(255), primary_key=True, nullable=False, server_default='', comment='店铺名称，空字符串表示未知店铺')
+    pay_gmv = Column(DECIMAL(20, 4), nullable=True, comment='支付金额')
+    note_pay_gmv = Column(DECIMAL(20, 4), nullable=True, comment='笔记支付金额')
+    live_pay_gmv = Column(DECIMAL(20, 4), nullable=True, comment='直播支付金额')
+    card_pay_gmv = Column(DECIMAL(20, 4), nullable=True, comment='商卡支付金额')
+    pay_pkg_cnt = Column(BigInteger, nullable=True, comment='支付订单数')
+    source_update_time = Column(DateTime, nullable=True, comment='源数据最后更新时间')
+    update_time = Column(DateTime, nullable=False, server_default=text('CURRENT_TIMESTAMP'), comment='汇总时间')
@@ -55,9 +55,14 @@ class CrawlAccountQueryModel(BaseModel):
     platform_id: Optional[str] = Field(default=None, description='平台ID')
     product_id: Optional[str] = Field(default=None, description='产品ID')
     account: Optional[str] = Field(default=None, description='账号')
+    account_match: Literal['prefix', 'contains'] = Field(
+        default='contains', description='账号匹配方式：contains包含匹配，prefix前缀匹配（走索引）'
+    )
     status: Optional[Union[int, str]] = Field(default=None, description='状态')
     page_num: int = Field(default=1, description='当前页码')
     page_size: int = Field(default=10, description='每页记录数')
+    cursor: Optional[str] = Field(default=None, description='游标，传入上一页返回的nextCursor获取下一页')
+    exact_count: bool = Field(default=False, description='是否精确统计总数，默认返回缓存的近似总数')
     
     @field_validator('status', mode='before')
     @classmethod
@@ -117,6 +122,7 @@ class QRCodeRequestModel(BaseModel):
 
     platform_id: str = Field(description='平台ID')
     product_id: str = Field(description='产品ID')
+    account_id: Optional[int] = Field(default=None, description='账号ID，传入时登录成功后保存cookies和店铺关联')
 
 
 class SendVerifyCodeModel(BaseModel):
@@ -137,3 +137,25 @@ class TrendDataModel(BaseModel):
     live_data: list[float] = Field(description='直播数据')
     card_data: list[float] = Field(description='商卡数据')
 
+
+
+class QfRollupRefreshModel(BaseModel):
+    """
+    千帆汇总表增量刷新模型
+    """
+
+    model_config = ConfigDict(alias_generator=to_camel)
+
+    collect_date: Optional[date] = Field(default=None, description='采集日期，为空时刷新上次汇总后源数据有变化的日期及当天')
+    store_names: Optional[list[str]] = Field(default=None, description='店铺名称列表，仅在指定采集日期时生效')
+
+
+class QfRollupRebuildModel(BaseModel):
+    """
+    千帆汇总表重建模型
+    """
+
+    model_config = ConfigDict(alias_generator=to_camel)
+
+    begin_date: date = Field(description='开始日期')
+    end_date: date = Field(description='结束日期')
@@ -22,6 +22,9 @@ class ConfigMenuService:
     DVD配置菜单模块服务层
     """
 
+    # 配置菜单数据版本名称，新增、编辑、删除后递增，用于计算配置菜单树及列表接口的ETag
+    data_version_name = 'config_menu'
+
     @classmethod
     async def get_config_menu_tree_services(cls, query_db: AsyncSession) -> list[dict[str, Any]]:
         """
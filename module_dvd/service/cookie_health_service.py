@@ -0,0 +1,224 @@
+import asyncio
+import json
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Literal, Optional
+
+from redis import asyncio as aioredis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.enums import RedisInitKeyConfig
+from config.database import AsyncSessionLocal
+from exceptions.exception import ServiceException
+from module_dvd.dao.dvd_account_dao import CrawlAccountDao
+from module_dvd.entity.do.dvd_crawl_account_do import DvdCrawlAccountInfo
+from tools.qrcode.qrcode_login_factory import QRCodeLoginFactory
+from tools.qrcode.QRCodeLogin import QRCodeLogin
+from utils.log_util import logger
+
+CheckResult = Literal['valid', 'expired', 'error', 'skipped']
+
+
+class PlatformRateLimiter:
+    """
+    平台请求限速器，保证同一平台的请求发起间隔不小于1/rate_per_second秒，并限制同时进行的请求数
+    """
+
+    def __init__(self, rate_per_second: float, concurrency: int) -> None:
+        self._interval = 1 / rate_per_second
+        self._next_time = 0.0
+        self._lock = asyncio.Lock()
+        self.semaphore = asyncio.Semaphore(concurrency)
+
+    async def wait(self) -> None:
+        """
+        等待到允许发起下一次请求的时间
+
+        :return:
+        """
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            delay = self._next_time - now
+            self._next_time = max(now, self._next_time) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class CookieHealthService:
+    """
+    采集账号cookies检测服务层
+
+    按主键分批遍历状态为正常的采集账号，同一批账号并发调用登录实例的verify_login检测cookies，
+    每个平台单独限速和限制并发；平台明确返回cookies无效的账号按批更新为过期状态，
+    请求超时等网络异常只计入失败数量，不修改账号状态。多个worker进程通过redis锁保证同一时间只有一个检测任务
+    """
+
+    page_size = 200
+    # 各登录类型每秒请求数及最大并发数，未配置的登录类型使用默认值
+    platform_limits: dict[str, tuple[float, int]] = {
+        'DdQRCodeLogin': (5, 10),
+        'QfQRCodeLogin': (5, 10),
+    }
+    default_limit = (3, 5)
+    lock_expire_seconds = 3600
+
+    @classmethod
+    async def check_cookies_services(cls, redis: aioredis.Redis, dry_run: bool = False) -> dict[str, Any]:
+        """
+        检测所有正常状态采集账号的cookies service
+
+        :param redis: redis对象
+        :param dry_run: 是否仅统计检测结果，不更新账号状态
+        :return: 检测指标
+        """
+        lock_key = f'{RedisInitKeyConfig.COOKIE_HEALTH.key}:lock'
+        lock_token = uuid.uuid4().hex
+        if not await redis.set(lock_key, lock_token, nx=True, ex=cls.lock_expire_seconds):
+            raise ServiceException(message='cookies检测任务正在执行，请稍后再试')
+        try:
+            metrics = await cls._check_all_accounts(dry_run)
+        finally:
+            # 执行时间超过锁过期时间后锁可能已被其他进程持有，仅释放本次持有的锁
+            if await redis.get(lock_key) == lock_token:
+                await redis.delete(lock_key)
+        await redis.set(f'{RedisInitKeyConfig.COOKIE_HEALTH.key}:metrics', json.dumps(metrics, ensure_ascii=False))
+        logger.info(f'采集账号cookies检测完成，检测结果：{metrics}')
+
+        return metrics
+
+    @classmethod
+    async def scheduled_check_services(cls, redis: aioredis.Redis, dry_run: bool = False) -> None:
+        """
+        定时任务执行cookies检测service，其他进程正在执行时跳过本次检测
+
+        :param redis: redis对象
+        :param dry_run: 是否仅统计检测结果，不更新账号状态
+        :return:
+        """
+        try:
+            await cls.check_cookies_services(redis, dry_run)
+        except ServiceException as e:
+            logger.info(f'跳过本次采集账号cookies检测：{e.message}')
+        except Exception as e:
+            logger.error(f'采集账号cookies检测失败，详细错误信息：{e}')
+
+    @classmethod
+    async def get_last_metrics_services(cls, redis: aioredis.Redis) -> Optional[dict[str, Any]]:
+        """
+        获取最近一次cookies检测指标service
+
+        :param redis: redis对象
+        :return: 检测指标，未执行过检测时返回None
+        """
+        metrics = await redis.get(f'{RedisInitKeyConfig.COOKIE_HEALTH.key}:metrics')
+
+        return json.loads(metrics) if metrics else None
+
+    @classmethod
+    async def _check_all_accounts(cls, dry_run: bool) -> dict[str, Any]:
+        """
+        分批检测所有正常状态的账号
+
+        :param dry_run: 是否仅统计检测结果，不更新账号状态
+        :return: 检测指标
+        """
+        start_time = time.perf_counter()
+        metrics: dict[str, Any] = {
+            'dryRun': dry_run,
+            'startTime': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'checked': 0,
+            'valid': 0,
+            'expired': 0,
+            'error': 0,
+            'skipped': 0,
+            'updated': 0,
+        }
+        limiters: dict[str, PlatformRateLimiter] = {}
+        last_id = 0
+        while True:
+            async with AsyncSessionLocal() as session:
+                # 状态：1-正常
+                accounts = await CrawlAccountDao.get_account_batch_after_id(session, last_id, cls.page_size, 1)
+                if not accounts:
+                    break
+                last_id = accounts[-1].id
+                login_instances = [await cls._get_login_instance(session, account) for account in accounts]
+
+            results: list[CheckResult] = await asyncio.gather(
+                *(
+                    cls._check_account(account, login_instance, limiters)
+                    for account, login_instance in zip(accounts, login_instances)
+                )
+            )
+            for result in results:
+                metrics[result] += 1
+            metrics['checked'] += len(accounts)
+
+            expired_ids = [account.id for account, result in zip(accounts, results) if result == 'expired']
+            if expired_ids and not dry_run:
+                async with AsyncSessionLocal() as session:
+                    # 状态：1-正常 2-过期，检测期间重新扫码登录的账号不会被覆盖
+                    metrics['updated'] += await CrawlAccountDao.update_account_status_batch_dao(
+                        session, expired_ids, 1, 2
+                    )
+                    await session.commit()
+
+        cost_seconds = time.perf_counter() - start_time
+        metrics['costSeconds'] = round(cost_seconds, 2)
+        metrics['accountsPerSecond'] = round(metrics['checked'] / cost_seconds, 2) if cost_seconds else 0
+
+        return metrics
+
+    @classmethod
+    async def _get_login_instance(cls, session: AsyncSession, account: DvdCrawlAccountInfo) -> Optional[QRCodeLogin]:
+        """
+        获取账号对应的登录实例
+
+        :param session: orm对象
+        :param account: 账号对象
+        :return: 登录实例，不支持的平台返回None
+        """
+        try:
+            return await QRCodeLoginFactory.get_login_instance_by_ids(account.platform_id, account.product_id, session)
+        except ValueError:
+            return None
+
+    @classmethod
+    async def _check_account(
+        cls,
+        account: DvdCrawlAccountInfo,
+        login_instance: Optional[QRCodeLogin],
+        limiters: dict[str, PlatformRateLimiter],
+    ) -> CheckResult:
+        """
+        检测单个账号的cookies
+
+        :param account: 账号对象
+        :param login_instance: 登录实例
+        :param limiters: 各登录类型的限速器
+        :return: 检测结果
+        """
+        if login_instance is None:
+            return 'skipped'
+        try:
+            cookies = json.loads(account.cookies) if account.cookies else None
+        except ValueError:
+            cookies = None
+        if not cookies:
+            return 'expired'
+
+        login_type = type(login_instance).__name__
+        if login_type not in limiters:
+            limiters[login_type] = PlatformRateLimiter(*cls.platform_limits.get(login_type, cls.default_limit))
+        limiter = limiters[login_type]
+        async with limiter.semaphore:
+            await limiter.wait()
+            try:
+                # verify_login仅在200响应表明登录态失效时返回假值，限流、服务端错误等非200响应抛出异常
+                is_valid = await login_instance.verify_login(cookies)
+            except Exception as e:
+                logger.warning(f'采集账号{account.id}cookies检测失败，详细错误信息：{e}')
+                return 'error'
+
+        return 'valid' if is_valid else 'expired'
@@ -0,0 +1,261 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from datetime import date
+from typing import Any, Literal, Optional, Union
+
+from redis import asyncio as aioredis
+
+from config.database import AsyncSessionLocal
+from module_dvd.dao.dd_dao import DdOverviewDao
+from module_dvd.dao.qf_dao import QfOverviewDao
+from module_dvd.entity.do.dd_do import DdRealBusinessOverview, DdRealHourlyTrend
+from module_dvd.service.dd_service import DdLatestCollectDateService
+from utils.log_util import logger
+
+# 订阅键：(平台, 数据日期, 店铺)，抖店接口固定查询最新日期，数据日期为latest；
+# 千帆未指定日期时数据日期为today，匹配通知及查询时按当天日期解析，跨天后自动跟随新日期；未筛选店铺时店铺为all
+SubscriptionKey = tuple[str, str, str]
+
+
+class DashboardPushService:
+    """
+    数据大屏实时推送服务层
+
+    数据入库后通过redis频道发布变更通知，每个worker进程只订阅一次频道，
+    收到通知后按订阅条件重新查询一次数据，仅将发生变化的组件数据推送给本进程内所有匹配的SSE连接
+    """
+
+    channel_prefix = 'dashboard_push'
+    heartbeat_seconds = 15
+    reconnect_seconds = 1
+    queue_size = 10
+    _redis: Optional[aioredis.Redis] = None
+    _listener_task: Optional[asyncio.Task] = None
+    _subscribers: dict[SubscriptionKey, set[asyncio.Queue]] = {}
+    _last_payloads: dict[SubscriptionKey, dict[str, Any]] = {}
+
+    @classmethod
+    async def start_listener(cls, redis: aioredis.Redis) -> None:
+        """
+        应用启动时订阅数据变更频道
+
+        :param redis: redis对象
+        :return:
+        """
+        cls._redis = redis
+        cls._listener_task = asyncio.create_task(cls._listen())
+        logger.info('✅️ 数据大屏推送频道订阅成功')
+
+    @classmethod
+    async def stop_listener(cls) -> None:
+        """
+        应用关闭时取消订阅数据变更频道
+
+        :return:
+        """
+        if cls._listener_task:
+            cls._listener_task.cancel()
+            try:
+                await cls._listener_task
+            except asyncio.CancelledError:
+                pass
+            cls._listener_task = None
+
+    @classmethod
+    async def publish_data_change_services(
+        cls,
+        redis: aioredis.Redis,
+        platform: Literal['qf', 'dd'],
+        collect_date: Optional[Union[date, str]] = None,
+        store: Optional[str] = None,
+    ) -> None:
+        """
+        发布数据变更通知service，供数据入库后调用
+
+        :param redis: redis对象
+        :param platform: 平台标识（qf千帆 dd抖店）
+        :param collect_date: 发生变更的采集日期，为空表示所有日期
+        :param store: 发生变更的店铺名称（千帆）或店铺ID（抖店），为空表示所有店铺
+        :return:
+        """
+        change = {'platform': platform, 'collectDate': str(collect_date) if collect_date else None, 'store': store}
+        await redis.publish(f'{cls.channel_prefix}:{platform}', json.dumps(change, ensure_ascii=False))
+
+    @classmethod
+    async def subscribe_services(
+        cls, platform: Literal['qf', 'dd'], collect_date: Optional[date] = None, store: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        订阅数据大屏更新service，连接建立后先推送一次全量数据，之后仅推送发生变化的组件数据
+
+        :param platform: 平台标识（qf千帆 dd抖店）
+        :param collect_date: 订阅的数据日期，千帆默认为当天并随自然日滚动，抖店固定为最新日期
+        :param store: 订阅的店铺名称（千帆）或店铺ID（抖店）
+        :return: SSE消息
+        """
+        subscription_key = (platform, cls._get_subscription_date(platform, collect_date), store or 'all')
+        queue: asyncio.Queue = asyncio.Queue(maxsize=cls.queue_size)
+        cls._subscribers.setdefault(subscription_key, set()).add(queue)
+        try:
+            payload = cls._last_payloads.get(subscription_key)
+            if payload is None:
+                payload = await cls._build_payload(subscription_key)
+                cls._last_payloads[subscription_key] = payload
+            yield cls._format_event('snapshot', payload)
+            while True:
+                delta = await cls._wait_delta(queue)
+                yield cls._format_event('update', delta) if delta is not None else ': heartbeat\n\n'
+        finally:
+            subscribers = cls._subscribers.get(subscription_key, set())
+            subscribers.discard(queue)
+            if not subscribers:
+                cls._subscribers.pop(subscription_key, None)
+                cls._last_payloads.pop(subscription_key, None)
+
+    @classmethod
+    def _get_subscription_date(cls, platform: Literal['qf', 'dd'], collect_date: Optional[date]) -> str:
+        """
+        获取订阅键中的数据日期
+
+        :param platform: 平台标识（qf千帆 dd抖店）
+        :param collect_date: 订阅的数据日期
+        :return: 抖店为latest，千帆未指定日期时为today，否则为指定日期
+        """
+        if platform == 'dd':
+            return 'latest'
+        if collect_date is None:
+            return 'today'
+
+        return collect_date.isoformat()
+
+    @classmethod
+    def _resolve_subscription_date(cls, subscription_date: str) -> str:
+        """
+        将订阅键中的today解析为当天日期
+
+        :param subscription_date: 订阅键中的数据日期
+        :return: 解析后的数据日期
+        """
+        return date.today().isoformat() if subscription_date == 'today' else subscription_date
+
+    @classmethod
+    async def _wait_delta(cls, queue: asyncio.Queue) -> Optional[dict[str, Any]]:
+        """
+        等待订阅者队列中的增量数据
+
+        :param queue: 订阅者队列
+        :return: 增量数据，超过心跳间隔仍无数据时返回None
+        """
+        try:
+            return await asyncio.wait_for(queue.get(), timeout=cls.heartbeat_seconds)
+        except asyncio.TimeoutError:
+            return None
+
+    @classmethod
+    async def _listen(cls) -> None:
+        """
+        监听数据变更频道，连接断开后自动重连
+
+        :return:
+        """
+        while True:
+            pubsub = cls._redis.pubsub()
+            try:
+                await pubsub.psubscribe(f'{cls.channel_prefix}:*')
+                async for message in pubsub.listen():
+                    if message['type'] == 'pmessage':
+                        await cls._dispatch(json.loads(message['data']))
+            except asyncio.CancelledError:
+                await pubsub.aclose()
+                raise
+            except Exception as e:
+                logger.error(f'数据大屏推送频道监听异常，{cls.reconnect_seconds}秒后重连，详细错误信息：{e}')
+                await pubsub.aclose()
+                await asyncio.sleep(cls.reconnect_seconds)
+
+    @classmethod
+    async def _dispatch(cls, change: dict[str, Any]) -> None:
+        """
+        将数据变更分发给本进程内匹配的订阅者，每个订阅条件只查询一次
+
+        :param change: 数据变更通知
+        :return:
+        """
+        for subscription_key in list(cls._subscribers):
+            if not cls._match(subscription_key, change):
+                continue
+            try:
+                payload = await cls._build_payload(subscription_key)
+            except Exception as e:
+                logger.error(f'数据大屏推送数据查询失败，订阅条件：{subscription_key}，详细错误信息：{e}')
+                continue
+            last_payload = cls._last_payloads.get(subscription_key, {})
+            delta = {widget: data for widget, data in payload.items() if last_payload.get(widget) != data}
+            cls._last_payloads[subscription_key] = payload
+            if not delta:
+                continue
+            for queue in list(cls._subscribers.get(subscription_key, set())):
+                # 客户端消费过慢时丢弃最旧的消息，避免阻塞其他连接
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(delta)
+
+    @classmethod
+    def _match(cls, subscription_key: SubscriptionKey, change: dict[str, Any]) -> bool:
+        """
+        判断数据变更是否影响订阅条件
+
+        :param subscription_key: 订阅键
+        :param change: 数据变更通知
+        :return: 是否匹配
+        """
+        platform, subscription_date, store = subscription_key
+        if change.get('platform') != platform:
+            return False
+        subscription_date = cls._resolve_subscription_date(subscription_date)
+        if change.get('collectDate') and subscription_date not in ('latest', change.get('collectDate')):
+            return False
+
+        return not (change.get('store') and store not in ('all', change.get('store')))
+
+    @classmethod
+    async def _build_payload(cls, subscription_key: SubscriptionKey) -> dict[str, Any]:
+        """
+        按订阅条件查询实时组件数据
+
+        :param subscription_key: 订阅键
+        :return: 组件名称与组件数据的映射
+        """
+        platform, subscription_date, store = subscription_key
+        store = None if store == 'all' else store
+        async with AsyncSessionLocal() as session:
+            if platform == 'qf':
+                target_date = date.fromisoformat(cls._resolve_subscription_date(subscription_date))
+                return {
+                    'realtimeMetrics': await QfOverviewDao.get_realtime_metrics(session, target_date, store),
+                    'realtimeTrend': await QfOverviewDao.get_realtime_trend(session, target_date, store),
+                    'realtimeOrders': await QfOverviewDao.get_realtime_orders(session, target_date, store),
+                }
+            business_date = await DdLatestCollectDateService.get_latest_collect_date_services(
+                session, cls._redis, DdRealBusinessOverview.__tablename__
+            )
+            hourly_date = await DdLatestCollectDateService.get_latest_collect_date_services(
+                session, cls._redis, DdRealHourlyTrend.__tablename__
+            )
+            return {
+                'overviewMetrics': await DdOverviewDao.get_overview_metrics(session, business_date, store),
+                'hourlyTrend': await DdOverviewDao.get_hourly_trend(session, hourly_date, store, '用户支付金额'),
+                'storeTop5': await DdOverviewDao.get_store_top5(session, business_date, store),
+            }
+
+    @classmethod
+    def _format_event(cls, event: str, data: dict[str, Any]) -> str:
+        """
+        格式化SSE消息
+
+        :param event: 事件名称
+        :param data: 事件数据
+        :return: SSE消息
+        """
+        return f'event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n'
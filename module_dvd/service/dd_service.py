@@ -1,9 +1,73 @@
+import time
 from datetime import date
-from typing import Any
+from typing import Any, Optional
 
+from redis import asyncio as aioredis
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from common.enums import RedisInitKeyConfig
 from module_dvd.dao.dd_dao import DdOverviewDao
+from module_dvd.entity.do.dd_do import DdRealBusinessOverview, DdRealHourlyTrend
+
+
+class DdLatestCollectDateService:
+    """
+    抖店最新采集日期解析服务层
+
+    解析结果依次缓存在进程内存与redis中，进程内缓存过期时间较短以便及时感知其他进程推进的日期
+    """
+
+    local_expire_seconds = 5
+    redis_expire_seconds = 300
+    _local_cache: dict[str, tuple[Optional[date], float]] = {}
+
+    @classmethod
+    async def get_latest_collect_date_services(
+        cls, query_db: AsyncSession, redis: aioredis.Redis, table_name: str
+    ) -> Optional[date]:
+        """
+        获取指定表的最新采集日期service
+
+        :param query_db: orm对象
+        :param redis: redis对象
+        :param table_name: 表名
+        :return: 最新采集日期，表中没有数据时返回None
+        """
+        local_cache = cls._local_cache.get(table_name)
+        if local_cache and local_cache[1] > time.monotonic():
+            return local_cache[0]
+
+        redis_key = f'{RedisInitKeyConfig.DD_LATEST_COLLECT_DATE.key}:{table_name}'
+        cached_date = await redis.get(redis_key)
+        if cached_date:
+            latest_date = date.fromisoformat(cached_date)
+        else:
+            latest_date = await DdOverviewDao.get_latest_collect_date(query_db, table_name)
+            # 表中没有数据时不写入redis，避免数据入库后仍读取到空结果
+            if latest_date:
+                await redis.set(redis_key, latest_date.isoformat(), ex=cls.redis_expire_seconds)
+        cls._local_cache[table_name] = (latest_date, time.monotonic() + cls.local_expire_seconds)
+
+        return latest_date
+
+    @classmethod
+    async def advance_latest_collect_date_services(
+        cls, redis: aioredis.Redis, table_name: str, collect_date: date
+    ) -> None:
+        """
+        数据入库后推进指定表的最新采集日期service，仅在新日期晚于当前缓存日期时生效
+
+        :param redis: redis对象
+        :param table_name: 表名
+        :param collect_date: 入库数据的采集日期
+        :return:
+        """
+        redis_key = f'{RedisInitKeyConfig.DD_LATEST_COLLECT_DATE.key}:{table_name}'
+        cached_date = await redis.get(redis_key)
+        if cached_date and date.fromisoformat(cached_date) >= collect_date:
+            return
+        await redis.set(redis_key, collect_date.isoformat(), ex=cls.redis_expire_seconds)
+        cls._local_cache[table_name] = (collect_date, time.monotonic() + cls.local_expire_seconds)
 
 
 class DdOverviewService:
@@ -25,6 +89,7 @@ class DdOverviewService:
     async def get_store_top5_service(
         cls, 
         query_db: AsyncSession, 
+        redis: aioredis.Redis,
         store_id: str = None,
         sort_by: str = 'amount', 
         limit: int = 5
@@ -33,32 +98,42 @@ class DdOverviewService:
         获取店铺TOP5 service
         
         :param query_db: orm对象
+        :param redis: redis对象
         :param store_id: 店铺ID筛选
         :param sort_by: 排序方式，'amount'-按成交金额，'orders'-按订单数
         :param limit: 返回数量
         :return: TOP5店铺列表
         """
-        return await DdOverviewDao.get_store_top5(query_db, store_id, sort_by, limit)
+        query_date = await DdLatestCollectDateService.get_latest_collect_date_services(
+            query_db, redis, DdRealBusinessOverview.__tablename__
+        )
+        return await DdOverviewDao.get_store_top5(query_db, query_date, store_id, sort_by, limit)
 
     @classmethod
     async def get_overview_metrics_service(
         cls,
         query_db: AsyncSession,
+        redis: aioredis.Redis,
         store_id: str = None
     ) -> dict[str, Any]:
         """
         获取抖店概览指标数据 service
         
         :param query_db: orm对象
+        :param redis: redis对象
         :param store_id: 店铺ID筛选
         :return: 概览指标数据
         """
-        return await DdOverviewDao.get_overview_metrics(query_db, store_id)
+        query_date = await DdLatestCollectDateService.get_latest_collect_date_services(
+            query_db, redis, DdRealBusinessOverview.__tablename__
+        )
+        return await DdOverviewDao.get_overview_metrics(query_db, query_date, store_id)
 
     @classmethod
     async def get_hourly_trend_service(
         cls,
         query_db: AsyncSession,
+        redis: aioredis.Redis,
         store_id: str = None,
         index_display: str = None
     ) -> list[dict[str, Any]]:
@@ -66,21 +141,30 @@ class DdOverviewService:
         获取小时趋势 service
         
         :param query_db: orm对象
+        :param redis: redis对象
         :param store_id: 店铺ID筛选
         :param index_display: 指标显示名称筛选
         :return: 24小时趋势数据
         """
-        return await DdOverviewDao.get_hourly_trend(query_db, store_id, index_display)
+        query_date = await DdLatestCollectDateService.get_latest_collect_date_services(
+            query_db, redis, DdRealHourlyTrend.__tablename__
+        )
+        return await DdOverviewDao.get_hourly_trend(query_db, query_date, store_id, index_display)
 
     @classmethod
     async def get_available_indices_service(
         cls,
-        query_db: AsyncSession
+        query_db: AsyncSession,
+        redis: aioredis.Redis
     ) -> list[dict[str, Any]]:
         """
         获取可用的指标列表 service
         
         :param query_db: orm对象
+        :param redis: redis对象
         :return: 指标列表
         """
-        return await DdOverviewDao.get_available_indices(query_db)
+        query_date = await DdLatestCollectDateService.get_latest_collect_date_services(
+            query_db, redis, DdRealHourlyTrend.__tablename__
+        )
+        return await DdOverviewDao.get_available_indices(query_db, query_date)
@@ -1,14 +1,18 @@
+import base64
 import hashlib
 import json
 from datetime import datetime
-from typing import Any
+from typing import Any, Optional
 
+from redis import asyncio as aioredis
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from common.vo import CrudResponseModel, PageModel
+from common.enums import RedisInitKeyConfig
+from common.vo import CrudResponseModel, CursorPageModel
 from exceptions.exception import ServiceException
 from module_dvd.dao.dvd_account_dao import CrawlAccountDao
 from module_dvd.dao.dvd_account_store_dao import AccountStoreDao
+from module_dvd.entity.do.dvd_crawl_account_do import DvdCrawlAccountInfo
 from module_dvd.entity.vo.dvd_crawl_account_vo import (
     CrawlAccountModel,
     CrawlAccountQueryModel,
@@ -17,6 +21,7 @@ from module_dvd.entity.vo.dvd_crawl_account_vo import (
     QRCodeStatusModel,
 )
 from tools.qrcode.qrcode_login_factory import QRCodeLoginFactory
+from tools.qrcode.QRCodeLogin import QRCodeLogin
 from utils.common_util import CamelCaseUtil
 
 
@@ -25,6 +30,8 @@ class CrawlAccountService:
     采集账号模块服务层
     """
 
+    count_expire_seconds = 60
+
     @classmethod
     def generate_unique_md5(
         cls, platform_id: str, product_id: str, account: str, bind_user_id: int
@@ -44,17 +51,33 @@ class CrawlAccountService:
 
     @classmethod
     async def get_account_list_services(
-        cls, query_db: AsyncSession, query_object: CrawlAccountQueryModel
-    ) -> PageModel:
+        cls, query_db: AsyncSession, redis: aioredis.Redis, query_object: CrawlAccountQueryModel
+    ) -> CursorPageModel:
         """
         获取账号分页列表信息service
 
+        传入游标或查询第一页时按(创建时间, id)游标分页，未传入游标的其他页码沿用偏移分页；
+        总数默认取缓存的近似值，exact_count为True时重新统计
+
         :param query_db: orm对象
+        :param redis: redis对象
         :param query_object: 查询参数对象
         :return: 账号分页列表信息
         """
-        account_list_result = await CrawlAccountDao.get_account_list(query_db, query_object, is_page=True)
-        account_count = await CrawlAccountDao.get_account_count(query_db, query_object)
+        if query_object.cursor or query_object.page_num == 1:
+            account_list_result = await CrawlAccountDao.get_account_list_by_cursor(
+                query_db, query_object, cls._decode_cursor(query_object.cursor), query_object.page_size + 1
+            )
+            # 多查询一条用于判断是否有下一页
+            has_next = len(account_list_result) > query_object.page_size
+            account_list_result = account_list_result[: query_object.page_size]
+        else:
+            account_list_result = await CrawlAccountDao.get_account_list(query_db, query_object, is_page=True)
+            has_next = None
+        account_count, count_is_exact = await cls._get_account_count(query_db, redis, query_object)
+        if has_next is None:
+            has_next = query_object.page_num * query_object.page_size < account_count
+        next_cursor = cls._encode_cursor(account_list_result[-1]) if has_next and account_list_result else None
 
         account_list = [CamelCaseUtil.transform_result(account) for account in account_list_result]
 
@@ -67,14 +90,68 @@ class CrawlAccountService:
             for account in account_list:
                 account['storeNames'] = stores_dict.get(account['id'], [])
 
-        return PageModel(
+        return CursorPageModel(
             rows=account_list,
             pageNum=query_object.page_num,
             pageSize=query_object.page_size,
             total=account_count,
-            hasNext=query_object.page_num * query_object.page_size < account_count,
+            hasNext=has_next,
+            nextCursor=next_cursor,
+            totalIsExact=count_is_exact,
         )
 
+    @classmethod
+    async def _get_account_count(
+        cls, query_db: AsyncSession, redis: aioredis.Redis, query_object: CrawlAccountQueryModel
+    ) -> tuple[int, bool]:
+        """
+        获取账号总数，相同查询条件的总数缓存count_expire_seconds秒
+
+        :param query_db: orm对象
+        :param redis: redis对象
+        :param query_object: 查询参数对象
+        :return: 账号总数及是否为精确值
+        """
+        filters = query_object.model_dump(include={'platform_id', 'product_id', 'account', 'account_match', 'status'})
+        filters_md5 = hashlib.md5(json.dumps(filters, sort_keys=True).encode('utf-8')).hexdigest()
+        cache_key = f'{RedisInitKeyConfig.CRAWL_ACCOUNT_COUNT.key}:{filters_md5}'
+        if not query_object.exact_count:
+            cached_count = await redis.get(cache_key)
+            if cached_count is not None:
+                return int(cached_count), False
+        account_count = await CrawlAccountDao.get_account_count(query_db, query_object)
+        await redis.set(cache_key, account_count, ex=cls.count_expire_seconds)
+
+        return account_count, True
+
+    @classmethod
+    def _encode_cursor(cls, account: DvdCrawlAccountInfo) -> str:
+        """
+        将记录的(创建时间, id)编码为游标
+
+        :param account: 账号对象
+        :return: 游标
+        """
+        cursor = f'{account.create_time.isoformat()}|{account.id}'
+
+        return base64.urlsafe_b64encode(cursor.encode('utf-8')).decode('utf-8')
+
+    @classmethod
+    def _decode_cursor(cls, cursor: Optional[str]) -> Optional[tuple[datetime, int]]:
+        """
+        解析游标
+
+        :param cursor: 游标
+        :return: (创建时间, id)
+        """
+        if not cursor:
+            return None
+        try:
+            create_time, account_id = base64.urlsafe_b64decode(cursor.encode('utf-8')).decode('utf-8').split('|')
+            return datetime.fromisoformat(create_time), int(account_id)
+        except ValueError:
+            raise ServiceException(message='分页游标无效') from None
+
     @classmethod
     async def account_detail_services(cls, query_db: AsyncSession, account_id: int) -> dict[str, Any]:
         """
@@ -231,7 +308,7 @@ class CrawlAccountService:
             )
 
             # 获取二维码（不同平台的返回格式可能不同）
-            qrcode_result = login_instance.get_qrcode()
+            qrcode_result = await login_instance.get_qrcode()
 
             # 处理不同平台的返回格式
             if isinstance(qrcode_result, tuple):
@@ -275,9 +352,33 @@ class CrawlAccountService:
                 product_id=product_id,
                 db_session=query_db
             )
+        except Exception as e:
+            raise ServiceException(message=f'检查二维码状态失败: {str(e)}')
+
+        return await cls.poll_qrcode_status_services(query_db, login_instance, status_model, platform_id, product_id)
+
+    @classmethod
+    async def poll_qrcode_status_services(
+        cls,
+        query_db: AsyncSession,
+        login_instance: QRCodeLogin,
+        status_model: QRCodeStatusModel,
+        platform_id: str,
+        product_id: str,
+    ) -> dict[str, Any]:
+        """
+        使用已创建的登录实例检查一次二维码扫码状态service，登录成功时保存cookies和店铺关联
 
+        :param query_db: orm对象
+        :param login_instance: 登录实例
+        :param status_model: 状态查询模型
+        :param platform_id: 平台ID
+        :param product_id: 产品ID
+        :return: 扫码状态和cookies
+        """
+        try:
             # 检查扫码状态（非阻塞式检查）
-            result = login_instance.listen_qrcode(status_model.token, blocking=False)
+            result = await login_instance.listen_qrcode(status_model.token, blocking=False)
             
             # 处理返回结果（可能是三元组或None）
             if result is None:
@@ -307,12 +408,12 @@ class CrawlAccountService:
             elif token and cookies:
                 status = 0
                 # 检测是否真的登录完毕
-                login_status = login_instance.verify_login(cookies)
+                login_status = await login_instance.verify_login(cookies)
                 if login_status:
                     status = 1
 
                 # 获取店铺名称
-                stores = login_instance.get_stores(cookies)
+                stores = await login_instance.get_stores(cookies)
 
                 # 如果提供了account_id，更新账号的cookies和店铺关联
                 if status_model.account_id:
@@ -372,7 +473,7 @@ class CrawlAccountService:
             )
 
             # 调用发送验证码方法
-            result = login_instance.get_sms_code(verify_ticket, cookies)
+            result = await login_instance.get_sms_code(verify_ticket, cookies)
             
             if result:
                 return {
@@ -412,13 +513,13 @@ class CrawlAccountService:
             )
 
             # 提交验证码，获取新的ticket
-            new_ticket = login_instance.submit_code(verify_code, verify_ticket, cookies)
+            new_ticket = await login_instance.submit_code(verify_code, verify_ticket, cookies)
             
             if not new_ticket:
                 raise ServiceException(message='验证码验证失败')
 
             # 使用新ticket继续登录流程
-            result = login_instance.listen_qrcode(token, blocking=False, verify_ticket=new_ticket)
+            result = await login_instance.listen_qrcode(token, blocking=False, verify_ticket=new_ticket)
             
             if result is None:
                 raise ServiceException(message='登录验证失败')
@@ -439,12 +540,12 @@ class CrawlAccountService:
 
             # 检测是否真的登录完毕
             status = 0
-            login_status = login_instance.verify_login(final_cookies)
+            login_status = await login_instance.verify_login(final_cookies)
             if login_status:
                 status = 1
 
             # 获取店铺名称
-            stores = login_instance.get_stores(final_cookies)
+            stores = await login_instance.get_stores(final_cookies)
 
             # 更新账号的cookies和店铺关联
             account = await CrawlAccountDao.get_account_by_id(query_db, account_id)
@@ -0,0 +1,217 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Literal
+
+from redis import asyncio as aioredis
+from sqlalchemy import Column, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.vo import CrudResponseModel
+from config.database import Base
+from exceptions.exception import ServiceException
+from module_dvd.dao.ingest_dao import IngestDao
+from module_dvd.entity.do.dd_do import DdRealBusinessOverview, DdRealHourlyTrend, DdRealIncomeExpenditureOverview
+from module_dvd.entity.do.qf_do import QfOverview
+from module_dvd.entity.do.qf_order_list_do import QfOrderList
+from module_dvd.entity.do.qf_realtime_metrics_do import QfRealtimeMetrics
+from module_dvd.entity.do.qf_realtime_trend_do import QfRealtimeTrend
+from module_dvd.service.dashboard_push_service import DashboardPushService
+from module_dvd.service.dd_service import DdLatestCollectDateService
+from module_dvd.service.qf_rollup_service import QfRollupService
+from utils.dashboard_cache_util import DashboardCacheUtil
+from utils.log_util import logger
+
+
+class IngestService:
+    """
+    采集数据入库模块服务层
+    """
+
+    chunk_size = 1000
+    # 单条语句的绑定参数上限，postgresql(asyncpg)为32767，mysql为65535，按较小值限制每块行数
+    max_bind_params = 32767
+    max_rows = 100000
+    max_error_count = 20
+    # 允许入库的表及其所属平台
+    ingest_models: dict[str, tuple[type[Base], Literal['qf', 'dd']]] = {
+        model.__tablename__: (model, platform)
+        for model, platform in [
+            (QfOverview, 'qf'),
+            (QfRealtimeTrend, 'qf'),
+            (QfRealtimeMetrics, 'qf'),
+            (QfOrderList, 'qf'),
+            (DdRealBusinessOverview, 'dd'),
+            (DdRealHourlyTrend, 'dd'),
+            (DdRealIncomeExpenditureOverview, 'dd'),
+        ]
+    }
+    # 需要同步刷新千帆汇总表的源表
+    qf_rollup_tables = {QfOverview.__tablename__, QfRealtimeTrend.__tablename__}
+
+    @classmethod
+    async def ingest_ndjson_services(
+        cls, query_db: AsyncSession, redis: aioredis.Redis, table_name: str, ndjson_body: bytes
+    ) -> CrudResponseModel:
+        """
+        批量写入NDJSON格式的采集数据service，所有数据在同一事务中分块写入
+
+        :param query_db: orm对象
+        :param redis: redis对象
+        :param table_name: 目标表名
+        :param ndjson_body: NDJSON请求体，每行一个json对象
+        :return: 入库结果
+        """
+        if table_name not in cls.ingest_models:
+            raise ServiceException(message=f'不支持写入数据表{table_name}')
+        model, platform = cls.ingest_models[table_name]
+        rows = cls._parse_and_validate_rows(model, ndjson_body)
+
+        try:
+            for row_group in cls._group_rows_by_columns(rows):
+                chunk_size = cls._get_chunk_size(len(row_group[0]))
+                for start in range(0, len(row_group), chunk_size):
+                    await IngestDao.upsert_rows_dao(query_db, model, row_group[start : start + chunk_size])
+            await query_db.commit()
+        except Exception as e:
+            await query_db.rollback()
+            raise e
+
+        # 同一批数据中店铺名称、店铺ID可能部分为空，排序时将None视为空字符串
+        partitions = sorted(
+            {(row['collect_date'], row.get('store_name'), row.get('store_id')) for row in rows},
+            key=lambda partition: (partition[0], partition[1] or '', partition[2] or ''),
+        )
+        await cls._after_ingest(query_db, redis, table_name, platform, partitions)
+        logger.info(f'{table_name}入库{len(rows)}条数据')
+
+        return CrudResponseModel(is_success=True, message='入库成功', result={'rowCount': len(rows)})
+
+    @classmethod
+    def _parse_and_validate_rows(cls, model: type[Base], ndjson_body: bytes) -> list[dict[str, Any]]:
+        """
+        解析NDJSON并按表字段校验、转换数据
+
+        :param model: 目标表模型
+        :param ndjson_body: NDJSON请求体
+        :return: 校验后的数据行列表
+        """
+        columns: dict[str, Column] = {column.name: column for column in inspect(model).columns}
+        required_columns = {
+            name
+            for name, column in columns.items()
+            if not column.nullable and column.default is None and column.server_default is None
+        }
+        rows = []
+        errors = []
+        for line_no, line in enumerate(ndjson_body.decode('utf-8').splitlines(), start=1):
+            if not line.strip():
+                continue
+            if len(rows) >= cls.max_rows:
+                raise ServiceException(message=f'单次入库不能超过{cls.max_rows}条数据')
+            try:
+                raw_row = json.loads(line)
+                if not isinstance(raw_row, dict):
+                    raise ValueError('每行必须为json对象')
+                unknown_columns = set(raw_row) - set(columns)
+                if unknown_columns:
+                    raise ValueError(f'未知字段{sorted(unknown_columns)}')
+                missing_columns = required_columns - {key for key, value in raw_row.items() if value is not None}
+                if missing_columns:
+                    raise ValueError(f'缺少必填字段{sorted(missing_columns)}')
+                rows.append({key: cls._convert_value(columns[key], value) for key, value in raw_row.items()})
+            except ValueError as e:
+                errors.append(f'第{line_no}行：{e}')
+                if len(errors) >= cls.max_error_count:
+                    break
+        if errors:
+            raise ServiceException(data='\n'.join(errors), message=f'数据校验失败，共{len(errors)}处错误')
+        if not rows:
+            raise ServiceException(message='入库数据不能为空')
+
+        return rows
+
+    @classmethod
+    def _convert_value(cls, column: Column, value: Any) -> Any:
+        """
+        按字段类型转换json值
+
+        :param column: 字段对象
+        :param value: json值
+        :return: 转换后的值
+        """
+        if value is None:
+            return None
+        python_type = column.type.python_type
+        try:
+            if python_type is datetime:
+                return datetime.fromisoformat(value)
+            if python_type is date:
+                return date.fromisoformat(value)
+            if python_type is Decimal:
+                return Decimal(str(value))
+            if python_type is int:
+                return int(value)
+        except (TypeError, ValueError, InvalidOperation) as e:
+            raise ValueError(f'字段{column.name}的值{value!r}格式错误') from e
+
+        return str(value) if python_type is str else value
+
+    @classmethod
+    def _group_rows_by_columns(cls, rows: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+        """
+        按字段集合对数据行分组，同一条多行INSERT语句中的数据行需具有相同字段
+
+        :param rows: 数据行列表
+        :return: 分组后的数据行列表
+        """
+        row_groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for row in rows:
+            row_groups.setdefault(tuple(sorted(row)), []).append(row)
+
+        return list(row_groups.values())
+
+    @classmethod
+    def _get_chunk_size(cls, column_count: int) -> int:
+        """
+        根据字段数量获取每条多行INSERT语句的行数，避免绑定参数数量超过数据库上限
+
+        :param column_count: 每行的字段数量
+        :return: 每块行数
+        """
+        return max(1, min(cls.chunk_size, cls.max_bind_params // max(column_count, 1)))
+
+    @classmethod
+    async def _after_ingest(
+        cls,
+        query_db: AsyncSession,
+        redis: aioredis.Redis,
+        table_name: str,
+        platform: Literal['qf', 'dd'],
+        partitions: list[tuple[date, Any, Any]],
+    ) -> None:
+        """
+        入库完成后刷新汇总表、推进最新采集日期、清除缓存并推送数据变更
+
+        :param query_db: orm对象
+        :param redis: redis对象
+        :param table_name: 目标表名
+        :param platform: 平台标识
+        :param partitions: 入库数据涉及的(采集日期, 店铺名称, 店铺ID)列表
+        :return:
+        """
+        collect_dates = sorted({partition[0] for partition in partitions})
+        if table_name in cls.qf_rollup_tables:
+            for collect_date in collect_dates:
+                store_names = {partition[1] for partition in partitions if partition[0] == collect_date}
+                # 存在未知店铺时刷新当天所有店铺
+                await QfRollupService.refresh_rollup_services(
+                    query_db, collect_date, None if None in store_names else sorted(store_names)
+                )
+        if platform == 'dd':
+            await DdLatestCollectDateService.advance_latest_collect_date_services(
+                redis, table_name, collect_dates[-1]
+            )
+        for collect_date in collect_dates:
+            await DashboardCacheUtil.invalidate(redis, platform, collect_date)
+            await DashboardPushService.publish_data_change_services(redis, platform, collect_date)
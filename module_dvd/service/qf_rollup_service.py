@@ -0,0 +1,141 @@
+import uuid
+from datetime import date
+from typing import Optional
+
+from redis import asyncio as aioredis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.enums import RedisInitKeyConfig
+from common.vo import CrudResponseModel
+from config.database import AsyncSessionLocal
+from exceptions.exception import ServiceException
+from module_dvd.dao.qf_rollup_dao import QfRollupDao
+from module_dvd.service.dashboard_push_service import DashboardPushService
+from utils.dashboard_cache_util import DashboardCacheUtil
+from utils.log_util import logger
+
+
+class QfRollupService:
+    """
+    千帆汇总表服务层
+    """
+
+    lock_expire_seconds = 1800
+
+    @classmethod
+    async def refresh_rollup_services(
+        cls, query_db: AsyncSession, collect_date: Optional[date] = None, store_names: Optional[list[str]] = None
+    ) -> CrudResponseModel:
+        """
+        增量刷新汇总表service
+
+        :param query_db: orm对象
+        :param collect_date: 采集日期，为空时刷新上次汇总后源数据有变化的日期及当天
+        :param store_names: 店铺名称列表，仅在指定采集日期时生效，为空时刷新当天所有店铺
+        :return: 刷新结果
+        """
+        if collect_date:
+            collect_dates = [collect_date]
+        else:
+            # 源表的更新时间不一定随数据覆盖而变化，当天数据始终参与刷新
+            collect_dates = sorted({*await QfRollupDao.get_changed_collect_dates(query_db), date.today()})
+            store_names = None
+
+        try:
+            for refresh_date in collect_dates:
+                await cls._refresh_collect_date(query_db, refresh_date, store_names)
+            await query_db.commit()
+        except Exception as e:
+            await query_db.rollback()
+            raise e
+        logger.info(f'千帆汇总表增量刷新完成，刷新日期：{[str(item) for item in collect_dates]}')
+
+        return CrudResponseModel(
+            is_success=True, message='刷新成功', result={'collectDates': [str(item) for item in collect_dates]}
+        )
+
+    @classmethod
+    async def rebuild_rollup_services(cls, query_db: AsyncSession, begin_date: date, end_date: date) -> CrudResponseModel:
+        """
+        按日期区间重建汇总表service，用于历史数据回填
+
+        :param query_db: orm对象
+        :param begin_date: 开始日期
+        :param end_date: 结束日期
+        :return: 重建结果
+        """
+        if begin_date > end_date:
+            raise ServiceException(message='开始日期不能晚于结束日期')
+        collect_dates = await QfRollupDao.get_raw_collect_dates(query_db, begin_date, end_date)
+
+        try:
+            await QfRollupDao.delete_trend_rollup_dao(query_db, begin_date, end_date)
+            await QfRollupDao.delete_overview_rollup_dao(query_db, begin_date, end_date)
+            for rebuild_date in collect_dates:
+                await QfRollupDao.add_trend_rollup_dao(
+                    query_db, await QfRollupDao.aggregate_trend_rows(query_db, rebuild_date)
+                )
+                await QfRollupDao.add_overview_rollup_dao(
+                    query_db, await QfRollupDao.aggregate_overview_rows(query_db, rebuild_date)
+                )
+            await query_db.commit()
+        except Exception as e:
+            await query_db.rollback()
+            raise e
+        logger.info(f'千帆汇总表重建完成，日期区间：{begin_date} ~ {end_date}，共{len(collect_dates)}天')
+
+        return CrudResponseModel(is_success=True, message='重建成功', result={'dayCount': len(collect_dates)})
+
+    @classmethod
+    async def _refresh_collect_date(
+        cls, query_db: AsyncSession, collect_date: date, store_names: Optional[list[str]] = None
+    ) -> None:
+        """
+        重新聚合单个采集日期的汇总数据
+
+        :param query_db: orm对象
+        :param collect_date: 采集日期
+        :param store_names: 店铺名称列表，为空时刷新当天所有店铺
+        :return:
+        """
+        trend_rows = await QfRollupDao.aggregate_trend_rows(query_db, collect_date, store_names)
+        overview_rows = await QfRollupDao.aggregate_overview_rows(query_db, collect_date, store_names)
+        await QfRollupDao.delete_trend_rollup_dao(query_db, collect_date, collect_date, store_names)
+        await QfRollupDao.delete_overview_rollup_dao(query_db, collect_date, collect_date, store_names)
+        await QfRollupDao.add_trend_rollup_dao(query_db, trend_rows)
+        await QfRollupDao.add_overview_rollup_dao(query_db, overview_rows)
+
+    @classmethod
+    async def scheduled_refresh_services(cls, redis: aioredis.Redis) -> None:
+        """
+        定时任务刷新汇总表service，汇总表为空时按源数据的日期范围全量回填，否则增量刷新有变化的日期及当天；
+        未经入库接口写入的源数据由该任务同步到汇总表，其他进程正在执行时跳过本次刷新
+
+        :param redis: redis对象
+        :return:
+        """
+        lock_key = f'{RedisInitKeyConfig.QF_ROLLUP.key}:lock'
+        lock_token = uuid.uuid4().hex
+        if not await redis.set(lock_key, lock_token, nx=True, ex=cls.lock_expire_seconds):
+            logger.info('跳过本次千帆汇总表刷新：其他进程正在执行')
+            return
+        try:
+            async with AsyncSessionLocal() as session:
+                if await QfRollupDao.is_rollup_empty(session):
+                    date_range = await QfRollupDao.get_raw_collect_date_range(session)
+                    if date_range is None:
+                        return
+                    await cls.rebuild_rollup_services(session, *date_range)
+                    await DashboardCacheUtil.invalidate(redis, 'qf')
+                    await DashboardPushService.publish_data_change_services(redis, 'qf')
+                    return
+                refresh_result = await cls.refresh_rollup_services(session)
+            for collect_date in refresh_result.result['collectDates']:
+                await DashboardCacheUtil.invalidate(redis, 'qf', collect_date)
+                await DashboardPushService.publish_data_change_services(redis, 'qf', collect_date)
+        except Exception as e:
+            logger.error(f'千帆汇总表定时刷新失败，详细错误信息：{e}')
+        finally:
+            # 执行时间超过锁过期时间后锁可能已被其他进程持有，仅释放本次持有的锁
+            if await redis.get(lock_key) == lock_token:
+                await redis.delete(lock_key)
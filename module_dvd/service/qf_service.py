@@ -1,8 +1,12 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
 from datetime import date
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from config.database import AsyncSessionLocal
 from module_dvd.dao.qf_dao import QfOverviewDao
 
 
@@ -154,25 +158,61 @@ class QfOverviewService:
         return await QfOverviewDao.get_sku_sales_data(query_db, target_date, sort_by)
 
     @classmethod
-    async def get_all_dashboard_data_service(cls, query_db: AsyncSession, target_date: date = None) -> dict[str, Any]:
+    async def get_all_dashboard_data_service(
+        cls, query_db: AsyncSession, target_date: date = None, fan_out: bool = True
+    ) -> dict[str, Any]:
         """
         获取大屏所有数据service
-        
+
         :param query_db: orm对象
         :param target_date: 目标日期
+        :param fan_out: 是否并发查询，开启后每个组件使用独立的连接池会话并发执行
         :return: 大屏所有数据
         """
-        metrics = await cls.get_dashboard_metrics_service(query_db, target_date)
-        store_rank = await cls.get_store_sales_rank_service(query_db, target_date, 10)
-        channel_data = await cls.get_channel_sales_data_service(query_db, target_date)
-        recent_orders = await cls.get_recent_orders_service(query_db, 20)
-        trend_data = await cls.get_trend_data_service(query_db, 7)
-
-        return {
-            'metrics': metrics,
-            'storeRank': store_rank,
-            'channelData': channel_data,
-            'recentOrders': recent_orders,
-            'trendData': trend_data,
-        }
+        widget_queries: list[tuple[str, Callable[..., Awaitable[Any]], tuple]] = [
+            ('metrics', QfOverviewDao.get_dashboard_metrics, (target_date,)),
+            ('storeRank', QfOverviewDao.get_store_sales_rank, (target_date, 10)),
+            ('channelData', QfOverviewDao.get_channel_sales_data, (target_date,)),
+            ('recentOrders', QfOverviewDao.get_recent_orders, (20,)),
+            ('trendData', QfOverviewDao.get_trend_data, (7,)),
+        ]
+        if fan_out:
+            results = await asyncio.gather(
+                *[cls._run_widget_query(None, widget, query, *args) for widget, query, args in widget_queries]
+            )
+        else:
+            results = [
+                await cls._run_widget_query(query_db, widget, query, *args) for widget, query, args in widget_queries
+            ]
+
+        all_data = {widget: data for widget, data, _ in results}
+        all_data['widgetCost'] = {widget: cost for widget, _, cost in results}
+
+        return all_data
 
+    @classmethod
+    async def _run_widget_query(
+        cls,
+        query_db: AsyncSession,
+        widget: str,
+        query: Callable[..., Awaitable[Any]],
+        *args,
+    ) -> tuple[str, Any, float]:
+        """
+        执行单个大屏组件的查询并统计耗时
+
+        :param query_db: orm对象，为None时从连接池获取独立会话
+        :param widget: 组件名称
+        :param query: dao查询方法
+        :param args: dao查询参数
+        :return: 组件名称、查询结果及耗时（毫秒）
+        """
+        start_time = time.perf_counter()
+        if query_db is None:
+            async with AsyncSessionLocal() as session:
+                data = await query(session, *args)
+        else:
+            data = await query(query_db, *args)
+        cost = round((time.perf_counter() - start_time) * 1000, 2)
+
+        return widget, data, cost
@@ -0,0 +1,283 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any, Optional
+
+from redis import asyncio as aioredis
+
+from common.enums import RedisInitKeyConfig
+from config.database import AsyncSessionLocal
+from exceptions.exception import ServiceException
+from module_dvd.entity.vo.dvd_crawl_account_vo import QRCodeStatusModel
+from module_dvd.service.dvd_account_service import CrawlAccountService
+from tools.qrcode.qrcode_login_factory import QRCodeLoginFactory
+from utils.log_util import logger
+
+
+class QRCodeWatchService:
+    """
+    二维码扫码状态监听服务层
+
+    二维码生成后由服务端为每个token启动一个监听任务，按poll_interval_seconds固定频率查询平台扫码状态，
+    状态变化时写入redis并通过redis频道发布；客户端通过SSE或长轮询订阅状态，
+    每个worker进程只订阅一次频道，无论打开多少浏览器标签页，平台侧的查询频率都只与token数量有关
+    """
+
+    channel_prefix = 'qrcode_watch'
+    poll_interval_seconds = 1.5
+    watch_timeout_seconds = 300
+    state_expire_seconds = 600
+    heartbeat_seconds = 15
+    reconnect_seconds = 1
+    queue_size = 10
+    final_status = ('verify_code', 'success', 'expired', 'error')
+    _redis: Optional[aioredis.Redis] = None
+    _listener_task: Optional[asyncio.Task] = None
+    _watch_tasks: dict[str, asyncio.Task] = {}
+    _subscribers: dict[str, set[asyncio.Queue]] = {}
+
+    @classmethod
+    async def start_listener(cls, redis: aioredis.Redis) -> None:
+        """
+        应用启动时订阅扫码状态频道
+
+        :param redis: redis对象
+        :return:
+        """
+        cls._redis = redis
+        cls._listener_task = asyncio.create_task(cls._listen())
+        logger.info('✅️ 二维码扫码状态频道订阅成功')
+
+    @classmethod
+    async def stop_listener(cls) -> None:
+        """
+        应用关闭时停止所有监听任务并取消订阅扫码状态频道
+
+        :return:
+        """
+        tasks = list(cls._watch_tasks.values())
+        if cls._listener_task:
+            tasks.append(cls._listener_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        cls._watch_tasks.clear()
+        cls._listener_task = None
+
+    @classmethod
+    async def start_watch_services(
+        cls, redis: aioredis.Redis, token: str, platform_id: str, product_id: str, account_id: int
+    ) -> None:
+        """
+        启动二维码扫码状态监听任务service，同一token在所有worker进程中只会启动一个监听任务
+
+        :param redis: redis对象
+        :param token: 登录token
+        :param platform_id: 平台ID
+        :param product_id: 产品ID
+        :param account_id: 账号ID，登录成功后保存cookies和店铺关联
+        :return:
+        """
+        lock_acquired = await redis.set(
+            f'{RedisInitKeyConfig.QRCODE_WATCH.key}:lock:{token}', 1, nx=True, ex=cls.watch_timeout_seconds + 60
+        )
+        if not lock_acquired:
+            return
+        await cls._set_state(redis, token, {'status': 'waiting', 'message': '等待扫码'})
+        cls._watch_tasks[token] = asyncio.create_task(cls._watch(redis, token, platform_id, product_id, account_id))
+
+    @classmethod
+    async def get_state_services(cls, redis: aioredis.Redis, token: str) -> Optional[dict[str, Any]]:
+        """
+        获取二维码当前扫码状态service
+
+        :param redis: redis对象
+        :param token: 登录token
+        :return: 扫码状态，未启动监听或已过期时返回None
+        """
+        state = await redis.get(f'{RedisInitKeyConfig.QRCODE_WATCH.key}:{token}')
+
+        return json.loads(state) if state else None
+
+    @classmethod
+    async def wait_state_services(
+        cls, redis: aioredis.Redis, token: str, since_status: Optional[str], timeout: float
+    ) -> dict[str, Any]:
+        """
+        长轮询等待二维码扫码状态变化service
+
+        :param redis: redis对象
+        :param token: 登录token
+        :param since_status: 客户端已知的扫码状态，当前状态与之不同时立即返回
+        :param timeout: 最长等待时间（秒）
+        :return: 扫码状态
+        """
+        queue = cls._add_subscriber(token)
+        try:
+            state = await cls.get_state_services(redis, token)
+            if state is None:
+                raise ServiceException(message='二维码不存在或已过期，请重新获取二维码')
+            if state['status'] != since_status:
+                return state
+            return await cls._wait_state(queue, timeout) or state
+        finally:
+            cls._remove_subscriber(token, queue)
+
+    @classmethod
+    async def subscribe_services(cls, redis: aioredis.Redis, token: str) -> AsyncIterator[str]:
+        """
+        订阅二维码扫码状态service，连接建立后先推送一次当前状态，之后推送状态变化，进入最终状态后结束
+
+        :param redis: redis对象
+        :param token: 登录token
+        :return: SSE消息
+        """
+        queue = cls._add_subscriber(token)
+        try:
+            state = await cls.get_state_services(redis, token) or {
+                'status': 'expired',
+                'message': '二维码不存在或已过期，请重新获取二维码',
+            }
+            yield cls._format_event(state)
+            while state['status'] not in cls.final_status:
+                new_state = await cls._wait_state(queue, cls.heartbeat_seconds)
+                if new_state is None:
+                    yield ': heartbeat\n\n'
+                    continue
+                state = new_state
+                yield cls._format_event(state)
+        finally:
+            cls._remove_subscriber(token, queue)
+
+    @classmethod
+    async def _wait_state(cls, queue: asyncio.Queue, timeout: float) -> Optional[dict[str, Any]]:
+        """
+        等待订阅者队列中的扫码状态变化
+
+        :param queue: 订阅者队列
+        :param timeout: 等待超时时间（秒）
+        :return: 新的扫码状态，超时时返回None
+        """
+        try:
+            return await asyncio.wait_for(queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    @classmethod
+    async def _watch(
+        cls, redis: aioredis.Redis, token: str, platform_id: str, product_id: str, account_id: int
+    ) -> None:
+        """
+        按固定频率查询平台扫码状态，直到进入最终状态或超时
+
+        :param redis: redis对象
+        :param token: 登录token
+        :param platform_id: 平台ID
+        :param product_id: 产品ID
+        :param account_id: 账号ID
+        :return:
+        """
+        status_model = QRCodeStatusModel(token=token, account_id=account_id)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + cls.watch_timeout_seconds
+        state = {'status': 'waiting'}
+        try:
+            async with AsyncSessionLocal() as session:
+                login_instance = await QRCodeLoginFactory.get_login_instance_by_ids(platform_id, product_id, session)
+            while state['status'] == 'waiting':
+                if loop.time() >= deadline:
+                    state = {'status': 'expired', 'message': '二维码已过期，请重新获取二维码'}
+                    break
+                await asyncio.sleep(cls.poll_interval_seconds)
+                async with AsyncSessionLocal() as session:
+                    state = await CrawlAccountService.poll_qrcode_status_services(
+                        session, login_instance, status_model, platform_id, product_id
+                    ) or {'status': 'waiting'}
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f'二维码{token}扫码状态监听异常，详细错误信息：{e}')
+            state = {'status': 'error', 'message': e.message if isinstance(e, ServiceException) else str(e)}
+        finally:
+            cls._watch_tasks.pop(token, None)
+        # 登录成功时cookies已保存到账号，扫码状态可通过状态查询接口读取，不对外暴露平台会话cookies；
+        # 需要验证码时后续发送及提交验证码仍需使用cookies，予以保留
+        if state['status'] == 'success':
+            state.pop('cookies', None)
+        await cls._set_state(redis, token, state)
+        logger.info(f'二维码{token}扫码状态监听结束，最终状态：{state["status"]}')
+
+    @classmethod
+    async def _set_state(cls, redis: aioredis.Redis, token: str, state: dict[str, Any]) -> None:
+        """
+        保存扫码状态并发布状态变化
+
+        :param redis: redis对象
+        :param token: 登录token
+        :param state: 扫码状态
+        :return:
+        """
+        state_json = json.dumps(state, ensure_ascii=False)
+        await redis.set(f'{RedisInitKeyConfig.QRCODE_WATCH.key}:{token}', state_json, ex=cls.state_expire_seconds)
+        await redis.publish(f'{cls.channel_prefix}:{token}', state_json)
+
+    @classmethod
+    async def _listen(cls) -> None:
+        """
+        监听扫码状态频道，连接断开后自动重连
+
+        :return:
+        """
+        while True:
+            pubsub = cls._redis.pubsub()
+            try:
+                await pubsub.psubscribe(f'{cls.channel_prefix}:*')
+                async for message in pubsub.listen():
+                    if message['type'] == 'pmessage':
+                        token = message['channel'].split(':', 1)[1]
+                        cls._dispatch(token, json.loads(message['data']))
+            except asyncio.CancelledError:
+                await pubsub.aclose()
+                raise
+            except Exception as e:
+                logger.error(f'二维码扫码状态频道监听异常，{cls.reconnect_seconds}秒后重连，详细错误信息：{e}')
+                await pubsub.aclose()
+                await asyncio.sleep(cls.reconnect_seconds)
+
+    @classmethod
+    def _dispatch(cls, token: str, state: dict[str, Any]) -> None:
+        """
+        将扫码状态分发给本进程内订阅该token的连接
+
+        :param token: 登录token
+        :param state: 扫码状态
+        :return:
+        """
+        for queue in list(cls._subscribers.get(token, set())):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(state)
+
+    @classmethod
+    def _add_subscriber(cls, token: str) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=cls.queue_size)
+        cls._subscribers.setdefault(token, set()).add(queue)
+
+        return queue
+
+    @classmethod
+    def _remove_subscriber(cls, token: str, queue: asyncio.Queue) -> None:
+        subscribers = cls._subscribers.get(token, set())
+        subscribers.discard(queue)
+        if not subscribers:
+            cls._subscribers.pop(token, None)
+
+    @classmethod
+    def _format_event(cls, state: dict[str, Any]) -> str:
+        """
+        格式化SSE消息
+
+        :param state: 扫码状态
+        :return: SSE消息
+        """
+        return f'event: status\ndata: {json.dumps(state, ensure_ascii=False)}\n\n'
@@ -9,11 +9,20 @@ from common.router import auto_register_routers
 from config.env import AppConfig
 from config.get_db import init_create_table
 from config.get_redis import RedisUtil
+from config.get_scheduler import SchedulerUtil
 from exceptions.handle import handle_exception
 from middlewares.handle import handle_middleware
+from module_admin.service.log_writer_service import LogWriterService
+from module_dvd.service.dashboard_push_service import DashboardPushService
+from module_dvd.service.qrcode_watch_service import QRCodeWatchService
 from sub_applications.handle import handle_sub_applications
+from tools.qrcode.QfQRCodeLogin import QfQRCodeLogin
+from tools.qrcode.qrcode_login_factory import QRCodeLoginFactory
+from tools.qrcode.QRCodeLogin import QRCodeLogin
 from utils.common_util import worship
+from utils.ip_location_util import IpLocationUtil
 from utils.log_util import logger
+from utils.sys_cache_util import SysCacheUtil
 
 
 # 生命周期事件
@@ -25,8 +34,24 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     app.state.redis = await RedisUtil.create_redis_pool()
     await RedisUtil.init_sys_dict(app.state.redis)
     await RedisUtil.init_sys_config(app.state.redis)
+    await SysCacheUtil.start_listener(app.state.redis)
+    await QRCodeLoginFactory.start_listener(app.state.redis)
+    await DashboardPushService.start_listener(app.state.redis)
+    await QRCodeWatchService.start_listener(app.state.redis)
+    await LogWriterService.start_writer()
+    IpLocationUtil.init_ip_location()
+    await SchedulerUtil.init_system_scheduler(app.state.redis)
     logger.info(f'🚀 {AppConfig.app_name}启动成功')
     yield
+    await SchedulerUtil.close_system_scheduler()
+    await LogWriterService.stop_writer()
+    await IpLocationUtil.close_ip_location()
+    await QRCodeLogin.close_transport()
+    await QfQRCodeLogin.close_signer()
+    await QRCodeWatchService.stop_listener()
+    await DashboardPushService.stop_listener()
+    await QRCodeLoginFactory.stop_listener()
+    await SysCacheUtil.stop_listener()
     await RedisUtil.close_redis_pool(app)
 
 
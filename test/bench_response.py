@@ -0,0 +1,164 @@
+"""
+中间件及响应序列化微基准测试
+
+对比旧实现（BaseHTTPMiddleware上下文清理中间件 + jsonable_encoder + JSONResponse）
+与新实现（纯ASGI trace中间件中清理上下文 + orjson直接序列化）在进程内处理请求的吞吐量，
+不经过网络和服务器，仅衡量中间件与响应序列化的开销
+
+用法：python test/bench_response.py [--requests 3000] [--rows 200]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--requests', type=int, default=3000)
+parser.add_argument('--rows', type=int, default=200)
+args = parser.parse_args()
+# config.env在导入时解析命令行参数，导入项目模块前移除基准测试参数
+sys.argv = sys.argv[:1]
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse, Response  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint  # noqa: E402
+from starlette.types import Message, Receive, Scope, Send  # noqa: E402
+
+from common.context import RequestContext  # noqa: E402
+from middlewares.trace_middleware import TraceASGIMiddleware  # noqa: E402
+from middlewares.trace_middleware.span import get_current_span  # noqa: E402
+from utils.response_util import ResponseUtil  # noqa: E402
+
+
+class LegacyTraceASGIMiddleware(TraceASGIMiddleware):
+    """
+    未清理上下文的trace中间件
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        async with get_current_span(scope) as span:
+            handle_outgoing_receive = await self.my_receive(receive, span)
+
+            async def handle_outgoing_request(message: Message) -> None:
+                await span.response(message)
+                await send(message)
+
+            await self.app(scope, handle_outgoing_receive, handle_outgoing_request)
+
+
+class LegacyContextCleanupMiddleware(BaseHTTPMiddleware):
+    """
+    基于BaseHTTPMiddleware的上下文清理中间件
+    """
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        response = await call_next(request)
+        RequestContext.clear_all()
+        return response
+
+
+def build_payload(rows: int) -> list[dict]:
+    """
+    构造与数据大屏接口相近的响应数据
+    """
+    now = datetime.now()
+    return [
+        {
+            'storeName': f'店铺{index}',
+            'collectDate': (now - timedelta(days=index % 30)).date(),
+            'gmv': Decimal(f'{index * 123.45:.2f}'),
+            'orderCount': index * 7,
+            'refundRate': Decimal('0.0321'),
+            'updateTime': now,
+        }
+        for index in range(rows)
+    ]
+
+
+def build_legacy_app(payload: list[dict]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get('/bench')
+    async def bench() -> Response:
+        result = {'code': 200, 'msg': '操作成功', 'data': payload, 'success': True, 'time': datetime.now()}
+        return JSONResponse(content=jsonable_encoder(result))
+
+    app.add_middleware(LegacyContextCleanupMiddleware)
+    app.add_middleware(LegacyTraceASGIMiddleware)
+    return app
+
+
+def build_current_app(payload: list[dict]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get('/bench')
+    async def bench() -> Response:
+        return ResponseUtil.success(data=payload)
+
+    app.add_middleware(TraceASGIMiddleware)
+    return app
+
+
+async def call(app: FastAPI) -> bytes:
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': '/bench',
+        'raw_path': b'/bench',
+        'root_path': '',
+        'query_string': b'',
+        'headers': [(b'host', b'bench')],
+        'client': ('127.0.0.1', 12345),
+        'server': ('bench', 80),
+        'state': {},
+    }
+    body = bytearray()
+
+    async def receive() -> dict:
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message: dict) -> None:
+        if message['type'] == 'http.response.body':
+            body.extend(message.get('body', b''))
+
+    await app(scope, receive, send)
+    return bytes(body)
+
+
+async def measure(app: FastAPI, requests: int) -> float:
+    for _ in range(min(200, requests)):
+        await call(app)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await call(app)
+    return requests / (time.perf_counter() - start)
+
+
+async def main() -> None:
+    payload = build_payload(args.rows)
+    for rows in (0, args.rows):
+        legacy_app = build_legacy_app(payload[:rows])
+        current_app = build_current_app(payload[:rows])
+        legacy_rps = await measure(legacy_app, args.requests)
+        current_rps = await measure(current_app, args.requests)
+        print(
+            f'rows={rows:<4} before: {legacy_rps:8.0f} req/s  after: {current_rps:8.0f} req/s  '
+            f'speedup: {current_rps / legacy_rps:.2f}x'
+        )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,4 @@
+import sys
+
+# config.env在导入时解析命令行参数，pytest的参数不属于应用参数，导入应用模块前移除
+sys.argv = sys.argv[:1]
@@ -0,0 +1,22 @@
+import json
+import time
+
+from utils.dashboard_cache_util import DashboardCacheUtil
+from utils.response_util import ResponseUtil
+
+
+def test_content_etag_ignores_response_time() -> None:
+    """
+    相同数据在不同时间生成的响应ETag相同，数据变化时ETag随之变化
+    """
+    first = ResponseUtil.success(data={'sales': 1})
+    time.sleep(0.001)
+    second = ResponseUtil.success(data={'sales': 1})
+    changed = ResponseUtil.success(data={'sales': 2})
+
+    assert first.body != second.body
+    first_etag, second_etag, changed_etag = (
+        DashboardCacheUtil.build_content_etag(json.loads(response.body)) for response in (first, second, changed)
+    )
+    assert first_etag == second_etag
+    assert first_etag != changed_etag
@@ -0,0 +1,89 @@
+import asyncio
+import json
+from datetime import date
+from typing import Any, Optional
+
+import pytest
+
+from module_dvd.entity.do.qf_realtime_trend_do import QfRealtimeTrend
+from module_dvd.service import ingest_service
+from module_dvd.service.ingest_service import IngestService
+
+
+class FakeSession:
+    """
+    记录提交与回滚次数的orm对象
+    """
+
+    def __init__(self) -> None:
+        self.commit_count = 0
+        self.rollback_count = 0
+
+    async def commit(self) -> None:
+        self.commit_count += 1
+
+    async def rollback(self) -> None:
+        self.rollback_count += 1
+
+
+@pytest.fixture
+def ingest_calls(monkeypatch: pytest.MonkeyPatch) -> dict[str, list]:
+    """
+    替换入库及入库后处理的数据库、redis操作，记录调用参数
+    """
+    calls: dict[str, list] = {'upsert': [], 'rollup': [], 'invalidate': [], 'publish': []}
+
+    async def upsert_rows_dao(db: Any, model: Any, rows: list[dict[str, Any]]) -> None:
+        calls['upsert'].append(rows)
+
+    async def refresh_rollup_services(query_db: Any, collect_date: date, store_names: Optional[list[str]]) -> None:
+        calls['rollup'].append((collect_date, store_names))
+
+    async def invalidate(redis: Any, platform: str, collect_date: date) -> None:
+        calls['invalidate'].append((platform, collect_date))
+
+    async def publish_data_change_services(redis: Any, platform: str, collect_date: date) -> None:
+        calls['publish'].append((platform, collect_date))
+
+    monkeypatch.setattr(ingest_service.IngestDao, 'upsert_rows_dao', upsert_rows_dao)
+    monkeypatch.setattr(ingest_service.QfRollupService, 'refresh_rollup_services', refresh_rollup_services)
+    monkeypatch.setattr(ingest_service.DashboardCacheUtil, 'invalidate', invalidate)
+    monkeypatch.setattr(
+        ingest_service.DashboardPushService, 'publish_data_change_services', publish_data_change_services
+    )
+
+    return calls
+
+
+def test_ingest_mixed_null_store(ingest_calls: dict[str, list]) -> None:
+    """
+    同一批数据中店铺名称部分为空时正常完成入库后处理，并刷新当天所有店铺的汇总数据
+    """
+    rows = [
+        {'id': 'a' * 32, 'collect_date': '2026-10-17', 'dtm': '10', 'store_name': '店铺A'},
+        {'id': 'b' * 32, 'collect_date': '2026-10-17', 'dtm': '11', 'store_name': None},
+        {'id': 'c' * 32, 'collect_date': '2026-10-16', 'dtm': '10', 'store_name': '店铺B'},
+    ]
+    ndjson_body = '\n'.join(json.dumps(row, ensure_ascii=False) for row in rows).encode('utf-8')
+    query_db = FakeSession()
+
+    result = asyncio.run(
+        IngestService.ingest_ndjson_services(query_db, None, QfRealtimeTrend.__tablename__, ndjson_body)
+    )
+
+    assert result.is_success
+    assert query_db.commit_count == 1
+    assert query_db.rollback_count == 0
+    assert ingest_calls['rollup'] == [(date(2026, 10, 16), ['店铺B']), (date(2026, 10, 17), None)]
+    assert ingest_calls['invalidate'] == [('qf', date(2026, 10, 16)), ('qf', date(2026, 10, 17))]
+    assert ingest_calls['publish'] == ingest_calls['invalidate']
+
+
+def test_chunk_size_within_bind_param_limit() -> None:
+    """
+    每块的绑定参数数量不超过数据库上限
+    """
+    for column_count in (1, 35, 62):
+        chunk_size = IngestService._get_chunk_size(column_count)
+        assert 1 <= chunk_size <= IngestService.chunk_size
+        assert chunk_size * column_count <= IngestService.max_bind_params
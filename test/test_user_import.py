@@ -0,0 +1,159 @@
+import asyncio
+import io
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from fastapi import UploadFile
+from openpyxl import Workbook
+
+from module_admin.entity.vo.user_vo import CurrentUserModel, UserImportResultModel, UserInfoModel
+from module_admin.service import user_service
+from module_admin.service.user_service import UserService
+
+ALLOWED_DEPT_IDS = {100}
+ALLOWED_USER_IDS = {10}
+
+
+@pytest.fixture
+def import_calls(monkeypatch: pytest.MonkeyPatch) -> dict[str, list]:
+    """
+    替换用户导入的数据库操作，已存在用户为old1、old2及admin，有数据权限的部门为100、用户为old1
+    """
+    calls: dict[str, list] = {'add': [], 'edit': [], 'dept_scope': []}
+    existing_users = [
+        SimpleNamespace(user_id=10, user_name='old1'),
+        SimpleNamespace(user_id=11, user_name='old2'),
+        SimpleNamespace(user_id=1, user_name='admin'),
+    ]
+
+    async def get_user_list_by_user_names(db: Any, user_names: list[str]) -> list[SimpleNamespace]:
+        return [user for user in existing_users if user.user_name in user_names]
+
+    async def get_dept_ids_by_data_scope(db: Any, dept_ids: list[int], data_scope_sql: Any) -> list[int]:
+        calls['dept_scope'].append(sorted(dept_ids))
+        return [dept_id for dept_id in dept_ids if dept_id in ALLOWED_DEPT_IDS]
+
+    async def get_user_ids_by_data_scope(db: Any, user_ids: list[int], data_scope_sql: Any) -> list[int]:
+        return [user_id for user_id in user_ids if user_id in ALLOWED_USER_IDS]
+
+    async def batch_add_user_dao(db: Any, user_list: list[dict]) -> None:
+        calls['add'].extend(user_list)
+
+    async def batch_edit_user_dao(db: Any, user_list: list[dict]) -> None:
+        calls['edit'].extend(user_list)
+
+    monkeypatch.setattr(user_service.UserDao, 'get_user_list_by_user_names', get_user_list_by_user_names)
+    monkeypatch.setattr(user_service.DeptDao, 'get_dept_ids_by_data_scope', get_dept_ids_by_data_scope)
+    monkeypatch.setattr(user_service.UserDao, 'get_user_ids_by_data_scope', get_user_ids_by_data_scope)
+    monkeypatch.setattr(user_service.UserDao, 'batch_add_user_dao', batch_add_user_dao)
+    monkeypatch.setattr(user_service.UserDao, 'batch_edit_user_dao', batch_edit_user_dao)
+
+    return calls
+
+
+def import_chunk(chunk: list[tuple[int, dict[str, Any]]], update_support: bool) -> UserImportResultModel:
+    """
+    以非超级管理员身份导入一块用户数据
+
+    :param chunk: 行号与行数据组成的列表
+    :param update_support: 用户存在时是否更新
+    :return: 导入结果
+    """
+    current_user = CurrentUserModel(permissions=[], roles=[], user=UserInfoModel(userId=2, userName='ry'))
+    import_result = UserImportResultModel()
+    asyncio.run(
+        UserService._import_user_chunk(
+            None,
+            chunk,
+            'hashed',
+            update_support,
+            current_user,
+            None,
+            None,
+            {},
+            set(),
+            import_result,
+        )
+    )
+
+    return import_result
+
+
+def test_import_mixed_add_edit_and_errors(import_calls: dict[str, list]) -> None:
+    """
+    同一块中新增与更新分别批量写入，校验或数据权限失败的行按行号记录失败原因
+    """
+    chunk = [
+        (1, {'user_name': 'new1', 'nick_name': '新用户', 'dept_id': 100, 'sex': '男', 'status': '正常'}),
+        (2, {'user_name': 'old1', 'nick_name': '老用户', 'dept_id': 100, 'phonenumber': 13800000000}),
+        (3, {'user_name': 'new1', 'nick_name': '重复用户', 'dept_id': 100}),
+        (4, {'user_name': 'new2', 'nick_name': '邮箱错误', 'dept_id': 100, 'email': 'bad'}),
+        (5, {'user_name': 'admin', 'nick_name': '超级管理员', 'dept_id': 100}),
+        (6, {'user_name': 'new3', 'nick_name': '无部门权限', 'dept_id': 200}),
+        (7, {'user_name': 'old2', 'nick_name': '无用户权限', 'dept_id': 100}),
+    ]
+
+    import_result = import_chunk(chunk, update_support=True)
+
+    assert (import_result.total, import_result.added, import_result.updated, import_result.failed) == (7, 1, 1, 5)
+    assert [(error.row_num, error.user_name, error.message) for error in import_result.errors] == [
+        (3, 'new1', '用户账号new1在导入文件中重复'),
+        (4, 'new2', '邮箱格式不正确'),
+        (5, 'admin', '不允许操作超级管理员用户'),
+        (6, 'new3', '没有权限访问部门数据'),
+        (7, 'old2', '没有权限访问用户数据'),
+    ]
+    assert import_calls['dept_scope'] == [[100, 200]]
+    assert [(user['user_name'], user['password'], user['sex'], user['status']) for user in import_calls['add']] == [
+        ('new1', 'hashed', '0', '0')
+    ]
+    assert [(user['user_id'], user['user_name'], user['phonenumber']) for user in import_calls['edit']] == [
+        (10, 'old1', '13800000000')
+    ]
+    assert 'password' not in import_calls['edit'][0]
+
+
+def test_import_existing_user_without_update_support(import_calls: dict[str, list]) -> None:
+    """
+    不支持更新时已存在的用户记录为失败，其余行正常新增
+    """
+    chunk = [
+        (1, {'user_name': 'old1', 'nick_name': '老用户', 'dept_id': 100}),
+        (2, {'user_name': 'new1', 'nick_name': '新用户', 'dept_id': 100}),
+    ]
+
+    import_result = import_chunk(chunk, update_support=False)
+
+    assert (import_result.added, import_result.updated, import_result.failed) == (1, 0, 1)
+    assert [(error.row_num, error.message) for error in import_result.errors] == [(1, '用户账号old1已存在')]
+    assert [user['user_name'] for user in import_calls['add']] == ['new1']
+    assert import_calls['edit'] == []
+
+
+def test_import_row_numbers_match_sheet_rows() -> None:
+    """
+    跳过空行后行号仍与工作表中的实际行号一致
+    """
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(['登录名称', '用户名称'])
+    sheet.append(['user1', '用户1'])
+    sheet.append([None, None])
+    sheet.append(['', ' '])
+    sheet.append(['user2', '用户2'])
+    content = io.BytesIO()
+    workbook.save(content)
+    file = UploadFile(file=content, filename='user.xlsx')
+
+    async def read_chunks() -> list[list[tuple[int, dict[str, Any]]]]:
+        return [
+            chunk
+            async for chunk in UserService._iter_import_chunks(file, {'登录名称': 'user_name', '用户名称': 'nick_name'})
+        ]
+
+    chunks = asyncio.run(read_chunks())
+
+    assert chunks == [
+        [(2, {'user_name': 'user1', 'nick_name': '用户1'}), (5, {'user_name': 'user2', 'nick_name': '用户2'})]
+    ]
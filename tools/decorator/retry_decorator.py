@@ -1,8 +1,16 @@
+import asyncio
 import time
+from collections.abc import Awaitable
 from functools import wraps
+from typing import Callable, TypeVar
+
+from typing_extensions import ParamSpec
 
 from utils.log_util import logger
 
+P = ParamSpec('P')
+R = TypeVar('R')
+
 
 def simple_retry(max_retries=3, delay=1):
     """
@@ -33,3 +41,36 @@ def simple_retry(max_retries=3, delay=1):
 
     return decorator
 
+
+
+def async_retry(
+    max_retries: int = 3, delay: float = 1, exceptions: tuple[type[BaseException], ...] = (Exception,)
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """
+    异步重试装饰器
+
+    Args:
+        max_retries: 最大重试次数
+        delay: 重试延迟时间（秒）
+        exceptions: 需要重试的异常类型
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            last_exception = None
+            for attempt in range(max_retries):
+                try:
+                    return await func(*args, **kwargs)
+                except exceptions as e:  # noqa: PERF203
+                    last_exception = e
+                    if attempt < max_retries - 1:
+                        logger.warning(f"{func.__name__} 执行失败，{delay}秒后进行第 {attempt + 2} 次重试: {e}")
+                        await asyncio.sleep(delay)
+                    else:
+                        logger.error(f"{func.__name__} 执行失败，已达最大重试次数 {max_retries}: {e}")
+            raise last_exception
+
+        return wrapper
+
+    return decorator
@@ -1,6 +1,4 @@
-import time
-
-import requests
+import asyncio
 
 from tools.qrcode.QRCodeLogin import QRCodeLogin
 from utils.log_util import logger
@@ -26,18 +24,19 @@ class DdQRCodeLogin(QRCodeLogin):
         "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36",
     }
 
-    def get_qrcode(self):
+    async def get_qrcode(self):
         """
         返回url\ token \base64
         """
         url = "https://doudian-sso.jinritemai.com/get_qrcode/"
-        response = requests.post(url, headers=self.headers)
+        async with self.new_session(headers=self.headers) as session:
+            response = await session.post(url)
         assert response.status_code == 200, f"请求异常,{response.status_code}"
         res = response.json()
         qr_url = res.get("data", {}).get("qrcode_index_url")
         return qr_url, res.get("data", {}).get("token"),self.bash64_qrcode(qr_url)
 
-    def listen_qrcode(self, token, blocking=True,verify_ticket=None):
+    async def listen_qrcode(self, token, blocking=True,verify_ticket=None):
         """
         监听二维码扫码状态
         :param token: 登录token
@@ -45,79 +44,32 @@ class DdQRCodeLogin(QRCodeLogin):
         :return: (token, cookies) 或 None
         """
         try:
-            # 创建 session 对象，自动管理整个请求链的 cookies
-            session = requests.Session()
-            session.headers.update(self.headers)
-            # 删除 Accept-Encoding 避免编码问题
-            session.headers.pop('Accept-Encoding', None)
-            
-            if blocking:
-                # 阻塞模式：持续轮询直到扫码成功
-                while True:
-                    url = "https://doudian-sso.jinritemai.com/check_qrconnect/"
-                    data = {
-                        "aid": "4272",
-                        "language": "zh",
-                        "account_sdk_source": "web",
-                        "service": "https://fxg.jinritemai.com/login/common",
-                        "token": token,
-                        "redirect_sso_to_login": "false"
-                    }
-                    if verify_ticket:
-                        data["verify_ticket"] = verify_ticket
-                    response = session.post(url, data=data)
-                    assert response.status_code == 200, f"请求异常，{response.status_code}"
-                    
-                    response_data = response.json()
-
-                    if "请完成身份验证" in response.text or response_data.get('data', {}).get('verify_ticket'):
-                        # 需要身份验证（短信/邮箱验证码）
-                        all_cookies = session.cookies.get_dict()
-                        verify_info = {
-                            'verify_ticket': response_data.get('data', {}).get('verify_ticket', ''),
-                            'verify_ways': response_data.get('data', {}).get('verify_ways', []),
-                            'verify_scene_desc': response_data.get('data', {}).get('verify_scene_desc', '为保证账号安全，请完成身份验证'),
-                        }
-                        logger.info(f"需要身份验证: {verify_info}")
-                        return token, all_cookies, verify_info
-
-                    elif response_data['data']['status'] == "3":
-                        redirect_url = response_data['data']['redirect_url']
-                        logger.info(f"扫码成功，开始处理重定向: {redirect_url}")
-
-                        # 使用 session 访问重定向URL，自动跟随所有重定向并收集 cookies
-                        # allow_redirects=True 会自动跟随重定向链，收集所有过程中的 cookies
-                        session.get(url=redirect_url, allow_redirects=True)
+            url = "https://doudian-sso.jinritemai.com/check_qrconnect/"
+            data = {
+                "aid": "4272",
+                "language": "zh",
+                "account_sdk_source": "web",
+                "service": "https://fxg.jinritemai.com/login/common",
+                "token": token,
+                "redirect_sso_to_login": "false"
+            }
+            if verify_ticket:
+                data["verify_ticket"] = verify_ticket
 
-                        # 从 session 中获取完整的 cookies
-                        all_cookies = session.cookies.get_dict()
-                        logger.info(f"完整cookies数量: {len(all_cookies)}")
-                        logger.info(f"完整cookies内容: {all_cookies}")
+            # 创建会话对象，自动管理整个请求链的 cookies
+            async with self.new_session(headers=self.headers) as session:
+                while True:
+                    response = await session.post(url, data=data)
+                    if blocking:
+                        assert response.status_code == 200, f"请求异常，{response.status_code}"
+                    elif response.status_code != 200:
+                        return None
 
-                        return token, all_cookies, None
-                    time.sleep(0.5)
-
-            else:
-                # 非阻塞模式：单次检查
-                url = "https://doudian-sso.jinritemai.com/check_qrconnect/"
-                data = {
-                    "aid": "4272",
-                    "language": "zh",
-                    "account_sdk_source": "web",
-                    "service": "https://fxg.jinritemai.com/login/common",
-                    "token": token,
-                    "redirect_sso_to_login": "false"
-                }
-                if verify_ticket:
-                    data["verify_ticket"] = verify_ticket
-                response = session.post(url, data=data)
-                
-                if response.status_code == 200:
                     response_data = response.json()
 
                     if "请完成身份验证" in response.text or response_data.get('data', {}).get('verify_ticket'):
                         # 需要身份验证（短信/邮箱验证码）
-                        all_cookies = session.cookies.get_dict()
+                        all_cookies = self.cookies_dict(session.cookies)
                         verify_info = {
                             'verify_ticket': response_data.get('data', {}).get('verify_ticket', ''),
                             'verify_ways': response_data.get('data', {}).get('verify_ways', []),
@@ -128,22 +80,27 @@ class DdQRCodeLogin(QRCodeLogin):
 
                     elif response_data.get('data', {}).get('status') == "3":
                         redirect_url = response_data['data']['redirect_url']
+                        logger.info(f"扫码成功，开始处理重定向: {redirect_url}")
 
-                        # 使用 session 访问重定向URL，自动跟随所有重定向并收集 cookies
-                        session.get(url=redirect_url, allow_redirects=True)
+                        # 访问重定向URL并自动跟随重定向链，收集所有过程中的 cookies
+                        await session.get(url=redirect_url, follow_redirects=True)
 
-                        # 从 session 中获取完整的 cookies
-                        all_cookies = session.cookies.get_dict()
+                        # 从会话中获取完整的 cookies
+                        all_cookies = self.cookies_dict(session.cookies)
                         logger.info(f"完整cookies数量: {len(all_cookies)}")
                         logger.info(f"完整cookies内容: {all_cookies}")
+
                         return token, all_cookies, None
 
-                return None
+                    if not blocking:
+                        # 非阻塞模式：单次检查
+                        return None
+                    await asyncio.sleep(0.5)
         except Exception as e:
-            print(f"listen_qrcode 发生异常: {str(e)}")
+            logger.error(f"listen_qrcode 发生异常: {e}")
             return None
 
-    def verify_account_login(self, cookies):
+    async def verify_account_login(self, cookies):
         """
         校验登录账号信息
         :param cookies:
@@ -157,25 +114,25 @@ class DdQRCodeLogin(QRCodeLogin):
             "entry_source": "0",
             "bus_child_type": "0",
         }
-        response = requests.get(url, headers=self.headers, cookies=cookies, params=params)
+        response = await self.request("GET", url, headers=self.headers, cookies=cookies, params=params)
         assert response.status_code==200,f"请求异常，{response.status_code}"
         res = response.json()
         assert res.get("msg") == "success", f"请求错误，{response.text}"
         assert res.get("data"), f"账号获取店铺错误"
         return  True
 
-    def verify_store_login(self,cookies,shop_name):
+    async def verify_store_login(self,cookies,shop_name):
         """
         校验店铺cookies
         :return:
         """
         url = "https://fxg.jinritemai.com/ffa/mshop/homepage/index"
-        response = requests.get(url, headers=self.headers, cookies=cookies)
+        response = await self.request("GET", url, headers=self.headers, cookies=cookies)
         if shop_name in response.text:
             return True
         return False
 
-    def get_store_list(self,cookies):
+    async def get_store_list(self,cookies):
         """
         获取店铺列表
         :return:
@@ -190,7 +147,7 @@ class DdQRCodeLogin(QRCodeLogin):
             'bus_child_type': "0",
         }
 
-        response = requests.get(url, params=params, headers=self.headers,cookies=cookies)
+        response = await self.request("GET", url, params=params, headers=self.headers,cookies=cookies)
         assert response.status_code == 200, f"请求异常，{response.status_code}"
         res = response.json()
         assert res.get("msg") == "success" , f"请求错误，{response.text}"
@@ -206,7 +163,7 @@ class DdQRCodeLogin(QRCodeLogin):
             })
         return store_data
 
-    def get_stores(self,cookies):
+    async def get_stores(self,cookies):
         url = "https://fxg.jinritemai.com/ecomauth/loginv1/get_login_subject"
         params = {
             'bus_type': "1",
@@ -214,7 +171,7 @@ class DdQRCodeLogin(QRCodeLogin):
             'entry_source': "0",
             'bus_child_type': "0",
         }
-        response = requests.get(url, params=params, headers=self.headers, cookies=cookies)
+        response = await self.request("GET", url, params=params, headers=self.headers, cookies=cookies)
         assert response.status_code == 200, f"请求异常，{response.status_code}"
         res = response.json()
         assert res.get("msg") == "success", f"请求错误，{response.text}"
@@ -224,7 +181,7 @@ class DdQRCodeLogin(QRCodeLogin):
             store_data.append(data.get("account_name"))
         return store_data
 
-    def get_store_cookies(self,store_info ,cookies:dict):
+    async def get_store_cookies(self,store_info ,cookies:dict):
         """
         通过账号cookies 获取店铺cookies
         :return:
@@ -242,9 +199,9 @@ class DdQRCodeLogin(QRCodeLogin):
           'encode_member_id': store_info.get("encode_member_id"),
           'action_type': "1",
         }
-        response = requests.get(url, params=params, headers=self.headers,cookies=cookies)
+        response = await self.request("GET", url, params=params, headers=self.headers,cookies=cookies)
         assert response.status_code == 200,f"请求异常，{response.status_code}"
-        cookies.update(dict(response.cookies))
+        cookies.update(self.cookies_dict(response.cookies))
 
         dt_params = {
             "login_source": "compass",
@@ -255,12 +212,12 @@ class DdQRCodeLogin(QRCodeLogin):
             "encode_member_id": store_info.get("encode_member_id"),
             "action_type": "6",
         }
-        dt_response = requests.get(url, headers=self.headers, cookies=cookies, params=dt_params)
+        dt_response = await self.request("GET", url, headers=self.headers, cookies=cookies, params=dt_params)
         assert dt_response.status_code == 200, f"请求异常，{dt_response.status_code}"
-        cookies.update(dict(dt_response.cookies))
+        cookies.update(self.cookies_dict(dt_response.cookies))
         return cookies
 
-    def verify_login(self,cookies):
+    async def verify_login(self,cookies):
 
         url = "https://fxg.jinritemai.com/ecomauth/loginv1/get_login_subject"
 
@@ -285,14 +242,15 @@ class DdQRCodeLogin(QRCodeLogin):
             'priority': "u=1, i",
         }
 
-        response = requests.get(url=url, params=params, headers=headers, cookies=cookies)
+        response = await self.request("GET", url, params=params, headers=headers, cookies=cookies)
 
-        assert response.status_code == 200 , f"请求异常,{response.status_code}"
+        # 非200状态码为平台或网络异常，抛出HTTPStatusError，不能据此判断cookies失效
+        response.raise_for_status()
         res = response.json()
-        assert res.get("msg") == "success" , f"请求异常,{response.text}"
-        return True
+        # 200响应中msg不为success表示登录态已失效
+        return res.get("msg") == "success"
 
-    def get_sms_code(self,verify_ticket,cookie):
+    async def get_sms_code(self,verify_ticket,cookie):
         """
         获取短信验证码
         """
@@ -314,14 +272,15 @@ class DdQRCodeLogin(QRCodeLogin):
             "mobile": "undefined",
             "verify_ticket": f"{verify_ticket}"
         }
-        response = requests.post(url, headers=self.headers, cookies=cookie, params=params, data=data)
-        print(response.text)
+        async with self.new_session(headers=self.headers, cookies=cookie) as session:
+            response = await session.post(url, params=params, data=data)
+        logger.info(f"发送短信验证码响应: {response.text}")
         assert response.status_code == 200, f"请求异常,{response.status_code}"
         res = response.json()
         assert res.get("message") == "success", f"请求异常,{response.text}"
         return True
 
-    def submit_code(self,code,verify_ticket,cookies):
+    async def submit_code(self,code,verify_ticket,cookies):
         """
         提交验证码
         """
@@ -359,8 +318,9 @@ class DdQRCodeLogin(QRCodeLogin):
             "code": self.xor(code),
             "verify_ticket": f"{verify_ticket}"
         }
-        response = requests.post(url, headers=headers, cookies=cookies, params=params, data=data)
-        print(response)
+        async with self.new_session(headers=headers, cookies=cookies) as session:
+            response = await session.post(url, params=params, data=data)
+        logger.info(f"提交验证码响应: {response.status_code} {response.text}")
         assert response.status_code == 200, f"请求异常,{response.status_code}"
         res = response.json()
         assert res.get("message") == "success", f"请求异常,{response.text}"
@@ -392,6 +352,6 @@ if __name__ == '__main__':
         "encode_shop_id" :"QhWfhuDN",
         "encode_member_id" :"kpNVwzRnvZRcBZe",
     }
-    new_cookies = dy_login.get_store_cookies(store_info,account_cookies)
+    new_cookies = asyncio.run(dy_login.get_store_cookies(store_info,account_cookies))
     print(new_cookies)
     # print(dy_login.verify_store_login(account_cookies, "宇星物语"))
\ No newline at end of file
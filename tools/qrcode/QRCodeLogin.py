@@ -1,33 +1,117 @@
 from qrcode.main import QRCode
 from io import BytesIO
+from typing import Any, Optional
 from PIL import Image
 import base64
 import os
+
+import httpx
+
+from tools.decorator.retry_decorator import async_retry
 # from fake_useragent import UserAgent #pip install fake_useragent
 
 
+class SharedTransport(httpx.AsyncBaseTransport):
+    """
+    共享连接池包装，关闭会话时不关闭底层连接池
+    """
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport) -> None:
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        # 底层连接池由QRCodeLogin.close_transport统一关闭
+        pass
+
+
 class QRCodeLogin:
+    """
+    二维码登录基类
+
+    所有平台共用一个httpx连接池，每次登录流程通过new_session创建独立管理cookies的会话
+    """
+
+    timeout = httpx.Timeout(10.0, connect=5.0)
+    limits = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+    _transport: Optional[httpx.AsyncHTTPTransport] = None
+
+    @classmethod
+    def get_transport(cls) -> SharedTransport:
+        """
+        获取共享连接池，建立连接失败时自动重试2次
+        :return:
+        """
+        if QRCodeLogin._transport is None:
+            QRCodeLogin._transport = httpx.AsyncHTTPTransport(limits=cls.limits, retries=2)
+        return SharedTransport(QRCodeLogin._transport)
+
+    @classmethod
+    async def close_transport(cls) -> None:
+        """
+        关闭共享连接池，应用关闭时调用
+        :return:
+        """
+        if QRCodeLogin._transport is not None:
+            await QRCodeLogin._transport.aclose()
+            QRCodeLogin._transport = None
+
+    @classmethod
+    def new_session(cls, headers: Optional[dict] = None, cookies: Optional[dict] = None) -> httpx.AsyncClient:
+        """
+        创建使用共享连接池的会话
+        :param headers: 会话请求头
+        :param cookies: 会话初始cookies
+        :return:
+        """
+        return httpx.AsyncClient(
+            transport=cls.get_transport(), headers=headers, cookies=cookies, timeout=cls.timeout
+        )
+
+    @classmethod
+    @async_retry(max_retries=3, delay=0.5, exceptions=(httpx.TimeoutException, httpx.NetworkError))
+    async def request(cls, method: str, url: str, cookies: Optional[dict] = None, **kwargs: Any) -> httpx.Response:
+        """
+        使用独立会话发送单次请求，超时或网络异常时重试，仅用于可重复调用的查询接口
+        :param method: 请求方法
+        :param url: 请求地址
+        :param cookies: 请求cookies
+        :return:
+        """
+        async with cls.new_session(cookies=cookies) as session:
+            return await session.request(method, url, **kwargs)
 
-    def get_qrcode(self):
+    @classmethod
+    def cookies_dict(cls, cookies: httpx.Cookies) -> dict:
+        """
+        将会话cookies转换为字典，同名cookies以后写入的为准
+        :param cookies: httpx cookies对象
+        :return:
+        """
+        return {cookie.name: cookie.value for cookie in cookies.jar}
+
+    async def get_qrcode(self):
         """
         获取二维码地址
         :return:
         """
-        raise NotImplemented
+        raise NotImplementedError
 
-    def listen_qrcode(self,token, blocking=False):
+    async def listen_qrcode(self, token, blocking=False):
         """
         监听响应接口
         :return:
         """
-        raise NotImplemented
+        raise NotImplementedError
 
-    def verify_login(self,cookies):
+    async def verify_login(self, cookies):
         """
-        检测cookies是否有效
-        :return:
+        检测cookies是否有效，平台返回非200状态码时抛出httpx.HTTPStatusError，不视为cookies失效
+        :return: 200响应表明登录态有效时返回真值，否则返回假值
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @classmethod
     def bash64_qrcode(cls, img):
@@ -118,7 +202,7 @@ class QRCodeLogin:
         else:
             raise TypeError("参数必须是字符串URL或IO图片对象")
 
-    def get_stores(self,cookies):
+    async def get_stores(self, cookies):
         """
         获取店铺名称
         """
@@ -1,12 +1,9 @@
+import asyncio
 import json
 import os
-import time
-
-import execjs
-execjs.runtime_name = 'node'
 
 from tools.qrcode.QRCodeLogin import QRCodeLogin
-import requests
+from tools.qrcode.js_signer import JsSignerPool
 
 class QfQRCodeLogin(QRCodeLogin):
     """
@@ -27,13 +24,10 @@ class QfQRCodeLogin(QRCodeLogin):
         "sec-fetch-site": "same-origin",
         "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36",
     }
+    # 常驻node进程池，签名脚本只在进程启动时加载一次
+    signer_pool = JsSignerPool(os.path.join(os.path.dirname(os.path.abspath(__file__)), "js", "qf.js"))
 
-    def __init__(self):
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        self.js_file_path = os.path.join(current_dir, "js", "qf.js")
-
-
-    def get_qrcode(self):
+    async def get_qrcode(self):
         data = {
             "service": "https%3A%2F%2Fark.xiaohongshu.com%2Fark"
         }
@@ -42,14 +36,14 @@ class QfQRCodeLogin(QRCodeLogin):
         url = "https://customer.xiaohongshu.com/api/cas/customer/web/qr-code"
         # 获取JS文件的绝对路径
 
-        x_s = self.gen_x_s(
+        x_s = await self.gen_x_s(
             path="/api/cas/customer/web/qr-code",
-            data={"service": "https%3A%2F%2Fark.xiaohongshu.com%2Fark"},
-            js_path=self.js_file_path
+            data={"service": "https%3A%2F%2Fark.xiaohongshu.com%2Fark"}
         )
-        self.headers["x-s"] = x_s["X-s"]
-        self.headers["x-t"] = str(x_s["X-t"])
-        response = requests.post(url, headers=self.headers, data=data)
+        # 签名头按请求生成，不修改类属性，避免并发登录互相覆盖
+        headers = {**self.headers, "x-s": x_s["X-s"], "x-t": str(x_s["X-t"])}
+        async with self.new_session(headers=headers) as session:
+            response = await session.post(url, content=data)
         assert response.status_code == 200, f"请求异常,{response.status_code}"
 
         res = response.json()
@@ -57,22 +51,23 @@ class QfQRCodeLogin(QRCodeLogin):
         return qr_url, res.get("data", {}).get("id"),self.bash64_qrcode(qr_url)
 
     @classmethod
-    def gen_x_s(cls, path, data, js_path):
-        context = execjs.compile(cls.js_from_file(js_path))
-        x_s = context.call("lt", path, data)
-        return x_s
+    async def gen_x_s(cls, path, data):
+        """
+        生成x-s签名
+        :param path: 请求路径
+        :param data: 请求参数
+        :return: 包含X-s和X-t的签名字典
+        """
+        return await cls.signer_pool.sign(path, data)
 
     @classmethod
-    def js_from_file(cls, file_name):
+    async def close_signer(cls) -> None:
         """
-        读取js文件
-        :return:
+        关闭签名进程池
         """
-        with open(file_name, 'r', encoding='UTF-8') as file:
-            result = file.read()
-        return result
+        await cls.signer_pool.stop()
 
-    def listen_qrcode(self, token, blocking=True):
+    async def listen_qrcode(self, token, blocking=True):
         """
         监听二维码扫码状态
         :param token: 登录token
@@ -80,82 +75,48 @@ class QfQRCodeLogin(QRCodeLogin):
         :return: (token, cookies) 或 None
         """
         try:
-            # 创建 session 对象，自动管理整个请求链的 cookies
-            session = requests.Session()
-            session.headers.update(self.headers)
-            
             url = "https://customer.xiaohongshu.com/api/cas/customer/web/qr-code"
             params = {
                 "service": "https%3A%2F%2Fark.xiaohongshu.com%2Fapp-note%2Fmanagement",
                 "qr_code_id": f"{token}",
                 "source": ""
             }
-            x_s = self.gen_x_s(
-                path="/api/cas/customer/web/qr-code",
-                data={
-                "service": "https%3A%2F%2Fark.xiaohongshu.com%2Fapp-note%2Fmanagement",
-                "qr_code_id": f"{token}",
-                "source": "" },
-                js_path=self.js_file_path
-            )
-            session.headers["x-s"] = x_s["X-s"]
-            session.headers["x-t"] = str(x_s["X-t"])
-            
-            if blocking:
-                # 阻塞模式：持续轮询直到扫码成功
+            x_s = await self.gen_x_s(path="/api/cas/customer/web/qr-code", data=params)
+            headers = {**self.headers, "x-s": x_s["X-s"], "x-t": str(x_s["X-t"])}
+
+            # 创建会话对象，自动管理整个请求链的 cookies
+            async with self.new_session(headers=headers) as session:
                 while True:
-                    response = session.get(url, params=params)
+                    response = await session.get(url, params=params)
                     assert response.status_code == 200, f"请求异常，{response.status_code}"
-                    
+
                     response_data = response.json()
-                    if response_data['data']['status'] == 1:
+                    if response_data.get('data', {}).get('status') == 1:
                         ticket = response_data['data']['ticket']
-                        print(f"扫码成功，获取到ticket: {ticket}")
 
                         payload = {
                             "system": "https://ark.xiaohongshu.com/app-system/home?from=ark-login",
                             "ticket": ticket
                         }
                         sso_url = "https://ark.xiaohongshu.com/api/edith/open/ssologin"
-                        sso_response = session.post(url=sso_url, data=json.dumps(payload))
+                        sso_response = await session.post(url=sso_url, content=json.dumps(payload))
                         assert sso_response.status_code == 200, f"请求异常，{sso_response.status_code}"
                         assert sso_response.json().get("code") == 0, f"请求异常，{sso_response.text}"
-                        
-                        # 从 session 中获取完整的 cookies
-                        all_cookies = session.cookies.get_dict()
-                        print(f"完整cookies数量: {len(all_cookies)}")
-                        print(f"完整cookies内容: {all_cookies}")
-                        
-                        return token, all_cookies, None
-                    time.sleep(0.5)
-            else:
-                # 非阻塞模式：单次检查
-                response = session.get(url=url, params=params)
-                assert response.status_code == 200, f"请求异常，{response.status_code}"
-                
-                response_data = response.json()
-                if response_data.get('data', {}).get('status') == 1:
-                    ticket = response_data['data']['ticket']
-
-                    payload = {
-                        "system": "https://ark.xiaohongshu.com/app-system/home?from=ark-login",
-                        "ticket": ticket
-                    }
-                    sso_url = "https://ark.xiaohongshu.com/api/edith/open/ssologin"
-                    sso_response = session.post(url=sso_url, data=json.dumps(payload))
-                    assert sso_response.status_code == 200, f"请求异常，{sso_response.status_code}"
-                    assert sso_response.json().get("code") == 0, f"请求异常，{sso_response.text}"
-                    
-                    # 从 session 中获取完整的 cookies
-                    all_cookies = session.cookies.get_dict()
-                    return token, all_cookies
-                    
-                return None
+
+                        # 从会话中获取完整的 cookies
+                        all_cookies = self.cookies_dict(session.cookies)
+                        if blocking:
+                            return token, all_cookies, None
+                        return token, all_cookies
+                    if not blocking:
+                        # 非阻塞模式：单次检查
+                        return None
+                    await asyncio.sleep(0.5)
         except Exception as e:
             print(f"listen_qrcode 发生异常: {str(e)}")
             return None
 
-    def verify_login(self, cookies):
+    async def verify_login(self, cookies):
         headers = {
             "accept": "application/json, text/plain, */*",
             "accept-language": "zh-CN,zh;q=0.9",
@@ -170,12 +131,13 @@ class QfQRCodeLogin(QRCodeLogin):
             "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36",
         }
         url = "https://ark.xiaohongshu.com/api/edith/seller/info/v2"
-        response = requests.get(url, headers=headers, cookies=cookies)
-        assert response.status_code == 200 , f"请求异常，{response.status_code}"
+        response = await self.request("GET", url, headers=headers, cookies=cookies)
+        # 非200状态码为平台或网络异常，抛出HTTPStatusError，不能据此判断cookies失效
+        response.raise_for_status()
         res = response.json()
         return res.get("data",{}).get("company_name")
 
-    def get_stores(self,cookies):
+    async def get_stores(self,cookies):
 
         headers = {
             "accept": "application/json, text/plain, */*",
@@ -191,7 +153,7 @@ class QfQRCodeLogin(QRCodeLogin):
             "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36",
         }
         url = "https://ark.xiaohongshu.com/api/edith/seller/info/v2"
-        response = requests.get(url, headers=headers, cookies=cookies)
+        response = await self.request("GET", url, headers=headers, cookies=cookies)
         assert response.status_code == 200, f"请求异常，{response.status_code}"
         res = response.json()
         return [res.get("data", {}).get("company_name")]
@@ -199,14 +161,15 @@ class QfQRCodeLogin(QRCodeLogin):
 
 
 if __name__ == '__main__':
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    js_file_path = os.path.join(current_dir, "js", "qf.js")
-    x = QfQRCodeLogin.gen_x_s(
-        path="/api/cas/customer/web/qr-code",
-        data={
-            "service": "https%3A%2F%2Fark.xiaohongshu.com%2Fapp-note%2Fmanagement",
-            "qr_code_id": f"68c517600058301041491974",
-            "source": ""},
-        js_path=js_file_path
-    )
-    print(x)
\ No newline at end of file
+    async def main() -> None:
+        x = await QfQRCodeLogin.gen_x_s(
+            path="/api/cas/customer/web/qr-code",
+            data={
+                "service": "https%3A%2F%2Fark.xiaohongshu.com%2Fapp-note%2Fmanagement",
+                "qr_code_id": f"68c517600058301041491974",
+                "source": ""}
+        )
+        print(x)
+        await QfQRCodeLogin.close_signer()
+
+    asyncio.run(main())
\ No newline at end of file
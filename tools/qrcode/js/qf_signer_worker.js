@@ -0,0 +1,29 @@
+// 千帆x-s签名常驻进程：启动时加载一次qf.js，之后按行读取json请求并按行返回签名结果
+// 请求格式：{"id": 1, "path": "/api/...", "data": {...}}，{"id": 1, "ping": true}用于健康检查
+const fs = require('fs');
+const path = require('path');
+const readline = require('readline');
+const vm = require('vm');
+
+const scriptPath = process.argv[2] || path.join(__dirname, 'qf.js');
+const stdoutWrite = process.stdout.write.bind(process.stdout);
+const reply = (message) => stdoutWrite(JSON.stringify(message) + '\n');
+
+// qf.js加载时会打印调试信息，屏蔽console输出避免污染通信管道
+console.log = console.info = console.warn = console.debug = () => {};
+vm.runInThisContext(fs.readFileSync(scriptPath, 'utf-8'), { filename: scriptPath });
+
+readline.createInterface({ input: process.stdin }).on('line', (line) => {
+    let request = null;
+    try {
+        request = JSON.parse(line);
+        if (request.ping) {
+            reply({ id: request.id, result: 'pong' });
+        } else {
+            reply({ id: request.id, result: lt(request.path, request.data) });
+        }
+    } catch (e) {
+        reply({ id: request ? request.id : null, error: String((e && e.stack) || e) });
+    }
+});
+process.stdin.on('end', () => process.exit(0));
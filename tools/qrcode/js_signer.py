@@ -0,0 +1,204 @@
+import asyncio
+import itertools
+import json
+import os
+import shutil
+from typing import Any, Optional
+
+from utils.log_util import logger
+
+
+class JsSignerWorker:
+    """
+    常驻node签名进程，启动时加载一次签名脚本，之后通过标准输入输出按行收发json
+    """
+
+    def __init__(self, process: asyncio.subprocess.Process) -> None:
+        self.process = process
+        self._ids = itertools.count(1)
+
+    @property
+    def alive(self) -> bool:
+        return self.process.returncode is None
+
+    async def call(self, message: dict[str, Any], timeout: float) -> Any:
+        """
+        发送一条请求并等待结果
+
+        :param message: 请求内容
+        :param timeout: 超时时间（秒）
+        :return: 签名结果
+        """
+        request_id = next(self._ids)
+        self.process.stdin.write(json.dumps({**message, 'id': request_id}, ensure_ascii=False).encode() + b'\n')
+        await self.process.stdin.drain()
+        line = await asyncio.wait_for(self.process.stdout.readline(), timeout=timeout)
+        if not line:
+            raise RuntimeError(f'签名进程已退出，退出码：{self.process.returncode}')
+        response = json.loads(line)
+        if response.get('id') != request_id:
+            raise RuntimeError('签名进程响应与请求不匹配')
+        if 'error' in response:
+            raise RuntimeError(f'签名脚本执行失败：{response["error"]}')
+
+        return response['result']
+
+    async def close(self) -> None:
+        """
+        关闭签名进程
+
+        :return:
+        """
+        if not self.alive:
+            return
+        try:
+            self.process.stdin.close()
+            await asyncio.wait_for(self.process.wait(), timeout=2)
+        except (asyncio.TimeoutError, OSError):
+            self.process.kill()
+            await self.process.wait()
+
+
+class JsSignerPool:
+    """
+    node签名进程池
+
+    首次签名时启动pool_size个常驻node进程，每个进程同一时间只处理一个请求，空闲进程放在队列中，
+    队列即并发限制；取出进程时检查存活，签名超时或出错的进程直接销毁并补充新进程，
+    新进程需先通过ping健康检查才会放入队列
+    """
+
+    worker_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'js', 'qf_signer_worker.js')
+
+    def __init__(self, script_path: str, pool_size: int = 2, timeout: float = 5.0) -> None:
+        self.script_path = script_path
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._idle: Optional[asyncio.Queue] = None
+        self._workers: set[JsSignerWorker] = set()
+        # 保存进程回收任务的引用，避免任务在执行中被垃圾回收导致node进程泄漏
+        self._recycle_tasks: set[asyncio.Task] = set()
+        self._start_lock: Optional[asyncio.Lock] = None
+
+    async def start(self) -> None:
+        """
+        启动签名进程池，已启动时直接返回
+
+        :return:
+        """
+        # 进程池可能在事件循环启动前创建，启动锁在首次使用时创建
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._idle is not None:
+                return
+            idle = asyncio.Queue(maxsize=self.pool_size)
+            workers = await asyncio.gather(*(self._spawn() for _ in range(self.pool_size)))
+            for worker in workers:
+                idle.put_nowait(worker)
+            self._idle = idle
+            logger.info(f'✅️ 签名进程池启动成功，共{self.pool_size}个进程')
+
+    async def stop(self) -> None:
+        """
+        关闭所有签名进程
+
+        :return:
+        """
+        self._idle = None
+        # 等待进行中的回收任务结束，回收任务在进程池关闭后启动的新进程会自行销毁
+        await asyncio.gather(*self._recycle_tasks, return_exceptions=True)
+        workers = list(self._workers)
+        self._workers.clear()
+        await asyncio.gather(*(worker.close() for worker in workers), return_exceptions=True)
+
+    async def sign(self, path: str, data: Any) -> dict[str, Any]:
+        """
+        生成签名
+
+        :param path: 请求路径
+        :param data: 请求参数
+        :return: 签名结果
+        """
+        if self._idle is None:
+            await self.start()
+        idle = self._idle
+        worker: JsSignerWorker = await asyncio.wait_for(idle.get(), timeout=self.timeout)
+        try:
+            if not worker.alive:
+                worker = await self._replace(worker)
+            result = await worker.call({'path': path, 'data': data}, self.timeout)
+        except BaseException:
+            # 超时或出错后进程输出可能与请求错位，销毁后补充新进程
+            recycle_task = asyncio.create_task(self._recycle(idle, worker))
+            self._recycle_tasks.add(recycle_task)
+            recycle_task.add_done_callback(self._recycle_tasks.discard)
+            raise
+        idle.put_nowait(worker)
+
+        return result
+
+    async def _spawn(self) -> JsSignerWorker:
+        """
+        启动一个签名进程并完成健康检查
+
+        :return: 签名进程对象
+        """
+        node = shutil.which('node')
+        if not node:
+            raise RuntimeError('未找到node运行环境，无法生成签名')
+        process = await asyncio.create_subprocess_exec(
+            node,
+            self.worker_script,
+            self.script_path,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+        )
+        worker = JsSignerWorker(process)
+        self._workers.add(worker)
+        try:
+            # 首次ping需等待签名脚本加载完成
+            await worker.call({'ping': True}, self.timeout * 2)
+        except BaseException:
+            await self._discard(worker)
+            raise
+
+        return worker
+
+    async def _replace(self, worker: JsSignerWorker) -> JsSignerWorker:
+        """
+        销毁进程并启动新进程
+
+        :param worker: 需要销毁的签名进程
+        :return: 新签名进程
+        """
+        logger.warning(f'签名进程已退出，退出码：{worker.process.returncode}，重新启动')
+        await self._discard(worker)
+
+        return await self._spawn()
+
+    async def _recycle(self, idle: asyncio.Queue, worker: JsSignerWorker) -> None:
+        """
+        销毁异常进程，并向空闲队列补充新进程，保持进程池大小不变
+
+        :param idle: 进程所属的空闲队列
+        :param worker: 异常的签名进程
+        :return:
+        """
+        await self._discard(worker)
+        while idle is self._idle:
+            try:
+                worker = await self._spawn()
+            except Exception as e:
+                logger.error(f'签名进程启动失败，1秒后重试，详细错误信息：{e}')
+                await asyncio.sleep(1)
+                continue
+            if idle is self._idle:
+                idle.put_nowait(worker)
+            else:
+                await self._discard(worker)
+            return
+
+    async def _discard(self, worker: JsSignerWorker) -> None:
+        self._workers.discard(worker)
+        await worker.close()
@@ -1,9 +1,16 @@
+import asyncio
 from enum import Enum
 from typing import Optional
 
+from redis import asyncio as aioredis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from module_dvd.dao.config_menu_dao import ConfigMenuDao
+from module_dvd.entity.vo.config_menu_vo import ConfigMenuQueryModel
 from tools.qrcode.DdQRCodeLogin import DdQRCodeLogin
-from tools.qrcode.QRCodeLogin import QRCodeLogin
 from tools.qrcode.QfQRCodeLogin import QfQRCodeLogin
+from tools.qrcode.QRCodeLogin import QRCodeLogin
+from utils.invalidation_util import InvalidationChannel
 
 
 class QRCodeLoginType(str, Enum):
@@ -19,8 +26,20 @@ class QRCodeLoginFactory:
     """
     二维码登录工厂类
     根据平台和产品名称返回对应的登录实例
+
+    登录实例不保存请求状态，每种登录类型只创建一个实例供所有请求共用；
+    配置菜单ID与名称的映射在首次使用时加载，配置菜单变更后通过redis频道通知所有worker进程清空映射。
+    频道未订阅成功或连接断开期间不缓存映射，每次从数据库加载
     """
 
+    _login_instances: dict[QRCodeLoginType, QRCodeLogin] = {}
+    _menu_names: Optional[dict[int, str]] = None
+    _resolved_instances: dict[tuple[str, str], QRCodeLogin] = {}
+    _load_lock: Optional[asyncio.Lock] = None
+    _channel = InvalidationChannel(
+        'qrcode_login_menu_invalidate', '配置菜单', lambda data: QRCodeLoginFactory._clear_menu_names()
+    )
+
     # 平台名称到登录类型的映射
     PLATFORM_LOGIN_MAP = {
         "抖音": QRCodeLoginType.DOUDIAN,
@@ -56,39 +75,127 @@ class QRCodeLoginFactory:
             raise ValueError(f"不支持的平台或产品: 平台={platform_name}, 产品={product_name}")
 
         # 根据登录类型返回对应的实例
-        if login_type == QRCodeLoginType.DOUDIAN:
-            return DdQRCodeLogin()
-        elif login_type == QRCodeLoginType.QIANFAN:
-            return QfQRCodeLogin()
-        else:
-            raise ValueError(f"未实现的登录类型: {login_type}")
+        if login_type not in cls._login_instances:
+            if login_type == QRCodeLoginType.DOUDIAN:
+                cls._login_instances[login_type] = DdQRCodeLogin()
+            elif login_type == QRCodeLoginType.QIANFAN:
+                cls._login_instances[login_type] = QfQRCodeLogin()
+            else:
+                raise ValueError(f"未实现的登录类型: {login_type}")
+        return cls._login_instances[login_type]
 
     @classmethod
     async def get_login_instance_by_ids(
-        cls, platform_id: str, product_id: str, db_session
+        cls, platform_id: str, product_id: str, db_session: AsyncSession
     ) -> QRCodeLogin:
         """
         根据平台ID和产品ID获取对应的登录实例
-        需要从数据库查询平台和产品的名称
+        平台和产品的名称从缓存的配置菜单映射中获取，映射未加载或已失效时从数据库加载
 
         :param platform_id: 平台ID（dvd_config_menu_id）
         :param product_id: 产品ID（dvd_config_menu_id）
         :param db_session: 数据库会话
         :return: QRCodeLogin实例
         """
-        from module_dvd.dao.config_menu_dao import ConfigMenuDao
+        menu_names = cls._menu_names if cls._channel.listening else None
+        if menu_names is None:
+            async with cls._get_load_lock():
+                menu_names = cls._menu_names if cls._channel.listening else None
+                if menu_names is None:
+                    menu_names = await cls.load_menu_names(db_session)
+
+        cache_key = (str(platform_id), str(product_id))
+        resolved_instances = cls._resolved_instances
+        if cache_key not in resolved_instances:
+            # 查询平台名称
+            platform_name = menu_names.get(int(platform_id))
+            if not platform_name:
+                raise ValueError(f"平台ID不存在: {platform_id}")
+
+            # 查询产品名称
+            product_name = menu_names.get(int(product_id))
+            if not product_name:
+                raise ValueError(f"产品ID不存在: {product_id}")
+
+            login_instance = cls.get_login_instance(platform_name=platform_name, product_name=product_name)
+            if menu_names is cls._menu_names:
+                resolved_instances[cache_key] = login_instance
+            return login_instance
+        return resolved_instances[cache_key]
+
+    @classmethod
+    async def load_menu_names(cls, db_session: AsyncSession) -> dict[int, str]:
+        """
+        从数据库加载配置菜单ID与名称的映射，已订阅失效频道且加载期间未发生失效时缓存加载结果
+
+        :param db_session: 数据库会话
+        :return: 配置菜单ID与名称的映射
+        """
+        generation = cls._channel.generation
+        menu_list = await ConfigMenuDao.get_config_menu_list(db_session, ConfigMenuQueryModel())
+        menu_names = {menu.dvd_config_menu_id: menu.dvd_config_menu_name for menu in menu_list}
+        if cls._channel.is_current(generation):
+            cls._menu_names = menu_names
+            cls._resolved_instances = {}
+
+        return menu_names
+
+    @classmethod
+    async def start_listener(cls, redis: aioredis.Redis) -> None:
+        """
+        应用启动时订阅配置菜单失效频道
+
+        :param redis: redis对象
+        :return:
+        """
+        await cls._channel.start(redis)
+
+    @classmethod
+    async def stop_listener(cls) -> None:
+        """
+        应用关闭时取消订阅配置菜单失效频道
+
+        :return:
+        """
+        await cls._channel.stop()
+
+    @classmethod
+    async def publish_invalidate(cls, redis: aioredis.Redis) -> None:
+        """
+        清空本进程的配置菜单映射并通知其他worker进程，配置菜单变更提交后调用
+
+        :param redis: redis对象
+        :return:
+        """
+        await cls._channel.publish(redis, 'invalidate')
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        清空配置菜单映射及登录实例解析结果
+
+        :return:
+        """
+        cls._channel.invalidate()
 
-        # 查询平台名称
-        platform_menu = await ConfigMenuDao.get_config_menu_detail_by_id(db_session, int(platform_id))
-        if not platform_menu:
-            raise ValueError(f"平台ID不存在: {platform_id}")
+    @classmethod
+    def _clear_menu_names(cls) -> None:
+        """
+        清空缓存的配置菜单映射及登录实例解析结果
 
-        # 查询产品名称
-        product_menu = await ConfigMenuDao.get_config_menu_detail_by_id(db_session, int(product_id))
-        if not product_menu:
-            raise ValueError(f"产品ID不存在: {product_id}")
+        :return:
+        """
+        cls._menu_names = None
+        cls._resolved_instances = {}
+
+    @classmethod
+    def _get_load_lock(cls) -> asyncio.Lock:
+        """
+        获取映射加载锁，在事件循环中首次使用时创建
+
+        :return: 映射加载锁
+        """
+        if cls._load_lock is None:
+            cls._load_lock = asyncio.Lock()
 
-        return cls.get_login_instance(
-            platform_name=platform_menu.dvd_config_menu_name,
-            product_name=product_menu.dvd_config_menu_name
-        )
+        return cls._load_lock
@@ -0,0 +1,188 @@
+import gzip
+import zlib
+from typing import Optional
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+class StreamCompressor:
+    """
+    流式压缩器，统一gzip与brotli的增量压缩接口
+    """
+
+    def __init__(self, encoding: str, level: int) -> None:
+        """
+        流式压缩器
+
+        :param encoding: 压缩编码，gzip或br
+        :param level: 压缩级别
+        :return:
+        """
+        self.encoding = encoding
+        if encoding == 'br':
+            self._compressor = brotli.Compressor(quality=level)
+        else:
+            self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        压缩一段数据，返回当前可输出的压缩结果
+
+        :param data: 原始数据
+        :return: 压缩后的数据
+        """
+        if self.encoding == 'br':
+            return self._compressor.process(data)
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        """
+        结束压缩，返回剩余的压缩结果
+
+        :return: 压缩后的数据
+        """
+        if self.encoding == 'br':
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+class CompressUtil:
+    """
+    响应压缩工具类
+
+    按响应大小选择压缩级别：小响应压缩耗时短，使用较高级别换取压缩率；大响应压缩耗时随级别成倍增长而压缩率提升有限，使用较低级别。
+    仅压缩文本类响应，图片、压缩包、xlsx等本身已压缩的内容不再重复压缩；安装brotli时优先使用br编码
+    """
+
+    minimum_size = 1000
+    # (响应大小上限, 压缩级别)，超过所有上限时使用default级别，大小未知的流式响应按超过所有上限处理
+    gzip_levels = ((64 * 1024, 6), (1024 * 1024, 4))
+    gzip_default_level = 1
+    brotli_levels = ((64 * 1024, 5), (1024 * 1024, 4))
+    brotli_default_level = 2
+    compressible_types = (
+        'text/',
+        'application/json',
+        'application/javascript',
+        'application/xml',
+        'application/x-javascript',
+        'image/svg+xml',
+    )
+    excluded_types = ('text/event-stream',)
+
+    @classmethod
+    def select_encoding(cls, accept_encoding: str) -> Optional[str]:
+        """
+        根据Accept-Encoding请求头选择响应压缩编码
+
+        :param accept_encoding: Accept-Encoding请求头
+        :return: 压缩编码，客户端不支持压缩时返回None
+        """
+        accepted = cls._parse_accept_encoding(accept_encoding)
+        if brotli is not None and 'br' in accepted:
+            return 'br'
+        if 'gzip' in accepted or '*' in accepted:
+            return 'gzip'
+
+        return None
+
+    @classmethod
+    def accepts_encoding(cls, accept_encoding: str, encoding: str) -> bool:
+        """
+        判断客户端是否支持指定的压缩编码
+
+        :param accept_encoding: Accept-Encoding请求头
+        :param encoding: 压缩编码
+        :return: 是否支持
+        """
+        accepted = cls._parse_accept_encoding(accept_encoding)
+
+        return encoding in accepted or '*' in accepted
+
+    @classmethod
+    def _parse_accept_encoding(cls, accept_encoding: str) -> set[str]:
+        """
+        解析Accept-Encoding请求头，q=0的编码视为不支持
+
+        :param accept_encoding: Accept-Encoding请求头
+        :return: 客户端支持的编码集合
+        """
+        accepted = set()
+        for item in accept_encoding.lower().split(','):
+            coding, _, params = item.partition(';')
+            quality = params.strip()
+            if quality.startswith('q='):
+                try:
+                    if float(quality[2:]) <= 0:
+                        continue
+                except ValueError:
+                    continue
+            if coding.strip():
+                accepted.add(coding.strip())
+
+        return accepted
+
+    @classmethod
+    def is_compressible(cls, content_type: str) -> bool:
+        """
+        判断响应内容类型是否需要压缩
+
+        :param content_type: Content-Type响应头
+        :return: 是否需要压缩
+        """
+        content_type = content_type.lower()
+        if not content_type or content_type.startswith(cls.excluded_types):
+            return False
+
+        return content_type.startswith(cls.compressible_types)
+
+    @classmethod
+    def get_level(cls, encoding: str, size: Optional[int] = None) -> int:
+        """
+        根据响应大小获取压缩级别
+
+        :param encoding: 压缩编码，gzip或br
+        :param size: 响应大小，为None表示大小未知的流式响应
+        :return: 压缩级别
+        """
+        if encoding == 'br':
+            levels, default_level = cls.brotli_levels, cls.brotli_default_level
+        else:
+            levels, default_level = cls.gzip_levels, cls.gzip_default_level
+        if size is not None:
+            for max_size, level in levels:
+                if size <= max_size:
+                    return level
+
+        return default_level
+
+    @classmethod
+    def compress(cls, data: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+        """
+        压缩完整的响应内容，gzip的mtime固定为0，相同内容的压缩结果一致
+
+        :param data: 原始数据
+        :param encoding: 压缩编码，gzip或br
+        :param level: 压缩级别，为None时根据数据大小选择
+        :return: 压缩后的数据
+        """
+        if level is None:
+            level = cls.get_level(encoding, len(data))
+        if encoding == 'br':
+            return brotli.compress(data, quality=level)
+
+        return gzip.compress(data, compresslevel=level, mtime=0)
+
+    @classmethod
+    def create_compressor(cls, encoding: str, size: Optional[int] = None) -> StreamCompressor:
+        """
+        创建流式压缩器
+
+        :param encoding: 压缩编码，gzip或br
+        :param size: 响应大小，为None表示大小未知
+        :return: 流式压缩器
+        """
+        return StreamCompressor(encoding, cls.get_level(encoding, size))
@@ -0,0 +1,214 @@
+import asyncio
+import hashlib
+import json
+import uuid
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import date
+from typing import Optional, Union
+
+from fastapi import Response
+from redis import asyncio as aioredis
+from redis.client import NEVER_DECODE
+
+from common.constant import HttpStatusConstant
+from common.enums import RedisInitKeyConfig
+from utils.compress_util import CompressUtil
+from utils.etag_util import ETagUtil
+from utils.log_util import logger
+
+
+class DashboardCacheUtil:
+    """
+    数据大屏结果缓存工具类
+
+    缓存键格式为 dashboard_cache:{平台}:{日期}:{店铺}:{接口路径}:{查询参数摘要}，
+    未指定日期的抖店接口以latest作为日期，未指定店铺的请求以all作为店铺；
+    响应内容超过压缩阈值时，同时以 {缓存键}:gzip 缓存按最高级别压缩一次的内容，命中时直接返回给支持gzip的客户端；
+    {缓存键}:etag 缓存根据响应数据计算的ETag，与缓存内容同时写入、同时过期，未经入库接口写入的数据在缓存过期后也会反映到ETag；
+    计算ETag时排除每次响应都会变化的time等字段，缓存过期后重建的数据未变化时ETag保持不变
+    """
+
+    lock_expire_milliseconds = 10000
+    compressed_encoding = 'gzip'
+    compressed_level = 9
+    wait_interval_seconds = 0.05
+    etag_excluded_fields = ('time', 'msg')
+    _local_locks: 'weakref.WeakValueDictionary[str, asyncio.Lock]' = weakref.WeakValueDictionary()
+
+    @classmethod
+    def build_cache_key(
+        cls, platform: str, collect_date: Union[date, str], store: Optional[str], path: str, query_params: dict
+    ) -> str:
+        """
+        构建缓存键
+
+        :param platform: 平台标识，如qf、dd
+        :param collect_date: 数据日期，抖店接口为latest
+        :param store: 店铺筛选条件
+        :param path: 接口路径
+        :param query_params: 查询参数
+        :return: 缓存键
+        """
+        query_digest = hashlib.md5(
+            json.dumps(query_params, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        ).hexdigest()
+
+        return f'{RedisInitKeyConfig.DASHBOARD_CACHE.key}:{platform}:{collect_date}:{store or "all"}:{path}:{query_digest}'
+
+    @classmethod
+    async def get_cache(cls, redis: aioredis.Redis, cache_key: str) -> Optional[str]:
+        """
+        获取缓存的响应内容
+
+        :param redis: redis对象
+        :param cache_key: 缓存键
+        :return: 缓存的响应内容，不存在时返回None
+        """
+        return await redis.get(cache_key)
+
+    @classmethod
+    async def get_etag(cls, redis: aioredis.Redis, cache_key: str) -> Optional[str]:
+        """
+        获取缓存内容对应的ETag
+
+        :param redis: redis对象
+        :param cache_key: 缓存键
+        :return: ETag，缓存不存在时返回None
+        """
+        return await redis.get(f'{cache_key}:etag')
+
+    @classmethod
+    def build_content_etag(cls, content: dict) -> str:
+        """
+        根据响应数据计算ETag，排除响应时间等与数据无关的字段
+
+        :param content: 解析后的响应内容
+        :return: ETag
+        """
+        data = {key: value for key, value in content.items() if key not in cls.etag_excluded_fields}
+
+        return ETagUtil.build_etag(json.dumps(data, sort_keys=True, ensure_ascii=False))
+
+    @classmethod
+    async def get_compressed_cache(cls, redis: aioredis.Redis, cache_key: str) -> Optional[bytes]:
+        """
+        获取缓存的预压缩响应内容
+
+        :param redis: redis对象
+        :param cache_key: 缓存键
+        :return: gzip压缩后的响应内容，不存在时返回None
+        """
+        # redis连接开启了decode_responses，读取二进制内容时需跳过解码
+        return await redis.execute_command('GET', f'{cache_key}:{cls.compressed_encoding}', **{NEVER_DECODE: True})
+
+    @classmethod
+    async def set_cache(cls, redis: aioredis.Redis, cache_key: str, expire: int, response: Response) -> Optional[str]:
+        """
+        缓存成功的响应内容、预压缩内容及ETag，失败或非json响应不缓存
+
+        :param redis: redis对象
+        :param cache_key: 缓存键
+        :param expire: 过期时间（秒）
+        :param response: 响应对象
+        :return: 响应内容的ETag，未缓存时返回None
+        """
+        if response.media_type != 'application/json' or not isinstance(getattr(response, 'body', None), bytes):
+            return None
+        body = response.body.decode('utf-8')
+        content = json.loads(body)
+        if content.get('code') != HttpStatusConstant.SUCCESS:
+            return None
+        etag = cls.build_content_etag(content)
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.set(cache_key, body, ex=expire)
+            pipe.set(f'{cache_key}:etag', etag, ex=expire)
+            if len(response.body) >= CompressUtil.minimum_size:
+                pipe.set(
+                    f'{cache_key}:{cls.compressed_encoding}',
+                    CompressUtil.compress(response.body, cls.compressed_encoding, cls.compressed_level),
+                    ex=expire,
+                )
+            await pipe.execute()
+
+        return etag
+
+    @classmethod
+    @asynccontextmanager
+    async def single_flight(cls, redis: aioredis.Redis, cache_key: str) -> AsyncIterator[bool]:
+        """
+        缓存重建互斥锁，同一进程内通过asyncio锁排队，不同进程间通过redis锁选出唯一的重建者
+
+        :param redis: redis对象
+        :param cache_key: 缓存键
+        :return: 当前调用方是否为重建者
+        """
+        local_lock = cls._local_locks.get(cache_key)
+        if local_lock is None:
+            local_lock = asyncio.Lock()
+            cls._local_locks[cache_key] = local_lock
+        async with local_lock:
+            lock_key = f'{cache_key}:lock'
+            lock_token = uuid.uuid4().hex
+            acquired = await redis.set(lock_key, lock_token, nx=True, px=cls.lock_expire_milliseconds)
+            try:
+                yield bool(acquired)
+            finally:
+                if acquired and await redis.get(lock_key) == lock_token:
+                    await redis.delete(lock_key)
+
+    @classmethod
+    async def wait_for_cache(cls, redis: aioredis.Redis, cache_key: str) -> Optional[str]:
+        """
+        等待其他进程完成缓存重建
+
+        :param redis: redis对象
+        :param cache_key: 缓存键
+        :return: 重建后的缓存内容，重建者失败或超时时返回None
+        """
+        lock_key = f'{cache_key}:lock'
+        for _ in range(int(cls.lock_expire_milliseconds / 1000 / cls.wait_interval_seconds)):
+            await asyncio.sleep(cls.wait_interval_seconds)
+            cached = await redis.get(cache_key)
+            if cached is not None:
+                return cached
+            if not await redis.exists(lock_key):
+                break
+
+        return await redis.get(cache_key)
+
+    @classmethod
+    async def invalidate(
+        cls,
+        redis: aioredis.Redis,
+        platform: Optional[str] = None,
+        collect_date: Optional[Union[date, str]] = None,
+        store: Optional[str] = None,
+    ) -> int:
+        """
+        数据入库后清除对应的大屏缓存
+
+        :param redis: redis对象
+        :param platform: 平台标识，为空时清除所有平台
+        :param collect_date: 数据日期，为空时清除所有日期
+        :param store: 店铺名称或店铺ID，为空时清除所有店铺
+        :return: 清除的缓存键数量
+        """
+        cache_name = RedisInitKeyConfig.DASHBOARD_CACHE.key
+        date_parts = [str(collect_date), 'latest'] if collect_date else ['*']
+        store_parts = [store, 'all'] if store else ['*']
+        patterns = [
+            f'{cache_name}:{platform or "*"}:{date_part}:{store_part}:*'
+            for date_part in date_parts
+            for store_part in store_parts
+        ]
+
+        deleted_count = 0
+        for pattern in patterns:
+            cache_keys = [cache_key async for cache_key in redis.scan_iter(match=pattern, count=500)]
+            if cache_keys:
+                deleted_count += await redis.delete(*cache_keys)
+        logger.info(f'清除数据大屏缓存{deleted_count}条，平台：{platform or "全部"}，日期：{collect_date or "全部"}')
+
+        return deleted_count
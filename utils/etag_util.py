@@ -0,0 +1,157 @@
+import hashlib
+import uuid
+from collections.abc import Iterable
+from typing import Optional
+
+from fastapi import Request, Response, status
+from redis import asyncio as aioredis
+
+from common.enums import RedisInitKeyConfig
+
+
+class ETagUtil:
+    """
+    响应版本工具类
+
+    后台写入时递增对应的数据版本，接口根据数据版本、请求路径及查询参数计算强ETag，
+    请求携带的If-None-Match与之匹配时直接返回304，无需查询数据库及序列化响应；
+    数据版本以hash存储随机纪元及计数，版本键被清除、淘汰或redis清空后纪元随之变化，计数从0重新开始也不会与旧ETag相同
+    """
+
+    cache_control = 'no-cache'
+    epoch_field = 'epoch'
+    counter_field = 'counter'
+
+    @classmethod
+    def get_version_key(cls, name: str) -> str:
+        """
+        获取数据版本缓存键
+
+        :param name: 数据版本名称
+        :return: 数据版本缓存键
+        """
+        return f'{RedisInitKeyConfig.DATA_VERSION.key}:{name}'
+
+    @classmethod
+    async def get_versions(cls, redis: aioredis.Redis, names: Iterable[str]) -> list[str]:
+        """
+        在同一个管道中获取多个数据版本，版本不存在时初始化随机纪元
+
+        :param redis: redis对象
+        :param names: 数据版本名称列表
+        :return: 与名称一一对应的数据版本，格式为 纪元:计数
+        """
+        keys = [cls.get_version_key(name) for name in names]
+        if not keys:
+            return []
+        async with redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.hmget(key, [cls.epoch_field, cls.counter_field])
+            values = await pipe.execute()
+        missing_indexes = [index for index, (epoch, _counter) in enumerate(values) if epoch is None]
+        if missing_indexes:
+            # 多个进程同时初始化时只有第一个写入的纪元生效，写入后重新读取
+            async with redis.pipeline(transaction=False) as pipe:
+                for index in missing_indexes:
+                    pipe.hsetnx(keys[index], cls.epoch_field, uuid.uuid4().hex)
+                    pipe.hmget(keys[index], [cls.epoch_field, cls.counter_field])
+                results = await pipe.execute()
+            for index, value in zip(missing_indexes, results[1::2]):
+                values[index] = value
+
+        return [f'{epoch}:{counter or 0}' for epoch, counter in values]
+
+    @classmethod
+    async def bump_versions(cls, redis: aioredis.Redis, names: Iterable[str]) -> None:
+        """
+        递增数据版本，使依赖该数据的ETag失效
+
+        :param redis: redis对象
+        :param names: 数据版本名称列表
+        :return:
+        """
+        async with redis.pipeline(transaction=False) as pipe:
+            for name in names:
+                pipe.hincrby(cls.get_version_key(name), cls.counter_field, 1)
+            await pipe.execute()
+
+    @classmethod
+    def build_etag(cls, *parts: Optional[str]) -> str:
+        """
+        根据数据版本及请求信息计算强ETag
+
+        :param parts: 参与计算的数据版本、请求路径、查询参数或响应内容等
+        :return: ETag
+        """
+        digest = hashlib.md5('\x1f'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+
+        return f'"{digest}"'
+
+    @classmethod
+    def weaken(cls, etag: str) -> str:
+        """
+        将强ETag转换为弱ETag，用于同一内容的不同编码表示（如预压缩内容）
+
+        :param etag: 强ETag
+        :return: 弱ETag
+        """
+        return etag if etag.startswith('W/') else f'W/{etag}'
+
+    @classmethod
+    def build_request_etag(cls, request: Request, *parts: Optional[str]) -> str:
+        """
+        根据数据版本、请求路径及排序后的查询参数计算强ETag
+
+        :param request: Request对象
+        :param parts: 参与计算的数据版本等
+        :return: ETag
+        """
+        query = '&'.join(f'{key}={value}' for key, value in sorted(request.query_params.multi_items()))
+
+        return cls.build_etag(request.url.path, query, *parts)
+
+    @classmethod
+    def is_not_modified(cls, request: Request, etag: str) -> bool:
+        """
+        判断请求携带的If-None-Match是否与当前ETag匹配，按RFC 9110使用弱比较
+
+        :param request: Request对象
+        :param etag: 当前ETag
+        :return: 是否未修改
+        """
+        if_none_match = request.headers.get('if-none-match')
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == '*':
+            return True
+
+        opaque_tag = etag.removeprefix('W/')
+
+        return any(tag.strip().removeprefix('W/') == opaque_tag for tag in if_none_match.split(','))
+
+    @classmethod
+    def not_modified_response(cls, etag: str) -> Response:
+        """
+        生成304响应
+
+        :param etag: 当前ETag
+        :return: 304响应
+        """
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag, 'Cache-Control': cls.cache_control}
+        )
+
+    @classmethod
+    def set_etag(cls, response: Response, etag: str) -> Response:
+        """
+        为成功的响应设置ETag
+
+        :param response: 响应对象
+        :param etag: 当前ETag
+        :return: 响应对象
+        """
+        if response.status_code == status.HTTP_200_OK:
+            response.headers['ETag'] = etag
+            response.headers['Cache-Control'] = cls.cache_control
+
+        return response
@@ -0,0 +1,151 @@
+import asyncio
+import sys
+from collections.abc import Awaitable
+from datetime import date
+from typing import Any, Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.database import AsyncSessionLocal, async_engine
+from config.env import DataBaseConfig
+from module_dvd.dao.dd_dao import DdOverviewDao
+from module_dvd.dao.qf_dao import QfOverviewDao
+from module_dvd.entity.do.dd_do import DdRealBusinessOverview, DdRealHourlyTrend
+from utils.log_util import logger
+
+
+class ExplainUtil:
+    """
+    SQL执行计划检查工具类
+
+    通过拦截DAO方法实际执行的SQL并执行EXPLAIN，检查查询是否退化为全表扫描，
+    仅支持mysql，数据量过小的表优化器可能主动选择全表扫描，因此低于min_rows的扫描不视为问题
+    """
+
+    full_scan_types = {'ALL'}
+    min_rows = 1000
+
+    @classmethod
+    async def capture_statements(cls, query_func: Callable[[AsyncSession], Awaitable[Any]]) -> list[tuple[str, Any]]:
+        """
+        执行查询函数并捕获其发出的SELECT语句
+
+        :param query_func: 接收orm对象的查询函数
+        :return: SQL语句及参数列表
+        """
+        statements: list[tuple[str, Any]] = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001
+            if statement.lstrip().upper().startswith('SELECT'):
+                statements.append((statement, parameters))
+
+        event.listen(async_engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            async with AsyncSessionLocal() as session:
+                await query_func(session)
+        finally:
+            event.remove(async_engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+
+        return statements
+
+    @classmethod
+    async def explain_statement(cls, statement: str, parameters: Any) -> list[dict[str, Any]]:
+        """
+        获取SQL语句的执行计划
+
+        :param statement: SQL语句
+        :param parameters: SQL参数
+        :return: 执行计划行列表
+        """
+        async with async_engine.connect() as conn:
+            result = await conn.exec_driver_sql(f'EXPLAIN {statement}', parameters)
+            return [dict(row._mapping) for row in result]
+
+    @classmethod
+    async def find_full_scans(cls, query_func: Callable[[AsyncSession], Awaitable[Any]]) -> list[str]:
+        """
+        检查查询函数发出的SQL中是否存在全表扫描
+
+        :param query_func: 接收orm对象的查询函数
+        :return: 全表扫描描述列表，为空表示没有全表扫描
+        """
+        full_scans = []
+        for statement, parameters in await cls.capture_statements(query_func):
+            full_scans.extend(
+                f'表{plan_row.get("table")}全表扫描约{plan_row.get("rows")}行，'
+                f'可用索引：{plan_row.get("possible_keys")}，SQL：{" ".join(statement.split())}'
+                for plan_row in await cls.explain_statement(statement, parameters)
+                if plan_row.get('type') in cls.full_scan_types and (plan_row.get('rows') or 0) >= cls.min_rows
+            )
+
+        return full_scans
+
+
+def get_dashboard_query_funcs() -> dict[str, Callable[[AsyncSession], Awaitable[Any]]]:
+    """
+    获取需要检查执行计划的数据大屏查询
+
+    :return: 查询名称与查询函数的映射
+    """
+    today = date.today()
+
+    async def dd_query(session: AsyncSession, query: Callable, table_name: str, *args) -> Any:
+        query_date = await DdOverviewDao.get_latest_collect_date(session, table_name)
+        return await query(session, query_date, *args)
+
+    return {
+        'qf.get_store_list': QfOverviewDao.get_store_list,
+        'qf.get_realtime_metrics': lambda session: QfOverviewDao.get_realtime_metrics(session, today),
+        'qf.get_realtime_trend': lambda session: QfOverviewDao.get_realtime_trend(session, today),
+        'qf.get_top_stores': lambda session: QfOverviewDao.get_top_stores(session, today),
+        'qf.get_realtime_orders': lambda session: QfOverviewDao.get_realtime_orders(session, today),
+        'qf.get_dashboard_metrics': lambda session: QfOverviewDao.get_dashboard_metrics(session, today),
+        'qf.get_store_sales_rank': lambda session: QfOverviewDao.get_store_sales_rank(session, today),
+        'qf.get_channel_sales_data': lambda session: QfOverviewDao.get_channel_sales_data(session, today),
+        'qf.get_recent_orders': QfOverviewDao.get_recent_orders,
+        'qf.get_trend_data': QfOverviewDao.get_trend_data,
+        'qf.get_sku_sales_data': lambda session: QfOverviewDao.get_sku_sales_data(session, today),
+        'dd.get_store_list': DdOverviewDao.get_store_list,
+        'dd.get_store_top5': lambda session: dd_query(
+            session, DdOverviewDao.get_store_top5, DdRealBusinessOverview.__tablename__
+        ),
+        'dd.get_overview_metrics': lambda session: dd_query(
+            session, DdOverviewDao.get_overview_metrics, DdRealBusinessOverview.__tablename__
+        ),
+        'dd.get_hourly_trend': lambda session: dd_query(
+            session, DdOverviewDao.get_hourly_trend, DdRealHourlyTrend.__tablename__, None, '用户支付金额'
+        ),
+        'dd.get_available_indices': lambda session: dd_query(
+            session, DdOverviewDao.get_available_indices, DdRealHourlyTrend.__tablename__
+        ),
+    }
+
+
+async def check_dashboard_queries() -> bool:
+    """
+    检查所有数据大屏查询的执行计划
+
+    :return: 是否全部通过
+    """
+    if DataBaseConfig.db_type != 'mysql':
+        logger.warning('执行计划检查仅支持mysql，已跳过')
+        return True
+
+    passed = True
+    for query_name, query_func in get_dashboard_query_funcs().items():
+        full_scans = await ExplainUtil.find_full_scans(query_func)
+        if full_scans:
+            passed = False
+            for full_scan in full_scans:
+                logger.error(f'❌️ {query_name}：{full_scan}')
+        else:
+            logger.info(f'✅️ {query_name}：未发现全表扫描')
+    await async_engine.dispose()
+
+    return passed
+
+
+if __name__ == '__main__':
+    # 用法：python -m utils.explain_util --env=prod，存在全表扫描时以非0状态码退出
+    sys.exit(0 if asyncio.run(check_dashboard_queries()) else 1)
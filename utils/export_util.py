@@ -0,0 +1,163 @@
+import asyncio
+import csv
+import io
+import tempfile
+from collections.abc import AsyncIterator, Callable
+from datetime import datetime
+from typing import Any, Literal, Optional
+from urllib.parse import quote
+
+from fastapi import Response
+from openpyxl import Workbook
+from sqlalchemy import Select
+
+from config.database import AsyncSessionLocal
+from utils.common_util import CamelCaseUtil
+from utils.response_util import ResponseUtil
+
+ExportFileType = Literal['xlsx', 'csv']
+RowFormatter = Callable[[Any], dict[str, Any]]
+
+
+class ExportUtil:
+    """
+    流式导出工具类
+
+    使用服务端游标按批读取查询结果，逐行写入csv或只写模式的xlsx，内存占用与导出行数无关；
+    csv边查询边返回，xlsx逐行写入临时文件，写完后分块返回
+    """
+
+    yield_per = 1000
+    chunk_size = 64 * 1024
+    media_types: dict[str, str] = {
+        'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        'csv': 'text/csv; charset=utf-8',
+    }
+
+    @classmethod
+    def iter_export(
+        cls,
+        query: Select,
+        mapping_dict: dict[str, str],
+        file_type: ExportFileType = 'xlsx',
+        row_formatter: Optional[RowFormatter] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        将查询结果转换为导出文件内容
+
+        :param query: sqlalchemy查询语句
+        :param mapping_dict: 映射字典，键为导出字段名，值为表头名称，导出列顺序与映射字典一致
+        :param file_type: 导出文件类型
+        :param row_formatter: 可选，导出前对每行数据进行转换的方法，入参为小驼峰形式的行数据
+        :return: 导出文件内容分块
+        """
+        rows = cls.iter_query_rows(query)
+        if file_type == 'csv':
+            return cls.iter_csv(rows, mapping_dict, row_formatter)
+
+        return cls.iter_xlsx(rows, mapping_dict, row_formatter)
+
+    @classmethod
+    def streaming_response(
+        cls, content: AsyncIterator[bytes], file_name: str, file_type: ExportFileType = 'xlsx'
+    ) -> Response:
+        """
+        以文件流的形式返回导出文件
+
+        :param content: 导出文件内容分块
+        :param file_name: 不含扩展名的文件名
+        :param file_type: 导出文件类型
+        :return: 流式响应结果
+        """
+        full_name = f'{file_name}_{datetime.now().strftime("%Y%m%d%H%M%S")}.{file_type}'
+
+        return ResponseUtil.streaming(
+            data=content,
+            headers={'Content-Disposition': f"attachment; filename*=UTF-8''{quote(full_name)}"},
+            media_type=cls.media_types[file_type],
+        )
+
+    @classmethod
+    async def iter_query_rows(cls, query: Select) -> AsyncIterator[Any]:
+        """
+        使用独立会话及服务端游标按批读取查询结果，响应开始发送后请求会话可能已关闭
+
+        :param query: sqlalchemy查询语句
+        :return: 小驼峰形式的行数据，查询多个实体时为各实体数据组成的列表
+        """
+        async with AsyncSessionLocal() as session:
+            result = await session.stream(query.execution_options(yield_per=cls.yield_per))
+            async for row in result:
+                yield CamelCaseUtil.transform_result(row[0] if len(row) == 1 else row)
+
+    @classmethod
+    async def iter_csv(
+        cls, rows: AsyncIterator[Any], mapping_dict: dict[str, str], row_formatter: Optional[RowFormatter] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        逐行生成csv文件内容
+
+        :param rows: 行数据
+        :param mapping_dict: 映射字典
+        :param row_formatter: 可选，行数据转换方法
+        :return: csv文件内容分块
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        # 写入BOM，便于excel直接打开时识别utf-8编码
+        buffer.write('\ufeff')
+        writer.writerow(mapping_dict.values())
+        async for row in rows:
+            writer.writerow(cls._format_row(row, mapping_dict, row_formatter))
+            if buffer.tell() >= cls.chunk_size:
+                yield buffer.getvalue().encode('utf-8')
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue().encode('utf-8')
+
+    @classmethod
+    async def iter_xlsx(
+        cls, rows: AsyncIterator[Any], mapping_dict: dict[str, str], row_formatter: Optional[RowFormatter] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        逐行写入只写模式的xlsx文件后分块返回文件内容
+
+        :param rows: 行数据
+        :param mapping_dict: 映射字典
+        :param row_formatter: 可选，行数据转换方法
+        :return: xlsx文件内容分块
+        """
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet()
+        worksheet.append(list(mapping_dict.values()))
+        async for row in rows:
+            worksheet.append(cls._format_row(row, mapping_dict, row_formatter))
+        with tempfile.TemporaryFile() as file:
+            await asyncio.to_thread(workbook.save, file)
+            file.seek(0)
+            while chunk := file.read(cls.chunk_size):
+                yield chunk
+
+    @classmethod
+    def _format_row(
+        cls, row: Any, mapping_dict: dict[str, str], row_formatter: Optional[RowFormatter] = None
+    ) -> list[Any]:
+        """
+        按映射字典的字段顺序取出行数据
+
+        :param row: 行数据
+        :param mapping_dict: 映射字典
+        :param row_formatter: 可选，行数据转换方法
+        :return: 单元格数据列表
+        """
+        if row_formatter:
+            row = row_formatter(row)
+
+        return [cls._format_value(row.get(key)) for key in mapping_dict]
+
+    @classmethod
+    def _format_value(cls, value: Any) -> Any:
+        if value is None or isinstance(value, (str, int, float, datetime)):
+            return value
+
+        return str(value)
@@ -0,0 +1,59 @@
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from utils.log_util import logger
+
+
+class ImportProfiler:
+    """
+    启动阶段模块导入耗时统计
+
+    统计逐个导入的模块耗时（包含其首次导入的依赖模块）及新加载的模块数量，按耗时降序输出；
+    更细粒度的逐模块自身耗时可使用 python -X importtime app.py 查看
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        """
+        启动阶段模块导入耗时统计
+
+        :param enabled: 是否开启统计，未开启时measure不做任何处理
+        :return:
+        """
+        self.enabled = enabled
+        self.records: list[tuple[str, float, int]] = []
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """
+        统计代码块的耗时及期间新加载的模块数量
+
+        :param name: 统计项名称，通常为模块路径
+        :return:
+        """
+        if not self.enabled:
+            yield
+            return
+        module_count = len(sys.modules)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.records.append((name, time.perf_counter() - start, len(sys.modules) - module_count))
+
+    def report(self, title: str) -> None:
+        """
+        按耗时降序输出统计结果
+
+        :param title: 统计标题
+        :return:
+        """
+        if not self.enabled or not self.records:
+            return
+        total_seconds = sum(seconds for _name, seconds, _count in self.records)
+        total_count = sum(count for _name, _seconds, count in self.records)
+        lines = [f'{title}耗时{total_seconds * 1000:.1f}ms，新加载模块{total_count}个：']
+        for name, seconds, count in sorted(self.records, key=lambda record: record[1], reverse=True):
+            lines.append(f'  {seconds * 1000:9.1f}ms  {count:5d}个模块  {name}')
+        logger.info('\n'.join(lines))
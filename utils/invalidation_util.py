@@ -0,0 +1,118 @@
+import asyncio
+from collections.abc import Callable
+from typing import Optional
+
+from redis import asyncio as aioredis
+
+from utils.log_util import logger
+
+
+class InvalidationChannel:
+    """
+    进程内缓存失效频道
+
+    每个worker进程订阅一次redis频道，收到失效通知时回调清除本进程的内存缓存；
+    频道未订阅成功或连接断开期间listening为False，调用方不使用内存缓存，订阅状态变化时清除全部内存缓存
+    """
+
+    reconnect_seconds = 1
+
+    def __init__(self, channel: str, name: str, on_invalidate: Callable[[Optional[str]], None]) -> None:
+        """
+        进程内缓存失效频道
+
+        :param channel: redis频道名称
+        :param name: 缓存名称，用于日志
+        :param on_invalidate: 清除内存缓存的回调，参数为失效通知内容，为None表示清除全部
+        :return:
+        """
+        self.channel = channel
+        self.name = name
+        self.listening = False
+        # 每次失效时递增，读取数据期间发生失效时不写入内存缓存，避免写入失效前读到的旧值
+        self.generation = 0
+        self._on_invalidate = on_invalidate
+        self._listener_task: Optional[asyncio.Task] = None
+
+    def is_current(self, generation: int) -> bool:
+        """
+        判断读取数据期间是否未发生失效，可以写入内存缓存
+
+        :param generation: 读取数据前的失效代数
+        :return: 是否可以写入内存缓存
+        """
+        return self.listening and generation == self.generation
+
+    def invalidate(self, data: Optional[str] = None) -> None:
+        """
+        清除本进程的内存缓存
+
+        :param data: 失效通知内容，为None表示清除全部
+        :return:
+        """
+        self.generation += 1
+        self._on_invalidate(data)
+
+    async def publish(self, redis: aioredis.Redis, data: str) -> None:
+        """
+        清除本进程的内存缓存并通知其他worker进程，需在数据写入完成后调用
+
+        :param redis: redis对象
+        :param data: 失效通知内容
+        :return:
+        """
+        self.invalidate(data)
+        await redis.publish(self.channel, data)
+
+    async def start(self, redis: aioredis.Redis) -> None:
+        """
+        应用启动时订阅失效频道
+
+        :param redis: redis对象
+        :return:
+        """
+        self._listener_task = asyncio.create_task(self._listen(redis))
+
+    async def stop(self) -> None:
+        """
+        应用关闭时取消订阅失效频道
+
+        :return:
+        """
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+        self._set_listening(False)
+
+    def _set_listening(self, listening: bool) -> None:
+        self.listening = listening
+        self.invalidate()
+
+    async def _listen(self, redis: aioredis.Redis) -> None:
+        """
+        监听失效频道，连接断开后自动重连
+
+        :param redis: redis对象
+        :return:
+        """
+        while True:
+            pubsub = redis.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                self._set_listening(True)
+                logger.info(f'✅️ {self.name}失效频道订阅成功')
+                async for message in pubsub.listen():
+                    if message['type'] == 'message':
+                        self.invalidate(message['data'])
+            except asyncio.CancelledError:
+                await pubsub.aclose()
+                raise
+            except Exception as e:
+                self._set_listening(False)
+                logger.error(f'{self.name}失效频道监听异常，{self.reconnect_seconds}秒后重连，详细错误信息：{e}')
+                await pubsub.aclose()
+                await asyncio.sleep(self.reconnect_seconds)
@@ -0,0 +1,256 @@
+import asyncio
+import bisect
+import csv
+import ipaddress
+from collections import OrderedDict
+from typing import Optional, Protocol
+
+import httpx
+from redis import asyncio as aioredis
+from starlette.status import HTTP_200_OK
+
+from common.enums import RedisInitKeyConfig
+from config.env import AppConfig
+from utils.log_util import logger
+
+
+class IpLocationDatabase(Protocol):
+    """
+    离线IP库协议，实现lookup方法即可作为离线IP库使用
+    """
+
+    def lookup(self, ip: str) -> Optional[str]: ...
+
+
+class IpRangeDatabase:
+    """
+    基于IP段的离线IP库
+
+    数据文件为csv格式，每行为：起始IP,结束IP,归属区域，IP可为点分十进制或整数形式，
+    加载后按起始IP排序，查询时二分查找所在IP段
+    """
+
+    column_count = 3
+
+    def __init__(self, ranges: list[tuple[int, int, str]]) -> None:
+        self._ranges = sorted(ranges)
+        self._starts = [item[0] for item in self._ranges]
+
+    @classmethod
+    def load(cls, file_path: str) -> 'IpRangeDatabase':
+        """
+        从csv文件加载离线IP库
+
+        :param file_path: 数据文件路径
+        :return: 离线IP库对象
+        """
+        ranges = []
+        with open(file_path, encoding='utf-8') as f:
+            for row in csv.reader(f):
+                if len(row) < cls.column_count or row[0].startswith('#'):
+                    continue
+                ranges.append((cls._to_int(row[0]), cls._to_int(row[1]), row[2].strip()))
+
+        return cls(ranges)
+
+    def lookup(self, ip: str) -> Optional[str]:
+        """
+        查询IP归属区域
+
+        :param ip: IPv4地址
+        :return: 归属区域，不在任何IP段内时返回None
+        """
+        try:
+            ip_int = self._to_int(ip)
+        except ValueError:
+            return None
+        index = bisect.bisect_right(self._starts, ip_int) - 1
+        if index >= 0 and ip_int <= self._ranges[index][1]:
+            return self._ranges[index][2]
+
+        return None
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    @staticmethod
+    def _to_int(ip: str) -> int:
+        ip = ip.strip()
+        return int(ip) if ip.isdigit() else int(ipaddress.IPv4Address(ip))
+
+
+class IpLocationUtil:
+    """
+    IP归属区域查询工具类
+
+    依次查询进程内LRU缓存、离线IP库、redis共享缓存，均未命中时调用在线接口，
+    同一进程内同一IP的并发查询只发起一次在线请求
+    """
+
+    api_url = 'https://qifu-api.baidubce.com/ip/geo/v1/district'
+    local_max_size = 4096
+    expire_seconds = 7 * 24 * 3600
+    unknown_expire_seconds = 600
+    _client: Optional[httpx.AsyncClient] = None
+    _database: Optional[IpLocationDatabase] = None
+    _local_cache: 'OrderedDict[str, str]' = OrderedDict()
+    _pending: dict[str, asyncio.Future] = {}
+
+    @classmethod
+    def init_ip_location(cls) -> None:
+        """
+        应用启动时创建在线接口连接池并加载离线IP库
+
+        :return:
+        """
+        cls._get_client()
+        if AppConfig.app_ip_location_db:
+            try:
+                database = IpRangeDatabase.load(AppConfig.app_ip_location_db)
+                cls.set_database(database)
+                logger.info(f'✅️ 离线IP库加载成功，共{len(database)}个IP段')
+            except (OSError, ValueError) as e:
+                logger.error(f'离线IP库加载失败，将使用在线接口查询，详细错误信息：{e}')
+
+    @classmethod
+    async def close_ip_location(cls) -> None:
+        """
+        应用关闭时关闭在线接口连接池
+
+        :return:
+        """
+        if cls._client:
+            await cls._client.aclose()
+            cls._client = None
+
+    @classmethod
+    def set_database(cls, database: Optional[IpLocationDatabase]) -> None:
+        """
+        设置离线IP库
+
+        :param database: 离线IP库对象，为None时仅使用在线接口
+        :return:
+        """
+        cls._database = database
+        cls._local_cache.clear()
+
+    @classmethod
+    async def get_ip_location(cls, redis: aioredis.Redis, oper_ip: Optional[str]) -> str:
+        """
+        查询ip归属区域
+
+        :param redis: redis对象
+        :param oper_ip: 需要查询的ip，为X-Forwarded-For时取第一个ip
+        :return: ip归属区域
+        """
+        ip = (oper_ip or '').split(',')[0].strip()
+        if ip in ('127.0.0.1', 'localhost'):
+            return '内网IP'
+        try:
+            if ipaddress.ip_address(ip).is_private:
+                return '内网IP'
+        except ValueError:
+            return '未知'
+
+        if ip in cls._local_cache:
+            cls._local_cache.move_to_end(ip)
+            return cls._local_cache[ip]
+        if cls._database:
+            location = cls._database.lookup(ip)
+            if location:
+                cls._set_local_cache(ip, location)
+                return location
+
+        pending = cls._pending.get(ip)
+        if pending:
+            return await asyncio.shield(pending)
+        future = asyncio.get_running_loop().create_future()
+        cls._pending[ip] = future
+        try:
+            location = await cls._get_shared_location(redis, ip)
+            future.set_result(location)
+        except Exception as e:
+            logger.warning(f'查询IP{ip}归属区域失败，详细错误信息：{e}')
+            location = '未知'
+            future.set_result(location)
+        finally:
+            # 查询被取消时同样结束等待中的请求，避免其永久挂起
+            if not future.done():
+                future.set_result('未知')
+            cls._pending.pop(ip, None)
+
+        return location
+
+    @classmethod
+    async def _get_shared_location(cls, redis: aioredis.Redis, ip: str) -> str:
+        """
+        从redis共享缓存或在线接口查询ip归属区域
+
+        :param redis: redis对象
+        :param ip: 需要查询的ip
+        :return: ip归属区域
+        """
+        cache_key = f'{RedisInitKeyConfig.IP_LOCATION.key}:{ip}'
+        location = await redis.get(cache_key)
+        if location:
+            # 查询失败的结果只在redis中短暂缓存，不写入无过期时间的进程内缓存
+            if location != '未知':
+                cls._set_local_cache(ip, location)
+            return location
+
+        location = await cls._query_api(ip)
+        # 查询失败的结果只短暂缓存，避免接口异常期间反复请求，恢复后也能尽快重新查询
+        await redis.set(
+            cache_key, location, ex=cls.unknown_expire_seconds if location == '未知' else cls.expire_seconds
+        )
+        if location != '未知':
+            cls._set_local_cache(ip, location)
+
+        return location
+
+    @classmethod
+    async def _query_api(cls, ip: str) -> str:
+        """
+        调用在线接口查询ip归属区域
+
+        :param ip: 需要查询的ip
+        :return: ip归属区域
+        """
+        ip_result = await cls._get_client().get(cls.api_url, params={'ip': ip})
+        if ip_result.status_code == HTTP_200_OK:
+            data = ip_result.json().get('data') or {}
+            prov = data.get('prov')
+            city = data.get('city')
+            if prov or city:
+                return f'{prov}-{city}'
+
+        return '未知'
+
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        """
+        获取在线接口连接池，未创建时创建
+
+        :return: httpx客户端对象
+        """
+        if cls._client is None:
+            cls._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(3.0, connect=1.0),
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+
+        return cls._client
+
+    @classmethod
+    def _set_local_cache(cls, ip: str, location: str) -> None:
+        """
+        写入进程内LRU缓存
+
+        :param ip: ip
+        :param location: ip归属区域
+        :return:
+        """
+        cls._local_cache[ip] = location
+        cls._local_cache.move_to_end(ip)
+        while len(cls._local_cache) > cls.local_max_size:
+            cls._local_cache.popitem(last=False)
@@ -0,0 +1,133 @@
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Optional, TypeVar
+
+from pydantic import BaseModel
+from redis import asyncio as aioredis
+
+from common.enums import RedisInitKeyConfig
+
+PrincipalT = TypeVar('PrincipalT', bound=BaseModel)
+
+
+class PrincipalCacheUtil:
+    """
+    登录用户信息缓存工具类
+
+    缓存按用户id存储序列化后的登录用户信息，并记录写入时的缓存版本，版本由全局版本和用户版本组成：
+    角色、菜单、部门、岗位、卡密等影响多个用户的数据变更时递增全局版本，仅影响单个用户的数据变更时递增该用户的版本，
+    读取时版本不一致即视为失效。redis缓存前设有进程内LRU缓存，命中时只需读取版本号
+    """
+
+    expire_seconds = 1800
+    local_max_size = 1024
+    _local_cache: 'OrderedDict[int, tuple[str, BaseModel]]' = OrderedDict()
+
+    @classmethod
+    def get_global_version_key(cls) -> str:
+        """
+        获取全局版本缓存键
+
+        :return: 全局版本缓存键
+        """
+        return f'{RedisInitKeyConfig.PRINCIPAL_VERSION.key}:global'
+
+    @classmethod
+    def get_user_version_key(cls, user_id: int) -> str:
+        """
+        获取用户版本缓存键
+
+        :param user_id: 用户id
+        :return: 用户版本缓存键
+        """
+        return f'{RedisInitKeyConfig.PRINCIPAL_VERSION.key}:{user_id}'
+
+    @classmethod
+    async def get_principal(
+        cls, redis: aioredis.Redis, user_id: int, model_type: type[PrincipalT], extra_keys: Iterable[str] = ()
+    ) -> tuple[Optional[PrincipalT], str, list[Optional[str]]]:
+        """
+        获取缓存的登录用户信息，版本号与调用方需要的其他缓存值在同一次MGET中读取
+
+        :param redis: redis对象
+        :param user_id: 用户id
+        :param model_type: 登录用户信息模型
+        :param extra_keys: 需要一并读取的其他缓存键
+        :return: 登录用户信息（未命中时为None）、当前缓存版本、其他缓存值列表
+        """
+        values = await redis.mget(cls.get_global_version_key(), cls.get_user_version_key(user_id), *extra_keys)
+        version = f'{values[0] or 0}:{values[1] or 0}'
+        extra_values = values[2:]
+
+        local_cached = cls._local_cache.get(user_id)
+        if local_cached and local_cached[0] == version:
+            cls._local_cache.move_to_end(user_id)
+            return local_cached[1], version, extra_values
+
+        cached = await redis.get(f'{RedisInitKeyConfig.PRINCIPAL_CACHE.key}:{user_id}')
+        if cached:
+            cached_version, _, principal_json = cached.partition('|')
+            if cached_version == version:
+                principal = model_type.model_validate_json(principal_json)
+                cls._set_local_cache(user_id, version, principal)
+                return principal, version, extra_values
+
+        return None, version, extra_values
+
+    @classmethod
+    async def set_principal(cls, redis: aioredis.Redis, user_id: int, version: str, principal: BaseModel) -> None:
+        """
+        缓存登录用户信息，版本号需为读取缓存时获取的版本，期间发生的版本变更会使本次写入的缓存自然失效
+
+        :param redis: redis对象
+        :param user_id: 用户id
+        :param version: 缓存版本
+        :param principal: 登录用户信息
+        :return:
+        """
+        await redis.set(
+            f'{RedisInitKeyConfig.PRINCIPAL_CACHE.key}:{user_id}',
+            f'{version}|{principal.model_dump_json(by_alias=True)}',
+            ex=cls.expire_seconds,
+        )
+        cls._set_local_cache(user_id, version, principal)
+
+    @classmethod
+    async def bump_user_versions(cls, redis: aioredis.Redis, user_ids: Iterable[int]) -> None:
+        """
+        递增用户版本，使指定用户的缓存失效
+
+        :param redis: redis对象
+        :param user_ids: 用户id列表
+        :return:
+        """
+        async with redis.pipeline(transaction=False) as pipe:
+            for user_id in user_ids:
+                if user_id:
+                    pipe.incr(cls.get_user_version_key(int(user_id)))
+            await pipe.execute()
+
+    @classmethod
+    async def bump_global_version(cls, redis: aioredis.Redis) -> None:
+        """
+        递增全局版本，使所有用户的缓存失效
+
+        :param redis: redis对象
+        :return:
+        """
+        await redis.incr(cls.get_global_version_key())
+
+    @classmethod
+    def _set_local_cache(cls, user_id: int, version: str, principal: BaseModel) -> None:
+        """
+        写入进程内LRU缓存
+
+        :param user_id: 用户id
+        :param version: 缓存版本
+        :param principal: 登录用户信息
+        :return:
+        """
+        cls._local_cache[user_id] = (version, principal)
+        cls._local_cache.move_to_end(user_id)
+        while len(cls._local_cache) > cls.local_max_size:
+            cls._local_cache.popitem(last=False)
@@ -0,0 +1,107 @@
+from collections.abc import AsyncIterator, Sequence
+from typing import Optional
+
+from redis import asyncio as aioredis
+
+
+class RedisKeyUtil:
+    """
+    redis键空间工具类
+
+    使用SCAN增量遍历键空间代替KEYS，每次调用只遍历scan_count个键，不会长时间阻塞处理登录令牌校验等请求的redis；
+    按batch_size分批执行MGET和UNLINK，UNLINK在redis后台线程释放内存
+    """
+
+    scan_count = 1000
+    batch_size = 500
+
+    @classmethod
+    async def iter_key_batches(
+        cls, redis: aioredis.Redis, match: str, batch_size: Optional[int] = None
+    ) -> AsyncIterator[list[str]]:
+        """
+        分批遍历匹配的键，SCAN可能重复返回同一个键，已返回过的键会被跳过
+
+        :param redis: redis对象
+        :param match: 键名匹配模式
+        :param batch_size: 每批键数量，默认为batch_size
+        :return: 键名列表
+        """
+        batch_size = batch_size or cls.batch_size
+        seen_keys: set[str] = set()
+        batch: list[str] = []
+        async for key in redis.scan_iter(match=match, count=cls.scan_count):
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
+            batch.append(key)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    @classmethod
+    async def get_keys(cls, redis: aioredis.Redis, match: str) -> list[str]:
+        """
+        获取所有匹配的键
+
+        :param redis: redis对象
+        :param match: 键名匹配模式
+        :return: 键名列表
+        """
+        keys: list[str] = []
+        async for batch in cls.iter_key_batches(redis, match):
+            keys.extend(batch)
+
+        return keys
+
+    @classmethod
+    async def get_values(cls, redis: aioredis.Redis, keys: Sequence[str]) -> list[Optional[str]]:
+        """
+        按batch_size拆分为多个MGET，在同一个管道中发送
+
+        :param redis: redis对象
+        :param keys: 键名列表
+        :return: 与键名一一对应的值列表，不存在的键对应None
+        """
+        if not keys:
+            return []
+        async with redis.pipeline(transaction=False) as pipe:
+            for index in range(0, len(keys), cls.batch_size):
+                pipe.mget(keys[index : index + cls.batch_size])
+            results = await pipe.execute()
+
+        return [value for result in results for value in result]
+
+    @classmethod
+    async def iter_items(cls, redis: aioredis.Redis, match: str) -> AsyncIterator[list[tuple[str, str]]]:
+        """
+        分批遍历匹配的键及其值，遍历期间已过期的键会被跳过
+
+        :param redis: redis对象
+        :param match: 键名匹配模式
+        :return: 键名与值组成的列表
+        """
+        async for batch in cls.iter_key_batches(redis, match):
+            values = await redis.mget(batch)
+            yield [(key, value) for key, value in zip(batch, values) if value is not None]
+
+    @classmethod
+    async def unlink_keys(cls, redis: aioredis.Redis, match: str, exclude_prefixes: Sequence[str] = ()) -> int:
+        """
+        分批删除所有匹配的键
+
+        :param redis: redis对象
+        :param match: 键名匹配模式
+        :param exclude_prefixes: 不删除的键名前缀
+        :return: 删除的键数量
+        """
+        count = 0
+        exclude_prefixes = tuple(exclude_prefixes)
+        async for batch in cls.iter_key_batches(redis, match):
+            keys = [key for key in batch if not key.startswith(exclude_prefixes)] if exclude_prefixes else batch
+            if keys:
+                count += await redis.unlink(*keys)
+
+        return count
@@ -1,16 +1,50 @@
 from collections.abc import Mapping
-from datetime import datetime
+from datetime import datetime, timedelta
+from decimal import Decimal
 from typing import Any, Optional
 
+import orjson
 from fastapi import status
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse, Response, StreamingResponse
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 from starlette.background import BackgroundTask
 
 from common.constant import HttpStatusConstant
 
 
+def orjson_default(obj: Any) -> Any:
+    """
+    orjson无法原生序列化的类型的转换方法，转换结果与jsonable_encoder保持一致
+
+    :param obj: 待序列化对象
+    :return: orjson可序列化的对象
+    """
+    if isinstance(obj, Decimal):
+        # 无小数部分时转换为int，否则转换为float
+        return int(obj) if obj.as_tuple().exponent >= 0 else float(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(by_alias=True)
+    if isinstance(obj, timedelta):
+        return obj.total_seconds()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, bytes):
+        return obj.decode()
+
+    return jsonable_encoder(obj)
+
+
+class FastJSONResponse(ORJSONResponse):
+    """
+    直接使用orjson序列化响应内容，不经过jsonable_encoder，
+    datetime、date、UUID、Enum等类型由orjson原生处理，Decimal等其他类型由orjson_default转换
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
 class ResponseUtil:
     """
     响应工具类
@@ -54,9 +88,9 @@ class ResponseUtil:
 
         result.update({'success': True, 'time': datetime.now()})
 
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_200_OK,
-            content=jsonable_encoder(result),
+            content=result,
             headers=headers,
             media_type=media_type,
             background=background,
@@ -100,9 +134,9 @@ class ResponseUtil:
 
         result.update({'success': False, 'time': datetime.now()})
 
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_200_OK,
-            content=jsonable_encoder(result),
+            content=result,
             headers=headers,
             media_type=media_type,
             background=background,
@@ -146,9 +180,9 @@ class ResponseUtil:
 
         result.update({'success': False, 'time': datetime.now()})
 
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_200_OK,
-            content=jsonable_encoder(result),
+            content=result,
             headers=headers,
             media_type=media_type,
             background=background,
@@ -192,9 +226,9 @@ class ResponseUtil:
 
         result.update({'success': False, 'time': datetime.now()})
 
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_200_OK,
-            content=jsonable_encoder(result),
+            content=result,
             headers=headers,
             media_type=media_type,
             background=background,
@@ -238,9 +272,9 @@ class ResponseUtil:
 
         result.update({'success': False, 'time': datetime.now()})
 
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_200_OK,
-            content=jsonable_encoder(result),
+            content=result,
             headers=headers,
             media_type=media_type,
             background=background,
@@ -0,0 +1,174 @@
+import asyncio
+import hashlib
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Literal, Optional
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import MetaData, insert, select, text, update
+from sqlalchemy.engine import Dialect
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from module_admin.entity.do.schema_do import SysSchemaFingerprint
+from utils.log_util import logger
+
+SchemaMode = Literal['create_all', 'fingerprint', 'alembic']
+
+
+class SchemaUtil:
+    """
+    表结构初始化工具类
+
+    根据模型生成的建表语句计算表结构指纹并保存在数据库中，启动时只需一次查询比较指纹，指纹一致时跳过create_all的逐表反射查询；
+    指纹不一致时通过数据库命名锁保证多个worker中只有一个执行初始化，其余worker等待锁释放后重新比较指纹；
+    alembic模式下表结构完全由迁移脚本维护（基线版本包含全部基础表），不再执行create_all，新增或修改模型时需同时新增迁移脚本
+    """
+
+    schema_name = 'default'
+    lock_name = 'sys_schema_init'
+    lock_timeout_seconds = 300
+    alembic_script_location = 'alembic'
+
+    @classmethod
+    def get_metadata_fingerprint(cls, metadata: MetaData, dialect: Dialect) -> str:
+        """
+        根据所有表及索引的建表语句计算表结构指纹
+
+        :param metadata: 模型元数据
+        :param dialect: 数据库方言
+        :return: 表结构指纹
+        """
+        statements = []
+        for table_name in sorted(metadata.tables):
+            table = metadata.tables[table_name]
+            statements.append(str(CreateTable(table).compile(dialect=dialect)).strip())
+            statements.extend(
+                sorted(str(CreateIndex(index).compile(dialect=dialect)).strip() for index in table.indexes)
+            )
+
+        return hashlib.sha256('\n'.join(statements).encode('utf-8')).hexdigest()
+
+    @classmethod
+    async def get_stored_fingerprint(cls, conn: AsyncConnection) -> Optional[str]:
+        """
+        获取数据库中保存的表结构指纹，查询结束后结束事务，再次查询时可读取其他worker提交的指纹
+
+        :param conn: 数据库连接
+        :return: 表结构指纹，指纹表不存在或未保存时返回None
+        """
+        try:
+            fingerprint = (
+                await conn.execute(
+                    select(SysSchemaFingerprint.fingerprint).where(SysSchemaFingerprint.schema_name == cls.schema_name)
+                )
+            ).scalar()
+            await conn.commit()
+        except DBAPIError:
+            await conn.rollback()
+            return None
+
+        return fingerprint
+
+    @classmethod
+    async def save_fingerprint(cls, conn: AsyncConnection, fingerprint: str) -> None:
+        """
+        保存表结构指纹
+
+        :param conn: 数据库连接
+        :param fingerprint: 表结构指纹
+        :return:
+        """
+        result = await conn.execute(
+            update(SysSchemaFingerprint)
+            .where(SysSchemaFingerprint.schema_name == cls.schema_name)
+            .values(fingerprint=fingerprint, update_time=datetime.now())
+        )
+        if result.rowcount == 0:
+            await conn.execute(
+                insert(SysSchemaFingerprint).values(
+                    schema_name=cls.schema_name, fingerprint=fingerprint, update_time=datetime.now()
+                )
+            )
+        await conn.commit()
+
+    @classmethod
+    @asynccontextmanager
+    async def schema_lock(cls, conn: AsyncConnection) -> AsyncIterator[None]:
+        """
+        获取数据库命名锁（mysql为GET_LOCK，postgresql为会话级advisory锁），锁与连接绑定
+
+        :param conn: 数据库连接
+        :return:
+        """
+        if conn.dialect.name == 'postgresql':
+            await conn.execute(text('SELECT pg_advisory_lock(hashtext(:name))'), {'name': cls.lock_name})
+            release_sql = 'SELECT pg_advisory_unlock(hashtext(:name))'
+        else:
+            acquired = (
+                await conn.execute(
+                    text('SELECT GET_LOCK(:name, :timeout)'),
+                    {'name': cls.lock_name, 'timeout': cls.lock_timeout_seconds},
+                )
+            ).scalar()
+            if acquired != 1:
+                raise TimeoutError(f'等待表结构初始化锁超时（{cls.lock_timeout_seconds}秒）')
+            release_sql = 'SELECT RELEASE_LOCK(:name)'
+        await conn.commit()
+        try:
+            yield
+        finally:
+            await conn.rollback()
+            await conn.execute(text(release_sql), {'name': cls.lock_name})
+            await conn.commit()
+
+    @classmethod
+    def upgrade_alembic(cls) -> None:
+        """
+        执行alembic upgrade head，不传入alembic.ini，避免其日志配置覆盖应用的日志配置
+
+        :return:
+        """
+        alembic_config = Config()
+        alembic_config.set_main_option('script_location', cls.alembic_script_location)
+        command.upgrade(alembic_config, 'head')
+
+    @classmethod
+    async def ensure_schema(cls, engine: AsyncEngine, metadata: MetaData, mode: SchemaMode) -> None:
+        """
+        表结构指纹与数据库中保存的不一致时初始化表结构
+
+        :param engine: 数据库引擎
+        :param metadata: 模型元数据
+        :param mode: 表结构初始化方式
+        :return:
+        """
+        if mode == 'create_all':
+            async with engine.begin() as conn:
+                await conn.run_sync(metadata.create_all)
+            return
+
+        fingerprint = cls.get_metadata_fingerprint(metadata, engine.dialect)
+        async with engine.connect() as conn:
+            if await cls.get_stored_fingerprint(conn) == fingerprint:
+                logger.info('✅️ 表结构指纹未变化，跳过表结构初始化')
+                return
+            async with cls.schema_lock(conn):
+                # 等待锁期间其他worker可能已完成初始化
+                if await cls.get_stored_fingerprint(conn) == fingerprint:
+                    logger.info('✅️ 表结构已由其他进程完成初始化')
+                    return
+                if mode == 'alembic':
+                    logger.info('⏰️ 表结构指纹已变化，执行alembic upgrade head')
+                    # alembic迁移脚本内部使用asyncio.run，需在独立线程中执行
+                    await asyncio.to_thread(cls.upgrade_alembic)
+                else:
+                    logger.info('⏰️ 表结构指纹已变化，执行create_all')
+                    await conn.run_sync(metadata.create_all)
+                    await conn.commit()
+                # 表结构均已创建后再保存指纹，初始化失败时下次启动会重新执行
+                await cls.save_fingerprint(conn, fingerprint)
+                logger.info(f'✅️ 表结构初始化完成，指纹：{fingerprint}')
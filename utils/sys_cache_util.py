@@ -0,0 +1,141 @@
+import json
+from collections.abc import Callable, Iterable
+from typing import Any, Literal, Optional
+
+from redis import asyncio as aioredis
+
+from common.enums import RedisInitKeyConfig
+from utils.common_util import CamelCaseUtil
+from utils.invalidation_util import InvalidationChannel
+
+SysCacheType = Literal['config', 'dict']
+
+
+class SysCacheUtil:
+    """
+    参数配置及字典数据进程内缓存工具类
+
+    每个worker进程在redis前维护一份参数配置和字典数据的内存缓存，读取时优先命中内存，未命中时读取redis后写入内存；
+    参数配置或字典数据写入redis后通过redis频道发布失效通知，所有worker进程收到后清除对应的内存缓存。
+    频道未订阅成功或连接断开期间不使用内存缓存，直接读取redis，重新订阅成功后清空全部内存缓存
+    """
+
+    _caches: dict[SysCacheType, dict[str, Any]] = {'config': {}, 'dict': {}}
+    _channel = InvalidationChannel(
+        'sys_cache_invalidate', '参数配置及字典缓存', lambda data: SysCacheUtil._clear_caches(data)
+    )
+
+    @classmethod
+    async def start_listener(cls, redis: aioredis.Redis) -> None:
+        """
+        应用启动时订阅缓存失效频道
+
+        :param redis: redis对象
+        :return:
+        """
+        await cls._channel.start(redis)
+
+    @classmethod
+    async def stop_listener(cls) -> None:
+        """
+        应用关闭时取消订阅缓存失效频道
+
+        :return:
+        """
+        await cls._channel.stop()
+
+    @classmethod
+    async def get_config(cls, redis: aioredis.Redis, config_key: str) -> Optional[str]:
+        """
+        获取参数键名对应值
+
+        :param redis: redis对象
+        :param config_key: 参数键名
+        :return: 参数键值，不存在时返回None
+        """
+        return await cls._get(
+            redis, 'config', config_key, f'{RedisInitKeyConfig.SYS_CONFIG.key}:{config_key}', lambda value: value
+        )
+
+    @classmethod
+    async def get_dict(cls, redis: aioredis.Redis, dict_type: str) -> list[dict[str, Any]]:
+        """
+        获取字典类型对应的字典数据列表，返回的列表在请求间共享，调用方不可修改
+
+        :param redis: redis对象
+        :param dict_type: 字典类型
+        :return: 字典数据列表
+        """
+        return await cls._get(
+            redis,
+            'dict',
+            dict_type,
+            f'{RedisInitKeyConfig.SYS_DICT.key}:{dict_type}',
+            lambda value: CamelCaseUtil.transform_result(json.loads(value)) if value else [],
+        )
+
+    @classmethod
+    async def publish_invalidate(
+        cls, redis: aioredis.Redis, cache_type: Optional[SysCacheType] = None, keys: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        清除本进程内存缓存并通知其他worker进程，需在redis写入完成后调用
+
+        :param redis: redis对象
+        :param cache_type: 缓存类型，为空表示所有类型
+        :param keys: 参数键名或字典类型列表，为空表示该类型的所有键
+        :return:
+        """
+        key_list = list(keys) if keys is not None else None
+        await cls._channel.publish(redis, json.dumps({'type': cache_type, 'keys': key_list}, ensure_ascii=False))
+
+    @classmethod
+    async def _get(
+        cls,
+        redis: aioredis.Redis,
+        cache_type: SysCacheType,
+        key: str,
+        redis_key: str,
+        parse: Callable[[Optional[str]], Any],
+    ) -> Any:
+        """
+        优先从内存缓存读取，未命中时读取redis，redis中存在时写入内存缓存；
+        redis中不存在的键不写入内存缓存，避免任意键名的查询使内存缓存无限增长
+
+        :param redis: redis对象
+        :param cache_type: 缓存类型
+        :param key: 内存缓存键
+        :param redis_key: redis缓存键
+        :param parse: redis缓存值的转换方法
+        :return: 缓存值
+        """
+        cache = cls._caches[cache_type]
+        if cls._channel.listening and key in cache:
+            return cache[key]
+        generation = cls._channel.generation
+        raw_value = await redis.get(redis_key)
+        value = parse(raw_value)
+        if raw_value is not None and cls._channel.is_current(generation):
+            cache[key] = value
+
+        return value
+
+    @classmethod
+    def _clear_caches(cls, data: Optional[str]) -> None:
+        """
+        根据失效通知清除内存缓存
+
+        :param data: 失效通知内容，包含缓存类型及键列表，为None表示清除全部
+        :return:
+        """
+        invalidation = json.loads(data) if data else {}
+        cache_type = invalidation.get('type')
+        keys = invalidation.get('keys')
+        for current_type, cache in cls._caches.items():
+            if cache_type is not None and current_type != cache_type:
+                continue
+            if keys is None:
+                cache.clear()
+            else:
+                for key in keys:
+                    cache.pop(key, None)